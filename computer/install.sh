@@ -15,18 +15,17 @@ echo ""
 # --- Check Python ---
 
 if ! command -v python3 &>/dev/null; then
-    echo "Error: python3 not found. Install Python 3.11+ first."
+    echo "Error: python3 not found. Install Python 3.11.4+ first."
     echo "  macOS:  brew install python@3.13"
     echo "  Ubuntu: sudo apt install python3 python3-venv"
     exit 1
 fi
 
-PY_VERSION=$(python3 -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')
-PY_MAJOR=$(echo "$PY_VERSION" | cut -d. -f1)
-PY_MINOR=$(echo "$PY_VERSION" | cut -d. -f2)
+PY_VERSION=$(python3 -c 'import sys; print(".".join(map(str, sys.version_info[:3])))')
 
-if [ "$PY_MAJOR" -lt 3 ] || { [ "$PY_MAJOR" -eq 3 ] && [ "$PY_MINOR" -lt 11 ]; }; then
-    echo "Error: Python >= 3.11 required, found $PY_VERSION"
+# 3.11.4+ for tarfile extraction filters (transcription model download)
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 11, 4))'; then
+    echo "Error: Python >= 3.11.4 required, found $PY_VERSION"
     exit 1
 fi
 
@@ -19,6 +19,7 @@ import os
 import re
 import shutil
 import tempfile
+import time
 import uuid
 from datetime import date as _date, datetime, timedelta, timezone
 from pathlib import Path
@@ -47,6 +48,15 @@ def _log_task_exception(task: asyncio.Task) -> None:
 MAX_VOICE_BYTES = 200 * 1024 * 1024  # 200 MB
 ALLOWED_AUDIO_EXTENSIONS = {".wav", ".m4a", ".mp3", ".aac", ".ogg", ".webm", ".mp4"}
 
+# Background job pools — transcription is compute-bound, agent runs are LLM-bound
+TRANSCRIPTION_CONCURRENCY = 2
+TRANSCRIPTION_MAX_PENDING = 50
+AGENT_EVENT_CONCURRENCY = 2
+AGENT_EVENT_MAX_PENDING = 500
+
+# Minimum seconds between partial-transcript writes while a memo streams in
+PARTIAL_TRANSCRIPT_WRITE_INTERVAL = 2.0
+
 # Default redo log path for crash recovery (rolled to 90 days).
 # DailyModule derives the actual path from its home_path at init time,
 # so tests with a temp vault don't pollute the production log.
@@ -56,6 +66,8 @@ logger = logging.getLogger(__name__)
 
 # Tool/Trigger templates are defined in core (brain_chat_store.py) and imported here
 # for use in GET /tools/templates and tool creation endpoints.
+from parachute.core.agent_dispatch import invalidate_trigger_index
+from parachute.core.job_queue import Job, JobQueue, JobQueueFull
 from parachute.db.brain_chat_store import (
     POST_PROCESS_SYSTEM_PROMPT,
     TOOL_TEMPLATES,
@@ -298,7 +310,13 @@ async def _transcribe_and_cleanup(
     audio_path: Path,
     dispatch_event_fn=None,
 ) -> None:
-    """Background task: transcribe audio → dispatch event for cleanup.
+    """Transcription job: stream-transcribe audio → dispatch event for cleanup.
+
+    The Note's content fills in as segments arrive; the event fires only
+    after the final transcript commits. Runs as a ``transcription`` job on
+    the module's JobQueue. Transcription errors propagate so the queue can
+    retry with backoff; once retries are exhausted, _fail_transcription()
+    marks the entry failed.
 
     If dispatch_event_fn is provided, fires 'note.transcription_complete'
     event which triggers Agents (e.g., post-process).
@@ -313,56 +331,39 @@ async def _transcribe_and_cleanup(
         )
         return
 
-    try:
-        raw_text = await ts.transcribe(audio_path)
-        if not raw_text.strip():
-            await _update_entry_transcription_status(
-                graph, entry_id, "failed", error="No speech detected in audio"
-            )
-            return
-
-        # Update entry with raw transcription + status "transcribed" (atomic)
-        async with graph.write_lock:
-            rows = await graph.execute_cypher(
-                "MATCH (e:Note {entry_id: $entry_id}) RETURN e.metadata_json AS meta",
-                {"entry_id": entry_id},
-            )
-            existing_meta = {}
-            if rows:
-                blob = rows[0].get("meta") or ""
-                try:
-                    existing_meta = json.loads(blob) if blob else {}
-                except (json.JSONDecodeError, TypeError):
-                    existing_meta = {}
-
-            existing_meta["transcription_status"] = "transcribed"
-            existing_meta["transcription_raw"] = raw_text
-            await graph.execute_cypher(
-                "MATCH (e:Note {entry_id: $entry_id}) "
-                "SET e.content = $content, e.metadata_json = $meta",
-                {
-                    "entry_id": entry_id,
-                    "content": raw_text,
-                    "meta": json.dumps(existing_meta),
-                },
-            )
-
-        logger.info(f"Daily: transcribed voice entry {entry_id} ({len(raw_text)} chars)")
+    # Stream segments in, writing the partial transcript to the Note at most
+    # every PARTIAL_TRANSCRIPT_WRITE_INTERVAL seconds. Status stays
+    # "processing" until the final text commits.
+    parts: list[str] = []
+    last_write = time.monotonic()
+    written = 0
+    async for segment in ts.transcribe_stream(audio_path):
+        if segment.text:
+            parts.append(segment.text)
+        due = time.monotonic() - last_write >= PARTIAL_TRANSCRIPT_WRITE_INTERVAL
+        if len(parts) > written and due:
+            await _write_transcript(graph, entry_id, " ".join(parts), {
+                "transcription_progress_seconds": round(segment.end, 1),
+            })
+            last_write = time.monotonic()
+            written = len(parts)
 
-    except Exception as e:
-        logger.error(f"Daily: transcription failed for {entry_id}: {e}", exc_info=True)
+    raw_text = " ".join(parts)
+    if not raw_text.strip():
         await _update_entry_transcription_status(
-            graph, entry_id, "failed", error=str(e)
+            graph, entry_id, "failed", error="No speech detected in audio"
         )
-        # Clean up orphaned audio file only if transcription itself failed
-        try:
-            if audio_path.exists():
-                audio_path.unlink()
-                logger.info(f"Daily: cleaned up audio file after failed transcription: {audio_path}")
-        except OSError as cleanup_err:
-            logger.warning(f"Daily: failed to clean up audio file {audio_path}: {cleanup_err}")
         return
 
+    # Final commit: full raw transcription + status "transcribed"
+    await _write_transcript(graph, entry_id, raw_text, {
+        "transcription_status": "transcribed",
+        "transcription_raw": raw_text,
+        "transcription_progress_seconds": None,
+    })
+
+    logger.info(f"Daily: transcribed voice entry {entry_id} ({len(raw_text)} chars)")
+
     # Dispatch note.transcription_complete event to triggered Agents.
     # The cleanup_transcription Agent (if enabled) will handle text cleanup.
     # We pass a callback since _transcribe_and_cleanup is module-level.
@@ -379,6 +380,58 @@ async def _transcribe_and_cleanup(
             logger.error(f"Daily: cleanup failed for {entry_id} (transcription preserved): {e}", exc_info=True)
 
 
+async def _write_transcript(
+    graph,
+    entry_id: str,
+    text: str,
+    meta_updates: dict[str, Any],
+) -> None:
+    """Set an entry's content and merge metadata (None values remove keys), atomically."""
+    async with graph.write_lock:
+        rows = await graph.execute_cypher(
+            "MATCH (e:Note {entry_id: $entry_id}) RETURN e.metadata_json AS meta",
+            {"entry_id": entry_id},
+        )
+        existing_meta = {}
+        if rows:
+            blob = rows[0].get("meta") or ""
+            try:
+                existing_meta = json.loads(blob) if blob else {}
+            except (json.JSONDecodeError, TypeError):
+                existing_meta = {}
+
+        for key, value in meta_updates.items():
+            if value is None:
+                existing_meta.pop(key, None)
+            else:
+                existing_meta[key] = value
+        await graph.execute_cypher(
+            "MATCH (e:Note {entry_id: $entry_id}) "
+            "SET e.content = $content, e.metadata_json = $meta",
+            {
+                "entry_id": entry_id,
+                "content": text,
+                "meta": json.dumps(existing_meta),
+            },
+        )
+
+
+async def _fail_transcription(
+    graph,
+    entry_id: str,
+    audio_path: Path,
+    error: str,
+) -> None:
+    """Mark a transcription failed for good and remove the orphaned audio file."""
+    await _update_entry_transcription_status(graph, entry_id, "failed", error=error)
+    try:
+        if audio_path.exists():
+            audio_path.unlink()
+            logger.info(f"Daily: cleaned up audio file after failed transcription: {audio_path}")
+    except OSError as cleanup_err:
+        logger.warning(f"Daily: failed to clean up audio file {audio_path}: {cleanup_err}")
+
+
 async def _cleanup_transcription(
     graph,
     entry_id: str,
@@ -533,6 +586,23 @@ class DailyModule:
         self.home_path = home_path
         self._redo_log_path = home_path / ".parachute" / "daily" / "entries.jsonl"
 
+        # Durable queue for transcription and triggered-agent runs: survives
+        # restarts, bounds concurrency, retries with backoff.
+        self.jobs = JobQueue(home_path / ".parachute" / "daily" / "jobs")
+        self.jobs.register(
+            "transcription",
+            self._run_transcription_job,
+            concurrency=TRANSCRIPTION_CONCURRENCY,
+            max_pending=TRANSCRIPTION_MAX_PENDING,
+            on_failure=self._on_transcription_failed,
+        )
+        self.jobs.register(
+            "agent_event",
+            self._run_event_job,
+            concurrency=AGENT_EVENT_CONCURRENCY,
+            max_pending=AGENT_EVENT_MAX_PENDING,
+        )
+
     async def on_load(self) -> None:
         """Daily-specific initialization.
 
@@ -552,6 +622,9 @@ class DailyModule:
         redo_records = _trim_redo_log(self._redo_log_path)
         await self._recover_from_redo_log(graph, redo_records)
 
+        # Resume transcriptions and agent runs interrupted by the last shutdown
+        self.jobs.recover()
+
         logger.info("Daily: module loaded")
 
     async def _migrate_audio_paths_to_absolute(self, graph) -> None:
@@ -784,6 +857,52 @@ class DailyModule:
         from parachute.core.interfaces import get_registry
         return get_registry().get("BrainDB")
 
+    # ── Background jobs ───────────────────────────────────────────────────────
+
+    async def _enqueue_event(self, event: str, entry_id: str) -> None:
+        """Queue a Note lifecycle event for triggered Agents.
+
+        Pending duplicates of the same (entry_id, event) collapse into one run.
+        """
+        try:
+            self.jobs.enqueue(
+                "agent_event",
+                f"{entry_id}:{event}",
+                {"event": event, "entry_id": entry_id},
+            )
+        except JobQueueFull as e:
+            logger.warning(f"Daily: dropping {event} for {entry_id}: {e}")
+
+    def _enqueue_transcription(self, entry_id: str, audio_path: Path) -> None:
+        """Queue transcription of an entry's audio. Raises JobQueueFull."""
+        self.jobs.enqueue(
+            "transcription",
+            f"{entry_id}:transcribe",
+            {"entry_id": entry_id, "audio_path": str(audio_path)},
+        )
+
+    async def _run_transcription_job(self, payload: dict) -> None:
+        graph = self._get_graph()
+        if graph is None:
+            raise RuntimeError("BrainDB not available")
+        await _transcribe_and_cleanup(
+            graph,
+            payload["entry_id"],
+            Path(payload["audio_path"]),
+            dispatch_event_fn=self._enqueue_event,
+        )
+
+    async def _on_transcription_failed(self, job: Job, exc: BaseException) -> None:
+        graph = self._get_graph()
+        if graph is None:
+            return
+        await _fail_transcription(
+            graph, job.payload["entry_id"], Path(job.payload["audio_path"]), str(exc)
+        )
+
+    async def _run_event_job(self, payload: dict) -> None:
+        await self._dispatch_event(payload["event"], payload["entry_id"])
+
     async def _dispatch_event(self, event: str, entry_id: str) -> None:
         """Dispatch a Note lifecycle event to matching triggered Agents.
 
@@ -791,7 +910,8 @@ class DailyModule:
         because it's domain-specific to the Daily module — the dispatcher stays
         event-agnostic.
 
-        Runs as a background task. Errors are logged but don't propagate.
+        Runs as an ``agent_event`` job. Dispatch errors are logged and re-raised
+        so the job queue retries them.
         """
         from parachute.core.agent_dispatch import AgentDispatcher
 
@@ -845,6 +965,7 @@ class DailyModule:
                     await self._set_entry_meta(graph, entry_id, {"cleanup_status": "failed"})
                 except Exception:
                     pass
+            raise
 
     @staticmethod
     async def _set_entry_meta(graph: Any, entry_id: str, updates: dict[str, Any]) -> None:
@@ -1028,10 +1149,8 @@ class DailyModule:
 
         logger.info(f"Daily: created entry {entry_id}")
 
-        # Dispatch note.created event (non-blocking background task)
-        task = asyncio.create_task(self._dispatch_event("note.created", entry_id))
-        _background_tasks.add(task)
-        task.add_done_callback(_log_task_exception)
+        # Dispatch note.created event (queued, runs in the background)
+        await self._enqueue_event("note.created", entry_id)
 
         return {
             "id": entry_id,
@@ -1541,7 +1660,7 @@ class DailyModule:
 
             Saves the audio file, creates an entry with status "processing"
             (or resets an existing entry if replace_entry_id is given),
-            and kicks off background transcription + LLM cleanup.
+            and queues background transcription + LLM cleanup.
             """
             from parachute.core.interfaces import get_registry
 
@@ -1560,6 +1679,14 @@ class DailyModule:
                     content={"error": "Transcription service not available"},
                 )
 
+            # Backpressure: refuse before storing audio we can't get to soon
+            if not self.jobs.has_capacity("transcription"):
+                return JSONResponse(
+                    status_code=429,
+                    content={"error": "Transcription queue is full, try again shortly"},
+                    headers={"Retry-After": "30"},
+                )
+
             # Determine date
             date_str = date or datetime.now(timezone.utc).astimezone().strftime("%Y-%m-%d")
             if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_str):
@@ -1633,21 +1760,16 @@ class DailyModule:
                 result = await self.create_entry("", meta)
                 entry_id = result["id"]
 
-            # Kick off background transcription + event dispatch
-            task = asyncio.create_task(
-                _transcribe_and_cleanup(graph, entry_id, audio_path, dispatch_event_fn=self._dispatch_event)
-            )
-            _background_tasks.add(task)
-
-            def _on_done(t: asyncio.Task, eid: str = entry_id) -> None:
-                _background_tasks.discard(t)
-                if not t.cancelled() and (exc := t.exception()):
-                    logger.error(
-                        "Background transcription failed for entry %s: %s",
-                        eid, exc, exc_info=exc,
-                    )
-
-            task.add_done_callback(_on_done)
+            # Queue background transcription + event dispatch
+            try:
+                self._enqueue_transcription(entry_id, audio_path)
+            except JobQueueFull as e:
+                await _fail_transcription(graph, entry_id, audio_path, str(e))
+                return JSONResponse(
+                    status_code=429,
+                    content={"error": "Transcription queue is full, try again shortly"},
+                    headers={"Retry-After": "30"},
+                )
 
             return {
                 "entry_id": entry_id,
@@ -1711,20 +1833,7 @@ class DailyModule:
                 )
 
             # Dispatch transcription_complete event to triggered Agents
-            task = asyncio.create_task(
-                self._dispatch_event("note.transcription_complete", entry_id)
-            )
-            _background_tasks.add(task)
-
-            def _on_done(t: asyncio.Task, eid: str = entry_id) -> None:
-                _background_tasks.discard(t)
-                if not t.cancelled() and (exc := t.exception()):
-                    logger.error(
-                        "Background cleanup failed for entry %s: %s",
-                        eid, exc, exc_info=exc,
-                    )
-
-            task.add_done_callback(_on_done)
+            await self._enqueue_event("note.transcription_complete", entry_id)
 
             return {
                 "entry_id": entry_id,
@@ -1732,6 +1841,11 @@ class DailyModule:
                 "message": "Cleanup started",
             }
 
+        @router.get("/jobs")
+        async def list_jobs(kind: str | None = Query(None)):
+            """Background job queues: depth, throughput, latency, and in-flight jobs."""
+            return {"queues": self.jobs.stats(), "jobs": self.jobs.jobs(kind)}
+
         @router.get("/entries")
         async def list_entries(
             limit: int = Query(20, ge=1, le=100),
@@ -2457,6 +2571,7 @@ class DailyModule:
                     logger.warning(f"Error managing CAN_CALL edges: {e}")
             # Handle inline trigger fields from Flutter (schedule/event)
             await _upsert_inline_trigger(graph, name, body)
+            invalidate_trigger_index()
 
             # Return the created tool
             result = await graph.execute_cypher(
@@ -2523,6 +2638,7 @@ class DailyModule:
 
             # Handle inline trigger fields from Flutter (schedule/event)
             await _upsert_inline_trigger(graph, name, body)
+            invalidate_trigger_index()
 
             result = await graph.execute_cypher(
                 "MATCH (t:Tool {name: $name}) RETURN t", {"name": name}
@@ -2564,6 +2680,7 @@ class DailyModule:
                     )
             except Exception as e:
                 logger.debug(f"Orphan trigger cleanup: {e}")
+            invalidate_trigger_index()
             # Reload scheduler
             try:
                 from parachute.core.scheduler import reload_scheduler
@@ -2661,6 +2778,7 @@ class DailyModule:
                         )
                 except Exception as e:
                     logger.debug(f"CAN_CALL {name} → {child_name} on reset: {e}")
+            invalidate_trigger_index()
 
             # Re-fetch
             result = await graph.execute_cypher(
@@ -2903,6 +3021,7 @@ class DailyModule:
                     "CREATE (trigger)-[:INVOKES]->(tool)",
                     {"trigger": name, "tool": invokes_tool},
                 )
+            invalidate_trigger_index()
             result = await graph.execute_cypher(
                 "MATCH (t:Trigger {name: $name}) RETURN t", {"name": name}
             )
@@ -2962,6 +3081,7 @@ class DailyModule:
                                 "CREATE (trigger)-[:INVOKES]->(tool)",
                                 {"trigger": name, "tool": invokes_tool},
                             )
+            invalidate_trigger_index()
 
             result = await graph.execute_cypher(
                 "MATCH (t:Trigger {name: $name}) RETURN t", {"name": name}
@@ -2983,6 +3103,7 @@ class DailyModule:
                     "MATCH (t:Trigger {name: $name}) DELETE t",
                     {"name": name},
                 )
+            invalidate_trigger_index()
             return Response(status_code=204)
 
         return router
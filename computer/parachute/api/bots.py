@@ -14,7 +14,7 @@ import yaml
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from parachute.connectors.base import ConnectorState
+from parachute.connectors.base import ConnectorState, get_turn_scheduler
 from parachute.connectors.config import BotsConfig, TelegramConfig, DiscordConfig, MatrixConfig, TrustLevelStr, load_bots_config
 
 
@@ -283,6 +283,9 @@ async def _start_platform(platform: str) -> None:
         else:
             raise RuntimeError(f"Unknown platform: {platform}")
 
+        get_turn_scheduler().set_limit(config.max_concurrent_turns)
+        connector.dispatcher.coalesce_window = config.coalesce_window
+
         def _on_connector_error(task: asyncio.Task) -> None:
             if task.cancelled():
                 return
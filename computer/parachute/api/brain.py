@@ -460,4 +460,11 @@ async def cypher_execute(body: CypherRequest):
     brain = _get_graph()
     async with brain.write_lock:
         rows = await brain.execute_cypher(body.query, body.params or None)
+    # A raw write may touch Chat nodes in ways no query check can see;
+    # bumping the counter is cheap, so keep session-list ETags honest always
+    from parachute.core.interfaces import get_registry
+    store = get_registry().get("ChatStore")
+    if store is not None:
+        store.mark_sessions_changed()
+        store.clear_bot_link_cache()
     return {"ok": True, "rows": rows, "count": len(rows)}
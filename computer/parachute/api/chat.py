@@ -1,23 +1,24 @@
 """
 Chat API endpoints with SSE streaming.
 
-Streams directly from the orchestrator - client reconnection uses
-SDK session resumption rather than event buffering.
+Each turn runs in the background and is buffered in a LiveStream (see
+parachute.core.live_streams). The POST response is its first subscriber;
+a client that drops can reattach with GET /chat/{session_id}/stream and
+the last event ID it saw, and the turn keeps running in the meantime.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Header, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from parachute.config import get_settings
+from parachute.core.live_streams import LAG_POLICIES, LAG_SNAPSHOT, LiveStream, LiveStreamHub
 from parachute.core.orchestrator import InjectResult
-from parachute.lib.typed_errors import parse_error
-from parachute.models.events import TypedErrorEvent
+from parachute.lib.sse import StreamEncoder, negotiate_stream_protocol, sse_data
 from parachute.models.requests import ChatRequest
 
 router = APIRouter()
@@ -32,6 +33,14 @@ def get_orchestrator(request: Request):
     return orchestrator
 
 
+def get_live_streams(request: Request) -> LiveStreamHub:
+    """Get the live stream hub from app state (created on first use)."""
+    hub = getattr(request.app.state, "live_streams", None)
+    if hub is None:
+        hub = request.app.state.live_streams = LiveStreamHub()
+    return hub
+
+
 async def _with_heartbeat(stream, request: Request, interval: float = 15.0):
     """Wrap an async stream with SSE heartbeats during long pauses.
 
@@ -73,27 +82,72 @@ async def _with_heartbeat(stream, request: Request, interval: float = 15.0):
                 pass
 
 
+async def _subscriber_frames(
+    request: Request,
+    live: LiveStream,
+    encoder: StreamEncoder,
+    after_id: int = 0,
+    on_lag: str = LAG_SNAPSHOT,
+):
+    """SSE frames for one subscriber of a live stream.
+
+    Every data frame carries an ``id:`` line so the client can reattach
+    with the last ID it saw. The run is not tied to this subscriber — a
+    disconnect only ends this response.
+    """
+    event_count = 0
+    heartbeat_count = 0
+    end_reason = "unknown"
+    try:
+        preamble = encoder.preamble()
+        if preamble:
+            yield preamble
+
+        async for item in _with_heartbeat(live.subscribe(after_id, on_lag=on_lag), request):
+            if item is None:
+                heartbeat_count += 1
+                yield ": heartbeat\n\n"
+                continue
+            frame = encoder.encode(item.event, item.data)
+            if frame is not None:
+                event_count += 1
+                yield f"id: {item.id}\n{frame}"
+
+        end_reason = "normal"
+
+    except asyncio.CancelledError:
+        end_reason = "cancelled"
+        raise
+
+    finally:
+        logger.info(
+            f"SSE stream ended: session={live.session_id or 'new'}, "
+            f"reason={end_reason}, events={event_count}, heartbeats={heartbeat_count}, "
+            f"protocol=v{encoder.protocol}, subscribers={live.subscribers}"
+        )
+
+
 async def event_generator(request: Request, chat_request: ChatRequest):
     """
-    Generate SSE events from orchestrator.
+    Start a turn and stream its events as the first subscriber.
 
-    Streams directly from the SDK - if client disconnects, they can
-    resume the session using the SDK's resume parameter.
+    The orchestrator run continues if this client disconnects; reattach
+    with GET /chat/{session_id}/stream.
     """
     orchestrator = request.app.state.orchestrator
     if not orchestrator:
-        yield f"data: {json.dumps({'type': 'error', 'error': 'Server not ready'})}\n\n"
+        yield sse_data({"type": "error", "error": "Server not ready"})
         return
 
     settings = get_settings()
 
     # Validate message
     if not chat_request.message:
-        yield f"data: {json.dumps({'type': 'error', 'error': 'message is required'})}\n\n"
+        yield sse_data({"type": "error", "error": "message is required"})
         return
 
     if len(chat_request.message) > settings.max_message_length:
-        yield f"data: {json.dumps({'type': 'error', 'error': f'Message too long: {len(chat_request.message)} chars'})}\n\n"
+        yield sse_data({"type": "error", "error": f"Message too long: {len(chat_request.message)} chars"})
         return
 
     logger.info(
@@ -107,17 +161,17 @@ async def event_generator(request: Request, chat_request: ChatRequest):
     if session_id == 'new':
         session_id = None
 
-    event_count = 0
-    heartbeat_count = 0
-    end_reason = "unknown"
-    try:
-        # Convert attachments to dicts if present
-        attachments_data = None
-        if chat_request.attachments:
-            attachments_data = [att.model_dump() for att in chat_request.attachments]
+    encoder = StreamEncoder(negotiate_stream_protocol(
+        chat_request.stream_protocol, request.headers.get("accept")
+    ))
 
-        # Stream from orchestrator with heartbeat wrapper to keep connections alive
-        stream = orchestrator.run_streaming(
+    # Convert attachments to dicts if present
+    attachments_data = None
+    if chat_request.attachments:
+        attachments_data = [att.model_dump() for att in chat_request.attachments]
+
+    live = get_live_streams(request).start(
+        orchestrator.run_streaming(
             message=chat_request.message,
             session_id=session_id,
             module=chat_request.module,
@@ -134,34 +188,12 @@ async def event_generator(request: Request, chat_request: ChatRequest):
             mode=chat_request.mode,
             model=chat_request.model,
             container_id=chat_request.container_id,
-        )
-
-        async for event in _with_heartbeat(stream, request):
-            if event is None:
-                heartbeat_count += 1
-                yield ": heartbeat\n\n"
-            else:
-                event_count += 1
-                yield f"data: {json.dumps(event)}\n\n"
+        ),
+        session_id=session_id,
+    )
 
-        end_reason = "normal"
-
-    except asyncio.CancelledError:
-        end_reason = "cancelled"
-        raise
-
-    except Exception as e:
-        end_reason = f"error: {e}"
-        logger.error(f"Stream error: {e}", exc_info=True)
-        typed = parse_error(e)
-        event = TypedErrorEvent.from_typed_error(typed)
-        yield f"data: {json.dumps(event.model_dump(by_alias=True))}\n\n"
-
-    finally:
-        logger.info(
-            f"SSE stream ended: session={chat_request.session_id or 'new'}, "
-            f"reason={end_reason}, events={event_count}, heartbeats={heartbeat_count}"
-        )
+    async for frame in _subscriber_frames(request, live, encoder):
+        yield frame
 
 
 @router.post("/chat")
@@ -179,6 +211,8 @@ async def chat_stream(request: Request, chat_request: ChatRequest):
     - priorConversation: Prior conversation for continuation
     - contexts: Context files to load
     - recoveryMode: 'inject_context' or 'fresh_start'
+    - streamProtocol: 2 for delta-only text/thinking events (or send
+      ``Accept: text/event-stream; protocol=2``); see parachute.lib.sse
     """
     return StreamingResponse(
         event_generator(request, chat_request),
@@ -191,6 +225,54 @@ async def chat_stream(request: Request, chat_request: ChatRequest):
     )
 
 
+@router.get("/chat/{session_id}/stream")
+async def attach_stream(
+    request: Request,
+    session_id: str,
+    last_event_id: Optional[int] = Query(default=None, ge=0),
+    protocol: Optional[int] = Query(default=None),
+    on_lag: str = Query(default=LAG_SNAPSHOT, description="Slow-consumer policy: snapshot or disconnect"),
+    last_event_id_header: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """
+    Attach to an in-flight (or just finished) turn's event stream (SSE).
+
+    Replays buffered events after ``last_event_id`` (or the standard
+    ``Last-Event-ID`` header), then continues live. If the missed events
+    have already left the buffer, a ``stream_gap`` event comes first and
+    the client should refetch the transcript.
+
+    A subscriber that falls too far behind either gets superseded text
+    dropped (``on_lag=snapshot``, default) or a ``stream_lagged`` event
+    and the end of the response (``on_lag=disconnect``).
+
+    Returns 404 if the session has no live stream.
+    """
+    if on_lag not in LAG_POLICIES:
+        raise HTTPException(status_code=400, detail=f"on_lag must be one of {list(LAG_POLICIES)}")
+    live = get_live_streams(request).get(session_id)
+    if live is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No live stream for session {session_id}",
+        )
+
+    after_id = last_event_id
+    if after_id is None and last_event_id_header and last_event_id_header.isdigit():
+        after_id = int(last_event_id_header)
+
+    encoder = StreamEncoder(negotiate_stream_protocol(protocol, request.headers.get("accept")))
+    return StreamingResponse(
+        _subscriber_frames(request, live, encoder, after_id or 0, on_lag),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "Access-Control-Allow-Origin": "*",
+        },
+    )
+
+
 @router.post("/chat/{session_id}/abort")
 async def abort_stream(request: Request, session_id: str) -> dict[str, Any]:
     """
@@ -223,13 +305,16 @@ async def get_stream_status(request: Request, session_id: str) -> dict[str, Any]
     Returns:
         - active: True if the session has an active stream
         - sessionId: The session ID checked
+        - subscribers: Clients currently attached to the live stream
     """
     orchestrator = get_orchestrator(request)
 
     if orchestrator.has_active_stream(session_id):
+        live = get_live_streams(request).get(session_id)
         return {
             "active": True,
             "sessionId": session_id,
+            "subscribers": live.subscribers if live else 0,
         }
 
     return {
@@ -7,6 +7,7 @@ Provides endpoints for:
 - Managing session context folder selections
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -78,7 +79,7 @@ async def list_context_folders(request: Request):
     """
     service = get_context_folder_service(Path.home())
     try:
-        folders = service.discover_folders()
+        folders = await asyncio.to_thread(service.discover_folders)
 
         return ContextFoldersResponse(
             folders=[
@@ -112,7 +113,7 @@ async def get_context_chain(
     service = get_context_folder_service(Path.home())
     try:
         folder_list = [f.strip() for f in folders.split(",") if f.strip()]
-        chain = service.build_chain(folder_list, max_tokens=max_tokens)
+        chain = await asyncio.to_thread(service.build_chain, folder_list, max_tokens=max_tokens)
 
         return ContextChainResponse(
             files=[
@@ -154,7 +155,7 @@ async def get_session_contexts(
 
         if include_chain and folder_paths:
             service = get_context_folder_service(Path.home())
-            chain = service.build_chain(folder_paths)
+            chain = await asyncio.to_thread(service.build_chain, folder_paths)
 
             result.chain = ContextChainResponse(
                 files=[
@@ -2,6 +2,7 @@
 Filesystem API endpoints for browsing the host directory tree.
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime
@@ -11,6 +12,8 @@ from typing import Any, Optional
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 
+from parachute.lib.dir_listing import get_directory_lister
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,9 @@ async def list_directory(
     request: Request,
     path: Optional[str] = Query(None, description="Relative path within home directory"),
     includeHidden: bool = Query(False, description="Include hidden files/folders"),
+    offset: int = Query(0, ge=0, description="Index of the first entry to return"),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="Max entries (default: all)"),
+    markers: bool = Query(True, description="Probe child dirs for AGENTS.md/CLAUDE.md/.git"),
 ) -> dict[str, Any]:
     """
     List directory contents under the home directory.
@@ -60,81 +66,29 @@ async def list_directory(
     - lastModified: ISO timestamp
     - hasAgentsMd: (directories only) Whether AGENTS.md exists
     - hasClaudeMd: (directories only) Whether CLAUDE.md exists
+
+    With markers=false the three marker fields are null for directories.
+    Large directories can be paged with offset/limit; `nextOffset` is null
+    on the last page.
     """
     home_path = get_home_path(request).resolve()
     target_path = home_path / path if path else home_path
     target_path = _check_home_path(home_path, target_path)
 
-    if not target_path.exists():
+    try:
+        page = await asyncio.to_thread(
+            get_directory_lister().list,
+            str(target_path),
+            str(home_path),
+            include_hidden=includeHidden,
+            offset=offset,
+            limit=limit,
+            markers=markers,
+        )
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Path not found")
-
-    if not target_path.is_dir():
+    except NotADirectoryError:
         raise HTTPException(status_code=400, detail="Path is not a directory")
-
-    entries = []
-    try:
-        for item in sorted(target_path.iterdir()):
-            # Skip hidden files unless includeHidden is True
-            if item.name.startswith(".") and not includeHidden:
-                continue
-
-            relative_path = str(item.relative_to(home_path))
-            is_symlink = item.is_symlink()
-
-            # Check if symlink target exists (for broken symlink detection)
-            is_broken_symlink = False
-            if is_symlink:
-                try:
-                    item.resolve(strict=True)
-                except (OSError, FileNotFoundError):
-                    is_broken_symlink = True
-
-            # Use lstat for symlinks to get info about the link itself,
-            # not the target (which may not exist for broken symlinks)
-            try:
-                stat = item.lstat() if is_symlink else item.stat()
-            except (OSError, FileNotFoundError):
-                # Skip entries we can't stat at all
-                continue
-
-            # For broken symlinks, we can't determine type from target
-            if is_broken_symlink:
-                is_dir = False
-                is_file = False
-            else:
-                is_dir = item.is_dir()
-                is_file = item.is_file()
-
-            entry = {
-                "name": item.name,
-                "type": "symlink" if is_broken_symlink else ("directory" if is_dir else "file"),
-                "path": str(item),  # Full absolute path
-                "relativePath": relative_path,
-                "isDirectory": is_dir,
-                "isFile": is_file,
-                "isSymlink": is_symlink,
-                "isBrokenSymlink": is_broken_symlink,
-                "symlinkTarget": str(os.readlink(item)) if is_symlink else None,
-                "hasAgentsMd": False,
-                "hasClaudeMd": False,
-                "isGitRepo": False,
-                "size": stat.st_size if is_file else None,
-                "lastModified": datetime.fromtimestamp(stat.st_mtime).isoformat() + "Z",
-            }
-
-            # For directories, check if they have AGENTS.md, CLAUDE.md, or .git
-            # (skip for broken symlinks since we can't traverse them)
-            # Wrapped in try/except because FUSE mounts (e.g. OrbStack) can timeout
-            if is_dir and not is_broken_symlink:
-                try:
-                    entry["hasAgentsMd"] = (item / "AGENTS.md").exists()
-                    entry["hasClaudeMd"] = (item / "CLAUDE.md").exists()
-                    entry["isGitRepo"] = (item / ".git").exists()
-                except OSError:
-                    pass  # FUSE/network mounts may timeout or refuse
-
-            entries.append(entry)
-
     except PermissionError:
         raise HTTPException(status_code=403, detail="Permission denied")
     except OSError as e:
@@ -144,7 +98,10 @@ async def list_directory(
     return {
         "path": path or "",
         "fullPath": str(target_path),
-        "entries": entries,
+        "entries": page.entries,
+        "total": page.total,
+        "offset": page.offset,
+        "nextOffset": page.next_offset,
     }
 
 
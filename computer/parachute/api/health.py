@@ -8,11 +8,13 @@ from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from parachute import __version__
 from parachute.config import get_settings
 from parachute.core.interfaces import get_registry
 from parachute.core.sandbox import DockerSandbox
+from parachute.lib.metrics import get_metrics
 
 router = APIRouter()
 
@@ -111,4 +113,35 @@ async def health_check(
         "docker": docker_info,
         "bots": bots,
         "uptime": time.time() - _start_time,
+        "metrics": get_metrics().summary(),
     }
+
+
+@router.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """
+    Performance metrics in the Prometheus text exposition format.
+
+    Request latency plus hot paths: Cypher queries, time to first token,
+    docker exec, MCP config loads, hook runs and bot queue wait.
+    """
+    return PlainTextResponse(
+        get_metrics().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@router.get("/health/ready")
+async def readiness(request: Request) -> JSONResponse:
+    """
+    Readiness check with per-subsystem startup state.
+
+    Returns 200 once every subsystem has settled (ready, failed, or
+    skipped), 503 while any is still starting. The body always lists
+    each subsystem's state and init duration.
+    """
+    startup = getattr(request.app.state, "startup", None)
+    if startup is None:
+        return JSONResponse(status_code=503, content={"ready": False, "subsystems": {}})
+    body = startup.to_dict()
+    return JSONResponse(status_code=200 if body["ready"] else 503, content=body)
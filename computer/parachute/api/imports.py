@@ -2,6 +2,7 @@
 Import API endpoints for Claude/ChatGPT exports.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
@@ -11,7 +12,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Query
 from pydantic import BaseModel
 
-from ..core.import_service import ImportService
+from ..core.import_service import ImportProgress, ImportResult, ImportService
 from ..models.session import Session, SessionSource
 
 router = APIRouter()
@@ -34,6 +35,45 @@ class ImportResponse(BaseModel):
     skipped_count: int
     errors: list[str]
     session_ids: list[str]
+    import_id: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, result: ImportResult) -> "ImportResponse":
+        return cls(
+            total_conversations=result.total_conversations,
+            imported_count=result.imported_count,
+            skipped_count=result.skipped_count,
+            errors=result.errors,
+            session_ids=result.session_ids,
+            import_id=result.import_id,
+        )
+
+
+class ImportProgressResponse(BaseModel):
+    """Checkpointed progress of a streaming import."""
+    import_id: str
+    source_name: str
+    processed: int
+    imported_count: int
+    skipped_count: int
+    error_count: int
+    done: bool
+    started_at: str
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_progress(cls, progress: ImportProgress) -> "ImportProgressResponse":
+        return cls(
+            import_id=progress.import_id,
+            source_name=progress.source_name,
+            processed=progress.processed,
+            imported_count=progress.imported_count,
+            skipped_count=progress.skipped_count,
+            error_count=len(progress.errors),
+            done=progress.done,
+            started_at=progress.started_at,
+            updated_at=progress.updated_at,
+        )
 
 
 class ImportJsonRequest(BaseModel):
@@ -69,13 +109,7 @@ async def import_from_json(
             archived=body.archived
         )
 
-        return ImportResponse(
-            total_conversations=result.total_conversations,
-            imported_count=result.imported_count,
-            skipped_count=result.skipped_count,
-            errors=result.errors,
-            session_ids=result.session_ids
-        )
+        return ImportResponse.from_result(result)
     except Exception as e:
         logger.error(f"Import failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Import failed: {e}")
@@ -86,32 +120,34 @@ async def import_from_file_upload(
     request: Request,
     file: UploadFile = File(...),
     archived: bool = Query(True, description="Mark imported sessions as archived"),
+    resume: bool = Query(True, description="Resume a previously interrupted upload of the same file"),
 ) -> ImportResponse:
     """
-    Import conversations from an uploaded JSON file.
+    Import conversations from an uploaded JSON file or export zip.
 
-    Upload a conversations.json file from Claude.ai or ChatGPT data export.
-    The service automatically detects the format.
+    Upload a conversations.json file (or the whole data-export .zip) from
+    Claude.ai or ChatGPT. The service automatically detects the format.
+    The upload is streamed from its spooled temp file rather than read into
+    memory, so multi-hundred-MB exports are fine.
     """
     import_service = get_import_service(request)
 
     try:
-        # Read and parse uploaded file
-        content = await file.read()
-        import json
-        data = json.loads(content.decode("utf-8"))
-
-        result = await import_service.import_from_json(data, archived=archived)
-
-        return ImportResponse(
-            total_conversations=result.total_conversations,
-            imported_count=result.imported_count,
-            skipped_count=result.skipped_count,
-            errors=result.errors,
-            session_ids=result.session_ids
+        # Keyed by content: same-named exports of equal size must not share a checkpoint
+        import_id = await asyncio.to_thread(ImportService.fingerprint_content, file.file)
+        result = await import_service.import_stream(
+            file.file,
+            archived=archived,
+            import_id=import_id,
+            source_name=file.filename or "upload",
+            resume=resume,
         )
-    except json.JSONDecodeError as e:
+
+        return ImportResponse.from_result(result)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid export: {e}")
     except Exception as e:
         logger.error(f"Import failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Import failed: {e}")
@@ -120,13 +156,15 @@ async def import_from_file_upload(
 @router.post("/import/path")
 async def import_from_path(
     request: Request,
-    path: str = Query(..., description="Path to conversations.json file"),
+    path: str = Query(..., description="Path to conversations.json file or export .zip"),
     archived: bool = Query(True, description="Mark imported sessions as archived"),
+    resume: bool = Query(True, description="Resume a previously interrupted import of this file"),
 ) -> ImportResponse:
     """
     Import conversations from a file path on the server.
 
     Useful for importing from ~/Parachute/imports/ or similar directories.
+    Zip archives are read in place without extracting.
     """
     import_service = get_import_service(request)
 
@@ -135,20 +173,43 @@ async def import_from_path(
         raise HTTPException(status_code=404, detail=f"File not found: {path}")
 
     try:
-        result = await import_service.import_from_file(path, archived=archived)
-
-        return ImportResponse(
-            total_conversations=result.total_conversations,
-            imported_count=result.imported_count,
-            skipped_count=result.skipped_count,
-            errors=result.errors,
-            session_ids=result.session_ids
+        result = await import_service.import_from_file(
+            path, archived=archived, resume=resume
         )
+
+        return ImportResponse.from_result(result)
+    except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid export: {e}")
     except Exception as e:
         logger.error(f"Import failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Import failed: {e}")
 
 
+@router.get("/import/progress")
+async def list_import_progress(request: Request) -> list[ImportProgressResponse]:
+    """List streaming import checkpoints, most recent first."""
+    import_service = get_import_service(request)
+    return [
+        ImportProgressResponse.from_progress(p)
+        for p in import_service.list_progress()
+    ]
+
+
+@router.get("/import/progress/{import_id}")
+async def get_import_progress(request: Request, import_id: str) -> ImportProgressResponse:
+    """
+    Get progress of a streaming import.
+
+    Checkpoints are written after every insert batch, so this can be polled
+    while a large import is running.
+    """
+    import_service = get_import_service(request)
+    progress = import_service.load_progress(import_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"Import not found: {import_id}")
+    return ImportProgressResponse.from_progress(progress)
+
+
 class SyncResponse(BaseModel):
     """Response from sync operation."""
     discovered: int
@@ -24,16 +24,7 @@ from typing import Any
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
-from parachute.core.vault_tools import (
-    VAULT_TOOLS,
-    search_memory as _search_memory,
-    search_chats as _search_chats,
-    list_chats as _list_chats,
-    list_notes as _list_notes,
-    get_chat as _get_chat,
-    get_exchange as _get_exchange,
-    write_note as _write_note,
-)
+from parachute.core.vault_tools import VAULT_TOOL_NAMES, VAULT_TOOLS, call_vault_tool
 
 logger = logging.getLogger(__name__)
 
@@ -218,67 +209,12 @@ async def _handle_vault_tool(name: str, arguments: dict[str, Any]) -> str:
     if graph is None:
         return json.dumps({"error": "BrainDB not available"})
 
-    if name == "search_memory":
-        result = await _search_memory(
-            graph,
-            query=arguments["query"],
-            source=arguments.get("source"),
-            date_from=arguments.get("date_from"),
-            date_to=arguments.get("date_to"),
-            limit=arguments.get("limit", 10),
-        )
-    elif name == "search_chats":
-        result = await _search_chats(
-            graph,
-            query=arguments["query"],
-            limit=arguments.get("limit", 10),
-            module=arguments.get("module"),
-        )
-    elif name == "list_chats":
-        result = await _list_chats(
-            graph,
-            module=arguments.get("module"),
-            limit=arguments.get("limit", 20),
-            archived=arguments.get("archived", False),
-            search=arguments.get("search"),
-        )
-    elif name == "list_notes":
-        result = await _list_notes(
-            graph,
-            date_from=arguments.get("date_from"),
-            date_to=arguments.get("date_to"),
-            limit=arguments.get("limit", 20),
-            note_type=arguments.get("note_type"),
-            search=arguments.get("search"),
-        )
-    elif name == "get_chat":
-        result = await _get_chat(
-            graph,
-            session_id=arguments["session_id"],
-            exchange_limit=arguments.get("exchange_limit", 25),
-            max_chars=arguments.get("max_chars", 2000),
-        )
-    elif name == "get_exchange":
-        result = await _get_exchange(
-            graph,
-            exchange_id=arguments["exchange_id"],
-        )
-    elif name == "write_note":
-        result = await _write_note(
-            graph,
-            note_type=arguments["note_type"],
-            title=arguments["title"],
-            content=arguments["content"],
-            date=arguments.get("date"),
-        )
-    else:
-        return json.dumps({"error": f"Unknown vault tool: {name}"})
-
+    result = await call_vault_tool(graph, name, arguments)
     return json.dumps(result, default=str)
 
 
 # Vault tool names for dispatch
-_VAULT_TOOL_NAMES = {"search_memory", "search_chats", "list_chats", "list_notes", "get_chat", "get_exchange", "write_note"}
+_VAULT_TOOL_NAMES = VAULT_TOOL_NAMES
 
 
 # ── Handler Dispatch ──────────────────────────────────────────────────────────
@@ -33,6 +33,7 @@ async def get_scheduler_info() -> dict[str, Any]:
     - running: Whether the scheduler is active
     - jobs: List of scheduled jobs with next run times
     - agents: Configuration for all daily agents
+    - run_queue: Governor state — running and queued agent runs, concurrency limit
     - config: Legacy field
     """
     return await get_scheduler_status(Path.home())
@@ -2,11 +2,14 @@
 Session management API endpoints.
 """
 
+import base64
+import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 router = APIRouter()
@@ -63,42 +66,82 @@ def get_orchestrator(request: Request):
     return orchestrator
 
 
+def _encode_cursor(cursor: tuple[str, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(cursor)).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, session_id = json.loads(base64.urlsafe_b64decode(padded))
+        return str(ts), str(session_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
 @router.get("/chat")
 async def list_sessions(
     request: Request,
+    response: Response,
     module: Optional[str] = Query(None, description="Filter by module"),
     search: Optional[str] = Query(None, description="Search sessions by title"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     archived: Optional[bool] = Query(None, description="Filter by archived status"),
-) -> dict[str, Any]:
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated session fields to return"),
+):
     """
-    List all sessions.
+    List all sessions, most recently accessed first.
 
     Query params:
     - module: Filter by module (chat, daily, build)
     - search: Search sessions by title (case-insensitive LIKE match)
     - limit: Maximum number of sessions to return
-    - offset: Number of sessions to skip
+    - cursor: Resume after the previous page (keyset on lastAccessed, id)
+    - offset: Number of sessions to skip (legacy; ignored with cursor)
     - archived: Filter by archived status
+    - fields: Only return these fields, e.g. "id,title,lastAccessed,archived"
+
+    The response carries a weak ETag that changes whenever any session is
+    written; send it back as If-None-Match to get 304 Not Modified.
     """
-    orchestrator = get_orchestrator(request)
+    db = request.app.state.session_store
+    if not db:
+        raise HTTPException(status_code=503, detail="Database not ready")
+
+    query_key = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{db.sessions_version}?{query_key}".encode()).hexdigest()[:20]
+    etag = f'W/"{digest}"'
+    if etag in {t.strip() for t in request.headers.get("if-none-match", "").split(",")}:
+        return Response(status_code=304, headers={"ETag": etag})
 
     # If archived is not specified, default to showing non-archived
     show_archived = archived if archived is not None else False
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    after = _decode_cursor(cursor) if cursor else None
 
     try:
-        sessions = await orchestrator.list_sessions(
+        sessions, next_cursor = await db.list_session_page(
             module=module,
             archived=show_archived,
             search=search,
             limit=limit,
+            after=after,
+            offset=offset,
+            fields=field_list,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list sessions: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Session list error: {e}")
 
-    return {"sessions": sessions}
+    response.headers["ETag"] = etag
+    return {
+        "sessions": sessions,
+        "nextCursor": _encode_cursor(next_cursor) if next_cursor else None,
+    }
 
 
 # NOTE: /chat/stats must be BEFORE /chat/{session_id} to avoid "stats" being treated as a session_id
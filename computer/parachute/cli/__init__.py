@@ -0,0 +1,193 @@
+"""
+Parachute CLI.
+
+Usage:
+    parachute install                  # First-time setup + daemon install
+    parachute update                   # Pull latest code, reinstall, restart
+    parachute server restart           # Reinstall deps + restart server
+    parachute server                   # Start daemon (background)
+    parachute server --foreground      # Start in foreground (dev mode)
+    parachute server stop              # Stop daemon
+    parachute server restart           # Restart daemon
+    parachute server status            # Daemon state
+    parachute logs                     # Tail daemon logs
+    parachute doctor                   # Run diagnostics
+    parachute config show              # Show current config
+    parachute config set KEY VALUE     # Set a config value
+    parachute config get KEY           # Get a config value
+    parachute status                   # System overview
+    parachute module list              # List modules (offline)
+    parachute module approve NAME      # Approve a module (offline)
+    parachute module status            # Show live server status (online)
+    parachute module test [NAME]       # Test module endpoints (online)
+    parachute bot status               # Show bot connector status
+    parachute bot start <platform>     # Start a bot connector
+    parachute bot stop <platform>      # Stop a bot connector
+    parachute bot config               # Show bot configuration
+    parachute bot config set KEY VAL   # Set bot config (e.g. telegram.bot_token)
+    parachute bot approve [ID]         # Approve pending user (list if no ID)
+    parachute bot deny ID              # Deny a pending user
+    parachute bot users                # List approved users
+    parachute setup github             # Configure GitHub App credential broker
+    parachute sandbox clean-cache      # Remove shared package cache volumes
+    parachute sandbox inspect          # Inspect sandbox configuration and containers
+
+Each command lives in its own module under parachute.cli and is imported
+only when that command runs, so `--help`, `status` and `logs` don't pay
+for yaml, pydantic settings or the server stack.
+"""
+
+import argparse
+import importlib
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="parachute",
+        description="Parachute — local-first AI computer",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    # install
+    install_parser = subparsers.add_parser("install", help="First-time setup + daemon install")
+    install_parser.set_defaults(handler="install:cmd_install")
+
+    # update
+    update_parser = subparsers.add_parser("update", help="Pull latest code, reinstall, restart")
+    update_parser.set_defaults(handler="install:cmd_update")
+
+    # status
+    status_parser = subparsers.add_parser("status", help="Show system status")
+    status_parser.set_defaults(handler="status:cmd_status")
+
+    # server subcommand
+    server_parser = subparsers.add_parser("server", help="Server management")
+    server_parser.set_defaults(handler="server:cmd_server")
+    server_parser.add_argument(
+        "--foreground", "-f", action="store_true",
+        help="Run in foreground (dev mode)",
+    )
+    server_sub = server_parser.add_subparsers(dest="action")
+    server_sub.add_parser("stop", help="Stop the daemon")
+    server_sub.add_parser("restart", help="Restart the daemon")
+    server_sub.add_parser("status", help="Show daemon status")
+
+    # logs
+    logs_parser = subparsers.add_parser("logs", help="Tail daemon logs")
+    logs_parser.set_defaults(handler="logs:cmd_logs")
+    logs_parser.add_argument(
+        "--lines", "-n", type=int, default=50,
+        help="Number of lines to show (default: 50)",
+    )
+    logs_parser.add_argument(
+        "--no-follow", action="store_true",
+        help="Don't follow (just print and exit)",
+    )
+
+    # doctor
+    doctor_parser = subparsers.add_parser("doctor", help="Run diagnostics")
+    doctor_parser.set_defaults(handler="doctor:cmd_doctor")
+
+    # config subcommand
+    config_parser = subparsers.add_parser("config", help="Configuration management")
+    config_parser.set_defaults(handler="config:cmd_config")
+    config_sub = config_parser.add_subparsers(dest="action")
+    config_sub.add_parser("show", help="Show current config")
+    config_set_parser = config_sub.add_parser("set", help="Set a config value")
+    config_set_parser.add_argument("key", help="Config key")
+    config_set_parser.add_argument("value", help="Config value")
+    config_get_parser = config_sub.add_parser("get", help="Get a config value")
+    config_get_parser.add_argument("key", help="Config key")
+
+    # module subcommand
+    module_parser = subparsers.add_parser("module", help="Module management")
+    module_parser.set_defaults(usage=module_parser.print_help)
+    module_sub = module_parser.add_subparsers(dest="action")
+    list_parser = module_sub.add_parser("list", help="List modules (offline)")
+    list_parser.set_defaults(handler="module:cmd_module_list")
+    approve_parser = module_sub.add_parser("approve", help="Approve a module (offline)")
+    approve_parser.set_defaults(handler="module:cmd_module_approve")
+    approve_parser.add_argument("name", help="Module name to approve")
+    module_status_parser = module_sub.add_parser("status", help="Show live server status (online)")
+    module_status_parser.set_defaults(handler="module:cmd_module_status")
+    test_parser = module_sub.add_parser("test", help="Test module endpoints (online)")
+    test_parser.set_defaults(handler="module:cmd_module_test")
+    test_parser.add_argument("name", nargs="?", help="Specific module to test")
+
+    # bot subcommand
+    bot_parser = subparsers.add_parser("bot", help="Bot connector management")
+    bot_parser.set_defaults(handler="bot:cmd_bot")
+    bot_sub = bot_parser.add_subparsers(dest="action")
+    bot_sub.add_parser("status", help="Show bot connector status")
+    bot_start_parser = bot_sub.add_parser("start", help="Start a bot connector")
+    bot_start_parser.add_argument("platform", choices=["telegram", "discord", "matrix"])
+    bot_stop_parser = bot_sub.add_parser("stop", help="Stop a bot connector")
+    bot_stop_parser.add_argument("platform", choices=["telegram", "discord", "matrix"])
+
+    bot_config_parser = bot_sub.add_parser("config", help="Bot configuration")
+    bot_config_sub = bot_config_parser.add_subparsers(dest="config_action")
+    bot_config_set_parser = bot_config_sub.add_parser("set", help="Set a config value")
+    bot_config_set_parser.add_argument("key", help="Config key (e.g. telegram.bot_token)")
+    bot_config_set_parser.add_argument("value", help="Config value")
+
+    bot_approve_parser = bot_sub.add_parser("approve", help="Approve a pending pairing request")
+    bot_approve_parser.add_argument("request_id", nargs="?", help="Request ID (list all if omitted)")
+    bot_deny_parser = bot_sub.add_parser("deny", help="Deny a pairing request")
+    bot_deny_parser.add_argument("request_id", help="Request ID to deny")
+    bot_sub.add_parser("users", help="List approved users across platforms")
+
+    # supervisor subcommand
+    supervisor_parser = subparsers.add_parser("supervisor", help="Supervisor daemon management")
+    supervisor_parser.set_defaults(handler="supervisor:cmd_supervisor")
+    supervisor_sub = supervisor_parser.add_subparsers(dest="action")
+    supervisor_sub.add_parser("start", help="Start supervisor daemon")
+    supervisor_sub.add_parser("stop", help="Stop supervisor daemon")
+    supervisor_sub.add_parser("restart", help="Restart supervisor daemon")
+    supervisor_sub.add_parser("status", help="Check supervisor status")
+    supervisor_sub.add_parser("install", help="Install supervisor daemon")
+    supervisor_sub.add_parser("uninstall", help="Remove supervisor daemon")
+
+    # setup subcommand
+    setup_parser = subparsers.add_parser("setup", help="Setup credential providers")
+    setup_parser.set_defaults(handler="setup:cmd_setup")
+    setup_sub = setup_parser.add_subparsers(dest="action")
+    setup_sub.add_parser("github", help="Configure GitHub App for git push, gh CLI")
+    setup_sub.add_parser("cloudflare", help="Configure Cloudflare API tokens")
+
+    # sandbox subcommand
+    sandbox_parser = subparsers.add_parser("sandbox", help="Sandbox management")
+    sandbox_parser.set_defaults(handler="sandbox:cmd_sandbox")
+    sandbox_sub = sandbox_parser.add_subparsers(dest="action")
+    sandbox_sub.add_parser("clean-cache", help="Remove shared package cache volumes")
+    sandbox_sub.add_parser("inspect", help="Inspect sandbox configuration and containers")
+
+    # tools subcommand
+    tools_parser = subparsers.add_parser("tools", help="Manage shared tools volume")
+    tools_parser.set_defaults(handler="sandbox:cmd_tools")
+    tools_sub = tools_parser.add_subparsers(dest="action")
+    tools_install = tools_sub.add_parser("install", help="Install pip packages into shared tools volume")
+    tools_install.add_argument("packages", nargs="+", help="Package(s) to install")
+    tools_sub.add_parser("list", help="List packages installed in shared tools volume")
+
+    # help (alias for --help)
+    subparsers.add_parser("help", help="Show this help message")
+
+    return parser
+
+
+def main() -> None:
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    # Handlers are "module:function" names under parachute.cli, imported on use
+    handler = getattr(args, "handler", None)
+    if handler is None:
+        getattr(args, "usage", parser.print_help)()
+        return
+
+    if args.command == "logs":
+        args.follow = not getattr(args, "no_follow", False)
+
+    module_name, func_name = handler.split(":")
+    module = importlib.import_module(f"parachute.cli.{module_name}")
+    getattr(module, func_name)(args)
@@ -0,0 +1,144 @@
+"""Shared helpers for CLI commands: paths, .env, HTTP and process utilities."""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import time
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+
+def _get_parachute_dir() -> Path:
+    """Return the Parachute system directory (~/.parachute)."""
+    return Path.home() / ".parachute"
+
+
+def _get_server_url() -> str:
+    """Resolve server URL from PORT env or default."""
+    port = os.environ.get("PORT", "3333")
+    return f"http://localhost:{port}"
+
+
+def _get_env_file() -> Path:
+    """Get the .env file path (in CWD)."""
+    return Path.cwd() / ".env"
+
+
+def _load_env_file(env_file: Path | None = None) -> dict[str, str]:
+    """Load key=value pairs from .env file (default: .env in CWD)."""
+    env_file = env_file or _get_env_file()
+    env = {}
+    if env_file.exists():
+        for line in env_file.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line:
+                key, _, value = line.partition("=")
+                env[key.strip()] = value.strip()
+    return env
+
+
+def _save_env_file(env: dict[str, str]) -> Path:
+    """Save key=value pairs to .env file."""
+    env_file = _get_env_file()
+    lines = []
+    for key, value in sorted(env.items()):
+        lines.append(f"{key}={value}")
+    env_file.write_text("\n".join(lines) + "\n")
+    return env_file
+
+
+def _api_get(url: str, timeout: int = 5) -> dict:
+    """Make a GET request to the server API."""
+    req = Request(url)
+    req.add_header("Accept", "application/json")
+    with urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def _api_post(url: str, data: dict | None = None) -> dict:
+    """Make a POST request to the server API."""
+    body = json.dumps(data or {}).encode()
+    req = Request(url, data=body, method="POST")
+    req.add_header("Content-Type", "application/json")
+    req.add_header("Accept", "application/json")
+    with urlopen(req, timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def _api_put(url: str, data: dict) -> dict:
+    """Make a PUT request to the server API."""
+    body = json.dumps(data).encode()
+    req = Request(url, data=body, method="PUT")
+    req.add_header("Content-Type", "application/json")
+    req.add_header("Accept", "application/json")
+    with urlopen(req, timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+def _port_in_use(port: int) -> bool:
+    """Check if a port is already in use."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        return s.connect_ex(("127.0.0.1", port)) == 0
+
+
+def _find_port_pid(port: int) -> int | None:
+    """Find the PID of the process listening on a port. Returns None if not found."""
+    try:
+        result = subprocess.run(
+            ["lsof", "-ti", f":{port}"],
+            capture_output=True, text=True, timeout=5,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            # lsof may return multiple PIDs (one per line); take the first
+            return int(result.stdout.strip().splitlines()[0])
+    except Exception:
+        pass
+    return None
+
+
+def _kill_port_holder(port: int) -> bool:
+    """Kill whatever process is holding a port. Returns True if a process was killed."""
+    pid = _find_port_pid(port)
+    if pid is None:
+        return False
+    try:
+        print(f"Killing stale process on port {port} (PID {pid})...")
+        os.kill(pid, signal.SIGTERM)
+        # Wait for clean shutdown
+        for _ in range(10):
+            if not _process_alive(pid):
+                return True
+            time.sleep(0.5)
+        # Force kill
+        os.kill(pid, signal.SIGKILL)
+        time.sleep(0.5)
+        return not _process_alive(pid)
+    except (OSError, ProcessLookupError):
+        return True
+
+
+def _process_alive(pid: int) -> bool:
+    """Check if a process is alive."""
+    try:
+        os.kill(pid, 0)
+        return True
+    except (OSError, ProcessLookupError):
+        return False
+
+
+
+def _get_repo_dir() -> Path:
+    """Find the repo root from the installed package location."""
+    import parachute as pkg
+
+    # Editable install: parachute/__init__.py is inside the repo
+    pkg_dir = Path(pkg.__file__).parent  # parachute/
+    repo_dir = pkg_dir.parent            # computer/
+    if (repo_dir / "pyproject.toml").exists():
+        return repo_dir
+    # Fallback: CWD
+    return Path.cwd()
@@ -0,0 +1,377 @@
+"""parachute bot."""
+
+import argparse
+import os
+import sys
+from urllib.error import URLError
+
+import yaml
+
+from parachute.cli._common import (
+    _api_get,
+    _api_post,
+    _api_put,
+    _get_parachute_dir,
+    _get_server_url,
+)
+
+
+def cmd_bot(args: argparse.Namespace) -> None:
+    """Bot connector management."""
+    action = getattr(args, "action", None)
+
+    if action == "status":
+        _bot_status()
+    elif action == "start":
+        _bot_start(args.platform)
+    elif action == "stop":
+        _bot_stop(args.platform)
+    elif action == "config":
+        sub = getattr(args, "config_action", None)
+        if sub == "set":
+            _bot_config_set(args.key, args.value)
+        else:
+            _bot_config_show()
+    elif action == "approve":
+        _bot_approve(getattr(args, "request_id", None))
+    elif action == "deny":
+        _bot_deny(args.request_id)
+    elif action == "users":
+        _bot_users()
+    else:
+        print("Usage: parachute bot {status|start|stop|config|approve|deny|users}")
+
+
+def _bot_status() -> None:
+    """Show bot connector status — tries server API, falls back to config file."""
+    server_url = _get_server_url()
+
+    try:
+        data = _api_get(f"{server_url}/api/bots/status")
+        connectors = data.get("connectors", {})
+
+        print("\nBot Connectors")
+        print("-" * 40)
+
+        for platform, info in connectors.items():
+            running = info.get("running", False)
+            enabled = info.get("enabled", False)
+            has_token = info.get("has_token", False)
+
+            if running:
+                state = "running"
+            elif enabled and has_token:
+                state = "enabled (stopped)"
+            elif enabled:
+                state = "enabled (no token)"
+            else:
+                state = "disabled"
+
+            print(f"  {platform}: {state}")
+            if has_token:
+                print(f"    token: configured")
+            users_count = info.get("allowed_users_count", info.get("allowed_guilds_count", 0))
+            if users_count:
+                print(f"    allowed users: {users_count}")
+
+        print()
+
+    except (URLError, OSError):
+        # Offline fallback — read bots.yaml directly
+        parachute_dir = _get_parachute_dir()
+        config_path = parachute_dir / "bots.yaml"
+
+        if not config_path.exists():
+            print("No bot configuration found.")
+            print("Tip: Configure bots in Settings or run 'parachute bot config set telegram.bot_token <token>'")
+            return
+
+        try:
+            with open(config_path) as f:
+                data = yaml.safe_load(f) or {}
+
+            print("\nBot Configuration (offline — server not running)")
+            print("-" * 40)
+
+            for platform in ("telegram", "discord", "matrix"):
+                cfg = data.get(platform, {})
+                enabled = cfg.get("enabled", False)
+                has_token = bool(cfg.get("bot_token", "") or cfg.get("access_token", ""))
+                print(f"  {platform}: {'enabled' if enabled else 'disabled'}")
+                if has_token:
+                    print(f"    token: configured")
+        except Exception as e:
+            print(f"Error reading bot config: {e}")
+
+
+def _bot_start(platform: str) -> None:
+    """Start a bot connector via the server API."""
+    if platform not in ("telegram", "discord", "matrix"):
+        print(f"Unknown platform: {platform}")
+        print("Valid platforms: telegram, discord, matrix")
+        sys.exit(1)
+
+    server_url = _get_server_url()
+    try:
+        result = _api_post(f"{server_url}/api/bots/{platform}/start")
+        if result.get("success"):
+            print(f"{platform} connector started.")
+        else:
+            print(f"Start failed: {result.get('error', 'unknown error')}")
+            sys.exit(1)
+    except URLError as e:
+        print(f"Cannot connect to server: {e}")
+        print("Is the server running? Try: parachute server status")
+        sys.exit(1)
+
+
+def _bot_stop(platform: str) -> None:
+    """Stop a bot connector via the server API."""
+    if platform not in ("telegram", "discord", "matrix"):
+        print(f"Unknown platform: {platform}")
+        print("Valid platforms: telegram, discord, matrix")
+        sys.exit(1)
+
+    server_url = _get_server_url()
+    try:
+        result = _api_post(f"{server_url}/api/bots/{platform}/stop")
+        if result.get("success"):
+            print(f"{platform} connector stopped.")
+        else:
+            print(f"Stop failed: {result.get('error', 'unknown error')}")
+            sys.exit(1)
+    except URLError as e:
+        print(f"Cannot connect to server: {e}")
+        sys.exit(1)
+
+
+def _bot_config_show() -> None:
+    """Show bot configuration."""
+    server_url = _get_server_url()
+
+    try:
+        data = _api_get(f"{server_url}/api/bots/config")
+    except (URLError, OSError):
+        # Offline fallback
+        parachute_dir = _get_parachute_dir()
+        config_path = parachute_dir / "bots.yaml"
+        if not config_path.exists():
+            print("No bot configuration found.")
+            return
+        with open(config_path) as f:
+            data = yaml.safe_load(f) or {}
+
+    print("\nBot Configuration")
+    print("-" * 40)
+
+    for platform in ("telegram", "discord", "matrix"):
+        cfg = data.get(platform, {})
+        print(f"\n  {platform}:")
+
+        has_token = cfg.get("has_token", bool(cfg.get("bot_token", "") or cfg.get("access_token", "")))
+        enabled = cfg.get("enabled", False)
+        print(f"    enabled: {enabled}")
+        print(f"    token: {'configured' if has_token else 'not set'}")
+
+        dm_trust = cfg.get("dm_trust_level", "sandboxed")
+        group_trust = cfg.get("group_trust_level", "sandboxed")
+        print(f"    dm_trust_level: {dm_trust}")
+        print(f"    group_trust_level: {group_trust}")
+
+        # Platform-specific fields
+        if platform == "telegram":
+            users = cfg.get("allowed_users", [])
+            if users:
+                print(f"    allowed_users: {', '.join(str(u) for u in users)}")
+        elif platform == "discord":
+            guilds = cfg.get("allowed_guilds", [])
+            if guilds:
+                print(f"    allowed_guilds: {', '.join(guilds)}")
+        elif platform == "matrix":
+            rooms = cfg.get("allowed_rooms", [])
+            if rooms:
+                print(f"    allowed_rooms: {', '.join(rooms)}")
+            homeserver = cfg.get("homeserver_url", "")
+            if homeserver:
+                print(f"    homeserver_url: {homeserver}")
+            user_id = cfg.get("user_id", "")
+            if user_id:
+                print(f"    user_id: {user_id}")
+
+    print()
+
+
+def _bot_config_set(key: str, value: str) -> None:
+    """Set a bot config value. Key format: platform.field (e.g. telegram.bot_token)."""
+    parts = key.split(".", 1)
+    if len(parts) != 2 or parts[0] not in ("telegram", "discord", "matrix"):
+        print(f"Invalid key: {key}")
+        print("Format: <platform>.<field>  (e.g. telegram.bot_token, discord.enabled)")
+        sys.exit(1)
+
+    platform, field = parts
+
+    valid_fields = {"enabled", "bot_token", "access_token", "homeserver_url", "user_id", "device_id", "allowed_users", "allowed_guilds", "allowed_rooms", "dm_trust_level", "group_trust_level"}
+    if field not in valid_fields:
+        print(f"Unknown field: {field}")
+        print(f"Valid fields: {', '.join(sorted(valid_fields))}")
+        sys.exit(1)
+
+    # Build update payload
+    update: dict = {}
+    if field == "enabled":
+        update["enabled"] = value.lower() in ("true", "1", "yes")
+    elif field == "bot_token":
+        update["bot_token"] = value
+    elif field == "allowed_users":
+        if platform == "telegram":
+            update["allowed_users"] = [int(x.strip()) for x in value.split(",") if x.strip()]
+        else:
+            update["allowed_users"] = [x.strip() for x in value.split(",") if x.strip()]
+    elif field == "allowed_guilds":
+        update["allowed_guilds"] = [x.strip() for x in value.split(",") if x.strip()]
+    elif field == "allowed_rooms":
+        update["allowed_rooms"] = [x.strip() for x in value.split(",") if x.strip()]
+    elif field == "access_token":
+        update["access_token"] = value
+    elif field == "homeserver_url":
+        update["homeserver_url"] = value
+    elif field == "user_id":
+        update["user_id"] = value
+    elif field == "device_id":
+        update["device_id"] = value
+    elif field in ("dm_trust_level", "group_trust_level"):
+        if value not in ("direct", "sandboxed"):
+            print(f"Invalid trust level: {value}")
+            print("Valid levels: direct, sandboxed")
+            sys.exit(1)
+        update[field] = value
+
+    server_url = _get_server_url()
+    try:
+        result = _api_put(f"{server_url}/api/bots/config", {platform: update})
+        print(f"Set {key} = {value}")
+    except URLError:
+        # Offline: write directly to bots.yaml
+        parachute_dir = _get_parachute_dir()
+        config_path = parachute_dir / "bots.yaml"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        existing = {}
+        if config_path.exists():
+            with open(config_path) as f:
+                existing = yaml.safe_load(f) or {}
+
+        if platform not in existing:
+            existing[platform] = {}
+
+        # Convert the update value for YAML
+        if field == "enabled":
+            existing[platform][field] = value.lower() in ("true", "1", "yes")
+        elif field == "allowed_users" and platform == "telegram":
+            existing[platform][field] = [int(x.strip()) for x in value.split(",") if x.strip()]
+        elif field in ("allowed_users", "allowed_guilds"):
+            existing[platform][field] = [x.strip() for x in value.split(",") if x.strip()]
+        else:
+            existing[platform][field] = value
+
+        with open(config_path, "w") as f:
+            yaml.safe_dump(existing, f, default_flow_style=False)
+        os.chmod(config_path, 0o600)
+
+        print(f"Set {key} = {value} (written to bots.yaml)")
+        print("Note: Restart the server for changes to take effect.")
+
+
+def _bot_approve(request_id: str | None) -> None:
+    """Approve a pending pairing request. Lists pending if no ID given."""
+    server_url = _get_server_url()
+
+    try:
+        data = _api_get(f"{server_url}/api/bots/pairing")
+    except URLError as e:
+        print(f"Cannot connect to server: {e}")
+        sys.exit(1)
+
+    requests = data.get("requests", [])
+
+    if not request_id:
+        # List pending requests
+        if not requests:
+            print("No pending pairing requests.")
+            return
+
+        print("\nPending Pairing Requests")
+        print("-" * 40)
+        for r in requests:
+            rid = r.get("id", "")
+            display = r.get("platformUserDisplay", r.get("platform_user_display", "Unknown"))
+            platform = r.get("platform", "?")
+            user_id = r.get("platformUserId", r.get("platform_user_id", "?"))
+            print(f"  [{rid[:8]}] {display} on {platform} (ID: {user_id})")
+            print(f"           Full ID: {rid}")
+        print(f"\nApprove with: parachute bot approve <id>")
+        return
+
+    # Approve specific request
+    try:
+        result = _api_post(f"{server_url}/api/bots/pairing/{request_id}/approve", {"trust_level": "sandboxed"})
+        if result.get("success"):
+            print(f"Approved: {request_id}")
+        else:
+            print(f"Approval failed: {result}")
+            sys.exit(1)
+    except URLError as e:
+        print(f"Failed: {e}")
+        sys.exit(1)
+
+
+def _bot_deny(request_id: str) -> None:
+    """Deny a pairing request."""
+    server_url = _get_server_url()
+
+    try:
+        result = _api_post(f"{server_url}/api/bots/pairing/{request_id}/deny")
+        if result.get("success"):
+            print(f"Denied: {request_id}")
+        else:
+            print(f"Denial failed: {result}")
+            sys.exit(1)
+    except URLError as e:
+        print(f"Failed: {e}")
+        sys.exit(1)
+
+
+def _bot_users() -> None:
+    """List approved users across platforms."""
+    server_url = _get_server_url()
+
+    try:
+        data = _api_get(f"{server_url}/api/bots/config")
+    except (URLError, OSError):
+        # Offline fallback
+        parachute_dir = _get_parachute_dir()
+        config_path = parachute_dir / "bots.yaml"
+        if not config_path.exists():
+            print("No bot configuration found.")
+            return
+        with open(config_path) as f:
+            data = yaml.safe_load(f) or {}
+
+    print("\nApproved Bot Users")
+    print("-" * 40)
+
+    any_users = False
+    for platform in ("telegram", "discord", "matrix"):
+        cfg = data.get(platform, {})
+        users = cfg.get("allowed_users", [])
+        if users:
+            any_users = True
+            print(f"\n  {platform}:")
+            for u in users:
+                print(f"    {u}")
+
+    if not any_users:
+        print("  No approved users.")
+
+    print()
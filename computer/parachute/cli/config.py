@@ -0,0 +1,111 @@
+"""parachute config show|set|get."""
+
+import argparse
+import os
+import sys
+
+from parachute.cli._common import _get_parachute_dir
+from parachute.lib.config_file import (
+    CONFIG_KEYS,
+    _load_yaml_config,
+    get_config_path,
+    save_token,
+    save_yaml_config,
+)
+
+
+def cmd_config(args: argparse.Namespace) -> None:
+    """Config management: show, set, get."""
+    action = getattr(args, "action", None)
+
+    if action == "show":
+        _config_show()
+    elif action == "set":
+        _config_set(args.key, args.value)
+    elif action == "get":
+        _config_get(args.key)
+    else:
+        print("Usage: parachute config {show|set|get}")
+
+
+def _config_show() -> None:
+    """Show current config with effective values."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+
+    print(f"\nConfig: {get_config_path(parachute_dir)}")
+    print("-" * 40)
+
+    if not config:
+        print("  (empty — run 'parachute install' to configure)")
+        return
+
+    for key, value in config.items():
+        # Mask token-like values
+        display = value
+        if isinstance(value, str) and ("token" in key.lower() or "key" in key.lower()):
+            if len(value) > 12:
+                display = value[:12] + "..."
+
+        # Note env var overrides
+        env_val = os.environ.get(key.upper()) or os.environ.get(key)
+        override = f" (overridden by env: {key.upper()})" if env_val else ""
+        print(f"  {key}: {display}{override}")
+
+    # Show token status
+    from parachute.lib.config_file import _load_token
+
+    token = _load_token(parachute_dir)
+    print(f"\n  token: {'configured' if token else 'not set'} ({parachute_dir / '.token'})")
+
+
+def _config_set(key: str, value: str) -> None:
+    """Set a config value."""
+    if key in ("token", "claude_code_oauth_token"):
+        parachute_dir = _get_parachute_dir()
+        save_token(parachute_dir, value)
+        masked = value[:12] + "..." if len(value) > 12 else "***"
+        print(f"Token saved to {parachute_dir / '.token'} ({masked})")
+        print("Note: Restart the server for the new token to take effect.")
+        return
+
+    if key not in CONFIG_KEYS:
+        print(f"Unknown key: {key}")
+        print(f"Valid keys: {', '.join(sorted(CONFIG_KEYS))}")
+        sys.exit(1)
+
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+
+    # Type conversion
+    if key == "port":
+        try:
+            value = int(value)
+        except ValueError:
+            print(f"Error: port must be an integer, got '{value}'")
+            sys.exit(1)
+    elif key == "debug":
+        value = value.lower() in ("true", "1", "yes")
+
+    config[key] = value
+    save_yaml_config(parachute_dir, config)
+    print(f"Set {key} = {value}")
+    print("Note: Restart the server for changes to take effect.")
+
+
+def _config_get(key: str) -> None:
+    """Get a single config value."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+
+    # Check env override first
+    env_val = os.environ.get(key.upper()) or os.environ.get(key)
+    if env_val:
+        print(env_val)
+        return
+
+    if key in config:
+        print(config[key])
+    else:
+        print(f"Key '{key}' not set in config.yaml")
+        sys.exit(1)
@@ -0,0 +1,172 @@
+"""parachute doctor."""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+from parachute.cli._common import _api_get, _get_parachute_dir, _port_in_use
+from parachute.lib.config_file import _load_yaml_config, get_config_path
+
+
+def cmd_doctor(args: argparse.Namespace) -> None:
+    """Run diagnostics and report pass/warn/fail for each check."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+    port = config.get("port", 3333)
+    results = []
+
+    def check(name: str, fn):
+        try:
+            ok, detail = fn()
+            status = "PASS" if ok else "WARN"
+            results.append((status, name, detail))
+        except Exception as e:
+            results.append(("FAIL", name, str(e)))
+
+    # 1. Python version
+    def check_python():
+        v = sys.version_info
+        version_str = f"{v.major}.{v.minor}.{v.micro}"
+        if v >= (3, 11, 4):
+            return True, version_str
+        return False, f"{version_str} (requires >= 3.11.4)"
+
+    check("Python version", check_python)
+
+    # 2. Package import
+    def check_package():
+        try:
+            import parachute  # noqa: F401
+            return True, "parachute importable"
+        except ImportError as e:
+            return False, str(e)
+
+    check("Package installed", check_package)
+
+    # 3. Config dir
+    def check_config_dir():
+        if not parachute_dir.exists():
+            return False, f"{parachute_dir} does not exist (run: parachute install)"
+        if not os.access(parachute_dir, os.W_OK):
+            return False, f"{parachute_dir} not writable"
+        return True, str(parachute_dir)
+
+    check("Config dir", check_config_dir)
+
+    # 4. Config file
+    def check_config():
+        config_file = get_config_path(parachute_dir)
+        if not config_file.exists():
+            return False, "config.yaml not found (run: parachute install)"
+        try:
+            with open(config_file) as f:
+                yaml.safe_load(f)
+            return True, str(config_file)
+        except Exception as e:
+            return False, f"config.yaml parse error: {e}"
+
+    check("Config file", check_config)
+
+    # 5. Token
+    def check_token():
+        from parachute.lib.config_file import _load_token
+
+        token = _load_token(parachute_dir) or os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
+        if token:
+            return True, f"{token[:12]}..."
+        return False, (
+            "no token found\n"
+            "      Fix: Run `claude setup-token` then `parachute config set token <value>`\n"
+            "      Or: Paste in Settings > Claude Authentication"
+        )
+
+    check("Claude token", check_token)
+
+    # 6. Docker
+    def check_docker():
+        docker_path = shutil.which("docker")
+        if not docker_path:
+            if sys.platform == "darwin":
+                hint = "install: brew install orbstack  OR  brew install --cask docker"
+            else:
+                hint = "install: curl -fsSL https://get.docker.com | sh"
+            return False, f"not found ({hint})"
+        result = subprocess.run(
+            ["docker", "info"],
+            capture_output=True,
+            timeout=5,
+        )
+        if result.returncode != 0:
+            if sys.platform == "darwin":
+                hint = "start Docker Desktop or OrbStack; install: brew install orbstack"
+            else:
+                hint = "start: sudo systemctl start docker"
+            return False, f"not running ({hint})"
+
+        # Check sandbox image
+        result = subprocess.run(
+            ["docker", "images", "-q", "parachute-sandbox"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        has_image = bool(result.stdout.strip())
+        return True, f"running, sandbox image {'ready' if has_image else 'not built'}"
+
+    check("Docker", check_docker)
+
+    # 7. Port availability
+    def check_port():
+        if _port_in_use(port):
+            # Check if it's our server
+            try:
+                health = _api_get(f"http://localhost:{port}/api/health")
+                return True, f"port {port} in use by Parachute server"
+            except Exception:
+                return False, f"port {port} in use by another process"
+        return True, f"port {port} available"
+
+    check("Port", check_port)
+
+    # 8. Server reachability
+    def check_server():
+        try:
+            health = _api_get(f"http://localhost:{port}/api/health?detailed=true")
+            version = health.get("version", "?")
+            return True, f"reachable (v{version})"
+        except Exception:
+            return False, "not reachable (is daemon running?)"
+
+    check("Server", check_server)
+
+    # 9. Disk space
+    def check_disk():
+        check_path = parachute_dir if parachute_dir.exists() else Path.home()
+        stat = os.statvfs(check_path)
+        free_gb = (stat.f_bavail * stat.f_frsize) / (1024 ** 3)
+        if free_gb < 1.0:
+            return False, f"{free_gb:.1f} GB free (< 1 GB)"
+        return True, f"{free_gb:.1f} GB free"
+
+    check("Disk space", check_disk)
+
+    # Print results
+    print("\nParachute Doctor")
+    print("=" * 40)
+
+    for status, name, detail in results:
+        icon = {"PASS": "+", "WARN": "!", "FAIL": "x"}[status]
+        print(f"  [{icon}] {name}: {detail}")
+
+    passes = sum(1 for s, _, _ in results if s == "PASS")
+    warns = sum(1 for s, _, _ in results if s == "WARN")
+    fails = sum(1 for s, _, _ in results if s == "FAIL")
+    print(f"\n  {passes} passed, {warns} warnings, {fails} failures")
+
+    if fails:
+        sys.exit(1)
@@ -0,0 +1,448 @@
+"""parachute install / parachute update."""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+from parachute.cli._common import (
+    _api_get,
+    _get_env_file,
+    _get_parachute_dir,
+    _get_repo_dir,
+    _load_env_file,
+)
+from parachute.lib.config_file import (
+    _load_yaml_config,
+    get_config_path,
+    save_token,
+    save_yaml_config,
+)
+
+
+def _migrate_env_to_yaml(parachute_dir: Path) -> bool:
+    """Migrate .env file to config.yaml. Returns True if migration happened."""
+    env_file = _get_env_file()
+    if not env_file.exists():
+        return False
+
+    env = _load_env_file(env_file)
+    if not env:
+        return False
+
+    config_file = get_config_path(parachute_dir)
+    existing = _load_yaml_config(parachute_dir)
+
+    # Map env vars to config keys (home_path excluded — no longer valid)
+    env_to_config = {
+        "PORT": "port",
+        "HOST": "host",
+        "DEFAULT_MODEL": "default_model",
+        "LOG_LEVEL": "log_level",
+        "CORS_ORIGINS": "cors_origins",
+        "DEBUG": "debug",
+    }
+
+    migrated = {}
+    for env_key, config_key in env_to_config.items():
+        if env_key in env and config_key not in existing:
+            value = env[env_key]
+            # Convert types
+            if config_key == "port":
+                try:
+                    value = int(value)
+                except ValueError:
+                    pass
+            elif config_key == "debug":
+                value = value.lower() in ("true", "1", "yes")
+            migrated[config_key] = value
+
+    # Handle token separately
+    token = env.get("CLAUDE_CODE_OAUTH_TOKEN")
+    if token:
+        save_token(parachute_dir, token)
+        print(f"  Migrated token to {parachute_dir / '.token'}")
+
+    if migrated:
+        config_data = {**existing, **migrated}
+        save_yaml_config(parachute_dir, config_data)
+        print(f"  Migrated {len(migrated)} settings to {config_file}")
+
+    # Rename .env to .env.migrated
+    migrated_file = env_file.parent / (env_file.name + ".migrated")
+    env_file.rename(migrated_file)
+    print(f"  Renamed .env to {migrated_file.name}")
+
+    return True
+
+
+def _migrate_server_yaml(parachute_dir: Path) -> bool:
+    """Migrate server.yaml fields into config.yaml. Returns True if migration happened."""
+    # Check legacy location first
+    server_yaml = Path.home() / "Parachute" / ".parachute" / "server.yaml"
+    if not server_yaml.exists():
+        return False
+
+    try:
+        with open(server_yaml) as f:
+            data = yaml.safe_load(f) or {}
+    except Exception:
+        return False
+
+    existing = _load_yaml_config(parachute_dir)
+    migrated = {}
+
+    # Migrate security.require_auth -> auth_mode
+    if "security" in data:
+        sec = data["security"]
+        if "require_auth" in sec and "auth_mode" not in existing:
+            migrated["auth_mode"] = sec["require_auth"]
+
+    # Migrate server.port -> port
+    if "server" in data:
+        srv = data["server"]
+        if "port" in srv and "port" not in existing:
+            migrated["port"] = srv["port"]
+
+    if migrated:
+        config_data = {**existing, **migrated}
+        save_yaml_config(parachute_dir, config_data)
+        print(f"  Merged {len(migrated)} fields from server.yaml into config.yaml")
+        return True
+
+    return False
+
+
+def cmd_install(args: argparse.Namespace) -> None:
+    """First-time setup: interactive config + daemon install + start."""
+    print("Parachute Install")
+    print("=" * 40)
+
+    # 1. Set up ~/.parachute/
+    parachute_dir = _get_parachute_dir()
+    parachute_dir.mkdir(parents=True, exist_ok=True)
+    (parachute_dir / "logs").mkdir(exist_ok=True)
+    print(f"  Config dir: {parachute_dir}")
+
+    # 2. Migrate existing configs
+    print("\nChecking for existing configuration...")
+    migrated_env = _migrate_env_to_yaml(parachute_dir)
+    migrated_server = _migrate_server_yaml(parachute_dir)
+    if not migrated_env and not migrated_server:
+        print("  No existing config to migrate.")
+
+    # 3. Load current config (may have just been migrated)
+    config = _load_yaml_config(parachute_dir)
+
+    # 4. Port
+    current_port = config.get("port", 3333)
+    print(f"\nServer port [{current_port}]: ", end="")
+    port_input = input().strip()
+    if port_input:
+        try:
+            config["port"] = int(port_input)
+        except ValueError:
+            print(f"  Invalid port, keeping {current_port}")
+    else:
+        config["port"] = current_port
+
+    # 5. Claude token
+    from parachute.lib.config_file import _load_token
+
+    existing_token = _load_token(parachute_dir) or os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
+    has_token = bool(existing_token)
+
+    print(f"\nClaude token: {'configured' if has_token else 'not set'}")
+
+    if has_token:
+        print("Update token? [y/N]: ", end="")
+        update = input().strip().lower()
+        if update != "y":
+            print("  Keeping existing token.")
+        else:
+            has_token = False
+
+    if not has_token:
+        print("\nTo get a token, run: claude setup-token")
+        print("Then paste it here.")
+        print("\nCLAUDE_CODE_OAUTH_TOKEN: ", end="")
+        token = input().strip()
+        if token:
+            save_token(parachute_dir, token)
+            print("  Token saved.")
+        else:
+            print("  Skipped (you can set this later).")
+
+    # 6. Docker check
+    print("\nContainer runtime:")
+    print("  Docker provides sandboxed code execution for agents.")
+    print("  Chat still works without it — Docker is optional.")
+    docker_path = shutil.which("docker")
+    if docker_path:
+        print(f"  Docker: {docker_path}")
+        try:
+            result = subprocess.run(
+                ["docker", "info"],
+                capture_output=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                print("  Daemon: running")
+            else:
+                print("  Daemon: not running (sandbox features unavailable)")
+                if sys.platform == "darwin":
+                    print("  If already installed, start with:")
+                    print("    open /Applications/OrbStack.app  OR  open -a Docker")
+                    print("  If not installed:")
+                    print("    brew install orbstack          # lightweight, recommended")
+                    print("    brew install --cask docker     # Docker Desktop")
+                else:
+                    print("  To start: sudo systemctl start docker")
+                    print("  If not installed: curl -fsSL https://get.docker.com | sh")
+        except (subprocess.TimeoutExpired, OSError):
+            print("  Daemon: check timed out")
+    else:
+        print("  Docker: not found")
+        if sys.platform == "darwin":
+            print("  Install with one of:")
+            print("    brew install orbstack          # lightweight, recommended")
+            print("    brew install --cask docker     # Docker Desktop")
+            print("  Or download: https://orbstack.dev  /  https://docker.com/products/docker-desktop")
+        else:
+            print("  Install with:")
+            print("    curl -fsSL https://get.docker.com | sh")
+            print("    sudo usermod -aG docker $USER")
+            print("  Then log out and back in for group changes to take effect.")
+
+    # 7. Save config
+    config_file = save_yaml_config(parachute_dir, config)
+    print(f"\nConfig written to {config_file}")
+
+    # 8. Install and start main server daemon
+    print("\nInstalling main server daemon...")
+    try:
+        from parachute.daemon import get_daemon_manager
+
+        daemon = get_daemon_manager(parachute_dir, config)
+        daemon.install()
+        print("  Main server daemon installed.")
+
+        daemon.start()
+        print("  Main server daemon started.")
+        print(f"  Server running on port {config.get('port', 3333)}")
+    except Exception as e:
+        print(f"  Main server daemon install failed: {e}")
+        print("  You can start manually with: parachute server --foreground")
+
+    # 9. Install and start supervisor daemon
+    print("\nInstalling supervisor daemon...")
+    try:
+        from parachute.daemon import get_supervisor_daemon_manager
+
+        supervisor_daemon = get_supervisor_daemon_manager(parachute_dir, config)
+        supervisor_daemon.install()
+        print("  Supervisor daemon installed.")
+
+        supervisor_daemon.start()
+        print("  Supervisor daemon started.")
+        print("  Supervisor running on port 3334")
+    except Exception as e:
+        print(f"  Supervisor daemon install failed: {e}")
+        print("  You can install manually with: parachute supervisor install")
+
+    # 10. Check PATH
+    _check_path()
+
+    print("\nDone! Use 'parachute server status' to check the daemon.")
+    print("Use 'parachute supervisor status' to check the supervisor.")
+
+
+def _check_path() -> None:
+    """Check if ~/.local/bin is in PATH and advise if not."""
+    local_bin = Path.home() / ".local" / "bin"
+    path_dirs = os.environ.get("PATH", "").split(os.pathsep)
+    if str(local_bin) not in path_dirs:
+        shell = os.environ.get("SHELL", "")
+        if "zsh" in shell:
+            rc_file = "~/.zshrc"
+        elif "bash" in shell:
+            rc_file = "~/.bashrc"
+        else:
+            rc_file = "your shell rc file"
+        print(f"\nNote: {local_bin} is not in your PATH.")
+        print(f"  Add this to {rc_file}:")
+        print(f'  export PATH="$HOME/.local/bin:$PATH"')
+
+
+
+
+
+def cmd_update(args: argparse.Namespace) -> None:
+    """Pull latest code, reinstall deps, and restart daemon."""
+    repo_dir = _get_repo_dir()
+    venv_pip = Path(sys.executable).parent / "pip"
+
+    print(f"Updating Parachute ({repo_dir})")
+    print("=" * 40)
+
+    # 1. Git pull and detect what changed
+    supervisor_code_changed = False
+    if (repo_dir / ".git").exists():
+            print("\nPulling latest code...")
+
+            # Store current HEAD for diff
+            old_head = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+            )
+            old_head_sha = old_head.stdout.strip() if old_head.returncode == 0 else None
+
+            # Try git pull, fall back to git pull origin main if no upstream
+            result = subprocess.run(
+                ["git", "pull"],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            if result.returncode != 0 and "no tracking information" in result.stderr:
+                # Try pulling from origin main directly
+                result = subprocess.run(
+                    ["git", "pull", "origin", "main"],
+                    cwd=repo_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+            if result.returncode != 0:
+                print(f"  git pull failed: {result.stderr.strip()}")
+                print("  Try pulling manually, then run: parachute server restart")
+                sys.exit(1)
+            output = result.stdout.strip()
+            if "Already up to date" in output:
+                print("  Already up to date.")
+            else:
+                print(f"  {output}")
+
+                # Check if supervisor code changed
+                if old_head_sha:
+                    diff_result = subprocess.run(
+                        ["git", "diff", "--name-only", old_head_sha, "HEAD"],
+                        cwd=repo_dir,
+                        capture_output=True,
+                        text=True,
+                    )
+                    if diff_result.returncode == 0:
+                        changed_files = diff_result.stdout.strip().split('\n')
+                        supervisor_files = [
+                            "parachute/supervisor.py",
+                            "parachute/supervisor_main.py",
+                            "parachute/daemon.py",
+                        ]
+                        supervisor_code_changed = any(
+                            any(f.endswith(sf) for sf in supervisor_files)
+                            for f in changed_files
+                        )
+                        if supervisor_code_changed:
+                            print("  ⚠️  Supervisor code changed, will restart supervisor")
+    else:
+        print("\nNot a git repo — skipping pull.")
+        print("  (Install from git clone for auto-updates)")
+
+    # 2. Reinstall deps
+    print("\nInstalling dependencies...")
+    result = subprocess.run(
+        [str(venv_pip), "install", "-e", str(repo_dir), "-q"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        print(f"  pip install failed: {result.stderr.strip()}")
+        sys.exit(1)
+    print("  Dependencies updated.")
+
+    # 3. Restart main server daemon if running (deps already installed above)
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+
+    try:
+        from parachute.daemon import get_daemon_manager
+
+        daemon = get_daemon_manager(parachute_dir, config)
+        status = daemon.status()
+
+        if status.get("running"):
+            print("\nRestarting main server...")
+            daemon.restart()
+            print("  Main server restarted.")
+        elif daemon.is_installed():
+            print("\nStarting main server...")
+            daemon.start()
+            print("  Main server started.")
+        else:
+            print("\nMain server daemon not installed. Run 'parachute install' for daemon support.")
+    except Exception as e:
+        print(f"\nCouldn't restart main server daemon: {e}")
+        print("  Restart manually: parachute server restart")
+
+    # 4. Manage supervisor based on what changed
+    try:
+        from parachute.daemon import get_supervisor_daemon_manager
+
+        supervisor_daemon = get_supervisor_daemon_manager(parachute_dir, config)
+        supervisor_status = supervisor_daemon.status()
+
+        if supervisor_code_changed and supervisor_status.get("running"):
+            # Supervisor code changed and it's running — need to restart it
+            print("\nRestarting supervisor (code changed)...")
+            try:
+                # Verify main server is healthy before touching supervisor
+                try:
+                    health = _api_get("http://localhost:3333/api/health", timeout=2)
+                    if not health.get("status") == "ok":
+                        print("  ⚠️  Main server unhealthy, skipping supervisor restart")
+                        print("  Restart manually when safe: parachute supervisor restart")
+                        supervisor_code_changed = False
+                except Exception:
+                    print("  ⚠️  Can't verify main server health, skipping supervisor restart")
+                    print("  Restart manually when safe: parachute supervisor restart")
+                    supervisor_code_changed = False
+
+                if supervisor_code_changed:
+                    supervisor_daemon.restart()
+                    # Verify it came back up
+                    time.sleep(1)
+                    try:
+                        _api_get("http://localhost:3334/supervisor/status", timeout=3)
+                        print("  Supervisor restarted successfully.")
+                    except Exception:
+                        print("  ⚠️  Supervisor may not have restarted cleanly")
+                        print("  Check status: parachute supervisor status")
+            except Exception as e:
+                print(f"  ⚠️  Supervisor restart failed: {e}")
+                print("  Restart manually: parachute supervisor restart")
+
+        elif supervisor_status.get("running"):
+            pass  # Already up and code didn't change, leave it alone
+        elif supervisor_status.get("installed"):
+            print("\nStarting supervisor...")
+            supervisor_daemon.start()
+            print("  Supervisor started.")
+        else:
+            print("\nInstalling supervisor...")
+            supervisor_daemon.install()
+            supervisor_daemon.start()
+            print("  Supervisor installed and started.")
+    except Exception as e:
+        print(f"\nCouldn't manage supervisor: {e}")
+        print("  Try: parachute supervisor install")
+
+    print("\nDone!")
@@ -0,0 +1,54 @@
+"""parachute logs."""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from parachute.cli._common import _get_parachute_dir
+
+
+def cmd_logs(args: argparse.Namespace) -> None:
+    """Tail daemon log output."""
+    parachute_dir = _get_parachute_dir()
+    lines = getattr(args, "lines", 50)
+    follow = getattr(args, "follow", True)
+
+    # Platform-specific log locations (must match daemon.py)
+    if sys.platform == "darwin":
+        log_dir = Path.home() / "Library" / "Logs" / "Parachute"
+    else:
+        log_dir = Path.home() / ".local" / "state" / "parachute" / "logs"
+    stderr_log = log_dir / "stderr.log"
+    stdout_log = log_dir / "stdout.log"
+
+    if stderr_log.exists():
+        log_file = stderr_log
+    elif stdout_log.exists():
+        log_file = stdout_log
+    else:
+        # Try systemd journal on Linux
+        if sys.platform == "linux":
+            cmd = ["journalctl", "--user-unit", "parachute", "-n", str(lines)]
+            if follow:
+                cmd.append("-f")
+            try:
+                subprocess.run(cmd)
+                return
+            except FileNotFoundError:
+                pass
+
+        print(f"No log files found at {log_dir}")
+        print("Is the daemon running? Try: parachute server status")
+        return
+
+    print(f"Tailing {log_file}...\n")
+    cmd = ["tail", "-n", str(lines)]
+    if follow:
+        cmd.append("-f")
+    cmd.append(str(log_file))
+
+    try:
+        subprocess.run(cmd)
+    except KeyboardInterrupt:
+        pass
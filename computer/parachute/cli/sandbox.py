@@ -0,0 +1,193 @@
+"""parachute sandbox / parachute tools."""
+
+import argparse
+import subprocess
+import sys
+
+
+def cmd_tools(args: argparse.Namespace) -> None:
+    """Manage the parachute-tools shared volume (packages visible in all containers)."""
+    from parachute.core.sandbox import SANDBOX_IMAGE, TOOLS_VOLUME_NAME
+
+    action = args.action
+
+    # Verify Docker is available
+    check = subprocess.run(
+        ["docker", "info"],
+        capture_output=True,
+        check=False,
+    )
+    if check.returncode != 0:
+        print("Error: Docker is not available")
+        sys.exit(1)
+
+    # Ensure the tools volume exists (idempotent)
+    subprocess.run(
+        ["docker", "volume", "create", TOOLS_VOLUME_NAME],
+        capture_output=True,
+        check=False,
+    )
+
+    if action == "install":
+        packages = args.packages
+        if not packages:
+            print("Usage: parachute tools install <package> [<package>...]")
+            sys.exit(1)
+
+        print(f"Installing {', '.join(packages)} into {TOOLS_VOLUME_NAME}...")
+        mount_arg = f"source={TOOLS_VOLUME_NAME},target=/opt/parachute-tools"
+
+        # Ensure directory structure exists (safe: no user input in this call)
+        subprocess.run(
+            [
+                "docker", "run", "--rm",
+                "--mount", mount_arg,
+                SANDBOX_IMAGE,
+                "sh", "-c", "mkdir -p /opt/parachute-tools/bin /opt/parachute-tools/python",
+            ],
+            check=False,
+        )
+
+        # Install packages as proper argv (no shell, no injection possible)
+        result = subprocess.run(
+            [
+                "docker", "run", "--rm",
+                "--mount", mount_arg,
+                SANDBOX_IMAGE,
+                "pip", "install", "--target", "/opt/parachute-tools/python",
+                *packages,
+            ],
+            check=False,
+        )
+        if result.returncode == 0:
+            print(f"\nInstalled. Packages are immediately available in all running containers.")
+        else:
+            print(f"\nInstall failed (exit {result.returncode}).")
+            sys.exit(result.returncode)
+
+    elif action == "list":
+        result = subprocess.run(
+            [
+                "docker", "run", "--rm",
+                "--mount", f"source={TOOLS_VOLUME_NAME},target=/opt/parachute-tools,readonly",
+                SANDBOX_IMAGE,
+                "pip", "list", "--path", "/opt/parachute-tools/python",
+            ],
+            check=False,
+        )
+        if result.returncode != 0:
+            sys.exit(result.returncode)
+
+    else:
+        print("Usage: parachute tools <install|list>")
+
+
+
+
+def cmd_sandbox(args: argparse.Namespace) -> None:
+    """Manage Docker sandbox environment."""
+    action = getattr(args, "action", None)
+
+    try:
+        if action == "clean-cache":
+            # Remove shared package cache volumes
+            result = subprocess.run(
+                ["docker", "volume", "ls", "-q", "--filter", "label=app=parachute", "--filter", "label=type=cache"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+            if result.returncode != 0:
+                print("Error: Docker not available or failed to list volumes")
+                sys.exit(1)
+
+            volumes = [v.strip() for v in result.stdout.splitlines() if v.strip()]
+
+            if not volumes:
+                print("No cache volumes found.")
+                return
+
+            print(f"Found {len(volumes)} cache volume(s):")
+            for vol in volumes:
+                print(f"  - {vol}")
+
+            # Confirm deletion
+            response = input("\nRemove these volumes? [y/N]: ").strip().lower()
+            if response not in ("y", "yes"):
+                print("Cancelled.")
+                return
+
+            # Remove volumes
+            for vol in volumes:
+                result = subprocess.run(
+                    ["docker", "volume", "rm", vol],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                if result.returncode == 0:
+                    print(f"  ✓ Removed {vol}")
+                else:
+                    print(f"  ✗ Failed to remove {vol}: {result.stderr}")
+
+        elif action == "inspect":
+            # Show sandbox configuration and container status
+            from parachute.core.sandbox import (
+                SANDBOX_IMAGE,
+                CONTAINER_MEMORY_LIMIT_EPHEMERAL,
+                CONTAINER_MEMORY_LIMIT_PERSISTENT,
+                CONTAINER_CPU_LIMIT,
+            )
+
+            print("Sandbox Configuration:")
+            print(f"  Image: {SANDBOX_IMAGE}")
+            print(f"  Memory limit (ephemeral): {CONTAINER_MEMORY_LIMIT_EPHEMERAL}")
+            print(f"  Memory limit (persistent): {CONTAINER_MEMORY_LIMIT_PERSISTENT}")
+            print(f"  CPU limit: {CONTAINER_CPU_LIMIT}")
+
+            # Check if image exists
+            result = subprocess.run(
+                ["docker", "image", "inspect", SANDBOX_IMAGE],
+                capture_output=True,
+                check=False,
+            )
+            print(f"  Image status: {'exists' if result.returncode == 0 else 'not built'}")
+
+            # List cache volumes
+            result = subprocess.run(
+                ["docker", "volume", "ls", "--filter", "label=app=parachute", "--filter", "label=type=cache", "--format", "{{.Name}}"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            volumes = [v.strip() for v in result.stdout.splitlines() if v.strip()]
+            print(f"\nCache Volumes: {len(volumes)}")
+            for vol in volumes:
+                print(f"  - {vol}")
+
+            # List running containers
+            result = subprocess.run(
+                ["docker", "ps", "--filter", "label=app=parachute", "--format", "{{.Names}}\t{{.Status}}\t{{.Label \"workspace\"}}\t{{.Label \"config_hash\"}}"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            lines = [l.strip() for l in result.stdout.splitlines() if l.strip()]
+            print(f"\nRunning Containers: {len(lines)}")
+            if lines:
+                print(f"  {'Name':<30} {'Status':<20} {'Workspace':<20} {'Config Hash':<15}")
+                print(f"  {'-'*30} {'-'*20} {'-'*20} {'-'*15}")
+                for line in lines:
+                    parts = line.split('\t')
+                    name = parts[0] if len(parts) > 0 else ""
+                    status = parts[1] if len(parts) > 1 else ""
+                    workspace = parts[2] if len(parts) > 2 else ""
+                    config_hash = parts[3] if len(parts) > 3 else ""
+                    print(f"  {name:<30} {status:<20} {workspace:<20} {config_hash:<15}")
+        else:
+            print("Usage: parachute sandbox {clean-cache|inspect}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
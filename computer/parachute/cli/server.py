@@ -0,0 +1,258 @@
+"""parachute server [stop|restart|status] [--foreground]."""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from parachute.cli._common import (
+    _api_get,
+    _find_port_pid,
+    _get_parachute_dir,
+    _get_repo_dir,
+    _kill_port_holder,
+    _load_env_file,
+    _port_in_use,
+)
+from parachute.lib.config_file import _load_yaml_config
+
+
+def cmd_server(args: argparse.Namespace) -> None:
+    """Start/stop/restart the Parachute server daemon."""
+    action = getattr(args, "action", None)
+
+    if action == "stop":
+        _server_stop()
+    elif action == "restart":
+        _server_restart()
+    elif action == "status":
+        _server_status()
+    elif getattr(args, "foreground", False):
+        _server_foreground()
+    else:
+        _server_start()
+
+
+def _server_foreground() -> None:
+    """Start server in foreground (dev mode)."""
+    # Load config from all sources
+    env = _load_env_file()
+    for key, value in env.items():
+        if key not in os.environ:
+            os.environ[key] = value
+
+    parachute_dir = _get_parachute_dir()
+    yaml_config = _load_yaml_config(parachute_dir)
+
+    port = int(os.environ.get("PORT", yaml_config.get("port", 3333)))
+    host = os.environ.get("HOST", yaml_config.get("host", "0.0.0.0"))
+
+    # Load token from .token file if not in env
+    if not os.environ.get("CLAUDE_CODE_OAUTH_TOKEN"):
+        from parachute.lib.config_file import _load_token
+
+        token = _load_token(parachute_dir)
+        if token:
+            os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = token
+
+    token = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
+    if not token:
+        print("Warning: CLAUDE_CODE_OAUTH_TOKEN not set. Chat will not work.")
+        print("Run 'parachute install' to configure.\n")
+
+    print(f"Starting Parachute on {host}:{port}")
+
+    try:
+        import uvicorn
+        uvicorn.run(
+            "parachute.server:app",
+            host=host,
+            port=port,
+            log_level="info",
+        )
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+def _server_start() -> None:
+    """Start the server as a background daemon."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+
+    try:
+        from parachute.daemon import get_daemon_manager
+
+        daemon = get_daemon_manager(parachute_dir, config)
+
+        if not daemon.is_installed():
+            print("Daemon not installed. Falling back to foreground mode.")
+            print("Tip: Run 'parachute install' for background daemon support.\n")
+            _server_foreground()
+            return
+
+        port = config.get("port", 3333)
+        status = daemon.status()
+
+        # Check if actually responding, not just loaded
+        if status.get("running") or _port_in_use(port):
+            try:
+                _api_get(f"http://localhost:{port}/api/health")
+                print(f"Server already running (PID {status.get('pid')}, port {port})")
+                return
+            except Exception:
+                # Loaded but not responding — restart it
+                print("Server loaded but not responding. Restarting...")
+                daemon.stop()
+                time.sleep(1)
+
+        daemon.start()
+        print(f"Server started (port {config.get('port', 3333)})")
+        print("Use 'parachute logs' to view output, 'parachute server stop' to stop.")
+
+    except Exception as e:
+        print(f"Failed to start daemon: {e}")
+        print("Falling back to foreground mode.\n")
+        _server_foreground()
+
+
+def _server_stop() -> None:
+    """Stop the daemon and any rogue process on the port."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+    port = config.get("port", 3333)
+
+    try:
+        from parachute.daemon import get_daemon_manager
+
+        daemon = get_daemon_manager(parachute_dir, config)
+        daemon.stop()
+    except Exception as e:
+        print(f"Failed to stop daemon: {e}")
+
+    # Also kill any rogue process holding the port
+    if _port_in_use(port):
+        _kill_port_holder(port)
+
+    if _port_in_use(port):
+        print(f"Warning: port {port} still in use.")
+    else:
+        print("Server stopped.")
+
+
+def _server_restart() -> None:
+    """Restart the daemon, reinstalling deps first to ensure everything is current."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+    port = config.get("port", 3333)
+
+    # Reinstall dependencies to pick up any changes (new deps, updates, etc.)
+    repo_dir = _get_repo_dir()
+    venv_pip = Path(sys.executable).parent / "pip"
+
+    print("Installing dependencies...")
+    result = subprocess.run(
+        [str(venv_pip), "install", "-e", str(repo_dir), "-q"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        print(f"  pip install failed: {result.stderr.strip()}")
+        print("  Continuing with restart anyway...")
+    else:
+        print("  Dependencies updated.")
+
+    try:
+        from parachute.daemon import get_daemon_manager
+
+        daemon = get_daemon_manager(parachute_dir, config)
+        daemon.stop()
+        time.sleep(1)
+
+        # Reinstall plist to pick up current Python path (venv may have been
+        # recreated with a different Python version since last install).
+        if daemon.is_installed():
+            daemon.install()
+
+        # Kill any rogue process still holding the port
+        if _port_in_use(port):
+            _kill_port_holder(port)
+            time.sleep(0.5)
+
+        if _port_in_use(port):
+            print(f"Error: port {port} still in use (PID {_find_port_pid(port)}). Cannot restart.")
+            sys.exit(1)
+
+        daemon.start()
+
+        # Poll until port is listening (up to 60s) — launchd starts the process
+        # asynchronously via RunAtLoad, and startup takes ~20-30s with module
+        # loading, Telegram connector init, etc.
+        print("Waiting for server to start", end="", flush=True)
+        for _ in range(120):
+            if _port_in_use(port):
+                break
+            time.sleep(0.5)
+            print(".", end="", flush=True)
+        else:
+            print()
+            print("Warning: server did not start within 60s. Check: parachute server status")
+            sys.exit(1)
+        print()
+
+        print("Server restarted.")
+    except Exception as e:
+        print(f"Failed to restart server: {e}")
+        sys.exit(1)
+
+
+def _server_status() -> None:
+    """Show daemon status with HTTP health correlation."""
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+    port = config.get("port", 3333)
+
+    try:
+        from parachute.daemon import get_daemon_manager
+
+        daemon = get_daemon_manager(parachute_dir, config)
+        status = daemon.status()
+
+        # Check actual HTTP health
+        http_ok = False
+        try:
+            health = _api_get(f"http://localhost:{port}/api/health")
+            http_ok = True
+        except Exception:
+            pass
+
+        # Resolve PID: prefer daemon-tracked PID, fall back to lsof
+        pid = status.get("pid") or _find_port_pid(port)
+
+        if status.get("running") and http_ok:
+            print(f"Server: running (PID {pid}, port {port})")
+        elif http_ok:
+            print(f"Server: running (PID {pid}, port {port})")
+            print(f"  (not managed by daemon)")
+        elif status.get("loaded") and not status.get("running"):
+            print("Server: crashed")
+            if status.get("last_exit"):
+                print(f"  {status['last_exit']}")
+            if status.get("state"):
+                print(f"  State: {status['state']}")
+            print("  Check logs: parachute logs")
+        elif _port_in_use(port):
+            print(f"Server: running (PID {pid}, port {port})")
+            print(f"  (not managed by daemon)")
+        else:
+            print("Server: not running")
+
+        if status.get("installed") or status.get("loaded"):
+            print(f"  Daemon: installed ({status.get('type', 'unknown')})")
+        else:
+            print("  Daemon: not installed")
+
+    except Exception as e:
+        print(f"Error checking status: {e}")
@@ -0,0 +1,83 @@
+"""parachute status."""
+
+import argparse
+import os
+from urllib.error import URLError
+
+from parachute.cli._common import (
+    _api_get,
+    _find_port_pid,
+    _get_parachute_dir,
+    _get_server_url,
+    _load_env_file,
+)
+
+
+def cmd_status(args: argparse.Namespace) -> None:
+    """Show system status: vault, token, server, modules."""
+    parachute_dir = _get_parachute_dir()
+    server_url = _get_server_url()
+
+    print("Parachute Status")
+    print("=" * 40)
+
+    # System dir
+    parachute_dir_exists = parachute_dir.exists()
+    print(f"\nConfig dir: {parachute_dir}")
+    print(f"  exists: {'yes' if parachute_dir_exists else 'NO'}")
+    if parachute_dir_exists:
+        modules_dir = parachute_dir / "modules"
+        if modules_dir.exists():
+            module_count = sum(1 for d in modules_dir.iterdir() if d.is_dir())
+            print(f"  modules: {module_count}")
+
+    # Token
+    from parachute.lib.config_file import _load_token
+
+    token = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
+    if not token:
+        token = _load_token(parachute_dir) or ""
+    if not token:
+        env = _load_env_file()
+        token = env.get("CLAUDE_CODE_OAUTH_TOKEN", "")
+    print(f"\nClaude token: {'configured' if token else 'NOT SET (run: parachute install)'}")
+    if token:
+        print(f"  prefix: {token[:16]}...")
+
+    # Server
+    print(f"\nServer: {server_url}")
+    try:
+        health = _api_get(f"{server_url}/api/health?detailed=true")
+        version = health.get("version", "?")
+        commit = health.get("commit", "")
+        uptime = health.get("uptime", 0)
+
+        # Find PID of the running server
+        from urllib.parse import urlparse
+        parsed = urlparse(server_url)
+        server_port = parsed.port or 3333
+        pid = _find_port_pid(server_port)
+        pid_str = f", PID {pid}" if pid else ""
+
+        print(f"  status: running (v{version} {commit}{pid_str})")
+        print(f"  uptime: {uptime:.0f}s")
+
+        # Modules
+        modules = health.get("modules", [])
+        if modules:
+            print(f"\n  Modules ({len(modules)}):")
+            for m in modules:
+                print(f"    {m['name']}: {m['status']}")
+
+        # Docker
+        docker = health.get("docker", {})
+        if docker:
+            available = docker.get("available", False)
+            print(f"\n  Docker: {'available' if available else 'not available'}")
+            if available:
+                image_exists = docker.get("image_exists", False)
+                print(f"  Sandbox image: {'ready' if image_exists else 'not built'}")
+    except (URLError, OSError):
+        print("  status: not running")
+
+    print()
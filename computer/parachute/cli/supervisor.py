@@ -0,0 +1,60 @@
+"""parachute supervisor."""
+
+import argparse
+import sys
+
+from parachute.cli._common import _api_get, _get_parachute_dir
+from parachute.lib.config_file import _load_yaml_config
+
+
+def cmd_supervisor(args: argparse.Namespace) -> None:
+    """Manage the supervisor daemon."""
+    action = getattr(args, "action", None)
+    parachute_dir = _get_parachute_dir()
+    config = _load_yaml_config(parachute_dir)
+
+    try:
+        from parachute.daemon import get_supervisor_daemon_manager
+
+        daemon = get_supervisor_daemon_manager(parachute_dir, config)
+
+        if action == "install":
+            daemon.install()
+            print("Supervisor daemon installed.")
+            print("Use 'parachute supervisor start' to start it.")
+        elif action == "uninstall":
+            daemon.uninstall()
+            print("Supervisor daemon removed.")
+        elif action == "start":
+            if not daemon.is_installed():
+                print("Supervisor not installed. Run 'parachute supervisor install' first.")
+                return
+            daemon.start()
+            print("Supervisor started on http://localhost:3334")
+        elif action == "stop":
+            daemon.stop()
+            print("Supervisor stopped.")
+        elif action == "restart":
+            daemon.restart()
+            print("Supervisor restarted.")
+        elif action == "status":
+            status = daemon.status()
+            print(f"Supervisor daemon status:")
+            print(f"  Installed: {status.get('installed', False)}")
+            print(f"  Running: {status.get('running', False)}")
+            if status.get("pid"):
+                print(f"  PID: {status['pid']}")
+            print(f"  Type: {status.get('type', 'unknown')}")
+
+            # Check HTTP health
+            try:
+                _api_get("http://localhost:3334/supervisor/status")
+                print("  HTTP health: OK")
+            except Exception:
+                print("  HTTP health: not responding")
+        else:
+            print("Usage: parachute supervisor {install|uninstall|start|stop|restart|status}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
@@ -16,162 +16,25 @@ import re
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
+# File helpers live in a pydantic-free module so the CLI can import them cheaply
+from parachute.lib.config_file import (  # noqa: F401
+    CONFIG_KEYS,
+    _load_token,
+    _load_yaml_config,
+    get_config_path,
+    save_token,
+    save_yaml_config,
+    save_yaml_config_atomic,
+)
+
 logger = logging.getLogger(__name__)
 
 # The Parachute system directory — always ~/.parachute/
 PARACHUTE_DIR = Path.home() / ".parachute"
 
-# Known config keys that can be set via `parachute config set`
-CONFIG_KEYS = {
-    "port", "host", "default_model", "log_level",
-    "cors_origins", "auth_mode", "debug",
-    "docker_runtime", "docker_auto_start",
-    "credential_broker_secret",
-    "api_provider", "api_providers",
-    # Legacy keys (backward compat — auto-migrated to credential_providers)
-    "github_app_id", "github_broker_secret",
-}
-
-
-def _load_yaml_config(parachute_dir: Path) -> dict[str, Any]:
-    """Load config.yaml from ~/.parachute/config.yaml."""
-    config_file = parachute_dir / "config.yaml"
-    if not config_file.exists():
-        return {}
-    try:
-        with open(config_file) as f:
-            data = yaml.safe_load(f) or {}
-        if not isinstance(data, dict):
-            logger.warning(f"config.yaml is not a dict, ignoring: {config_file}")
-            return {}
-        # Drop legacy keys that would cause Pydantic validation errors.
-        data.pop("vault_path", None)
-        return data
-    except Exception as e:
-        logger.warning(f"Error loading config.yaml: {e}")
-        return {}
-
-
-def _load_token(parachute_dir: Path) -> Optional[str]:
-    """Load Claude token from ~/.parachute/.token."""
-    token_file = parachute_dir / ".token"
-    if not token_file.exists():
-        return None
-    try:
-        token = token_file.read_text().strip()
-        return token if token else None
-    except Exception as e:
-        logger.warning(f"Error reading .token: {e}")
-        return None
-
-
-def save_yaml_config(parachute_dir: Path, data: dict[str, Any]) -> Path:
-    """Write config values to ~/.parachute/config.yaml with restricted permissions.
-
-    Uses mkstemp + atomic rename so the file is never world-readable, even
-    transiently (the temp file is created with 0o600 before rename).
-    """
-    import os
-    import tempfile
-
-    config_file = parachute_dir / "config.yaml"
-    config_file.parent.mkdir(parents=True, exist_ok=True)
-
-    fd, tmp_path = tempfile.mkstemp(dir=config_file.parent, suffix=".yaml.tmp")
-    try:
-        with os.fdopen(fd, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
-        os.chmod(tmp_path, 0o600)
-        os.replace(tmp_path, str(config_file))
-    except Exception:
-        Path(tmp_path).unlink(missing_ok=True)
-        raise
-    return config_file
-
-
-def save_yaml_config_atomic(parachute_dir: Path, updates: dict[str, Any]) -> Path:
-    """
-    Atomically update config.yaml with file locking.
-
-    ARCHITECTURE: Prevents race conditions from concurrent writes
-    (supervisor API, CLI tool, potential server writes).
-
-    Pattern:
-    1. Acquire exclusive lock on .config.lock
-    2. Read current config
-    3. Merge updates
-    4. Write to temp file
-    5. Atomic rename
-    6. Release lock
-    """
-    import fcntl
-    import tempfile
-
-    config_file = parachute_dir / "config.yaml"
-    lock_file = parachute_dir / ".config.lock"
-
-    config_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(lock_file, 'w') as lock:
-        # Acquire exclusive lock (blocks if another process is writing)
-        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
-
-        try:
-            # Read current config
-            current = {}
-            if config_file.exists():
-                with open(config_file) as f:
-                    current = yaml.safe_load(f) or {}
-
-            # Drop legacy keys
-            updates.pop("vault_path", None)
-            current.pop("vault_path", None)
-
-            # Merge updates
-            current.update(updates)
-
-            # Write to temp file
-            fd, temp_path = tempfile.mkstemp(
-                dir=config_file.parent,
-                prefix=".config-",
-                suffix=".yaml.tmp"
-            )
-            try:
-                with os.fdopen(fd, "w") as f:
-                    yaml.safe_dump(current, f, default_flow_style=False, sort_keys=False)
-
-                # Restrict permissions before rename so file is never world-readable
-                os.chmod(temp_path, 0o600)
-                # Atomic rename (POSIX guarantee)
-                os.replace(temp_path, config_file)
-            except Exception:
-                # Clean up temp file on error
-                Path(temp_path).unlink(missing_ok=True)
-                raise
-        finally:
-            # Release lock
-            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
-
-    return config_file
-
-
-def save_token(parachute_dir: Path, token: str) -> Path:
-    """Write token to ~/.parachute/.token with restricted permissions."""
-    token_file = parachute_dir / ".token"
-    token_file.parent.mkdir(parents=True, exist_ok=True)
-    token_file.write_text(token + "\n")
-    token_file.chmod(0o600)
-    return token_file
-
-
-def get_config_path(parachute_dir: Path) -> Path:
-    """Get the config.yaml path."""
-    return parachute_dir / "config.yaml"
-
 
 class Settings(BaseSettings):
     """Server configuration. Precedence: env vars > .env > config.yaml > defaults."""
@@ -240,14 +103,32 @@ class Settings(BaseSettings):
         description="Per-event timeout for trusted SDK event queue in seconds (default: 300 = 5 min)",
     )
 
+    builtin_mcp_in_process: bool = Field(
+        default=True,
+        description=(
+            "Serve the built-in parachute MCP tools in-process for trusted sessions "
+            "instead of a stdio subprocess that calls back over HTTP"
+        ),
+    )
+
+    # Scheduled agents
+    scheduler_max_concurrent_agents: int = Field(
+        default=2,
+        ge=1,
+        description="Max scheduled/manual daily agent runs executing at once (default: 2)",
+    )
+
     # Transcription
     transcription_enabled: bool = Field(
         default=True,
-        description="Enable server-side transcription (requires parakeet-mlx on macOS)",
+        description="Enable server-side transcription (parakeet-mlx on macOS, sherpa-onnx on Linux)",
     )
     transcription_model_id: Optional[str] = Field(
         default=None,
-        description="HuggingFace model ID for transcription (default: mlx-community/parakeet-tdt-0.6b-v3)",
+        description=(
+            "Transcription model: HuggingFace ID on macOS (default: mlx-community/parakeet-tdt-0.6b-v3), "
+            "sherpa-onnx model name on Linux (default: sherpa-onnx-nemo-parakeet-tdt-0.6b-v3-int8)"
+        ),
     )
 
     # Development
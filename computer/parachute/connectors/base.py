@@ -1,8 +1,9 @@
 """
 Abstract bot connector interface.
 
-All platform connectors (Telegram, Discord) inherit from BotConnector
-and implement platform-specific message handling.
+All platform connectors (Telegram, Discord, Matrix) inherit from BotConnector
+and implement platform-specific message handling. Streaming replies go through
+the shared StreamingRenderer, which paces edits per platform rate limits.
 """
 
 import asyncio
@@ -12,13 +13,22 @@ import re
 import time
 from abc import ABC, abstractmethod
 from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import StrEnum
-from typing import Any, ClassVar, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, ClassVar, Optional
+
+from parachute.lib.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
+_QUEUE_WAIT_SECONDS = get_metrics().histogram(
+    "parachute_bot_queue_wait_seconds",
+    "Time a bot message waits before its turn starts",
+    ("platform",),
+)
+
 # Patterns that may leak sensitive info in exception messages
 _SENSITIVE_PATTERNS = [
     (re.compile(r"(bot|token)[\"']?\s*[:=]\s*[\"']?([a-zA-Z0-9:_-]{20,})", re.IGNORECASE), r"\1=<REDACTED>"),
@@ -119,6 +129,605 @@ class GroupHistoryBuffer:
         return "<group_context>\n" + "\n".join(lines) + "\n</group_context>"
 
 
+@dataclass(frozen=True)
+class StreamPacing:
+    """Edit-rate budget for progressively streamed replies on one platform."""
+
+    rate: float  # sustained edits per second per chat
+    burst: int  # edits allowed back-to-back before pacing kicks in
+    max_message_length: int
+
+
+class StreamRateLimited(Exception):
+    """Raised by send/edit callbacks when the platform asks us to back off."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"rate limited, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def rate_limit_delay(exc: BaseException) -> float | None:
+    """Extract a retry delay from a platform rate-limit exception, if any.
+
+    Covers StreamRateLimited, telegram.error.RetryAfter and
+    discord.RateLimited, which all expose ``retry_after``.
+    """
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EditPacer:
+    """Token bucket for message edits that adapts to platform pushback.
+
+    Starts at the platform's nominal rate. A rate-limit response halves the
+    rate and blocks until the server's retry-after; each successful edit
+    recovers the rate additively (AIMD).
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = rate / 8
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Seconds until the next edit may be sent (0 if one is available)."""
+        self._refill()
+        wait = max(0.0, self._blocked_until - time.monotonic())
+        if self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.rate)
+        return wait
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available now."""
+        if self.delay() > 0:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        while (wait := self.delay()) > 0:
+            await asyncio.sleep(wait)
+        self._tokens -= 1
+
+    def on_success(self) -> None:
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = 0.0
+        self._blocked_until = time.monotonic() + max(0.0, retry_after)
+        logger.info(f"Stream edits rate limited; backing off {retry_after:.1f}s (rate now {self.rate:.2f}/s)")
+
+
+# Block boundaries in streamed markdown: blank lines, and code fences
+# (blank lines inside a fence don't end a block).
+_BLOCK_BOUNDARY_RE = re.compile(r"\n{2,}|```")
+_STREAMING_SUFFIX = "\n\n…"
+
+
+class StreamingRenderer:
+    """Progressively render a streamed reply into one or more chat messages.
+
+    Feed it the accumulated response text with update(). Markdown blocks
+    (paragraphs / fenced code) are formatted once, when they complete; only
+    the trailing partial block is re-formatted on each edit. Edits are paced
+    by an EditPacer, with a deferred flush so text arriving while the bucket
+    is empty still shows up once a token frees. When the next block would
+    push a message past the platform limit, the message is finalized and a
+    new one started.
+
+    Args:
+        send: ``async (text, raw) -> handle`` posts a new message and returns
+            a handle for later edits (None if sending failed).
+        edit: ``async (handle, text, raw) -> None`` replaces a message's text.
+            Both receive the platform-formatted text plus the raw markdown for
+            plain-text fallback, and should raise StreamRateLimited (or a
+            platform exception with ``retry_after``) when throttled.
+        format_block: Converts a markdown block to the platform's format.
+        pacing: Platform rate/length budget.
+        message: Existing placeholder message to edit into first.
+        separator: Joins formatted blocks within a message.
+    """
+
+    def __init__(
+        self,
+        *,
+        send: Callable[[str, str], Awaitable[Any]],
+        edit: Callable[[Any, str, str], Awaitable[None]],
+        format_block: Callable[[str], str],
+        pacing: StreamPacing,
+        message: Any = None,
+        separator: str = "\n\n",
+    ):
+        self._send = send
+        self._edit = edit
+        self._format = format_block
+        self.max_length = pacing.max_message_length
+        self.pacer = EditPacer(pacing.rate, pacing.burst)
+        self._separator = separator
+        self._handle = message
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._closed = False
+        self.edit_count = 0
+        self.messages_sent = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._text = ""  # latest raw text
+        self._consumed = 0  # raw offset up to which blocks are committed
+        self._scan_pos = 0
+        self._in_fence = False
+        self._blocks_fmt: list[str] = []  # committed blocks in the current message
+        self._blocks_raw: list[str] = []
+        self._fmt_len = 0
+        self._shown: str | None = None  # text last rendered into the current message
+
+    @property
+    def has_content(self) -> bool:
+        return bool(self._blocks_fmt or self._text[self._consumed:].strip() or self.messages_sent)
+
+    # ── Feeding ──────────────────────────────────────────────────────────
+
+    async def update(self, text: str) -> None:
+        """Render the latest accumulated text, pacing the edit."""
+        async with self._lock:
+            await self._ingest(text)
+            if self.pacer.try_acquire():
+                await self._push(final=False)
+            else:
+                self._schedule_flush()
+
+    async def finish(self, text: str | None = None) -> None:
+        """Commit everything and make the final, fully formatted edit."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        async with self._lock:
+            self._closed = True
+            if text is not None:
+                await self._ingest(text)
+            tail = self._text[self._consumed:]
+            self._consumed = len(self._text)
+            if tail.strip():
+                await self._commit_block(tail)
+            await self._push_reliably()
+
+    async def _ingest(self, text: str) -> None:
+        if not text.startswith(self._text[:self._consumed]):
+            # New text isn't a continuation (e.g. the turn's final result
+            # replaced the streamed text): restart inside the current
+            # message. Already rolled-over messages stay as sent.
+            handle, shown = self._handle, self._shown
+            self._reset()
+            self._handle, self._shown = handle, shown
+        self._text = text
+
+        last_end = self._scan_pos
+        for match in _BLOCK_BOUNDARY_RE.finditer(text, self._scan_pos):
+            last_end = match.end()
+            if match.group() == "```":
+                self._in_fence = not self._in_fence
+            elif not self._in_fence:
+                block = text[self._consumed:match.start()]
+                self._consumed = match.end()
+                if block.strip():
+                    await self._commit_block(block)
+        # Rescan the last two chars next time: "``" or "\n" may be a
+        # boundary that is still being streamed.
+        self._scan_pos = max(self._consumed, last_end, len(text) - 2)
+
+    async def _commit_block(self, block: str) -> None:
+        block = block.strip("\n").rstrip()
+        formatted = self._format(block)
+        if not formatted:
+            return
+        pieces = (
+            [formatted] if len(formatted) <= self.max_length
+            else BotConnector.split_response(formatted, self.max_length)
+        )
+        for piece in pieces:
+            sep = len(self._separator) if self._blocks_fmt else 0
+            if self._blocks_fmt and self._fmt_len + sep + len(piece) > self.max_length:
+                await self._roll_over()
+                sep = 0
+            self._blocks_fmt.append(piece)
+            self._blocks_raw.append(block if len(pieces) == 1 else piece)
+            self._fmt_len += sep + len(piece)
+
+    async def _roll_over(self) -> None:
+        """Finalize the current message and start a new one."""
+        await self._push_reliably()
+        self._handle = None
+        self._shown = None
+        self._blocks_fmt = []
+        self._blocks_raw = []
+        self._fmt_len = 0
+
+    # ── Rendering ────────────────────────────────────────────────────────
+
+    def _render(self, final: bool) -> tuple[str, str]:
+        text = self._separator.join(self._blocks_fmt)
+        raw = "\n\n".join(self._blocks_raw)
+        if not final:
+            tail = self._text[self._consumed:].strip("\n").rstrip()
+            if tail:
+                tail_fmt = self._format(tail)
+                sep = self._separator if text else ""
+                room = self.max_length - len(text) - len(sep)
+                if len(tail_fmt) > room:
+                    tail_fmt = tail_fmt[:max(0, room - len(_STREAMING_SUFFIX))] + _STREAMING_SUFFIX
+                    tail = tail[:max(0, room - len(_STREAMING_SUFFIX))] + _STREAMING_SUFFIX
+                text += sep + tail_fmt
+                raw += ("\n\n" if raw else "") + tail
+        return text, raw
+
+    async def _push(self, final: bool) -> bool:
+        """Send or edit the current message. Returns False if throttled."""
+        text, raw = self._render(final)
+        if not text or text == self._shown:
+            return True
+        try:
+            if self._handle is None:
+                self._handle = await self._send(text, raw)
+                if self._handle is not None:
+                    self.messages_sent += 1
+            else:
+                try:
+                    await self._edit(self._handle, text, raw)
+                    self.edit_count += 1
+                except Exception as e:
+                    if not final or rate_limit_delay(e) is not None:
+                        raise
+                    # Final edit failed outright (message deleted?) — post anew
+                    logger.warning(f"Final edit failed, sending as new message: {e}")
+                    self._handle = await self._send(text, raw)
+                    if self._handle is not None:
+                        self.messages_sent += 1
+        except Exception as e:
+            retry_after = rate_limit_delay(e)
+            if retry_after is not None:
+                self.pacer.on_rate_limited(retry_after)
+                return False
+            if "not modified" not in str(e).lower():
+                logger.debug(f"Stream render failed: {e}")
+            return True
+        self._shown = text
+        self.pacer.on_success()
+        return True
+
+    async def _push_reliably(self, attempts: int = 3) -> None:
+        """Push a message's final state, waiting out rate limits."""
+        for _ in range(attempts):
+            await self.pacer.acquire()
+            if await self._push(final=True):
+                return
+
+    def _schedule_flush(self) -> None:
+        if self._closed or (self._flush_task is not None and not self._flush_task.done()):
+            return
+        self._flush_task = asyncio.create_task(self._deferred_flush())
+
+    async def _deferred_flush(self) -> None:
+        await asyncio.sleep(self.pacer.delay())
+        async with self._lock:
+            if self._closed:
+                return
+            if self.pacer.try_acquire():
+                await self._push(final=False)
+            else:
+                self._flush_task = None
+                self._schedule_flush()
+
+
+class TurnScheduler:
+    """Global cap on concurrent orchestrator turns, fair across chats.
+
+    Slots are granted strictly FIFO. Each chat holds at most one waiter at a
+    time (further messages coalesce behind it), so a busy chat rejoins the
+    back of the line after every turn and can't starve quieter ones.
+    """
+
+    def __init__(self, limit: int = 4):
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for fut in self._waiters if not fut.done())
+
+    def set_limit(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self._wake()
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self.waiting:
+            self.active += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # Slot was handed to us just as we were cancelled — pass it on
+            if not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.active < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self.active += 1
+                fut.set_result(None)
+
+
+_turn_scheduler: TurnScheduler | None = None
+
+
+def get_turn_scheduler() -> TurnScheduler:
+    """Scheduler shared by all connectors in this process."""
+    global _turn_scheduler
+    if _turn_scheduler is None:
+        _turn_scheduler = TurnScheduler()
+    return _turn_scheduler
+
+
+@dataclass
+class _PendingMessage:
+    text: str
+    context: str | None
+    session_id: str | None
+    run: Callable[[str], Awaitable[None]]
+    future: asyncio.Future
+    queued_at: float
+
+
+@dataclass
+class _ChatQueue:
+    pending: list[_PendingMessage] = field(default_factory=list)
+    draining: bool = False  # a drain task owns this chat
+    running_session: str | None = None  # session of the turn in flight
+    in_flight: list[asyncio.Future] = field(default_factory=list)
+
+
+class ChatDispatcher:
+    """Coalesces bursts of messages per chat into single orchestrator turns.
+
+    Messages arriving while a chat's turn is streaming are injected into that
+    turn when the orchestrator accepts them; otherwise they queue and run as
+    one combined turn next. A fresh message waits ``coalesce_window`` seconds
+    (debounced, capped at 4x) for follow-ups before its turn starts. Turns
+    run under the global TurnScheduler.
+
+    Args:
+        platform: Platform name, for logs.
+        coalesce_window: Debounce before starting a turn (0 disables).
+        inject: ``(session_id, text) -> bool`` mid-stream injection hook.
+        scheduler: Concurrency cap (defaults to the process-wide one).
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        coalesce_window: float = 0.75,
+        inject: Callable[[str, str], bool] | None = None,
+        scheduler: TurnScheduler | None = None,
+    ):
+        self.platform = platform
+        self.coalesce_window = coalesce_window
+        self._inject = inject
+        self._scheduler = scheduler
+        self._chats: dict[str, _ChatQueue] = {}
+        self.turns = 0
+        self.coalesced = 0
+        self.injected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @property
+    def scheduler(self) -> TurnScheduler:
+        return self._scheduler or get_turn_scheduler()
+
+    async def submit(
+        self,
+        chat_id: str,
+        text: str,
+        run: Callable[[str], Awaitable[None]],
+        *,
+        session_id: str | None = None,
+        context: str | None = None,
+    ) -> None:
+        """Dispatch a message; returns once the turn carrying it has finished.
+
+        Args:
+            chat_id: Platform chat the message belongs to.
+            text: The user's message.
+            run: Runs one turn for the (possibly combined) message text.
+                The last queued message's ``run`` is used for a combined turn.
+            session_id: Linked session, used for mid-stream injection.
+            context: Prompt prefix (e.g. group history); a combined turn uses
+                the first message's context.
+        """
+        loop = asyncio.get_running_loop()
+        chat = self._chats.setdefault(chat_id, _ChatQueue())
+
+        if (
+            session_id
+            and chat.running_session == session_id
+            and self._inject is not None
+            and self._inject(session_id, text)
+        ):
+            self.injected += 1
+            logger.info(f"{self.platform} chat {chat_id}: injected message into active turn")
+            fut = loop.create_future()
+            chat.in_flight.append(fut)
+            await fut
+            return
+
+        fut = loop.create_future()
+        chat.pending.append(_PendingMessage(text, context, session_id, run, fut, time.monotonic()))
+        if not chat.draining:
+            chat.draining = True
+            asyncio.create_task(self._drain(chat_id, chat))
+        await fut
+
+    async def _drain(self, chat_id: str, chat: _ChatQueue) -> None:
+        try:
+            while chat.pending:
+                await self._debounce(chat)
+                await self.scheduler.acquire()
+                try:
+                    await self._run_batch(chat_id, chat)
+                finally:
+                    self.scheduler.release()
+        finally:
+            chat.draining = False
+            if not chat.pending:
+                self._chats.pop(chat_id, None)
+
+    async def _debounce(self, chat: _ChatQueue) -> None:
+        if self.coalesce_window <= 0:
+            return
+        deadline = chat.pending[0].queued_at + 4 * self.coalesce_window
+        while True:
+            now = time.monotonic()
+            wait = min(chat.pending[-1].queued_at + self.coalesce_window, deadline) - now
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def _run_batch(self, chat_id: str, chat: _ChatQueue) -> None:
+        batch, chat.pending = chat.pending, []
+        wait = time.monotonic() - batch[0].queued_at
+        self.turns += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        _QUEUE_WAIT_SECONDS.observe(wait, platform=self.platform)
+        if len(batch) > 1:
+            self.coalesced += len(batch) - 1
+            logger.info(f"{self.platform} chat {chat_id}: coalesced {len(batch)} messages into one turn")
+
+        texts = "\n\n".join(m.text for m in batch)
+        context = batch[0].context
+        message = f"{context}\n\n{texts}" if context else texts
+
+        chat.running_session = batch[-1].session_id
+        chat.in_flight = [m.future for m in batch]
+        error: BaseException | None = None
+        try:
+            await batch[-1].run(message)
+        except Exception as e:
+            logger.error(f"{self.platform} turn failed for chat {chat_id}: {e}", exc_info=True)
+            error = e
+        finally:
+            chat.running_session = None
+            waiters, chat.in_flight = chat.in_flight, []
+            for fut in waiters:
+                if fut.done():
+                    continue
+                if error is not None:
+                    fut.set_exception(error)
+                else:
+                    fut.set_result(None)
+
+    def stats(self) -> dict:
+        """Queue depth and wait-time metrics for status reporting."""
+        scheduler = self.scheduler
+        return {
+            "queued_messages": sum(len(c.pending) for c in self._chats.values()),
+            "active_turns": sum(1 for c in self._chats.values() if c.in_flight),
+            "turns": self.turns,
+            "coalesced_messages": self.coalesced,
+            "injected_messages": self.injected,
+            "avg_wait_seconds": round(self._wait_total / self.turns, 3) if self.turns else 0.0,
+            "max_wait_seconds": round(self._wait_max, 3),
+            "global_active_turns": scheduler.active,
+            "global_waiting_chats": scheduler.waiting,
+            "global_turn_limit": scheduler.limit,
+        }
+
+
+@dataclass
+class _GateState:
+    cond: asyncio.Condition = field(default_factory=asyncio.Condition)
+    command_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    messages: int = 0  # message handlers running
+    commands: int = 0  # commands running or waiting
+    waiting: int = 0  # message handlers waiting for commands
+
+
+class ChatGate:
+    """Per-chat ordering between message handlers and commands.
+
+    Message handlers for a chat run concurrently with each other, so the
+    dispatcher can coalesce them. A command waits for the chat's running
+    handlers to finish and holds off new ones until it is done, so e.g.
+    /new can't archive a session a message is still being dispatched to.
+    """
+
+    def __init__(self):
+        self._chats: dict[str, _GateState] = {}
+
+    @asynccontextmanager
+    async def message(self, chat_id: str) -> AsyncIterator[None]:
+        state = self._chats.setdefault(chat_id, _GateState())
+        async with state.cond:
+            state.waiting += 1
+            await state.cond.wait_for(lambda: not state.commands)
+            state.waiting -= 1
+            state.messages += 1
+        try:
+            yield
+        finally:
+            async with state.cond:
+                state.messages -= 1
+                state.cond.notify_all()
+                self._prune(chat_id, state)
+
+    @asynccontextmanager
+    async def command(self, chat_id: str) -> AsyncIterator[None]:
+        state = self._chats.setdefault(chat_id, _GateState())
+        async with state.cond:
+            state.commands += 1
+            await state.cond.wait_for(lambda: not state.messages)
+        # Commands for one chat also run one at a time
+        async with state.command_lock:
+            try:
+                yield
+            finally:
+                async with state.cond:
+                    state.commands -= 1
+                    state.cond.notify_all()
+                    self._prune(chat_id, state)
+
+    def _prune(self, chat_id: str, state: _GateState) -> None:
+        if not (state.messages or state.commands or state.waiting):
+            self._chats.pop(chat_id, None)
+
+
 class BotConnector(ABC):
     """Base class for bot connectors.
 
@@ -139,6 +748,9 @@ class BotConnector(ABC):
 
     platform: str = "unknown"
 
+    # Edit-rate budget for streamed replies (override per platform)
+    stream_pacing: ClassVar[StreamPacing] = StreamPacing(rate=0.5, burst=2, max_message_length=4000)
+
     def __init__(
         self,
         bot_token: str,
@@ -159,8 +771,10 @@ class BotConnector(ABC):
         self.group_mention_mode = group_mention_mode
         self.ack_emoji = ack_emoji
         self._running = False
-        self._chat_locks: dict[str, asyncio.Lock] = {}
-        self._trust_overrides: dict[str, str] = {}  # user_id -> trust_level cache
+        # Per-chat message coalescing + global fair turn scheduling
+        self.dispatcher = ChatDispatcher(self.platform, inject=self._inject_into_stream)
+        self.chat_gate = ChatGate()
+        self._trust_overrides: dict[str, str | None] = {}  # user_id -> trust_level cache
         self._init_nudge_sent: dict[str, int] = {}
         self.group_history = GroupHistoryBuffer(max_messages=50)
 
@@ -199,6 +813,7 @@ class BotConnector(ABC):
         self._reconnect_attempts: int = 0
         self._stop_event: asyncio.Event = asyncio.Event()
         self._task: asyncio.Task | None = None
+        self._handler_tasks: set[asyncio.Task] = set()
 
     @abstractmethod
     async def start(self) -> None:
@@ -217,6 +832,28 @@ class BotConnector(ABC):
         """Platform-specific connection loop. Raise on failure, return on clean exit."""
         ...
 
+    def _spawn_handler(self, coro: Awaitable[None]) -> asyncio.Task:
+        """Run a message handler without blocking the platform's event loop.
+
+        Handlers await their whole turn; run inline, one slow turn would hold
+        back every later update and the dispatcher could never coalesce.
+        """
+        task = asyncio.ensure_future(coro)
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._on_handler_done)
+        return task
+
+    async def _gated(self, chat_id: str, coro: Awaitable[None], command: bool = False) -> None:
+        """Run a handler under its chat's gate: commands exclusive, messages shared."""
+        gate = self.chat_gate.command if command else self.chat_gate.message
+        async with gate(chat_id):
+            await coro
+
+    def _on_handler_done(self, task: asyncio.Task) -> None:
+        self._handler_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"{self.platform} message handler failed: {task.exception()}")
+
     # Valid state transitions
     _VALID_TRANSITIONS: ClassVar[dict[ConnectorState, set[ConnectorState]]] = {
         ConnectorState.STOPPED: {ConnectorState.RUNNING},
@@ -464,18 +1101,21 @@ class BotConnector(ABC):
     async def get_trust_level(self, chat_type: str, user_id: str | None = None) -> str:
         """Get trust level with per-user override, falling back to platform defaults."""
         if user_id:
-            # Check in-memory cache first
+            # Check in-memory cache first (None = looked up, no override)
             cache_key = str(user_id)
             if cache_key in self._trust_overrides:
-                return self._trust_overrides[cache_key]
-
-            # Look up approved pairing request
-            db = getattr(self.server, "session_store", None)
-            if db:
-                request = await db.get_pairing_request_for_user(self.platform, str(user_id))
-                if request and request.status == "approved" and request.approved_trust_level:
-                    self._trust_overrides[cache_key] = request.approved_trust_level
-                    return request.approved_trust_level
+                override = self._trust_overrides[cache_key]
+                if override:
+                    return override
+            else:
+                # Look up approved pairing request
+                db = getattr(self.server, "session_store", None)
+                if db:
+                    request = await db.get_pairing_request_for_user(self.platform, str(user_id))
+                    if request and request.status == "approved" and request.approved_trust_level:
+                        self._trust_overrides[cache_key] = request.approved_trust_level
+                        return request.approved_trust_level
+                    self._trust_overrides[cache_key] = None
 
         if chat_type == "dm":
             return self.dm_trust_level
@@ -485,11 +1125,17 @@ class BotConnector(ABC):
         """Update the in-memory trust override cache (called on approval)."""
         self._trust_overrides[str(user_id)] = trust_level
 
-    def _get_chat_lock(self, chat_id: str) -> asyncio.Lock:
-        """Get or create a per-chat lock (stable across session finalization)."""
-        if chat_id not in self._chat_locks:
-            self._chat_locks[chat_id] = asyncio.Lock()
-        return self._chat_locks[chat_id]
+    def _inject_into_stream(self, session_id: str, text: str) -> bool:
+        """Feed a follow-up message into the session's in-flight turn."""
+        orchestrator = getattr(self.server, "orchestrator", None)
+        inject = getattr(orchestrator, "inject_message", None)
+        if inject is None:
+            return False
+        try:
+            return inject(session_id, text) == "ok"
+        except Exception as e:
+            logger.debug(f"Mid-stream inject failed: {e}")
+            return False
 
     async def get_or_create_session(
         self,
@@ -586,6 +1232,94 @@ class BotConnector(ABC):
             )
         return len(expired)
 
+    def stream_pacing_for(self, chat_type: str) -> StreamPacing:
+        """Pacing for a chat. Override where groups have tighter limits."""
+        return self.stream_pacing
+
+    async def stream_response(
+        self,
+        session_id: str,
+        message: str,
+        renderer: StreamingRenderer,
+    ) -> None:
+        """Run one orchestrator turn, rendering the reply progressively.
+
+        Errors and warnings, including a failure of the stream itself, are
+        appended to the reply as ⚠️ notices. If the turn produces nothing,
+        "No response from agent." is shown.
+        """
+        orchestrate = getattr(self.server, "orchestrate", None)
+        if not orchestrate:
+            logger.error("Server has no orchestrate method")
+            await renderer.finish("Chat orchestrator not available.")
+            return
+
+        content = ""
+        notices = ""
+        error_occurred = False
+        event_count = 0
+        try:
+            async for event in orchestrate(
+                session_id=session_id,
+                message=message,
+                source=self.platform,
+            ):
+                event_count += 1
+                if isinstance(event, dict):
+                    get = event.get
+                else:
+                    def get(key: str, default: Any = "", _e: Any = event) -> Any:
+                        return getattr(_e, key, default)
+                event_type = get("type", "")
+
+                if event_type == "text":
+                    # 'content' is the full accumulated text of the current block
+                    new_content = get("content", "")
+                    if new_content:
+                        content = new_content
+                        await renderer.update(content + notices)
+
+                elif event_type == "error":
+                    logger.error(f"Orchestrator error event: {get('error', '')}")
+                    error_occurred = True
+
+                elif event_type == "typed_error":
+                    # Structured error with user-friendly message
+                    title = get("title", "Error")
+                    event_msg = get("message", "")
+                    error_text = f"{title}: {event_msg}" if event_msg else title
+                    logger.error(f"Orchestrator typed error: {error_text}")
+                    notices += f"\n\n⚠️ {error_text}"
+                    error_occurred = True
+                    await renderer.update(content + notices)
+
+                elif event_type == "warning":
+                    # Non-fatal warning — append to response
+                    title = get("title", "Warning")
+                    event_msg = get("message", "")
+                    warning_text = f"{title}: {event_msg}" if event_msg else title
+                    logger.warning(f"Orchestrator warning: {warning_text}")
+                    notices += f"\n\n⚠️ {warning_text}"
+                    await renderer.update(content + notices)
+
+            if content or notices:
+                await renderer.finish((content + notices).strip())
+            elif not error_occurred:
+                await renderer.finish("No response from agent.")
+            else:
+                await renderer.finish()
+
+            logger.info(
+                f"{self.platform} streaming: {event_count} events, "
+                f"{renderer.edit_count} edits, {renderer.messages_sent} messages, "
+                f"{len(content)} chars response"
+            )
+        except Exception as e:
+            logger.error(f"Chat streaming failed: {e}", exc_info=True)
+            # Append to what was already streamed rather than replacing it
+            failure = "\n\n⚠️ Something went wrong. Please try again later."
+            await renderer.finish((content + notices + failure).strip())
+
     @staticmethod
     def split_response(text: str, max_len: int) -> list[str]:
         """Split response at paragraph boundaries, preserving code blocks."""
@@ -722,4 +1456,5 @@ class BotConnector(ABC):
             "last_message_time": self._last_message_time,
             "reconnect_attempts": self._reconnect_attempts,
             "allowed_users_count": len(self.allowed_users),
+            "dispatch": self.dispatcher.stats(),
         }
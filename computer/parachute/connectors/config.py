@@ -79,6 +79,10 @@ class BotsConfig(BaseModel):
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
     discord: DiscordConfig = Field(default_factory=DiscordConfig)
     matrix: MatrixConfig = Field(default_factory=MatrixConfig)
+    # Concurrent orchestrator turns across all bot chats
+    max_concurrent_turns: int = Field(default=4, ge=1)
+    # Seconds to wait for follow-up messages before starting a turn (0 disables)
+    coalesce_window: float = Field(default=0.75, ge=0)
 
 
 def load_bots_config(parachute_dir: Path) -> BotsConfig:
@@ -10,9 +10,15 @@ Install: pip install 'discord.py>=2.3'
 import asyncio
 import logging
 import time
-from typing import Any, Optional
-
-from parachute.connectors.base import BotConnector, ConnectorState, GroupMessage
+from typing import Any, Awaitable, Callable, Optional
+
+from parachute.connectors.base import (
+    BotConnector,
+    ConnectorState,
+    GroupMessage,
+    StreamingRenderer,
+    StreamPacing,
+)
 from parachute.connectors.message_formatter import claude_to_discord
 
 logger = logging.getLogger(__name__)
@@ -55,6 +61,8 @@ class DiscordConnector(BotConnector):
     """Bridges Discord messages to Parachute Chat sessions."""
 
     platform = "discord"
+    # Discord allows 5 message edits per 5 seconds per channel
+    stream_pacing = StreamPacing(rate=1.0, burst=5, max_message_length=DISCORD_MAX_MESSAGE_LENGTH)
 
     def __init__(
         self,
@@ -260,28 +268,29 @@ class DiscordConnector(BotConnector):
                 logger.debug(f"Ack reaction failed (non-critical): {e}")
 
         # Inject group history for context (wrapped in XML tags to resist prompt injection)
-        effective_message = message_text
+        history = None
         if chat_type == "group":
             recent = self.group_history.get_recent(
                 str(message.channel.id), exclude_message_id=message.id
             )
             if recent:
                 history = self.group_history.format_for_prompt(recent)
-                effective_message = f"{history}\n\n{message_text}"
 
-        # Show typing indicator with per-chat lock
-        lock = self._get_chat_lock(chat_id)
-        async with lock:
+        async def run_turn(text: str) -> None:
+            # Show typing indicator while the reply streams
             async with message.channel.typing():
-                response_text = await self._route_to_chat(
+                # Stream reply, editing it as paragraphs complete (2000 char limit
+                # handled by rolling over into further replies)
+                await self._stream_to_chat(
                     session_id=session.id,
-                    message=effective_message,
+                    message=text,
+                    send=message.reply,
                 )
 
-        # Format and send (handle 2000 char limit)
-        formatted = claude_to_discord(response_text)
-        for chunk in self.split_response(formatted, DISCORD_MAX_MESSAGE_LENGTH):
-            await message.reply(chunk)
+        # Bursts in this channel coalesce into one turn
+        await self.dispatcher.submit(
+            chat_id, message_text, run_turn, session_id=session.id, context=history
+        )
 
         # Remove ack reaction after response
         if ack_sent:
@@ -372,17 +381,15 @@ class DiscordConnector(BotConnector):
             except Exception as e:
                 logger.debug(f"Ack reaction failed (non-critical): {e}")
 
-        lock = self._get_chat_lock(chat_id)
-        async with lock:
+        async def run_turn(turn_text: str) -> None:
             async with message.channel.typing():
-                response_text = await self._route_to_chat(
+                await self._stream_to_chat(
                     session_id=session.id,
-                    message=text,
+                    message=turn_text,
+                    send=message.reply,
                 )
 
-        formatted = claude_to_discord(response_text)
-        for chunk in self.split_response(formatted, DISCORD_MAX_MESSAGE_LENGTH):
-            await message.reply(chunk)
+        await self.dispatcher.submit(chat_id, text, run_turn, session_id=session.id)
 
         if ack_sent:
             try:
@@ -460,17 +467,15 @@ class DiscordConnector(BotConnector):
             self._init_nudge_sent[chat_id] = count + 1
             return
 
-        response_text = await self._route_to_chat(
-            session_id=session.id,
-            message=message,
-        )
+        async def run_turn(text: str) -> None:
+            await self._stream_to_chat(
+                session_id=session.id,
+                message=text,
+                send=lambda reply: interaction.followup.send(reply, wait=True),
+                send_more=interaction.channel.send,
+            )
 
-        formatted = claude_to_discord(response_text)
-        for i, chunk in enumerate(self.split_response(formatted, DISCORD_MAX_MESSAGE_LENGTH)):
-            if i == 0:
-                await interaction.followup.send(chunk)
-            else:
-                await interaction.channel.send(chunk)
+        await self.dispatcher.submit(chat_id, message, run_turn, session_id=session.id)
 
     async def _handle_journal(self, interaction: Any, entry: str) -> None:
         """Handle /journal slash command."""
@@ -495,59 +500,36 @@ class DiscordConnector(BotConnector):
         )
         await interaction.followup.send(response)
 
-    async def _route_to_chat(self, session_id: str, message: str) -> str:
-        """Route a message through the Chat orchestrator and collect response."""
-        response_text = ""
-        error_occurred = False
-        orchestrate = getattr(self.server, "orchestrate", None)
-        if not orchestrate:
-            logger.error("Server has no orchestrate method")
-            return "Chat orchestrator not available."
-
-        try:
-            event_count = 0
-            async for event in orchestrate(
-                session_id=session_id,
-                message=message,
-                source="discord",
-            ):
-                event_count += 1
-                event_type = event.get("type", "") if isinstance(event, dict) else getattr(event, "type", "")
-                if event_type == "text":
-                    # Use 'content' (full accumulated text) — more resilient than
-                    # accumulating 'delta' fragments, and consistent with Telegram streaming
-                    content = event.get("content", "") if isinstance(event, dict) else getattr(event, "content", "")
-                    if content:
-                        response_text = content
-                elif event_type == "error":
-                    error_msg = event.get("error", "") if isinstance(event, dict) else getattr(event, "error", "")
-                    logger.error(f"Orchestrator error event: {error_msg}")
-                    error_occurred = True
-
-                elif event_type == "typed_error":
-                    # Structured error with user-friendly message
-                    title = event.get("title", "Error") if isinstance(event, dict) else getattr(event, "title", "Error")
-                    event_msg = event.get("message", "") if isinstance(event, dict) else getattr(event, "message", "")
-                    error_text = f"{title}: {event_msg}" if event_msg else title
-                    logger.error(f"Orchestrator typed error: {error_text}")
-                    response_text += f"\n\n⚠️ {error_text}"
-                    error_occurred = True
-
-                elif event_type == "warning":
-                    # Non-fatal warning — append to response
-                    title = event.get("title", "Warning") if isinstance(event, dict) else getattr(event, "title", "Warning")
-                    event_msg = event.get("message", "") if isinstance(event, dict) else getattr(event, "message", "")
-                    warning_text = f"{title}: {event_msg}" if event_msg else title
-                    logger.warning(f"Orchestrator warning: {warning_text}")
-                    response_text += f"\n\n⚠️ {warning_text}"
-            logger.info(f"Discord orchestration: {event_count} events, {len(response_text)} chars response")
-        except Exception as e:
-            logger.error(f"Chat orchestration failed: {e}", exc_info=True)
-            return "Something went wrong. Please try again later."
-
-        if not response_text and not error_occurred:
-            response_text = "No response from agent."
-        return response_text
+    async def _stream_to_chat(
+        self,
+        session_id: str,
+        message: str,
+        send: Callable[[str], Awaitable[Any]],
+        send_more: Callable[[str], Awaitable[Any]] | None = None,
+    ) -> None:
+        """Stream an orchestrator response into Discord messages.
+
+        The first message is posted with ``send``; overflow past the 2000 char
+        limit goes out via ``send_more`` (defaults to ``send``).
+        """
+        sent = 0
+
+        async def post(text: str, raw: str) -> Any:
+            nonlocal sent
+            target = send if sent == 0 or send_more is None else send_more
+            sent += 1
+            return await target(text)
+
+        async def edit(msg: Any, text: str, raw: str) -> None:
+            await msg.edit(content=text)
+
+        renderer = StreamingRenderer(
+            send=post,
+            edit=edit,
+            format_block=claude_to_discord,
+            pacing=self.stream_pacing,
+        )
+        await self.stream_response(session_id, message, renderer)
 
     async def send_message(self, chat_id: str, text: str) -> None:
         """Send a message to a Discord channel."""
@@ -14,8 +14,15 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Optional, TypedDict
 
-from parachute.connectors.base import BotConnector, ConnectorState, GroupMessage
-from parachute.connectors.message_formatter import claude_to_matrix
+from parachute.connectors.base import (
+    BotConnector,
+    ConnectorState,
+    GroupMessage,
+    StreamingRenderer,
+    StreamPacing,
+    StreamRateLimited,
+)
+from parachute.connectors.message_formatter import claude_to_matrix, claude_to_plain
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +91,8 @@ class MatrixConnector(BotConnector):
     """Bridges Matrix messages to Parachute Chat sessions."""
 
     platform = "matrix"
+    # Synapse's default rc_message: 0.2 events/sec with a burst of 10
+    stream_pacing = StreamPacing(rate=0.2, burst=10, max_message_length=MATRIX_MAX_MESSAGE_LENGTH)
 
     def __init__(
         self,
@@ -194,10 +203,14 @@ class MatrixConnector(BotConnector):
             self._initial_sync_done = True
             return
 
-        await self.on_text_message(
-            update={"room": room, "event": event},
-            context=None,
-        )
+        # nio awaits callbacks in order — don't hold the sync loop for a whole turn.
+        # !commands wait for the room's in-flight messages (ChatGate).
+        command = (getattr(event, "body", "") or "").lstrip().startswith("!")
+        self._spawn_handler(self._gated(
+            room.room_id,
+            self.on_text_message(update={"room": room, "event": event}, context=None),
+            command=command,
+        ))
 
     async def _on_audio_message(self, room: Any, event: Any) -> None:
         """Callback for RoomMessageAudio events."""
@@ -205,10 +218,10 @@ class MatrixConnector(BotConnector):
             return
         if not self._initial_sync_done:
             return
-        await self.on_voice_message(
-            update={"room": room, "event": event},
-            context=None,
-        )
+        self._spawn_handler(self._gated(
+            room.room_id,
+            self.on_voice_message(update={"room": room, "event": event}, context=None),
+        ))
 
     async def _on_invite(self, room: Any, event: Any) -> None:
         """Handle room invites.
@@ -463,16 +476,13 @@ class MatrixConnector(BotConnector):
                 logger.debug(f"Ack reaction failed (non-critical): {e}")
 
         # Inject group history for context
-        effective_message = message_text
+        history_text = None
         if chat_type == "group":
             recent = self.group_history.get_recent(room_id, exclude_message_id=event.event_id)
             if recent:
                 history_text = self.group_history.format_for_prompt(recent)
-                effective_message = f"{history_text}\n\n{message_text}"
 
-        # Show typing indicator with per-chat lock
-        lock = self._get_chat_lock(room_id)
-        async with lock:
+        async def run_turn(message: str) -> None:
             # Start typing indicator
             if self._client:
                 try:
@@ -480,9 +490,11 @@ class MatrixConnector(BotConnector):
                 except Exception:
                     pass
 
-            response_text = await self._route_to_chat(
+            # Stream response as an edited (m.replace) message
+            await self._stream_to_chat(
+                room_id=room_id,
                 session_id=session.id,
-                message=effective_message,
+                message=message,
             )
 
             # Stop typing indicator
@@ -492,10 +504,10 @@ class MatrixConnector(BotConnector):
                 except Exception:
                     pass
 
-        # Format and send (handle 25K char limit)
-        plain, html = claude_to_matrix(response_text)
-        for chunk_plain, chunk_html in self._split_matrix_response(plain, html):
-            await self._send_room_message(room_id, chunk_plain, chunk_html)
+        # Bursts in this room coalesce into one turn
+        await self.dispatcher.submit(
+            room_id, message_text, run_turn, session_id=session.id, context=history_text
+        )
 
         # Remove ack reaction after response (Matrix requires redaction)
         if ack_event_id and self._client:
@@ -743,77 +755,72 @@ class MatrixConnector(BotConnector):
         except Exception as e:
             logger.error(f"Failed to send Matrix message to {room_id}: {e}")
 
-    def _split_matrix_response(
-        self, plain: str, html: str
-    ) -> list[tuple[str, str]]:
-        """Split a response into chunks that fit within Matrix limits.
+    async def _stream_to_chat(self, room_id: str, session_id: str, message: str) -> None:
+        """Stream an orchestrator response into a room, editing it in place.
 
-        Returns list of (plain_chunk, html_chunk) tuples.
-        For simplicity, split based on plain text length and pair with
-        corresponding HTML chunks (split at same boundaries).
+        Edits use m.replace relations; clients without edit support show the
+        "* " fallback body. Responses past the 25K limit roll over into new
+        messages.
         """
-        if len(plain) <= MATRIX_MAX_MESSAGE_LENGTH:
-            return [(plain, html)]
-
-        # Split plain text, send HTML only with first chunk
-        plain_chunks = self.split_response(plain, MATRIX_MAX_MESSAGE_LENGTH)
-        result = []
-        for i, chunk in enumerate(plain_chunks):
-            if i == 0:
-                result.append((chunk, html))
-            else:
-                result.append((chunk, ""))
-        return result
-
-    async def _route_to_chat(self, session_id: str, message: str) -> str:
-        """Route a message through the Chat orchestrator and collect response."""
-        response_text = ""
-        error_occurred = False
-        orchestrate = getattr(self.server, "orchestrate", None)
-        if not orchestrate:
-            logger.error("Server has no orchestrate method")
-            return "Chat orchestrator not available."
 
-        try:
-            event_count = 0
-            async for event in orchestrate(
-                session_id=session_id,
-                message=message,
-                source="matrix",
-            ):
-                event_count += 1
-                event_type = event.get("type", "") if isinstance(event, dict) else getattr(event, "type", "")
-                if event_type == "text":
-                    content = event.get("content", "") if isinstance(event, dict) else getattr(event, "content", "")
-                    if content:
-                        response_text = content
-                elif event_type == "error":
-                    error_msg = event.get("error", "") if isinstance(event, dict) else getattr(event, "error", "")
-                    logger.error(f"Orchestrator error event: {error_msg}")
-                    error_occurred = True
-
-                elif event_type == "typed_error":
-                    title = event.get("title", "Error") if isinstance(event, dict) else getattr(event, "title", "Error")
-                    event_msg = event.get("message", "") if isinstance(event, dict) else getattr(event, "message", "")
-                    error_text = f"{title}: {event_msg}" if event_msg else title
-                    logger.error(f"Orchestrator typed error: {error_text}")
-                    response_text += f"\n\n⚠️ {error_text}"
-                    error_occurred = True
-
-                elif event_type == "warning":
-                    title = event.get("title", "Warning") if isinstance(event, dict) else getattr(event, "title", "Warning")
-                    event_msg = event.get("message", "") if isinstance(event, dict) else getattr(event, "message", "")
-                    warning_text = f"{title}: {event_msg}" if event_msg else title
-                    logger.warning(f"Orchestrator warning: {warning_text}")
-                    response_text += f"\n\n⚠️ {warning_text}"
-            logger.info(f"Matrix orchestration: {event_count} events, {len(response_text)} chars response")
-        except Exception as e:
-            logger.error(f"Chat orchestration failed: {e}", exc_info=True)
-            return "Something went wrong. Please try again later."
+        async def send(html: str, raw: str) -> str | None:
+            return await self._room_send_streaming(room_id, raw, html)
+
+        async def edit(event_id: str, html: str, raw: str) -> None:
+            await self._room_send_streaming(room_id, raw, html, replaces=event_id)
+
+        renderer = StreamingRenderer(
+            send=send,
+            edit=edit,
+            format_block=lambda raw: claude_to_matrix(raw)[1],
+            pacing=self.stream_pacing,
+            separator="<br/><br/>",
+        )
+        await self.stream_response(session_id, message, renderer)
 
-        if not response_text and not error_occurred:
-            response_text = "No response from agent."
-        return response_text
+    async def _room_send_streaming(
+        self,
+        room_id: str,
+        raw: str,
+        html: str,
+        replaces: str | None = None,
+    ) -> str | None:
+        """Send (or edit) a streamed message, returning its event ID.
+
+        Raises StreamRateLimited on M_LIMIT_EXCEEDED so the renderer backs off.
+        """
+        if not self._client:
+            return None
+
+        content: dict[str, Any] = {
+            "msgtype": "m.text",
+            "body": claude_to_plain(raw),
+            "format": "org.matrix.custom.html",
+            "formatted_body": html,
+        }
+        if replaces:
+            content = {
+                "msgtype": "m.text",
+                "body": f"* {content['body']}",
+                "format": "org.matrix.custom.html",
+                "formatted_body": f"* {html}",
+                "m.new_content": content,
+                "m.relates_to": {"rel_type": "m.replace", "event_id": replaces},
+            }
+
+        response = await self._client.room_send(
+            room_id,
+            message_type="m.room.message",
+            content=content,
+        )
+        event_id = getattr(response, "event_id", None)
+        if event_id:
+            return event_id
+        if getattr(response, "status_code", None) == "M_LIMIT_EXCEEDED":
+            retry_after_ms = getattr(response, "retry_after_ms", None) or 1000
+            raise StreamRateLimited(retry_after_ms / 1000)
+        logger.warning(f"Matrix streamed send failed in {room_id}: {response}")
+        return replaces
 
     async def send_message(self, chat_id: str, text: str) -> None:
         """Send a message to a Matrix room (public API)."""
@@ -166,7 +166,8 @@ def claude_to_matrix(text: str) -> tuple[str, str]:
     # Unordered lists (- or * items)
     def _convert_ul(match: re.Match) -> str:
         lines = match.group(0).strip().split("\n")
-        items = "".join(f"<li>{re.sub(r'^[*-]\\s+', '', line)}</li>" for line in lines)
+        texts = (re.sub(r"^[*-]\s+", "", line) for line in lines)
+        items = "".join(f"<li>{text}</li>" for text in texts)
         return f"<ul>{items}</ul>"
 
     html = re.sub(r"(?:^[*-]\s+.+$\n?)+", _convert_ul, html, flags=re.MULTILINE)
@@ -174,7 +175,8 @@ def claude_to_matrix(text: str) -> tuple[str, str]:
     # Ordered lists (1. items)
     def _convert_ol(match: re.Match) -> str:
         lines = match.group(0).strip().split("\n")
-        items = "".join(f"<li>{re.sub(r'^\\d+\\.\\s+', '', line)}</li>" for line in lines)
+        texts = (re.sub(r"^\d+\.\s+", "", line) for line in lines)
+        items = "".join(f"<li>{text}</li>" for text in texts)
         return f"<ol>{items}</ol>"
 
     html = re.sub(r"(?:^\d+\.\s+.+$\n?)+", _convert_ol, html, flags=re.MULTILINE)
@@ -12,9 +12,16 @@ import logging
 import re
 import time
 from datetime import datetime, timezone
-from typing import Any, Optional
-
-from parachute.connectors.base import BotConnector, ConnectorState, GroupMessage
+from typing import Any, Callable, Optional
+
+from parachute.connectors.base import (
+    BotConnector,
+    ConnectorState,
+    GroupMessage,
+    StreamingRenderer,
+    StreamPacing,
+    rate_limit_delay,
+)
 from parachute.connectors.message_formatter import claude_to_telegram
 
 logger = logging.getLogger(__name__)
@@ -35,12 +42,16 @@ except ImportError:
 
 # Telegram message limits
 TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+TELEGRAM_GROUP_STREAM_PACING = StreamPacing(
+    rate=1 / 3, burst=3, max_message_length=TELEGRAM_MAX_MESSAGE_LENGTH
+)
 
 
 class TelegramConnector(BotConnector):
     """Bridges Telegram messages to Parachute Chat sessions."""
 
     platform = "telegram"
+    stream_pacing = StreamPacing(rate=1.0, burst=3, max_message_length=TELEGRAM_MAX_MESSAGE_LENGTH)
 
     def __init__(
         self,
@@ -86,24 +97,41 @@ class TelegramConnector(BotConnector):
 
     def _build_app(self) -> "Application":
         """Build a fresh Application with all handlers registered."""
-        app = Application.builder().token(self.bot_token).build()
-
-        app.add_handler(CommandHandler("start", self._cmd_start))
-        app.add_handler(CommandHandler("help", self._cmd_help))
-        app.add_handler(CommandHandler("new", self._cmd_new))
-        app.add_handler(CommandHandler("ask", self._cmd_ask))
-        app.add_handler(CommandHandler("journal", self._cmd_journal))
-        app.add_handler(CommandHandler("j", self._cmd_journal))
-        app.add_handler(CommandHandler("init", self._cmd_init))
+        # Handlers await their whole turn; process updates concurrently so a
+        # running turn doesn't block the next message (and bursts can coalesce).
+        # Commands still wait for the chat's in-flight messages (ChatGate).
+        app = Application.builder().token(self.bot_token).concurrent_updates(True).build()
+
+        command = self._chat_gated(command=True)
+        message = self._chat_gated(command=False)
+        app.add_handler(CommandHandler("start", command(self._cmd_start)))
+        app.add_handler(CommandHandler("help", command(self._cmd_help)))
+        app.add_handler(CommandHandler("new", command(self._cmd_new)))
+        app.add_handler(CommandHandler("ask", message(self._cmd_ask)))
+        app.add_handler(CommandHandler("journal", command(self._cmd_journal)))
+        app.add_handler(CommandHandler("j", command(self._cmd_journal)))
+        app.add_handler(CommandHandler("init", command(self._cmd_init)))
         app.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self.on_text_message)
+            MessageHandler(filters.TEXT & ~filters.COMMAND, message(self.on_text_message))
         )
         app.add_handler(
-            MessageHandler(filters.VOICE | filters.AUDIO, self.on_voice_message)
+            MessageHandler(filters.VOICE | filters.AUDIO, message(self.on_voice_message))
         )
 
         return app
 
+    def _chat_gated(self, command: bool) -> Callable[[Callable], Callable]:
+        """Wrap PTB callbacks so they run under the update's chat gate."""
+        def wrap(handler: Callable) -> Callable:
+            async def gated(update: Any, context: Any) -> None:
+                chat = getattr(update, "effective_chat", None)
+                if chat is None:
+                    await handler(update, context)
+                    return
+                await self._gated(str(chat.id), handler(update, context), command=command)
+            return gated
+        return wrap
+
     async def _run_loop(self) -> None:
         """Run Telegram long-polling. Blocks until updater stops or stop is requested.
 
@@ -405,7 +433,7 @@ class TelegramConnector(BotConnector):
                 logger.debug(f"Ack reaction failed (non-critical): {e}")
 
         # Inject group history for context (wrapped in XML tags to resist prompt injection)
-        effective_message = message_text
+        history_block = None
         if chat_type == "group":
             recent = self.group_history.get_recent(
                 chat_id,
@@ -414,14 +442,8 @@ class TelegramConnector(BotConnector):
             )
             if recent:
                 history_block = self.group_history.format_for_prompt(recent)
-                effective_message = (
-                    f"{history_block}\n\n"
-                    f"{message_text}"
-                )
 
-        # Route through Chat orchestrator with streaming (per-chat lock)
-        lock = self._get_chat_lock(chat_id)
-        async with lock:
+        async def run_turn(message: str) -> None:
             # Send placeholder message
             placeholder = None
             try:
@@ -432,11 +454,16 @@ class TelegramConnector(BotConnector):
             # Stream response — edits placeholder progressively
             await self._stream_to_chat(
                 session_id=session.id,
-                message=effective_message,
+                message=message,
                 update=update,
                 placeholder=placeholder,
             )
 
+        # Route through Chat orchestrator; bursts in this chat coalesce into one turn
+        await self.dispatcher.submit(
+            chat_id, message_text, run_turn, session_id=session.id, context=history_block
+        )
+
         # Remove ack reaction after response
         if ack_sent and update.message:
             try:
@@ -511,194 +538,63 @@ class TelegramConnector(BotConnector):
         update: Any,
         placeholder: Any | None = None,
     ) -> None:
-        """Stream orchestrator response to Telegram, editing draft message progressively."""
-        orchestrate = getattr(self.server, "orchestrate", None)
-        if not orchestrate:
-            logger.error("Server has no orchestrate method")
-            error_text = "Chat orchestrator not available."
-            if placeholder:
-                try:
-                    await placeholder.edit_text(error_text)
-                except Exception:
-                    await update.message.reply_text(error_text)
-            else:
-                await update.message.reply_text(error_text)
-            return
-
-        draft_msg = placeholder
-        buffer = ""
-        last_edit_len = 0
-        edit_count = 0
-        max_edits = 25  # Stay under Telegram's ~30-40 edit limit
-        min_edit_delta = 150  # Min chars between edits
-        error_occurred = False
-
-        try:
-            event_count = 0
-            async for event in orchestrate(
-                session_id=session_id,
-                message=message,
-                source="telegram",
-            ):
-                event_count += 1
-                event_type = (
-                    event.get("type", "") if isinstance(event, dict)
-                    else getattr(event, "type", "")
-                )
+        """Stream orchestrator response to Telegram, editing draft message progressively.
 
-                if event_type == "text":
-                    content = (
-                        event.get("content", "") if isinstance(event, dict)
-                        else getattr(event, "content", "")
-                    )
-                    if content:
-                        buffer = content
-
-                        # Edit draft when enough new content has accumulated
-                        delta_since_edit = len(buffer) - last_edit_len
-                        if delta_since_edit >= min_edit_delta and edit_count < max_edits:
-                            draft_msg = await self._edit_draft(
-                                update, draft_msg, buffer
-                            )
-                            last_edit_len = len(buffer)
-                            edit_count += 1
-
-                elif event_type == "error":
-                    error_msg = (
-                        event.get("error", "") if isinstance(event, dict)
-                        else getattr(event, "error", "")
-                    )
-                    logger.error(f"Orchestrator error event: {error_msg}")
-                    error_occurred = True
-
-                elif event_type == "typed_error":
-                    # Structured error with user-friendly message
-                    title = event.get("title", "Error") if isinstance(event, dict) else getattr(event, "title", "Error")
-                    message = event.get("message", "") if isinstance(event, dict) else getattr(event, "message", "")
-                    error_text = f"{title}: {message}" if message else title
-                    logger.error(f"Orchestrator typed error: {error_text}")
-                    buffer += f"\n\n⚠️ {error_text}"
-                    error_occurred = True
-
-                elif event_type == "warning":
-                    # Non-fatal warning — append to response
-                    title = event.get("title", "Warning") if isinstance(event, dict) else getattr(event, "title", "Warning")
-                    message = event.get("message", "") if isinstance(event, dict) else getattr(event, "message", "")
-                    warning_text = f"{title}: {message}" if message else title
-                    logger.warning(f"Orchestrator warning: {warning_text}")
-                    buffer += f"\n\n⚠️ {warning_text}"
-
-            # Final edit with complete formatted response
-            if buffer:
-                formatted = claude_to_telegram(buffer)
-                chunks = self.split_response(formatted, TELEGRAM_MAX_MESSAGE_LENGTH)
-
-                # Edit first chunk into draft, or send as reply
-                if draft_msg:
-                    await self._send_formatted(
-                        chunks[0], edit_msg=draft_msg, fallback_reply=update.message
-                    )
-                else:
-                    await self._send_formatted(
-                        chunks[0], reply_to=update.message
-                    )
-
-                # Send remaining chunks as replies
-                for chunk in chunks[1:]:
-                    await self._send_formatted(
-                        chunk, reply_to=update.message
-                    )
-            elif not error_occurred:
-                no_response = "No response from agent."
-                if draft_msg:
-                    try:
-                        await draft_msg.edit_text(no_response)
-                    except Exception:
-                        await update.message.reply_text(no_response)
-                else:
-                    await update.message.reply_text(no_response)
+        Completed paragraphs are sent as MarkdownV2 as soon as they finish;
+        replies longer than one message roll over into follow-up replies.
+        """
+        chat_type = "dm" if update.effective_chat.type == "private" else "group"
 
-            logger.info(
-                f"Telegram streaming: {event_count} events, "
-                f"{edit_count} edits, {len(buffer)} chars response"
-            )
+        async def send(text: str, raw: str) -> Any:
+            return await self._send_formatted(text, raw, reply_to=update.message)
 
-        except Exception as e:
-            logger.error(f"Chat streaming failed: {e}", exc_info=True)
-            error_text = "Something went wrong. Please try again later."
-            if draft_msg:
-                try:
-                    await draft_msg.edit_text(error_text)
-                except Exception:
-                    await update.message.reply_text(error_text)
-            else:
-                await update.message.reply_text(error_text)
+        async def edit(msg: Any, text: str, raw: str) -> None:
+            await self._send_formatted(text, raw, edit_msg=msg)
 
-    async def _edit_draft(
-        self,
-        update: Any,
-        draft_msg: Any | None,
-        text: str,
-    ) -> Any:
-        """Edit draft message with intermediate streaming content.
-
-        Uses plain text for intermediate edits (faster, no parse errors).
-        Returns the draft message object (creates one if needed).
-        """
-        # Truncate for intermediate display if over Telegram limit
-        display_text = text
-        if len(display_text) > TELEGRAM_MAX_MESSAGE_LENGTH:
-            display_text = display_text[: TELEGRAM_MAX_MESSAGE_LENGTH - 20] + "\n\n...streaming..."
+        renderer = StreamingRenderer(
+            send=send,
+            edit=edit,
+            format_block=claude_to_telegram,
+            pacing=self.stream_pacing_for(chat_type),
+            message=placeholder,
+        )
+        await self.stream_response(session_id, message, renderer)
 
-        if draft_msg is None:
-            try:
-                return await update.message.reply_text(display_text)
-            except Exception as e:
-                logger.debug(f"Draft creation failed: {e}")
-                return None
-        else:
-            try:
-                await draft_msg.edit_text(display_text)
-            except Exception as e:
-                if "not modified" not in str(e).lower():
-                    logger.debug(f"Draft edit failed: {e}")
-            return draft_msg
+    def stream_pacing_for(self, chat_type: str) -> StreamPacing:
+        # Telegram allows ~1 message/sec per chat, but only ~20/min in groups
+        if chat_type == "group":
+            return TELEGRAM_GROUP_STREAM_PACING
+        return self.stream_pacing
 
     async def _send_formatted(
         self,
         text: str,
+        raw: str,
         *,
         edit_msg: Any | None = None,
         reply_to: Any | None = None,
-        fallback_reply: Any | None = None,
-    ) -> None:
+    ) -> Any:
         """Send or edit a message with MarkdownV2, falling back to plain text.
 
         Either edit_msg (edit existing) or reply_to (send new) must be provided.
-        fallback_reply is used when edit fails entirely (e.g. message was deleted).
+        Rate-limit errors (RetryAfter) propagate so the caller can back off.
+        Returns the sent or edited message.
         """
         if edit_msg:
             try:
                 await edit_msg.edit_text(text, parse_mode="MarkdownV2")
-                return
-            except Exception:
-                pass
-            try:
-                await edit_msg.edit_text(text)
-                return
             except Exception as e:
-                logger.warning(f"Final edit failed (message may be deleted): {e}")
-                # Fall through to reply as last resort
-                if fallback_reply:
-                    reply_to = fallback_reply
-                else:
-                    return
+                if rate_limit_delay(e) is not None or "not modified" in str(e).lower():
+                    raise
+                await edit_msg.edit_text(raw)
+            return edit_msg
 
-        if reply_to:
-            try:
-                await reply_to.reply_text(text, parse_mode="MarkdownV2")
-            except Exception:
-                await reply_to.reply_text(text)
+        try:
+            return await reply_to.reply_text(text, parse_mode="MarkdownV2")
+        except Exception as e:
+            if rate_limit_delay(e) is not None:
+                raise
+            return await reply_to.reply_text(raw)
 
     async def _route_to_daily(self, text: str, update: Any) -> str:
         """Route to Daily module for journal entry creation."""
@@ -3,28 +3,196 @@ Event-driven Tool dispatcher.
 
 Discovers triggered Tools matching a Note lifecycle event (e.g.,
 "note.transcription_complete") via Trigger→Tool graph edges and
-invokes them sequentially on the triggering entry.
+invokes them on the triggering entry.
+
+Triggers are served from an in-memory index keyed by event, with each
+event_filter compiled once into a predicate. The index is rebuilt lazily
+after invalidate_trigger_index() (called by the Tool/Trigger CRUD routes)
+or after INDEX_TTL_SECONDS as a safety net for out-of-band graph edits.
+
+Matching Tools run on a dependency-aware plan: Tools that can mutate the
+Note run in their original (name) order, read-only Tools only wait for
+the mutations ordered before them, and everything else runs concurrently
+under MAX_CONCURRENT_AGENTS.
 
 The dispatcher is event-agnostic — it finds, invokes, and records.
 Lifecycle bookkeeping (cleanup_status, transcription_status) belongs
 in the module that owns the domain semantics (DailyModule).
 """
 
+import asyncio
 import json
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# Tools whose presence in an agent's CAN_CALL set means it mutates the Note
+NOTE_MUTATING_TOOLS = frozenset({"update-this-note", "update-note-tags", "update-note-metadata"})
+
+# Max triggered agents running at once for a single event
+MAX_CONCURRENT_AGENTS = 3
+
+# Rebuild the trigger index at least this often, even without invalidation
+INDEX_TTL_SECONDS = 300.0
+
+FilterPredicate = Callable[[dict[str, Any]], bool]
+
+
+def compile_filter(trigger_filter: dict[str, Any]) -> FilterPredicate:
+    """
+    Compile a Trigger's event_filter into a predicate over entry metadata.
+
+    Filter semantics:
+    - {} → always matches (no filter)
+    - {"entry_type": "voice"} → entry must have matching entry_type
+    - {"tags": ["meeting"]} → entry must have at least one matching tag
+    - Multiple keys → ALL must match (AND)
+    """
+    checks: list[FilterPredicate] = []
+    for key, expected in (trigger_filter or {}).items():
+        if key == "tags":
+            # Tags filter: entry must have at least one of the expected tags.
+            # A tuple, not a set: hand-edited filters may hold unhashable values
+            expected_tags = tuple(expected if isinstance(expected, list) else [expected])
+
+            def check_tags(meta: dict[str, Any], _expected=expected_tags) -> bool:
+                entry_tags = meta.get("tags") or []
+                if isinstance(entry_tags, str):
+                    entry_tags = [entry_tags]
+                return any(t in _expected for t in entry_tags)
+
+            checks.append(check_tags)
+        else:
+            # Equality for entry_type and any other filter key
+            def check_eq(meta: dict[str, Any], _key=key, _expected=expected) -> bool:
+                return meta.get(_key) == _expected
+
+            checks.append(check_eq)
+
+    if not checks:
+        return lambda meta: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda meta: all(check(meta) for check in checks)
+
+
+@dataclass(frozen=True)
+class IndexedTrigger:
+    """An enabled event Trigger→Tool edge, ready to match."""
+
+    name: str
+    display_name: str | None
+    event_filter: dict[str, Any]
+    matches: FilterPredicate
+    mutates_note: bool
+
+
+class _TriggerIndex:
+    """Process-wide event → triggers index, shared by all dispatchers."""
+
+    def __init__(self):
+        self.by_event: dict[str, list[IndexedTrigger]] | None = None
+        self.built_at = 0.0
+        self.generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self.by_event = None
+
+    async def get(self, graph: Any) -> dict[str, list[IndexedTrigger]]:
+        by_event = self.by_event
+        if by_event is not None and time.monotonic() - self.built_at < INDEX_TTL_SECONDS:
+            return by_event
+        async with self._lock:
+            if self.by_event is not None and time.monotonic() - self.built_at < INDEX_TTL_SECONDS:
+                return self.by_event
+            generation = self.generation
+            by_event = await _load_trigger_index(graph)
+            # Don't publish an index that was invalidated while loading
+            if generation == self.generation:
+                self.by_event = by_event
+                self.built_at = time.monotonic()
+            return by_event
+
+
+_trigger_index = _TriggerIndex()
+
+
+def invalidate_trigger_index() -> None:
+    """Drop the cached trigger index (call after any Tool/Trigger write)."""
+    _trigger_index.invalidate()
+
+
+async def _load_trigger_index(graph: Any) -> dict[str, list[IndexedTrigger]]:
+    rows = await graph.execute_cypher(
+        "MATCH (tr:Trigger)-[:INVOKES]->(t:Tool) "
+        "WHERE tr.enabled = 'true' AND tr.event IS NOT NULL AND tr.event <> '' "
+        "RETURN tr.event AS event, t.name AS name, t.display_name AS display_name, "
+        "       tr.event_filter AS event_filter, t.write_query AS write_query "
+        "ORDER BY t.name"
+    )
+    child_rows = await graph.execute_cypher(
+        "MATCH (t:Tool)-[:CAN_CALL]->(c:Tool) RETURN t.name AS parent, c.name AS child"
+    )
+    children: dict[str, set[str]] = {}
+    for row in child_rows:
+        children.setdefault(row.get("parent"), set()).add(row.get("child"))
+
+    by_event: dict[str, list[IndexedTrigger]] = {}
+    for row in rows:
+        filter_raw = row.get("event_filter") or "{}"
+        try:
+            trigger_filter = json.loads(filter_raw) if isinstance(filter_raw, str) else filter_raw
+        except (json.JSONDecodeError, TypeError):
+            trigger_filter = {}
+        if not isinstance(trigger_filter, dict):
+            trigger_filter = {}
+        name = row["name"]
+        by_event.setdefault(row["event"], []).append(IndexedTrigger(
+            name=name,
+            display_name=row.get("display_name"),
+            event_filter=trigger_filter,
+            matches=compile_filter(trigger_filter),
+            mutates_note=bool(row.get("write_query")) or bool(children.get(name, set()) & NOTE_MUTATING_TOOLS),
+        ))
+
+    logger.info(
+        f"AgentDispatcher: indexed {sum(len(v) for v in by_event.values())} "
+        f"event trigger(s) across {len(by_event)} event(s)"
+    )
+    return by_event
+
+
+def plan_dependencies(agents: list[IndexedTrigger]) -> list[list[int]]:
+    """
+    For each agent (in dispatch order), the indexes of agents it must wait for.
+
+    Reproduces sequential semantics without full serialization: a mutating
+    agent waits for every agent before it (so earlier readers saw the Note
+    as it was), a read-only agent waits only for earlier mutating agents.
+    """
+    deps: list[list[int]] = []
+    for i, agent in enumerate(agents):
+        if agent.mutates_note:
+            deps.append(list(range(i)))
+        else:
+            deps.append([j for j in range(i) if agents[j].mutates_note])
+    return deps
+
 
 class AgentDispatcher:
     """Discovers triggered Tools and invokes them when events fire."""
 
-    def __init__(self, graph: Any, home_path: Path):
+    def __init__(self, graph: Any, home_path: Path, max_concurrent: int = MAX_CONCURRENT_AGENTS):
         self.graph = graph
         self.home_path = home_path
+        self.max_concurrent = max_concurrent
 
     async def dispatch(
         self,
@@ -33,10 +201,10 @@ class AgentDispatcher:
         entry_meta: dict[str, Any],
     ) -> list[dict[str, Any]]:
         """
-        Find Tools matching this event + filter, invoke them sequentially.
+        Find Tools matching this event + filter and invoke them.
 
-        Sequential execution ensures earlier Tools' mutations (e.g., cleanup)
-        are visible to later Tools (e.g., tagging) on the same Note.
+        Earlier Tools' mutations (e.g., cleanup) stay visible to later Tools
+        (e.g., tagging) on the same Note; see plan_dependencies().
 
         Args:
             event: The lifecycle event (e.g., "note.transcription_complete")
@@ -44,7 +212,7 @@ class AgentDispatcher:
             entry_meta: Note metadata for filter matching (entry_type, tags, date)
 
         Returns:
-            List of result dicts from each invoked Tool
+            List of result dicts from each invoked Tool, in name order
         """
         if self.graph is None:
             logger.warning("AgentDispatcher: graph unavailable, skipping dispatch")
@@ -58,54 +226,52 @@ class AgentDispatcher:
 
         logger.info(
             f"AgentDispatcher: {len(agents)} agent(s) match event={event} "
-            f"for entry {entry_id}: {[a['name'] for a in agents]}"
+            f"for entry {entry_id}: {[a.name for a in agents]}"
         )
 
-        results = []
-        for agent_row in agents:
-            agent_name = agent_row["name"]
-            display_name = agent_row.get("display_name") or agent_name.replace("-", " ").title()
-            result = await self._invoke_agent(
-                agent_name, entry_id, event, entry_meta,
-                display_name=display_name,
-            )
-            results.append(result)
+        deps = plan_dependencies(agents)
+        done = [asyncio.Event() for _ in agents]
+        results: list[dict[str, Any]] = [{} for _ in agents]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent))
+
+        async def run(i: int) -> None:
+            try:
+                for j in deps[i]:
+                    await done[j].wait()
+                agent = agents[i]
+                display_name = agent.display_name or agent.name.replace("-", " ").title()
+                async with semaphore:
+                    results[i] = await self._invoke_agent(
+                        agent.name, entry_id, event, entry_meta,
+                        display_name=display_name,
+                    )
+            finally:
+                done[i].set()
 
+        await asyncio.gather(*(run(i) for i in range(len(agents))))
         return results
 
     async def _find_matching_agents(
         self,
         event: str,
         entry_meta: dict[str, Any],
-    ) -> list[dict[str, Any]]:
-        """Query Trigger→Tool graph for tools matching this event."""
-        matching = []
+    ) -> list[IndexedTrigger]:
+        """Look up indexed triggers for this event and apply their filters."""
         try:
-            rows = await self.graph.execute_cypher(
-                "MATCH (tr:Trigger)-[:INVOKES]->(t:Tool) "
-                "WHERE tr.enabled = 'true' AND tr.event = $event "
-                "RETURN t.name AS name, t.display_name AS display_name, "
-                "       tr.event_filter AS event_filter "
-                "ORDER BY t.name",
-                {"event": event},
-            )
-            for row in rows:
-                filter_raw = row.get("event_filter") or "{}"
-                try:
-                    trigger_filter = json.loads(filter_raw) if isinstance(filter_raw, str) else filter_raw
-                except (json.JSONDecodeError, TypeError):
-                    trigger_filter = {}
-
-                if self._matches_filter(trigger_filter, entry_meta):
-                    matching.append(row)
-                else:
-                    logger.debug(
-                        f"AgentDispatcher: tool '{row.get('name')}' "
-                        f"filter {trigger_filter} doesn't match entry meta"
-                    )
+            index = await _trigger_index.get(self.graph)
         except Exception as e:
             logger.error(f"AgentDispatcher: Trigger→Tool query failed: {e}")
+            return []
 
+        matching = []
+        for trigger in index.get(event, ()):
+            if trigger.matches(entry_meta):
+                matching.append(trigger)
+            else:
+                logger.debug(
+                    f"AgentDispatcher: tool '{trigger.name}' "
+                    f"filter {trigger.event_filter} doesn't match entry meta"
+                )
         return matching
 
     @staticmethod
@@ -113,41 +279,8 @@ class AgentDispatcher:
         trigger_filter: dict[str, Any],
         entry_meta: dict[str, Any],
     ) -> bool:
-        """
-        Check if an entry's metadata matches an Agent's trigger_filter.
-
-        Filter semantics:
-        - {} → always matches (no filter)
-        - {"entry_type": "voice"} → entry must have matching entry_type
-        - {"tags": ["meeting"]} → entry must have at least one matching tag
-        - Multiple keys → ALL must match (AND)
-        """
-        if not trigger_filter:
-            return True
-
-        for key, expected in trigger_filter.items():
-            actual = entry_meta.get(key)
-
-            if key == "tags":
-                # Tags filter: entry must have at least one of the expected tags
-                entry_tags = actual or []
-                if isinstance(entry_tags, str):
-                    entry_tags = [entry_tags]
-                expected_tags = expected if isinstance(expected, list) else [expected]
-                if not any(t in entry_tags for t in expected_tags):
-                    return False
-
-            elif key == "entry_type":
-                # Simple equality check
-                if actual != expected:
-                    return False
-
-            else:
-                # Generic equality for any other filter key
-                if actual != expected:
-                    return False
-
-        return True
+        """Check if an entry's metadata matches an Agent's trigger_filter (see compile_filter)."""
+        return compile_filter(trigger_filter)(entry_meta)
 
     async def _invoke_agent(
         self,
@@ -0,0 +1,104 @@
+"""
+In-process built-in ``parachute`` MCP server for trusted sessions.
+
+The stdio server (parachute.mcp_server) is a subprocess that calls back into
+this server over HTTP, so every memory search crosses two process boundaries.
+Trusted sessions already run inside the server process, so they get the same
+tool set as an SDK MCP server instead:
+
+- Vault tools (search_memory, list_chats, get_chat, ...) call
+  core.vault_tools directly against the shared BrainService.
+- The remaining tools (sessions, tags, brain_*) run the stdio server's own
+  handle_tool_call, with its HTTP client pointed at the FastAPI app through
+  an in-process ASGI transport — same endpoint code, no sockets.
+
+Sandboxed sessions are unaffected: they run in Docker and use the HTTP bridge.
+"""
+
+import json
+import logging
+from typing import Any
+
+from claude_agent_sdk import SdkMcpTool, create_sdk_mcp_server
+
+from parachute import mcp_server
+from parachute.core.interfaces import get_registry
+from parachute.core.vault_tools import VAULT_TOOL_NAMES, call_vault_tool
+from parachute.mcp_server import SessionContext
+
+logger = logging.getLogger(__name__)
+
+SERVER_NAME = "parachute"
+
+_bound_app: Any = None
+
+
+def _bind_app() -> bool:
+    """Point mcp_server's HTTP client at the published ASGI app (once)."""
+    global _bound_app
+    app = get_registry().get("ASGIApp")
+    if app is None:
+        return False
+    if app is not _bound_app:
+        mcp_server.use_in_process_app(app)
+        _bound_app = app
+    return True
+
+
+def is_available() -> bool:
+    """True when the server process can host the built-in tools in-process."""
+    registry = get_registry()
+    return registry.get("BrainDB") is not None and registry.get("ASGIApp") is not None
+
+
+async def call_tool(name: str, arguments: dict[str, Any], context: SessionContext) -> str:
+    """Run one built-in tool in-process; returns the JSON text result."""
+    if name in VAULT_TOOL_NAMES:
+        graph = get_registry().get("BrainDB")
+        if graph is None:
+            return json.dumps({"error": "BrainDB not available"})
+        try:
+            result = await call_vault_tool(graph, name, arguments)
+        except Exception as e:
+            logger.error(f"Built-in tool error ({name}): {e}", exc_info=True)
+            result = {"error": str(e)}
+        return json.dumps(result, indent=2, default=str)
+
+    if not _bind_app():
+        return json.dumps({"error": "Server API not available"})
+    return await mcp_server.handle_tool_call(name, arguments, context)
+
+
+def _make_tool(tool: Any, context: SessionContext) -> SdkMcpTool:
+    async def handler(args: dict[str, Any]) -> dict[str, Any]:
+        text = await call_tool(tool.name, args, context)
+        return {"content": [{"type": "text", "text": text}]}
+
+    return SdkMcpTool(
+        name=tool.name,
+        description=tool.description or "",
+        input_schema=tool.inputSchema,
+        handler=handler,
+    )
+
+
+def create_builtin_mcp_server(context: SessionContext) -> dict[str, Any]:
+    """SDK MCP server config exposing the stdio server's tool set for one session."""
+    tools = [_make_tool(t, context) for t in mcp_server.TOOLS]
+    return create_sdk_mcp_server(name=SERVER_NAME, version="1.0.0", tools=tools)
+
+
+def with_in_process_builtin(
+    servers: dict[str, Any] | None,
+    context: SessionContext,
+) -> dict[str, Any] | None:
+    """Swap the built-in stdio ``parachute`` server for the in-process one.
+
+    Leaves ``servers`` untouched when the built-in is absent (filtered out or
+    overridden by a user config) or the process can't host it.
+    """
+    if not servers or not servers.get(SERVER_NAME, {}).get("_builtin"):
+        return servers
+    if not is_available():
+        return servers
+    return {**servers, SERVER_NAME: create_builtin_mcp_server(context)}
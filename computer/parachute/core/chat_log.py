@@ -14,12 +14,22 @@ Key features:
 - Each session gets one para:ID per day (linked in frontmatter)
 - Activities append to the session's entry throughout the day
 - Supports session continuations from previous days
+
+Writes are append-only where possible: each day file has an in-memory index
+(para_id → byte range, session → para_id), new entries are a single write at
+the end of the file, and edits splice only the bytes from the edited entry
+onward. Frontmatter rewrites are debounced, and a per-file lock serializes
+writers so concurrent loggers don't lose updates.
 """
 
 import logging
+import os
 import random
 import re
 import string
+import tempfile
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -31,6 +41,14 @@ logger = logging.getLogger(__name__)
 # Characters for para ID generation (same as Daily)
 PARA_ID_CHARS = string.ascii_lowercase + string.digits
 
+# Seconds to coalesce frontmatter rewrites after an append
+FRONTMATTER_FLUSH_DELAY = 2.0
+
+_ENTRY_SEPARATOR = b"\n\n---\n\n"
+_NEXT_ENTRY_RE = re.compile(rb"\n---\n\n# para:")
+_HEADER_RE = re.compile(rb"# para:(\S+) ([^\n]+)\n")
+_SESSION_LINE_RE = re.compile(rb"^Session: `([^`]+)`", re.MULTILINE)
+
 
 def generate_para_id(length: int = 6) -> str:
     """Generate a random para ID like 'rhxo89'."""
@@ -87,16 +105,48 @@ class ChatLogEntry:
         return meta
 
 
+@dataclass
+class _EntrySpan:
+    """Byte range of one entry's content, relative to the start of the body.
+
+    ``start`` is just past the ``# para:`` header line; ``end`` is where the
+    next entry's separator begins, or None for the last entry (runs to EOF).
+    """
+    start: int
+    end: Optional[int] = None
+
+
+@dataclass
+class _DayIndex:
+    """In-memory view of one day's log file."""
+    path: Path
+    frontmatter: dict
+    body_start: int  # byte offset of the body within the file
+    body_len: int  # body length in bytes
+    content_end: int  # body length with trailing whitespace stripped
+    spans: dict[str, _EntrySpan] = field(default_factory=dict)
+    order: list[str] = field(default_factory=list)
+    sessions: dict[str, str] = field(default_factory=dict)  # session → para_id
+    stat_key: tuple[int, int] = (0, 0)  # (size, mtime_ns) after our last write
+    dirty: bool = False  # frontmatter on disk is behind self.frontmatter
+
+
 class ChatLogService:
     """
     Service for appending entries to Daily/chat-log/.
 
-    Uses surgical append to avoid conflicts with external editors.
+    Uses surgical append to avoid conflicts with external editors: the file
+    is re-indexed whenever its size or mtime no longer match our last write.
     """
 
-    def __init__(self, home_path: Path):
+    def __init__(self, home_path: Path, flush_delay: float = FRONTMATTER_FLUSH_DELAY):
         self.home_path = home_path
         self.chat_log_dir = home_path / "Daily" / "chat-log"
+        self.flush_delay = flush_delay
+        self._indexes: dict[Path, _DayIndex] = {}
+        self._locks: dict[Path, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+        self._timers: dict[Path, threading.Timer] = {}
 
     def _ensure_dir(self) -> None:
         """Ensure chat-log directory exists."""
@@ -106,39 +156,244 @@ class ChatLogService:
         """Get path for a day's log file."""
         return self.chat_log_dir / f"{date.strftime('%Y-%m-%d')}.md"
 
+    def _lock_for(self, path: Path) -> threading.RLock:
+        """Per-file writer lock."""
+        with self._locks_guard:
+            lock = self._locks.get(path)
+            if lock is None:
+                lock = self._locks[path] = threading.RLock()
+            return lock
+
+    # ── Index ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _stat_key(path: Path) -> tuple[int, int]:
+        st = path.stat()
+        return st.st_size, st.st_mtime_ns
+
+    def _load_index(self, path: Path) -> Optional[_DayIndex]:
+        """Return the index for a file, rebuilding it if the file changed on disk.
+
+        Caller must hold the file's lock.
+        """
+        if not path.exists():
+            self._indexes.pop(path, None)
+            return None
+        idx = self._indexes.get(path)
+        if idx is not None and idx.stat_key == self._stat_key(path):
+            return idx
+        if idx is not None and idx.dirty:
+            logger.warning(f"{path.name} changed on disk; dropping unflushed frontmatter")
+        idx = self._build_index(path)
+        self._evict_other_days(path)
+        self._indexes[path] = idx
+        return idx
+
+    def _build_index(self, path: Path) -> _DayIndex:
+        raw = path.read_bytes()
+        frontmatter: dict = {}
+        body_start = 0
+        if raw.startswith(b"---"):
+            end_marker = raw.find(b"\n---", 3)
+            if end_marker != -1:
+                try:
+                    frontmatter = yaml.safe_load(raw[4:end_marker].decode("utf-8")) or {}
+                except yaml.YAMLError:
+                    frontmatter = {}
+                if not isinstance(frontmatter, dict):
+                    frontmatter = {}
+                body_start = end_marker + 4
+                while raw[body_start:body_start + 1] == b"\n":
+                    body_start += 1
+        body = raw[body_start:]
+
+        idx = _DayIndex(
+            path=path,
+            frontmatter=frontmatter,
+            body_start=body_start,
+            body_len=len(body),
+            content_end=len(body.rstrip()),
+            stat_key=self._stat_key(path),
+        )
+        entries_meta = frontmatter.setdefault("entries", {})
+        for para_id, meta in entries_meta.items():
+            session = meta.get("session") if isinstance(meta, dict) else None
+            if session:
+                idx.sessions.setdefault(session, str(para_id))
+
+        for match in _HEADER_RE.finditer(body):
+            para_id = match.group(1).decode("utf-8")
+            if para_id in idx.spans:
+                continue  # first header wins, as with a regex search
+            start = match.end()
+            nxt = _NEXT_ENTRY_RE.search(body, start)
+            idx.spans[para_id] = _EntrySpan(start, nxt.start() if nxt else None)
+            idx.order.append(para_id)
+
+            if para_id not in entries_meta:
+                # Appended but crashed before the frontmatter flush — recover
+                meta = {"type": "chat", "created": match.group(2).decode("utf-8").strip()}
+                section = body[start:nxt.start() if nxt else len(body)]
+                session_match = _SESSION_LINE_RE.search(section)
+                if session_match:
+                    meta["session"] = session_match.group(1).decode("utf-8")
+                    idx.sessions.setdefault(meta["session"], para_id)
+                entries_meta[para_id] = meta
+                idx.dirty = True
+        if idx.dirty:
+            self._schedule_flush(idx)
+        return idx
+
+    def _evict_other_days(self, keep: Path) -> None:
+        """Drop clean indexes for other days so memory stays bounded."""
+        for path in list(self._indexes):
+            if path != keep and not self._indexes[path].dirty:
+                del self._indexes[path]
+
+    # ── Low-level writes ─────────────────────────────────────────────────────
+
+    def _create_file(self, path: Path, frontmatter: dict, body: bytes) -> _DayIndex:
+        header = self._serialize_file(frontmatter, "").encode("utf-8")
+        path.write_bytes(header + body)
+        idx = self._build_index(path)
+        self._indexes[path] = idx
+        return idx
+
+    def _splice(self, idx: _DayIndex, start: int, end: Optional[int], data: bytes) -> None:
+        """Replace body bytes [start, end) with data; end=None means to EOF.
+
+        Only the bytes from ``start`` onward are rewritten, and appends
+        (start at the end of the content, end=None) are a single write.
+        """
+        abs_start = idx.body_start + start
+        with open(idx.path, "r+b") as f:
+            tail = b""
+            if end is not None:
+                f.seek(idx.body_start + end)
+                tail = f.read()
+            f.seek(abs_start)
+            f.write(data + tail)
+            f.truncate()
+
+        old_end = idx.body_len if end is None else end
+        delta = len(data) - (old_end - start)
+        for para_id in idx.order:
+            span = idx.spans[para_id]
+            if span.start > start:
+                span.start += delta
+            if span.end is not None and span.end >= old_end and span.start >= start:
+                span.end += delta
+        idx.body_len = start + len(data) + len(tail)
+        if end is None:
+            idx.content_end = start + len(data.rstrip())
+        elif idx.content_end >= old_end:
+            idx.content_end += delta
+        idx.stat_key = self._stat_key(idx.path)
+
+    def _read_span(self, idx: _DayIndex, span: _EntrySpan) -> bytes:
+        end = idx.body_len if span.end is None else span.end
+        with open(idx.path, "rb") as f:
+            f.seek(idx.body_start + span.start)
+            return f.read(end - span.start)
+
+    # ── Frontmatter flushing ─────────────────────────────────────────────────
+
+    def _schedule_flush(self, idx: _DayIndex) -> None:
+        """Mark frontmatter dirty and debounce the rewrite."""
+        idx.dirty = True
+        if self.flush_delay <= 0:
+            self._flush_index(idx)
+            return
+        if idx.path in self._timers:
+            return
+        timer = threading.Timer(self.flush_delay, self._flush_path, args=(idx.path,))
+        timer.daemon = True
+        self._timers[idx.path] = timer
+        timer.start()
+
+    def _flush_path(self, path: Path) -> None:
+        with self._lock_for(path):
+            self._timers.pop(path, None)
+            idx = self._indexes.get(path)
+            if idx is not None and idx.dirty:
+                self._flush_index(idx)
+
+    def _flush_index(self, idx: _DayIndex) -> None:
+        """Rewrite the file with current frontmatter. Caller holds the lock."""
+        try:
+            if idx.stat_key != self._stat_key(idx.path):
+                logger.warning(f"{idx.path.name} changed on disk; skipping frontmatter flush")
+                self._indexes.pop(idx.path, None)
+                return
+            with open(idx.path, "rb") as f:
+                f.seek(idx.body_start)
+                body = f.read()
+            header = self._serialize_file(idx.frontmatter, "").encode("utf-8")
+            fd, tmp_path = tempfile.mkstemp(dir=idx.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(header + body)
+                os.replace(tmp_path, idx.path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            idx.body_start = len(header)
+            idx.stat_key = self._stat_key(idx.path)
+            idx.dirty = False
+        except Exception as e:
+            logger.error(f"Failed to flush chat log frontmatter: {e}", exc_info=True)
+
+    def flush(self) -> None:
+        """Write any pending frontmatter changes now."""
+        for path in list(self._indexes):
+            timer = self._timers.pop(path, None)
+            if timer is not None:
+                timer.cancel()
+            self._flush_path(path)
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
     def append_entry(self, entry: ChatLogEntry) -> bool:
         """
         Append an entry to today's chat log.
 
-        Uses surgical append - reads existing file, updates frontmatter,
-        appends entry to end.
+        The entry is a single write at the end of the file; the frontmatter
+        update is batched with other appends and flushed shortly after.
         """
         self._ensure_dir()
 
         log_path = self._get_log_path(entry.timestamp)
+        markdown = entry.to_markdown().encode("utf-8")
 
         try:
-            if log_path.exists():
-                content = log_path.read_text(encoding="utf-8")
-                frontmatter, body = self._parse_file(content)
-            else:
-                frontmatter = {
-                    "date": entry.timestamp.strftime("%Y-%m-%d"),
-                    "entries": {},
-                }
-                body = ""
-
-            # Add entry metadata to frontmatter
-            frontmatter.setdefault("entries", {})
-            frontmatter["entries"][entry.para_id] = entry.to_metadata()
-
-            # Append entry to body
-            separator = "\n\n---\n\n" if body.strip() else ""
-            new_body = body.rstrip() + separator + entry.to_markdown() + "\n"
-
-            # Write file
-            new_content = self._serialize_file(frontmatter, new_body)
-            log_path.write_text(new_content, encoding="utf-8")
+            with self._lock_for(log_path):
+                idx = self._load_index(log_path)
+                if idx is None:
+                    frontmatter = {
+                        "date": entry.timestamp.strftime("%Y-%m-%d"),
+                        "entries": {entry.para_id: entry.to_metadata()},
+                    }
+                    self._create_file(log_path, frontmatter, markdown + b"\n")
+                else:
+                    separator = _ENTRY_SEPARATOR if idx.content_end else b""
+                    start = idx.content_end
+                    self._splice(idx, start, None, separator + markdown + b"\n")
+                    if idx.order:
+                        last = idx.spans[idx.order[-1]]
+                        if last.end is None:
+                            # The previous entry now ends where "\n---\n\n# para:" begins
+                            last.end = start + 1
+
+                    header = _HEADER_RE.match(markdown)
+                    span_start = start + len(separator) + (header.end() if header else 0)
+                    if entry.para_id not in idx.spans:
+                        idx.spans[entry.para_id] = _EntrySpan(span_start)
+                        idx.order.append(entry.para_id)
+                    if entry.session_id:
+                        idx.sessions.setdefault(entry.session_id, entry.para_id)
+                    idx.frontmatter.setdefault("entries", {})
+                    idx.frontmatter["entries"][entry.para_id] = entry.to_metadata()
+                    self._schedule_flush(idx)
 
             logger.info(f"Appended chat log entry {entry.para_id} to {log_path.name}")
             return True
@@ -186,19 +441,13 @@ class ChatLogService:
         Returns None if no entry exists for this session today.
         """
         log_path = self.get_today_path()
-        if not log_path.exists():
-            return None
 
         try:
-            content = log_path.read_text(encoding="utf-8")
-            frontmatter, _ = self._parse_file(content)
-
-            entries = frontmatter.get("entries", {})
-            for para_id, meta in entries.items():
-                if meta.get("session") == session_id:
-                    return para_id
-
-            return None
+            with self._lock_for(log_path):
+                idx = self._load_index(log_path)
+                if idx is None:
+                    return None
+                return idx.sessions.get(session_id)
         except Exception as e:
             logger.error(f"Failed to get session para_id: {e}")
             return None
@@ -207,42 +456,29 @@ class ChatLogService:
         """
         Append content to an existing entry.
 
-        Finds the entry by para_id and appends content to its section.
+        Finds the entry by para_id and appends content to its section. For
+        the last entry in the file this is a plain append.
         """
         log_path = self.get_today_path()
-        if not log_path.exists():
-            logger.error(f"Log file not found: {log_path}")
-            return False
 
         try:
-            file_content = log_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_file(file_content)
-
-            # Find the entry section
-            entry_pattern = rf"(# para:{re.escape(para_id)} [^\n]+\n)"
-            match = re.search(entry_pattern, body)
-
-            if not match:
-                logger.error(f"Entry para:{para_id} not found in {log_path.name}")
-                return False
-
-            # Find where this entry ends (next entry or end of file)
-            entry_start = match.end()
-            next_entry = re.search(r"\n---\n\n# para:", body[entry_start:])
-
-            if next_entry:
-                entry_end = entry_start + next_entry.start()
-                entry_content = body[entry_start:entry_end]
-                # Insert content before the separator
-                new_entry_content = entry_content.rstrip() + "\n" + content + "\n"
-                new_body = body[:entry_start] + new_entry_content + body[entry_end:]
-            else:
-                # This is the last entry
-                new_body = body.rstrip() + "\n" + content + "\n"
-
-            # Write file
-            new_content = self._serialize_file(frontmatter, new_body)
-            log_path.write_text(new_content, encoding="utf-8")
+            with self._lock_for(log_path):
+                idx = self._load_index(log_path)
+                if idx is None:
+                    logger.error(f"Log file not found: {log_path}")
+                    return False
+
+                span = idx.spans.get(para_id)
+                if span is None:
+                    logger.error(f"Entry para:{para_id} not found in {log_path.name}")
+                    return False
+
+                addition = b"\n" + content.encode("utf-8") + b"\n"
+                if span.end is None:
+                    self._splice(idx, idx.content_end, None, addition)
+                else:
+                    existing = self._read_span(idx, span).rstrip()
+                    self._splice(idx, span.start, span.end, existing + addition)
 
             logger.info(f"Appended to entry para:{para_id}")
             return True
@@ -259,40 +495,20 @@ class ChatLogService:
         evolves throughout the day.
         """
         log_path = self.get_today_path()
-        if not log_path.exists():
-            return False
 
         try:
-            file_content = log_path.read_text(encoding="utf-8")
-            frontmatter, body = self._parse_file(file_content)
-
-            # Find the entry header
-            header_pattern = rf"(# para:{re.escape(para_id)} [^\n]+\n)"
-            header_match = re.search(header_pattern, body)
-
-            if not header_match:
-                logger.error(f"Entry para:{para_id} not found in {log_path.name}")
-                return False
-
-            # Find where this entry ends (next entry separator or end of file)
-            entry_start = header_match.end()
-            next_entry = re.search(r"\n---\n\n# para:", body[entry_start:])
-
-            if next_entry:
-                entry_end = entry_start + next_entry.start()
-                # Replace content between header and separator
-                new_body = (
-                    body[:entry_start] +
-                    "\n" + new_content.strip() + "\n" +
-                    body[entry_end:]
-                )
-            else:
-                # This is the last entry - replace from header to end
-                new_body = body[:entry_start] + "\n" + new_content.strip() + "\n"
+            with self._lock_for(log_path):
+                idx = self._load_index(log_path)
+                if idx is None:
+                    return False
+
+                span = idx.spans.get(para_id)
+                if span is None:
+                    logger.error(f"Entry para:{para_id} not found in {log_path.name}")
+                    return False
 
-            # Write file
-            new_file_content = self._serialize_file(frontmatter, new_body)
-            log_path.write_text(new_file_content, encoding="utf-8")
+                data = b"\n" + new_content.strip().encode("utf-8") + b"\n"
+                self._splice(idx, span.start, span.end, data)
 
             logger.info(f"Updated entry para:{para_id}")
             return True
@@ -308,29 +524,16 @@ class ChatLogService:
         Read what was previously written before updating.
         """
         log_path = self.get_today_path()
-        if not log_path.exists():
-            return None
 
         try:
-            file_content = log_path.read_text(encoding="utf-8")
-            _, body = self._parse_file(file_content)
-
-            # Find the entry header
-            header_pattern = rf"# para:{re.escape(para_id)} [^\n]+\n"
-            header_match = re.search(header_pattern, body)
-
-            if not header_match:
-                return None
-
-            # Find where this entry ends
-            entry_start = header_match.end()
-            next_entry = re.search(r"\n---\n\n# para:", body[entry_start:])
-
-            if next_entry:
-                entry_end = entry_start + next_entry.start()
-                return body[entry_start:entry_end].strip()
-            else:
-                return body[entry_start:].strip()
+            with self._lock_for(log_path):
+                idx = self._load_index(log_path)
+                if idx is None:
+                    return None
+                span = idx.spans.get(para_id)
+                if span is None:
+                    return None
+                return self._read_span(idx, span).decode("utf-8").strip()
 
         except Exception as e:
             logger.error(f"Failed to get entry content: {e}")
@@ -419,6 +622,12 @@ class ChatLogService:
         return self.append_entry(entry)
 
 
+_services: dict[Path, ChatLogService] = {}
+
+
 def get_chat_log_service(home_path: Path) -> ChatLogService:
-    """Get a ChatLogService instance."""
-    return ChatLogService(home_path)
+    """Get the shared ChatLogService for a vault (one index per process)."""
+    service = _services.get(home_path)
+    if service is None:
+        service = _services[home_path] = ChatLogService(home_path)
+    return service
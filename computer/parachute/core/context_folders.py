@@ -11,17 +11,27 @@ See docs/AGENTS_CONTEXT_ARCHITECTURE.md for full design.
 """
 
 import logging
+import os
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from ..lib.constants import CHARS_PER_TOKEN
+from ..lib.dir_listing import RACY_WINDOW_NS
 
 logger = logging.getLogger(__name__)
 
 # File names we look for (in priority order)
 CONTEXT_FILE_NAMES = ["AGENTS.md", "CLAUDE.md"]
 
+# Directories never descended into (hidden directories are skipped too)
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv", "build"})
+
+# How long discover_folders() answers from memory before revalidating
+INDEX_TTL_SECONDS = 30.0
+
 
 @dataclass
 class ContextFolder:
@@ -66,63 +76,195 @@ class ContextChain:
         return [f.path for f in self.files if f.exists]
 
 
-class ContextFolderService:
-    """Service for discovering and loading folder-based context."""
+@dataclass(frozen=True)
+class _DirState:
+    """Cached listing of one directory, valid while its mtime is unchanged."""
 
-    def __init__(self, home_path: Path):
-        self.home_path = home_path
+    mtime_ns: int
+    trusted: bool  # mtime old enough that a same-tick change is impossible
+    descend: bool
+    subdirs: tuple[str, ...] = ()
+    linked_dirs: tuple[str, ...] = ()  # symlinked dirs: checked, not descended
+    has_agents_md: bool = False
+    has_claude_md: bool = False
 
-    def discover_folders(self) -> list[ContextFolder]:
-        """
-        Discover all folders in the vault that have AGENTS.md or CLAUDE.md.
+    @property
+    def context_file(self) -> Optional[str]:
+        if self.has_agents_md:
+            return "AGENTS.md"
+        if self.has_claude_md:
+            return "CLAUDE.md"
+        return None
+
+
+def _scan_dir(path: str, mtime_ns: int, descend: bool) -> _DirState:
+    """List one directory with os.scandir, keeping only what the index needs."""
+    subdirs: list[str] = []
+    linked: list[str] = []
+    has_agents = has_claude = False
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if name == "AGENTS.md":
+                        has_agents = entry.is_file()
+                    elif name == "CLAUDE.md":
+                        has_claude = entry.is_file()
+                    elif descend and not name.startswith(".") and name not in SKIP_DIRS:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(name)
+                        elif entry.is_symlink() and entry.is_dir():
+                            linked.append(name)
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug(f"Skipping unreadable folder {path}: {e}")
+    return _DirState(
+        mtime_ns=mtime_ns,
+        trusted=mtime_ns < time.time_ns() - RACY_WINDOW_NS,
+        descend=descend,
+        subdirs=tuple(subdirs),
+        linked_dirs=tuple(linked),
+        has_agents_md=has_agents,
+        has_claude_md=has_claude,
+    )
+
+
+class ContextFolderIndex:
+    """
+    In-memory index of the folders under a root that hold AGENTS.md or CLAUDE.md.
+
+    The walk uses os.scandir and never descends into hidden or SKIP_DIRS
+    directories. A directory whose mtime is unchanged has the same entries,
+    so on refresh its cached subdirectories and context-file flags are
+    reused and it costs one stat instead of a listing.
+
+    The walk runs outside ``_lock`` (``_refresh_lock`` keeps it to one at a
+    time) and the result is swapped in, so context_file() lookups never
+    wait behind a refresh.
+    """
+
+    def __init__(self, root: Path, ttl: float = INDEX_TTL_SECONDS):
+        self.root = root
+        self.ttl = ttl
+        self._dirs: dict[str, _DirState] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self.last_refresh = {"scanned": 0, "reused": 0, "ms": 0.0}
+
+    def _path(self, rel: str) -> str:
+        return os.path.join(self.root, rel) if rel else str(self.root)
+
+    def folders(self) -> list[ContextFolder]:
+        """Context folders sorted by depth; revalidated at most once per ttl."""
+        if self._stale():
+            with self._refresh_lock:
+                if self._stale():  # another caller may have just refreshed
+                    self._refresh()
+        with self._lock:
+            folders = [
+                ContextFolder(
+                    path=rel,
+                    context_file=state.context_file,
+                    has_agents_md=state.has_agents_md,
+                    has_claude_md=state.has_claude_md,
+                )
+                for rel, state in self._dirs.items()
+                if state.context_file
+            ]
+        folders.sort(key=lambda f: (len(f.path.split("/")) if f.path else 0, f.path))
+        return folders
+
+    def context_file(self, rel: str) -> Optional[str]:
+        """Which context file a folder has (AGENTS.md preferred).
 
-        Returns folders sorted by path depth (shallower first).
+        One stat when the folder's cached listing is still current.
         """
-        folders: list[ContextFolder] = []
-
-        # Check root
-        root_file = self._find_context_file(self.home_path)
-        if root_file:
-            folders.append(ContextFolder(
-                path="",
-                context_file=root_file,
-                has_agents_md=(self.home_path / "AGENTS.md").exists(),
-                has_claude_md=(self.home_path / "CLAUDE.md").exists(),
-            ))
-
-        # Walk the vault looking for context files
-        for folder in self.home_path.rglob("*"):
-            if not folder.is_dir():
+        path = self._path(rel)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            state = self._dirs.get(rel)
+        if state is not None and state.trusted and state.mtime_ns == mtime_ns:
+            return state.context_file
+        fresh = _scan_dir(path, mtime_ns, descend=state.descend if state else False)
+        if state is not None:
+            with self._lock:
+                if self._dirs.get(rel) is state:
+                    self._dirs[rel] = fresh
+        return fresh.context_file
+
+    def invalidate(self) -> None:
+        """Force the next folders() call to revalidate."""
+        self._refreshed_at = None
+
+    def _stale(self) -> bool:
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.ttl
+
+    def _refresh(self) -> None:
+        """Walk the tree against a snapshot of the cache, then swap the result in."""
+        started = time.monotonic()
+        with self._lock:
+            previous = self._dirs
+        dirs: dict[str, _DirState] = {}
+        scanned = reused = 0
+        stack: list[tuple[str, bool]] = [("", True)]
+        while stack:
+            rel, descend = stack.pop()
+            path = self._path(rel)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
                 continue
+            state = previous.get(rel)
+            if (
+                state is None
+                or not state.trusted
+                or state.mtime_ns != mtime_ns
+                or state.descend != descend
+            ):
+                state = _scan_dir(path, mtime_ns, descend)
+                scanned += 1
+            else:
+                reused += 1
+            dirs[rel] = state
+            prefix = f"{rel}/" if rel else ""
+            stack.extend((prefix + name, True) for name in state.subdirs)
+            stack.extend((prefix + name, False) for name in state.linked_dirs)
+
+        with self._lock:
+            self._dirs = dirs
+        self._refreshed_at = time.monotonic()
+        self.last_refresh = {
+            "scanned": scanned,
+            "reused": reused,
+            "ms": round((self._refreshed_at - started) * 1000, 1),
+        }
+        logger.debug(
+            f"Context folder index: {scanned} scanned, {reused} reused "
+            f"in {self.last_refresh['ms']}ms"
+        )
 
-            # Skip hidden folders and common non-content folders
-            relative = folder.relative_to(self.home_path)
-            parts = relative.parts
-            if any(p.startswith(".") for p in parts):
-                continue
-            if any(p in ("node_modules", "__pycache__", "venv", ".git", "build") for p in parts):
-                continue
 
-            context_file = self._find_context_file(folder)
-            if context_file:
-                folders.append(ContextFolder(
-                    path=str(relative),
-                    context_file=context_file,
-                    has_agents_md=(folder / "AGENTS.md").exists(),
-                    has_claude_md=(folder / "CLAUDE.md").exists(),
-                ))
+class ContextFolderService:
+    """Service for discovering and loading folder-based context."""
 
-        # Sort by path depth
-        folders.sort(key=lambda f: (len(f.path.split("/")) if f.path else 0, f.path))
+    def __init__(self, home_path: Path, index: Optional[ContextFolderIndex] = None):
+        self.home_path = home_path
+        self.index = index or ContextFolderIndex(home_path)
 
-        return folders
+    def discover_folders(self) -> list[ContextFolder]:
+        """
+        Discover all folders in the vault that have AGENTS.md or CLAUDE.md.
 
-    def _find_context_file(self, folder: Path) -> Optional[str]:
-        """Find which context file exists in a folder (AGENTS.md preferred)."""
-        for name in CONTEXT_FILE_NAMES:
-            if (folder / name).exists():
-                return name
-        return None
+        Returns folders sorted by path depth (shallower first). Answers from
+        the index; see ContextFolderIndex for when it revalidates.
+        """
+        return self.index.folders()
 
     def build_chain(
         self,
@@ -190,7 +332,7 @@ class ContextFolderService:
             seen_paths.add(folder_path)
 
             folder_full_path = self.home_path / folder_path if folder_path else self.home_path
-            context_filename = self._find_context_file(folder_full_path)
+            context_filename = self.index.context_file(folder_path)
 
             if not context_filename:
                 continue
@@ -280,6 +422,14 @@ class ContextFolderService:
 
         return "\n".join(parts)
 
+
+# One service per root, so the folder index survives across requests
+_services: dict[Path, ContextFolderService] = {}
+
+
 def get_context_folder_service(home_path: Path) -> ContextFolderService:
-    """Get a ContextFolderService instance."""
-    return ContextFolderService(home_path)
+    """Get the shared ContextFolderService for a root."""
+    service = _services.get(home_path)
+    if service is None:
+        service = _services[home_path] = ContextFolderService(home_path)
+    return service
@@ -288,7 +288,8 @@ def _get_graph() -> Any | None:
 async def discover_daily_agents(home_path: Path, graph=None) -> list[DailyAgentConfig]:
     """Discover all schedulable tools from Trigger→Tool graph.
 
-    Queries schedule-type Triggers with INVOKES edges to enabled agent/transform Tools.
+    Queries schedule-type Triggers with INVOKES edges to enabled agent/transform Tools,
+    collecting each tool's CAN_CALL children in the same round-trip.
     """
     g = graph or _get_graph()
     if g is None:
@@ -299,23 +300,15 @@ async def discover_daily_agents(home_path: Path, graph=None) -> list[DailyAgentC
             "MATCH (trigger:Trigger {type: 'schedule', enabled: 'true'})"
             "-[:INVOKES]->(tool:Tool {enabled: 'true'}) "
             "WHERE tool.mode = 'agent' OR tool.mode = 'transform' "
-            "RETURN tool, trigger ORDER BY tool.name"
+            "OPTIONAL MATCH (tool)-[:CAN_CALL]->(child:Tool) "
+            "RETURN tool, trigger, collect(child.name) AS can_call ORDER BY tool.name"
         )
         agents = []
         for row in rows:
             tool_row = row.get("tool") or row
             trigger_row = row.get("trigger") or {}
-            tool_name = tool_row.get("name", "")
-            # Get CAN_CALL children for this tool
-            try:
-                child_rows = await g.execute_cypher(
-                    "MATCH (t:Tool {name: $name})-[:CAN_CALL]->(child:Tool) "
-                    "RETURN child.name AS name",
-                    {"name": tool_name},
-                )
-                can_call = [r.get("name", "") for r in child_rows]
-            except Exception:
-                can_call = []
+            # collect() over an empty OPTIONAL MATCH yields null, not []
+            can_call = [name for name in (row.get("can_call") or []) if name]
             agents.append(DailyAgentConfig.from_tool_row(tool_row, can_call, trigger_row))
         logger.info(f"Discovered {len(agents)} scheduled tools from Trigger→Tool graph")
         return agents
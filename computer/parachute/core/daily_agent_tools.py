@@ -91,15 +91,16 @@ def _make_read_days_chats(graph: Any, scope: dict, agent_name: str, home_path: P
             date_start = f"{date_obj.isoformat()}T00:00:00"
             date_end = f"{(date_obj + timedelta(days=1)).isoformat()}T00:00:00"
 
-            # Get sessions with today's messages
+            # One round-trip: sessions with today's messages collected per session
             session_rows = await graph.execute_cypher(
                 "MATCH (s:Chat)-[:HAS_MESSAGE]->(m:Message) "
                 "WHERE m.created_at >= $date_start AND m.created_at < $date_end "
                 "  AND s.module = 'chat' "
                 "WITH s, count(m) AS msg_count, "
-                "     min(m.created_at) AS first_msg, max(m.created_at) AS last_msg "
+                "     min(m.created_at) AS first_msg, max(m.created_at) AS last_msg, "
+                "     collect({sequence: m.sequence, role: m.role, content: m.content}) AS messages "
                 "RETURN s.session_id AS session_id, s.title AS title, "
-                "       s.summary AS summary, msg_count, first_msg, last_msg "
+                "       s.summary AS summary, msg_count, first_msg, last_msg, messages "
                 "ORDER BY first_msg ASC",
                 {"date_start": date_start, "date_end": date_end},
             )
@@ -111,7 +112,6 @@ def _make_read_days_chats(graph: Any, scope: dict, agent_name: str, home_path: P
 
             for r in session_rows:
                 title = r.get("title") or "(untitled)"
-                sid = r.get("session_id", "?")
                 count = r.get("msg_count", 0)
                 summary = r.get("summary") or ""
 
@@ -120,38 +120,25 @@ def _make_read_days_chats(graph: Any, scope: dict, agent_name: str, home_path: P
                 if summary:
                     lines.append(f"**Existing summary:** {summary}\n")
 
-                # Fetch today's messages for this session
-                try:
-                    msg_rows = await graph.execute_cypher(
-                        "MATCH (s:Chat {session_id: $sid})-[:HAS_MESSAGE]->(m:Message) "
-                        "WHERE m.created_at >= $date_start AND m.created_at < $date_end "
-                        "RETURN m.role AS role, m.content AS content "
-                        "ORDER BY m.sequence ASC",
-                        {"sid": sid, "date_start": date_start, "date_end": date_end},
-                    )
-
-                    if msg_rows:
-                        # Sample messages if too many
-                        msgs = msg_rows
-                        if len(msgs) > MAX_MSGS_PER_SESSION:
-                            # Keep first few, last few, and sample from middle
-                            first_n = 10
-                            last_n = 10
-                            msgs = msgs[:first_n] + [{"role": "system", "content": f"... ({len(msg_rows) - first_n - last_n} messages omitted) ..."}] + msgs[-last_n:]
-
-                        for msg in msgs:
-                            role = msg.get("role", "unknown")
-                            content = (msg.get("content") or "").strip()
-                            if not content:
-                                continue
-                            label = "User" if role == "human" else "Assistant" if role == "assistant" else role.title()
-                            # Truncate long messages
-                            if len(content) > MAX_CHARS_PER_MSG:
-                                content = content[:MAX_CHARS_PER_MSG] + "..."
-                            lines.append(f"**{label}:** {content}")
-
-                except Exception as e:
-                    lines.append(f"(could not load messages: {e})")
+                # collect() doesn't guarantee order — sort by sequence here
+                msg_rows = sorted(r.get("messages") or [], key=lambda m: m.get("sequence") or 0)
+                msgs = msg_rows
+                if len(msgs) > MAX_MSGS_PER_SESSION:
+                    # Keep first few, last few, and sample from middle
+                    first_n = 10
+                    last_n = 10
+                    msgs = msgs[:first_n] + [{"role": "system", "content": f"... ({len(msg_rows) - first_n - last_n} messages omitted) ..."}] + msgs[-last_n:]
+
+                for msg in msgs:
+                    role = msg.get("role", "unknown")
+                    content = (msg.get("content") or "").strip()
+                    if not content:
+                        continue
+                    label = "User" if role == "human" else "Assistant" if role == "assistant" else role.title()
+                    # Truncate long messages
+                    if len(content) > MAX_CHARS_PER_MSG:
+                        content = content[:MAX_CHARS_PER_MSG] + "..."
+                    lines.append(f"**{label}:** {content}")
 
                 lines.append("")  # blank line between sessions
 
@@ -298,6 +285,12 @@ def _make_summarize_chat(graph: Any, scope: dict, agent_name: str, home_path: Pa
                 "SET s.summary = $summary, s.summary_updated_at = $updated_at",
                 {"sid": session_id, "summary": session_summary, "updated_at": now_iso},
             )
+            # Keep session-list ETags and bot-link lookups honest — this writes a Chat row directly
+            from parachute.core.interfaces import get_registry
+            store = get_registry().get("ChatStore")
+            if store is not None:
+                store.mark_sessions_changed()
+                store.clear_bot_link_cache()
 
             return {"content": [{"type": "text", "text": todays_activity or session_summary}]}
 
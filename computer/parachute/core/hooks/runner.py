@@ -12,6 +12,7 @@ of SDK-native hooks.
 
 import asyncio
 import logging
+import time
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,12 +20,18 @@ from typing import Any
 
 from parachute.core.hooks.events import HookEvent
 from parachute.core.hooks.models import HookConfig, HookError
+from parachute.lib.metrics import get_metrics
 
 logger = logging.getLogger(__name__)
 
 # Maximum recent errors to keep in memory
 MAX_RECENT_ERRORS = 50
 
+# Observed even when the hook times out or raises
+_HOOK_SECONDS = get_metrics().histogram(
+    "parachute_hook_seconds", "Internal hook execution time", ("event",)
+)
+
 
 class HookRunner:
     """Internal event bus for server-to-module communication.
@@ -97,6 +104,13 @@ class HookRunner:
 
     async def _execute(self, hook: HookConfig, context: dict) -> None:
         """Execute a hook's run() function."""
+        started = time.perf_counter()
+        try:
+            await self._run_hook(hook, context)
+        finally:
+            _HOOK_SECONDS.observe(time.perf_counter() - started, event=context.get("event", "?"))
+
+    async def _run_hook(self, hook: HookConfig, context: dict) -> None:
         module = self._hook_modules.get(hook.name)
         if not module:
             logger.error(f"Hook module not loaded: {hook.name}")
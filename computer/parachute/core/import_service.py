@@ -5,19 +5,42 @@ This service:
 1. Parses export files from Claude.ai and ChatGPT
 2. Converts conversations to SDK JSONL format
 3. Writes JSONL files to ~/.claude/projects/{vault}/
-4. Inserts session records into SQLite
+4. Inserts session records into the graph
+
+Large exports (ChatGPT conversations.json routinely runs to hundreds of MB)
+go through import_stream(): an incremental JSON array parser feeds a bounded
+parse → convert → batched-insert pipeline, zip archives are read in place,
+and progress is checkpointed so an interrupted import can resume.
 """
 
+import asyncio
+import codecs
+import hashlib
 import json
+import logging
+import os
+import tempfile
 import uuid
+import zipfile
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Union
 
+from ..config import PARACHUTE_DIR
 from ..db.brain_chat_store import BrainChatStore
 from ..models.session import Session, SessionSource
 
+logger = logging.getLogger(__name__)
+
+# Streaming import tuning
+_READ_CHUNK_SIZE = 1 << 16  # 64 KiB reads from the export
+_PIPELINE_QUEUE_SIZE = 64  # converted conversations buffered ahead of the DB
+_INSERT_BATCH_SIZE = 50  # sessions per create_sessions() call
+
+ImportSource = Union[str, Path, BinaryIO]
+
 
 @dataclass
 class ImportedMessage:
@@ -46,17 +69,188 @@ class ImportResult:
     skipped_count: int
     errors: list[str]
     session_ids: list[str]
+    import_id: Optional[str] = None
+
+
+@dataclass
+class ImportProgress:
+    """Checkpointed state of a streaming import.
+
+    ``processed`` counts top-level export items consumed (imported, skipped
+    or failed) in stream order, so a resumed run skips exactly that many.
+    """
+    import_id: str
+    source_name: str
+    processed: int = 0
+    imported_count: int = 0
+    skipped_count: int = 0
+    errors: list[str] = field(default_factory=list)
+    session_ids: list[str] = field(default_factory=list)
+    done: bool = False
+    started_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+    updated_at: Optional[str] = None
+
+    def to_result(self) -> ImportResult:
+        return ImportResult(
+            total_conversations=self.processed,
+            imported_count=self.imported_count,
+            skipped_count=self.skipped_count,
+            errors=list(self.errors),
+            session_ids=list(self.session_ids),
+            import_id=self.import_id,
+        )
+
+
+# =============================================================================
+# Incremental JSON parsing
+# =============================================================================
+
+
+def iter_json_array(stream: BinaryIO, chunk_size: int = _READ_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array without loading it whole.
+
+    Only the element currently being decoded is held in memory. If the
+    document is an object rather than an array (the wrapped Claude format,
+    ``{"conversations": [...]}``), it is small enough in practice to load
+    in one go and is yielded as a single item.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill(min_chars: int = 1) -> None:
+        nonlocal buf, pos, eof
+        buf = buf[pos:]
+        pos = 0
+        target = len(buf) + min_chars
+        while not eof and len(buf) < target:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                eof = True
+                buf += utf8.decode(b"", final=True)
+            else:
+                buf += utf8.decode(chunk)
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    skip_ws()
+    if pos >= len(buf):
+        return
+    if buf[pos] != "[":
+        while not eof:
+            fill(chunk_size)
+        yield json.loads(buf[pos:])
+        return
+    pos += 1
+
+    first = True
+    while True:
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError("Unexpected end of JSON array")
+        if buf[pos] == "]":
+            return
+        if not first:
+            if buf[pos] != ",":
+                raise ValueError(f"Expected ',' in JSON array, got {buf[pos]!r}")
+            pos += 1
+            skip_ws()
+        first = False
+
+        # Decode the next element. On a partial element, grow the buffer by
+        # at least its current size before retrying so a single huge element
+        # is re-scanned O(log n) times rather than once per chunk.
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill(max(chunk_size, len(buf) - pos))
+                continue
+            if end == len(buf) and not eof:
+                # A bare number could continue in the next chunk
+                fill()
+                continue
+            break
+        pos = end
+        yield item
+
+
+@contextmanager
+def open_export(source: ImportSource) -> Iterator[BinaryIO]:
+    """Open an export as a binary stream.
+
+    Accepts a path or a seekable binary file object. Zip archives (the
+    format both ChatGPT and Claude ship their data exports in) are read in
+    place: the ``conversations.json`` member is decompressed on the fly,
+    never extracted to disk.
+    """
+    owned: Optional[BinaryIO] = None
+    fileobj: BinaryIO
+    if isinstance(source, (str, Path)):
+        owned = open(source, "rb")
+        fileobj = owned
+    else:
+        fileobj = source
+
+    try:
+        if zipfile.is_zipfile(fileobj):
+            fileobj.seek(0)
+            with zipfile.ZipFile(fileobj) as zf:
+                member = _find_conversations_member(zf)
+                with zf.open(member) as member_stream:
+                    yield member_stream
+        else:
+            fileobj.seek(0)
+            yield fileobj
+    finally:
+        if owned is not None:
+            owned.close()
+
+
+def _find_conversations_member(zf: zipfile.ZipFile) -> str:
+    """Pick the conversations JSON inside an export archive."""
+    json_members = [
+        n for n in zf.namelist()
+        if n.lower().endswith(".json") and not n.startswith("__MACOSX/")
+    ]
+    for name in json_members:
+        if Path(name).name == "conversations.json":
+            return name
+    if json_members:
+        return json_members[0]
+    raise ValueError("Archive contains no JSON export")
 
 
 class ImportService:
     """Service for importing external chat exports."""
 
-    def __init__(self, home_path: str, session_store: BrainChatStore, module: str = "chat"):
+    def __init__(
+        self,
+        home_path: str,
+        session_store: BrainChatStore,
+        module: str = "chat",
+        progress_dir: Optional[Path] = None,
+    ):
         self.home_path = home_path
         self.database = session_store  # keep alias for compatibility
         self.module = module
         # Sessions are stored in ~/.claude/ (real home)
         self._sdk_projects_dir = Path.home() / ".claude" / "projects"
+        # Streaming import checkpoints
+        self.progress_dir = progress_dir or (PARACHUTE_DIR / "imports")
 
         # Working directory for this module (e.g., ~/Parachute/Chat)
         self.working_directory = str(Path(home_path) / module.capitalize())
@@ -103,6 +297,32 @@ class ImportService:
         else:
             return self._parse_claude_export(data)
 
+    def iter_export_items(self, item: Any) -> Iterator[dict]:
+        """Expand one top-level export item into raw conversation dicts.
+
+        Array exports yield their elements one by one; a wrapped object
+        (``{"conversations": [...]}``) arrives as a single item and is
+        unpacked here.
+        """
+        if not isinstance(item, dict):
+            return
+        if "mapping" in item or "chat_messages" in item:
+            yield item
+            return
+        nested = item.get("conversations", item.get("chats"))
+        if isinstance(nested, list):
+            for conv in nested:
+                if isinstance(conv, dict):
+                    yield conv
+        else:
+            yield item
+
+    def parse_conversation(self, conv: dict) -> Optional[ImportedConversation]:
+        """Parse a single raw conversation, detecting its format."""
+        if self.detect_source(conv) == SessionSource.CHATGPT:
+            return self._parse_chatgpt_conversation(conv)
+        return self._parse_claude_conversation(conv)
+
     def _parse_claude_export(self, data: dict | list) -> list[ImportedConversation]:
         """Parse Claude.ai export format."""
         conversations = []
@@ -121,7 +341,7 @@ class ImportService:
                 if parsed and parsed.messages:
                     conversations.append(parsed)
             except Exception as e:
-                print(f"[Import] Error parsing Claude conversation: {e}")
+                logger.warning(f"Error parsing Claude conversation: {e}")
 
         return conversations
 
@@ -205,7 +425,7 @@ class ImportService:
                 if parsed and parsed.messages:
                     conversations.append(parsed)
             except Exception as e:
-                print(f"[Import] Error parsing ChatGPT conversation: {e}")
+                logger.warning(f"Error parsing ChatGPT conversation: {e}")
 
         return conversations
 
@@ -377,8 +597,7 @@ class ImportService:
         jsonl_path = sdk_dir / f"{session_id}.jsonl"
 
         with open(jsonl_path, "w") as f:
-            for event in events:
-                f.write(json.dumps(event) + "\n")
+            f.write("".join(json.dumps(event) + "\n" for event in events))
 
         return jsonl_path
 
@@ -416,34 +635,18 @@ class ImportService:
 
                 # Write JSONL file
                 jsonl_path = self.write_sdk_jsonl(session_id, events)
-                print(f"[Import] Written: {jsonl_path}")
-
-                # Create session record
-                session = Session(
-                    id=session_id,
-                    title=conv.title,
-                    module=self.module,
-                    source=conv.source,
-                    working_directory=self.working_directory,
-                    created_at=conv.created_at,
-                    last_accessed=conv.updated_at or conv.created_at,
-                    message_count=len(conv.messages),
-                    archived=archived,
-                    metadata={
-                        "original_id": conv.original_id,
-                        "imported_at": datetime.now(timezone.utc).isoformat()
-                    }
-                )
+                logger.debug(f"Written: {jsonl_path}")
 
                 # Insert into database
+                session = self._build_session(conv, session_id, archived)
                 await self.database.create_session(session)
-                print(f"[Import] Created session: {session_id} - {conv.title}")
+                logger.debug(f"Created session: {session_id} - {conv.title}")
 
                 session_ids.append(session_id)
                 imported_count += 1
 
             except Exception as e:
-                print(f"[Import] Error importing '{conv.title}': {e}")
+                logger.warning(f"Error importing '{conv.title}': {e}")
                 errors.append(f"Failed to import '{conv.title}': {e}")
                 skipped_count += 1
 
@@ -455,28 +658,59 @@ class ImportService:
             session_ids=session_ids
         )
 
+    def _build_session(
+        self, conv: ImportedConversation, session_id: str, archived: bool
+    ) -> Session:
+        """Build the session record for an imported conversation."""
+        return Session(
+            id=session_id,
+            title=conv.title,
+            module=self.module,
+            source=conv.source,
+            working_directory=self.working_directory,
+            created_at=conv.created_at,
+            last_accessed=conv.updated_at or conv.created_at,
+            message_count=len(conv.messages),
+            archived=archived,
+            metadata={
+                "original_id": conv.original_id,
+                "imported_at": datetime.now(timezone.utc).isoformat()
+            }
+        )
+
     async def import_from_file(
         self,
         file_path: str,
-        archived: bool = True
+        archived: bool = True,
+        resume: bool = True,
+        on_progress: Optional[Callable[[ImportProgress], None]] = None,
     ) -> ImportResult:
         """
-        Import from a JSON export file.
+        Import from a JSON export file or zip archive.
+
+        Streams the file (see import_stream); the import ID is derived from
+        the file's path, size and mtime so re-running the same import after
+        an interruption resumes where it left off.
 
         Args:
-            file_path: Path to conversations.json or similar
+            file_path: Path to conversations.json, or the export .zip
             archived: Whether to mark imported sessions as archived
+            resume: Continue from an existing checkpoint for this file
 
         Returns:
             ImportResult
         """
-        with open(file_path, "r") as f:
-            data = json.load(f)
-
-        conversations = self.parse_export(data)
-        print(f"[Import] Parsed {len(conversations)} conversations from {file_path}")
-
-        return await self.import_conversations(conversations, archived=archived)
+        path = Path(file_path).resolve()
+        st = path.stat()
+        import_id = self.fingerprint(f"{path}:{st.st_size}:{st.st_mtime_ns}")
+        return await self.import_stream(
+            path,
+            archived=archived,
+            import_id=import_id,
+            source_name=path.name,
+            resume=resume,
+            on_progress=on_progress,
+        )
 
     async def import_from_json(
         self,
@@ -494,10 +728,240 @@ class ImportService:
             ImportResult
         """
         conversations = self.parse_export(json_data)
-        print(f"[Import] Parsed {len(conversations)} conversations")
+        logger.info(f"Parsed {len(conversations)} conversations")
 
         return await self.import_conversations(conversations, archived=archived)
 
+    # =========================================================================
+    # Streaming Import
+    # =========================================================================
+
+    @staticmethod
+    def fingerprint(key: str) -> str:
+        """Stable import ID for a source (used to find its checkpoint)."""
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def fingerprint_content(fh: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+        """Import ID from a file's bytes (blocking), rewinding it afterwards.
+
+        For uploads, where there is no path or mtime to tell two exports
+        with the same name and size apart.
+        """
+        digest = hashlib.sha256()
+        fh.seek(0)
+        while chunk := fh.read(chunk_size):
+            digest.update(chunk)
+        fh.seek(0)
+        return digest.hexdigest()[:16]
+
+    def _progress_path(self, import_id: str) -> Path:
+        return self.progress_dir / f"{import_id}.json"
+
+    def load_progress(self, import_id: str) -> Optional[ImportProgress]:
+        """Read the checkpoint for an import, if one exists."""
+        if not import_id.isalnum():
+            return None
+        path = self._progress_path(import_id)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable import checkpoint {path}: {e}")
+            return None
+        try:
+            return ImportProgress(**data)
+        except TypeError:
+            return None
+
+    def list_progress(self) -> list[ImportProgress]:
+        """All known import checkpoints, most recently updated first."""
+        if not self.progress_dir.exists():
+            return []
+        results = []
+        for path in self.progress_dir.glob("*.json"):
+            progress = self.load_progress(path.stem)
+            if progress is not None:
+                results.append(progress)
+        results.sort(key=lambda p: p.updated_at or p.started_at, reverse=True)
+        return results
+
+    def _save_progress(self, progress: ImportProgress) -> None:
+        """Atomically write the checkpoint (temp file + rename)."""
+        progress.updated_at = datetime.now(timezone.utc).isoformat()
+        self.progress_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.progress_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(progress), f)
+            os.replace(tmp_path, self._progress_path(progress.import_id))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _stable_session_id(self, import_id: str, index: int, conv: ImportedConversation) -> str:
+        """Session ID that is identical across resumed runs of one import."""
+        return str(uuid.uuid5(
+            uuid.NAMESPACE_URL,
+            f"parachute-import:{import_id}:{index}:{conv.original_id}",
+        ))
+
+    def _produce(
+        self,
+        source: ImportSource,
+        import_id: str,
+        skip: int,
+        archived: bool,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        cancelled: Callable[[], bool],
+    ) -> None:
+        """Parse and convert conversations on a worker thread.
+
+        Each raw item becomes ``(index, Session | None, error | None)`` on
+        the queue; ``queue.put`` is awaited from this thread so a slow
+        consumer applies backpressure to parsing. Ends with a ``None``
+        sentinel (or the exception that stopped the stream).
+        """
+        def put(item: Any) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        try:
+            index = 0
+            with open_export(source) as stream:
+                for top in iter_json_array(stream):
+                    for raw in self.iter_export_items(top):
+                        if cancelled():
+                            return
+                        if index < skip:
+                            index += 1
+                            continue
+                        title = raw.get("title") or raw.get("name") or "Untitled Conversation"
+                        try:
+                            conv = self.parse_conversation(raw)
+                            if conv is None:
+                                put((index, None, None))
+                            else:
+                                session_id = self._stable_session_id(import_id, index, conv)
+                                _, events = self.convert_to_sdk_jsonl(conv, session_id)
+                                self.write_sdk_jsonl(session_id, events)
+                                put((index, self._build_session(conv, session_id, archived), None))
+                        except Exception as e:
+                            put((index, None, f"Failed to import '{title}': {e}"))
+                        index += 1
+            put(None)
+        except BaseException as e:
+            put(e)
+
+    async def import_stream(
+        self,
+        source: ImportSource,
+        archived: bool = True,
+        import_id: Optional[str] = None,
+        source_name: str = "upload",
+        resume: bool = True,
+        batch_size: int = _INSERT_BATCH_SIZE,
+        on_progress: Optional[Callable[[ImportProgress], None]] = None,
+    ) -> ImportResult:
+        """
+        Import a (possibly very large) export without loading it into memory.
+
+        Pipeline: a worker thread incrementally parses the export and
+        converts/writes each conversation's SDK JSONL, handing finished
+        sessions through a bounded queue to this coroutine, which inserts
+        them with create_sessions() in batches. After every batch the
+        progress checkpoint is saved and ``on_progress`` is called.
+
+        Args:
+            source: Path or seekable binary file (JSON or zip archive)
+            archived: Whether to mark imported sessions as archived
+            import_id: Checkpoint key; resuming requires passing the same ID
+            source_name: Human-readable source label stored in the checkpoint
+            resume: Continue from an existing, unfinished checkpoint
+            batch_size: Sessions per database batch
+            on_progress: Called with the checkpoint after each batch
+
+        Returns:
+            ImportResult (counts cover resumed runs too)
+        """
+        import_id = import_id or uuid.uuid4().hex[:16]
+        progress = self.load_progress(import_id) if resume else None
+        if progress is None or progress.done:
+            progress = ImportProgress(import_id=import_id, source_name=source_name)
+        elif progress.processed:
+            logger.info(
+                f"Resuming import {import_id} at item {progress.processed} "
+                f"({progress.imported_count} already imported)"
+            )
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+        stop = False
+        producer = loop.run_in_executor(
+            None, self._produce, source, import_id, progress.processed,
+            archived, loop, queue, lambda: stop,
+        )
+
+        batch: list[Session] = []
+        batch_errors: list[str] = []
+        batch_end = progress.processed
+
+        async def flush() -> None:
+            nonlocal batch, batch_errors
+            created, failed = await self.database.create_sessions(batch)
+            created_set = set(created)
+            for session in batch:
+                if session.id in failed:
+                    progress.errors.append(
+                        f"Failed to import '{session.title}': {failed[session.id]}"
+                    )
+                    progress.skipped_count += 1
+                elif session.id in created_set:
+                    progress.session_ids.append(session.id)
+                    progress.imported_count += 1
+            progress.skipped_count += len(batch_errors)
+            progress.errors.extend(batch_errors)
+            progress.processed = batch_end
+            batch, batch_errors = [], []
+            self._save_progress(progress)
+            if on_progress is not None:
+                on_progress(progress)
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                index, session, error = item
+                batch_end = index + 1
+                if session is not None:
+                    batch.append(session)
+                elif error is not None:
+                    logger.warning(error)
+                    batch_errors.append(error)
+                else:
+                    progress.skipped_count += 1
+                if len(batch) >= batch_size:
+                    await flush()
+            progress.done = True
+            await flush()
+        finally:
+            stop = True
+            # Unblock a producer waiting on a full queue so the thread exits
+            while not producer.done():
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.sleep(0.01)
+
+        logger.info(
+            f"Import {import_id} complete: {progress.imported_count} imported, "
+            f"{progress.skipped_count} skipped ({progress.processed} items)"
+        )
+        return progress.to_result()
+
     # =========================================================================
     # Helpers
     # =========================================================================
@@ -0,0 +1,374 @@
+"""
+Durable background job queue.
+
+Jobs are persisted one JSON file per job under a queue directory, so work
+that was pending or in flight when the server stopped is picked up again on
+the next start (``recover()``). Each job kind has its own worker pool with a
+bounded concurrency and a bounded backlog; failed attempts are retried with
+exponential backoff until ``max_attempts`` is reached, after which the job is
+kept on disk as a dead letter with its last error.
+
+Jobs are deduplicated by key while they are pending: enqueueing the same key
+again refreshes the payload of the waiting job instead of adding a second one.
+Once a job has started, a new enqueue with the same key queues a follow-up run.
+
+Workers are spawned on demand and exit when their pool has drained, so an idle
+queue holds no tasks.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+FailureHandler = Callable[["Job", BaseException], Awaitable[None]]
+
+# Latency samples kept per kind for the stats endpoint
+LATENCY_SAMPLES = 200
+# Dead-letter files kept on disk across restarts
+MAX_FAILED_JOBS = 100
+
+
+class JobQueueFull(Exception):
+    """Raised when a kind's backlog is at its ``max_pending`` limit."""
+
+    def __init__(self, kind: str, limit: int):
+        super().__init__(f"Job queue '{kind}' is full ({limit} pending)")
+        self.kind = kind
+        self.limit = limit
+
+
+@dataclass
+class Job:
+    """A unit of background work, persisted as JSON."""
+
+    id: str
+    kind: str
+    key: str
+    payload: dict[str, Any]
+    status: str = "pending"  # pending | running | failed
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+    next_attempt_at: float = 0.0
+    started_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Pool:
+    """Per-kind worker pool state."""
+
+    handler: JobHandler
+    concurrency: int
+    max_pending: int
+    on_failure: Optional[FailureHandler] = None
+    ready: deque[str] = field(default_factory=deque)
+    workers: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    retried: int = 0
+    wait_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    run_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+
+def _latency_summary(samples: deque[float]) -> dict[str, Optional[float]]:
+    if not samples:
+        return {"avg": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "avg": round(sum(ordered) / len(ordered), 1),
+        "p95": round(p95, 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+class JobQueue:
+    """File-backed job queue with per-kind bounded worker pools."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_attempts: int = 4,
+        base_delay: float = 2.0,
+        max_delay: float = 300.0,
+    ):
+        self.root = root
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._pools: dict[str, _Pool] = {}
+        self._jobs: dict[str, Job] = {}
+        # key -> job_id for jobs that have not started yet (dedupe window)
+        self._pending_keys: dict[str, str] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    # ── Registration ─────────────────────────────────────────────────────────
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        *,
+        concurrency: int = 1,
+        max_pending: int = 100,
+        on_failure: Optional[FailureHandler] = None,
+    ) -> None:
+        """Register the handler for a job kind.
+
+        ``on_failure`` runs once when a job exhausts its attempts.
+        """
+        self._pools[kind] = _Pool(
+            handler=handler,
+            concurrency=max(1, concurrency),
+            max_pending=max_pending,
+            on_failure=on_failure,
+        )
+
+    # ── Enqueue ──────────────────────────────────────────────────────────────
+
+    def pending_count(self, kind: str) -> int:
+        return sum(
+            1 for j in self._jobs.values() if j.kind == kind and j.status == "pending"
+        )
+
+    def has_capacity(self, kind: str) -> bool:
+        pool = self._pools[kind]
+        return self.pending_count(kind) < pool.max_pending
+
+    def enqueue(self, kind: str, key: str, payload: dict[str, Any]) -> Job:
+        """Persist and schedule a job. Must be called from the event loop.
+
+        Returns the existing job when one with the same key is still pending.
+        Raises JobQueueFull when the kind's backlog is at its limit.
+        """
+        pool = self._pools.get(kind)
+        if pool is None:
+            raise KeyError(f"Unknown job kind: {kind}")
+
+        existing_id = self._pending_keys.get(self._dedupe_key(kind, key))
+        if existing_id and existing_id in self._jobs:
+            job = self._jobs[existing_id]
+            job.payload = payload
+            self._persist(job)
+            logger.debug(f"Jobs: deduplicated {kind} job for {key}")
+            return job
+
+        if self.pending_count(kind) >= pool.max_pending:
+            raise JobQueueFull(kind, pool.max_pending)
+
+        job = Job(id=uuid.uuid4().hex, kind=kind, key=key, payload=payload)
+        self._persist(job)
+        self._track(job)
+        self._make_ready(job)
+        return job
+
+    # ── Recovery ─────────────────────────────────────────────────────────────
+
+    def recover(self) -> int:
+        """Reload persisted jobs after a restart and reschedule them.
+
+        Jobs that were running when the process stopped are retried (their
+        attempt is not counted again). Returns the number of jobs rescheduled.
+        """
+        if not self.root.exists():
+            return 0
+
+        failed: list[tuple[float, Path]] = []
+        recovered = 0
+        for path in self.root.glob("*.json"):
+            try:
+                job = Job(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, TypeError, json.JSONDecodeError) as e:
+                logger.warning(f"Jobs: skipping unreadable job file {path.name}: {e}")
+                continue
+            if job.id in self._jobs:
+                continue
+            if job.status == "failed":
+                failed.append((job.enqueued_at, path))
+                continue
+            if job.kind not in self._pools:
+                logger.warning(f"Jobs: no handler for recovered {job.kind} job {job.id}")
+                continue
+            if job.status == "running":
+                job.attempts = max(0, job.attempts - 1)
+            job.status = "pending"
+            self._track(job)
+            self._make_ready(job)
+            recovered += 1
+
+        # Keep only the most recent dead letters
+        failed.sort(reverse=True)
+        for _, path in failed[MAX_FAILED_JOBS:]:
+            path.unlink(missing_ok=True)
+
+        if recovered:
+            logger.info(f"Jobs: recovered {recovered} pending jobs from {self.root}")
+        return recovered
+
+    # ── Introspection ────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, throughput counters, and latency (ms) per kind."""
+        return {
+            kind: {
+                "pending": self.pending_count(kind),
+                "running": pool.running,
+                "concurrency": pool.concurrency,
+                "max_pending": pool.max_pending,
+                "completed": pool.completed,
+                "failed": pool.failed,
+                "retried": pool.retried,
+                "wait_ms": _latency_summary(pool.wait_ms),
+                "run_ms": _latency_summary(pool.run_ms),
+            }
+            for kind, pool in self._pools.items()
+        }
+
+    def jobs(self, kind: Optional[str] = None) -> list[dict[str, Any]]:
+        """In-flight and waiting jobs, oldest first."""
+        now = time.time()
+        rows = []
+        for job in sorted(self._jobs.values(), key=lambda j: j.enqueued_at):
+            if kind and job.kind != kind:
+                continue
+            row = job.to_dict()
+            row["age_ms"] = round((now - job.enqueued_at) * 1000, 1)
+            rows.append(row)
+        return rows
+
+    async def drain(self) -> None:
+        """Wait until no jobs are pending or running (retries included)."""
+        while self._jobs:
+            await asyncio.sleep(0.01)
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _dedupe_key(kind: str, key: str) -> str:
+        return f"{kind}\0{key}"
+
+    def _track(self, job: Job) -> None:
+        self._jobs[job.id] = job
+        self._pending_keys[self._dedupe_key(job.kind, job.key)] = job.id
+
+    def _path(self, job: Job) -> Path:
+        return self.root / f"{job.id}.json"
+
+    def _persist(self, job: Job) -> None:
+        """Atomically write the job file (tmp + rename)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(job)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(job.to_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _make_ready(self, job: Job) -> None:
+        delay = job.next_attempt_at - time.time()
+        if delay > 0:
+            loop = asyncio.get_running_loop()
+            self._timers[job.id] = loop.call_later(delay, self._on_timer, job.id)
+            return
+        pool = self._pools[job.kind]
+        pool.ready.append(job.id)
+        self._spawn(pool)
+
+    def _on_timer(self, job_id: str) -> None:
+        self._timers.pop(job_id, None)
+        job = self._jobs.get(job_id)
+        if job is not None:
+            pool = self._pools[job.kind]
+            pool.ready.append(job_id)
+            self._spawn(pool)
+
+    def _spawn(self, pool: _Pool) -> None:
+        # Workers not currently running a job are about to pick from ``ready``
+        while pool.workers < pool.concurrency and pool.workers - pool.running < len(pool.ready):
+            pool.workers += 1
+            task = asyncio.create_task(self._worker(pool))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _worker(self, pool: _Pool) -> None:
+        try:
+            while pool.ready:
+                job = self._jobs.get(pool.ready.popleft())
+                if job is not None:
+                    await self._run(pool, job)
+        finally:
+            pool.workers -= 1
+
+    async def _run(self, pool: _Pool, job: Job) -> None:
+        dedupe_key = self._dedupe_key(job.kind, job.key)
+        if self._pending_keys.get(dedupe_key) == job.id:
+            del self._pending_keys[dedupe_key]
+
+        started = time.time()
+        if job.attempts == 0:
+            pool.wait_ms.append((started - job.enqueued_at) * 1000)
+        job.status = "running"
+        job.attempts += 1
+        job.started_at = started
+        self._persist(job)
+
+        pool.running += 1
+        try:
+            await pool.handler(job.payload)
+        except Exception as e:
+            await self._on_error(pool, job, e)
+        else:
+            pool.completed += 1
+            pool.run_ms.append((time.time() - started) * 1000)
+            self._jobs.pop(job.id, None)
+            self._path(job).unlink(missing_ok=True)
+        finally:
+            pool.running -= 1
+
+    async def _on_error(self, pool: _Pool, job: Job, exc: Exception) -> None:
+        job.last_error = str(exc) or type(exc).__name__
+
+        if job.attempts < self.max_attempts:
+            delay = min(self.max_delay, self.base_delay * 2 ** (job.attempts - 1))
+            logger.warning(
+                f"Jobs: {job.kind} job {job.key} failed (attempt {job.attempts}/"
+                f"{self.max_attempts}), retrying in {delay:.1f}s: {job.last_error}"
+            )
+            pool.retried += 1
+            job.status = "pending"
+            job.next_attempt_at = time.time() + delay
+            self._persist(job)
+            # A newer enqueue for the same key may have arrived while running;
+            # keep that one as the dedupe target and let this retry run too.
+            self._pending_keys.setdefault(self._dedupe_key(job.kind, job.key), job.id)
+            self._make_ready(job)
+            return
+
+        logger.error(
+            f"Jobs: {job.kind} job {job.key} failed after {job.attempts} attempts: "
+            f"{job.last_error}",
+            exc_info=exc,
+        )
+        pool.failed += 1
+        job.status = "failed"
+        self._persist(job)
+        self._jobs.pop(job.id, None)
+        if pool.on_failure is not None:
+            try:
+                await pool.on_failure(job, exc)
+            except Exception as e:
+                logger.error(f"Jobs: failure handler for {job.kind} job {job.key} raised: {e}")
@@ -0,0 +1,265 @@
+"""
+Live chat streams that outlive the HTTP response that started them.
+
+An orchestrator run is pumped by a background task into a LiveStream: a
+bounded ring buffer of serialized events with monotonically increasing
+IDs. Each turn's IDs start above every ID issued before it, so a
+Last-Event-ID from an earlier turn of the same session is recognized and
+the new turn is replayed from the start. HTTP responses are subscribers that read the buffer from a cursor,
+so a client that drops mid-turn can reattach with the last ID it saw,
+replay what it missed, and continue live — and several clients can watch
+one run without starting another.
+
+Finished streams linger briefly so a reconnect that races the end of the
+turn still gets the tail (including the ``done`` event).
+
+Subscribers don't get a copy of each event; each keeps a cursor into the
+shared buffer, and how far it may trail the head is bounded. A
+subscriber more than ``max_lag`` events behind is handled by its policy:
+
+- ``snapshot``: drop superseded events and deliver the rest. Text and
+  thinking events carry full content, so only the last event of each
+  block is needed to reach the same state (its ``delta`` field is then
+  stale; clients render ``content``). Other events are kept.
+- ``disconnect``: send a ``stream_lagged`` event and end the
+  subscription; the client reattaches with its last event ID.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+from parachute.lib.sse import dumps
+from parachute.lib.typed_errors import parse_error
+from parachute.models.events import TypedErrorEvent
+
+logger = logging.getLogger(__name__)
+
+# Ring buffer bounds per stream — whichever is hit first evicts the oldest
+BUFFER_MAX_EVENTS = 2048
+BUFFER_MAX_BYTES = 8 * 1024 * 1024
+
+# How long a finished stream stays attachable
+FINISHED_LINGER_SECONDS = 120.0
+
+# Slow-consumer policies
+LAG_SNAPSHOT = "snapshot"
+LAG_DISCONNECT = "disconnect"
+LAG_POLICIES = (LAG_SNAPSHOT, LAG_DISCONNECT)
+DEFAULT_MAX_LAG = 256
+
+_CONFLATABLE = ("text", "thinking")
+
+
+def _conflate(items: list["BufferedEvent"]) -> list["BufferedEvent"]:
+    """Drop text/thinking events superseded by a later event that extends them."""
+    kept: list[BufferedEvent] = []
+    later: dict[str, str] = {}
+    for item in reversed(items):
+        kind = item.event.get("type")
+        if kind in _CONFLATABLE:
+            content = item.event.get("content") or ""
+            next_content = later.get(kind)
+            later[kind] = content
+            if next_content is not None and next_content.startswith(content):
+                continue
+        kept.append(item)
+    kept.reverse()
+    return kept
+
+
+@dataclass(frozen=True)
+class BufferedEvent:
+    """One event in a stream's ring buffer."""
+
+    id: int
+    event: dict[str, Any]
+    data: str  # event serialized once, shared by all v1 subscribers
+
+
+class LiveStream:
+    """Ring buffer of one orchestrator run's events."""
+
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        max_events: int = BUFFER_MAX_EVENTS,
+        max_bytes: int = BUFFER_MAX_BYTES,
+        id_base: int = 0,
+    ):
+        self.session_id = session_id
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.done = False
+        self.subscribers = 0
+        self._buffer: deque[BufferedEvent] = deque()
+        self._bytes = 0
+        self._base = id_base  # first event gets id_base + 1
+        self._last_id = id_base
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    @property
+    def first_id(self) -> int:
+        """ID of the oldest buffered event (last_id + 1 when empty)."""
+        return self._buffer[0].id if self._buffer else self._last_id + 1
+
+    def publish(self, event: dict[str, Any]) -> BufferedEvent:
+        """Append an event, evicting the oldest beyond the buffer bounds."""
+        self._last_id += 1
+        item = BufferedEvent(id=self._last_id, event=event, data=dumps(event))
+        self._buffer.append(item)
+        self._bytes += len(item.data)
+        while len(self._buffer) > 1 and (
+            len(self._buffer) > self.max_events or self._bytes > self.max_bytes
+        ):
+            self._bytes -= len(self._buffer.popleft().data)
+        self._notify()
+        return item
+
+    def finish(self) -> None:
+        self.done = True
+        self._notify()
+
+    def _notify(self) -> None:
+        # Wake every waiting subscriber; later waiters get a fresh Event
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+    async def subscribe(
+        self,
+        after_id: int = 0,
+        max_lag: Optional[int] = DEFAULT_MAX_LAG,
+        on_lag: str = LAG_SNAPSHOT,
+    ) -> AsyncIterator[BufferedEvent]:
+        """Yield events with ID > after_id, then follow live until done.
+
+        If events after ``after_id`` were already evicted, a synthetic
+        ``stream_gap`` event is yielded first so the client knows to
+        refetch the transcript for the missing tool calls. A subscriber
+        more than ``max_lag`` events behind is handled per ``on_lag``.
+        """
+        if on_lag not in LAG_POLICIES:
+            raise ValueError(f"Unknown slow-consumer policy: {on_lag}")
+        # A cursor outside this run's IDs is from another turn; replay all
+        cursor = after_id if self._base <= after_id <= self._last_id else self._base
+        self.subscribers += 1
+        try:
+            while True:
+                if cursor < self.first_id - 1:
+                    missed = self.first_id - 1 - cursor
+                    cursor = self.first_id - 1
+                    gap = {"type": "stream_gap", "missed": missed}
+                    yield BufferedEvent(id=cursor, event=gap, data=dumps(gap))
+                    continue
+
+                lag = self._last_id - cursor
+                if max_lag is not None and lag > max_lag and on_lag == LAG_DISCONNECT:
+                    logger.info(
+                        f"Disconnecting slow subscriber: session={self.session_id}, behind={lag}"
+                    )
+                    lagged = {"type": "stream_lagged", "behind": lag}
+                    yield BufferedEvent(id=cursor, event=lagged, data=dumps(lagged))
+                    return
+
+                # Buffer IDs are contiguous, so index arithmetic finds the cursor
+                start = cursor - self.first_id + 1
+                pending = [self._buffer[i] for i in range(start, len(self._buffer))]
+                if max_lag is not None and lag > max_lag:
+                    pending = _conflate(pending)
+                if pending:
+                    for item in pending:
+                        cursor = item.id
+                        yield item
+                    continue
+
+                if self.done:
+                    return
+                await self._wakeup.wait()
+        finally:
+            self.subscribers -= 1
+
+    async def pump(self, source: AsyncIterator[dict[str, Any]], hub: "LiveStreamHub") -> None:
+        """Drain an orchestrator stream into the buffer."""
+        try:
+            async for event in source:
+                self.publish(event)
+                if event.get("type") in ("session", "done") and event.get("sessionId"):
+                    hub._register(event["sessionId"], self)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Live stream error: {e}", exc_info=True)
+            typed = parse_error(e)
+            self.publish(TypedErrorEvent.from_typed_error(typed).model_dump(by_alias=True))
+        finally:
+            self.finish()
+            hub._schedule_discard(self)
+
+
+class LiveStreamHub:
+    """Active (and recently finished) live streams keyed by session ID."""
+
+    def __init__(self, linger_seconds: float = FINISHED_LINGER_SECONDS):
+        self.linger_seconds = linger_seconds
+        self._streams: dict[str, LiveStream] = {}
+        self._running: set[LiveStream] = set()
+
+    def start(
+        self,
+        source: AsyncIterator[dict[str, Any]],
+        session_id: Optional[str] = None,
+    ) -> LiveStream:
+        """Run ``source`` in the background and return its stream.
+
+        New sessions have no ID yet; the stream is registered once the
+        orchestrator announces one in a ``session`` or ``done`` event.
+        """
+        stream = LiveStream(session_id=session_id, id_base=self._next_id_base())
+        if session_id:
+            self._register(session_id, stream)
+        self._running.add(stream)
+        stream._task = asyncio.create_task(stream.pump(source, self))
+        return stream
+
+    def get(self, session_id: str) -> Optional[LiveStream]:
+        return self._streams.get(session_id)
+
+    def _next_id_base(self) -> int:
+        """Start above every ID issued so far.
+
+        Streams still held cover this process; the microsecond clock covers
+        discarded streams and earlier processes, since a turn never emits
+        events faster than one per microsecond.
+        """
+        issued = max((s.last_id for s in self._running | set(self._streams.values())), default=0)
+        return max(issued, time.time_ns() // 1000)
+
+    def _register(self, session_id: str, stream: LiveStream) -> None:
+        stream.session_id = session_id
+        # A new turn on the same session replaces the lingering previous one
+        self._streams[session_id] = stream
+
+    def _schedule_discard(self, stream: LiveStream) -> None:
+        self._running.discard(stream)
+        if stream.session_id and self._streams.get(stream.session_id) is stream:
+            asyncio.get_running_loop().call_later(self.linger_seconds, self._discard, stream)
+
+    def _discard(self, stream: LiveStream) -> None:
+        if stream.session_id and self._streams.get(stream.session_id) is stream:
+            del self._streams[stream.session_id]
+
+    async def close(self) -> None:
+        """Cancel in-flight runs (server shutdown)."""
+        tasks = [s._task for s in self._running if s._task and not s._task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._streams.clear()
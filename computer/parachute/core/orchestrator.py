@@ -26,7 +26,8 @@ from parachute.core.session_manager import SessionManager
 from parachute.db.brain_chat_store import BrainChatStore
 from parachute.lib.context_loader import format_context_for_prompt, load_agent_context
 from parachute.lib.credentials import load_credentials
-from parachute.core.context_folders import ContextFolderService
+from parachute.lib.metrics import get_metrics
+from parachute.core.context_folders import get_context_folder_service
 from parachute.core.capability_filter import filter_by_trust_level
 from parachute.core.tool_guidance import build_tool_guidance
 from parachute.lib.mcp_loader import (
@@ -63,6 +64,12 @@ from parachute.models.session import (
 
 logger = logging.getLogger(__name__)
 
+_FIRST_TOKEN_SECONDS = get_metrics().histogram(
+    "parachute_stream_first_token_seconds",
+    "Time from run_streaming() start to the first text event",
+    ("trust",),
+)
+
 
 def generate_title_from_message(message: str, max_length: int = 60) -> str:
     """
@@ -358,7 +365,15 @@ class Orchestrator:
         await self._sandbox.delete_container(slug)
 
     async def reconcile_containers(self) -> None:
-        """Reconcile sandbox containers on startup."""
+        """Reconcile sandbox containers on startup.
+
+        Runs in the background while requests are served, so sandboxed
+        turns wait until it finishes (see DockerSandbox.reconciling).
+        """
+        with self._sandbox.reconciling():
+            await self._reconcile_containers()
+
+    async def _reconcile_containers(self) -> None:
         # Remove container records for envs where every session is empty
         # (message_count == 0) and the env is older than 5 minutes. These are
         # abandoned or failed sessions that never sent a message.
@@ -726,6 +741,7 @@ class Orchestrator:
             )
 
             # Phase 4: Execute (sandboxed or trusted)
+            first_token = True
             # Pre-check Docker availability. Local sessions get a TypedErrorEvent
             # with recovery action; bot sessions hard-fail.
             if caps.effective_trust == "sandboxed":
@@ -744,6 +760,9 @@ class Orchestrator:
                         mode=effective_mode,
                         interrupt=interrupt,
                     ):
+                        if first_token and event.get("type") == "text":
+                            first_token = False
+                            _FIRST_TOKEN_SECONDS.observe(time.time() - start_time, trust="sandboxed")
                         yield event
                 elif session.source in BOT_SOURCES:
                     logger.error(
@@ -792,6 +811,9 @@ class Orchestrator:
                     start_time=start_time,
                     mode=effective_mode,
                 ):
+                    if first_token and event.get("type") == "text":
+                        first_token = False
+                        _FIRST_TOKEN_SECONDS.observe(time.time() - start_time, trust="direct")
                     yield event
 
         except asyncio.CancelledError:
@@ -1107,6 +1129,22 @@ class Orchestrator:
             f"{f', provider={current_settings.api_provider}' if provider_base_url else ''}"
         )
 
+        # Trusted sessions share the server process — serve the built-in
+        # parachute tools in-process rather than via a stdio subprocess.
+        mcp_servers = caps.resolved_mcps
+        if mcp_servers and current_settings.builtin_mcp_in_process:
+            from parachute.core.builtin_mcp import with_in_process_builtin
+            from parachute.mcp_server import SessionContext
+
+            mcp_servers = with_in_process_builtin(
+                mcp_servers,
+                SessionContext(
+                    session_id=session.id if session.id != "pending" else None,
+                    trust_level=caps.effective_trust,
+                    container_id=session.container_id,
+                ),
+            )
+
         try:
             async for event in query_streaming(
                 prompt=actual_message,
@@ -1116,7 +1154,7 @@ class Orchestrator:
                 setting_sources=["project"],
                 cwd=effective_cwd,
                 resume=resume_id,
-                mcp_servers=caps.resolved_mcps,
+                mcp_servers=mcp_servers,
                 permission_mode="bypassPermissions",
                 plugin_dirs=caps.plugin_dirs if caps.plugin_dirs else None,
                 agents=caps.agents_dict,
@@ -2140,7 +2178,7 @@ class Orchestrator:
         # Handle explicitly selected context files (beyond automatic hierarchy)
         # These are files the user explicitly selected in the UI
         if contexts:
-            context_folder_service = ContextFolderService(Path.home())
+            context_folder_service = get_context_folder_service(Path.home())
 
             # Separate folder paths from file paths
             folder_paths: list[str] = []
@@ -2157,8 +2195,8 @@ class Orchestrator:
             # Load folder-based context (explicit selections only)
             if folder_paths:
                 try:
-                    chain = context_folder_service.build_chain(
-                        folder_paths, max_tokens=40000
+                    chain = await asyncio.to_thread(
+                        context_folder_service.build_chain, folder_paths, max_tokens=40000
                     )
                     if chain.files:
                         folder_context = context_folder_service.format_chain_for_prompt(
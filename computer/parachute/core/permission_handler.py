@@ -12,12 +12,15 @@ dynamically via the permission_request SSE flow.
 
 import asyncio
 import logging
+import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Optional
 from uuid import uuid4
 
+from parachute.lib.glob_matcher import GlobMatcher
 from parachute.lib.ignore_patterns import get_ignore_patterns
 from parachute.models.session import Session, SessionPermissions, TrustLevel
 
@@ -59,6 +62,27 @@ WRITE_TOOLS = [
 # Bash requires special handling
 BASH_TOOL = "Bash"
 
+# Substrings that block a Bash command outright (case-insensitive)
+DANGEROUS_COMMANDS = [
+    ("sudo", "sudo commands are not allowed"),
+    ("rm -rf /", "Cannot delete root filesystem"),
+    ("rm -rf ~", "Cannot delete home directory"),
+    ("rm -rf /*", "Cannot delete root filesystem"),
+    (":(){:|:&};:", "Fork bomb detected"),
+    ("mkfs", "Cannot format filesystems"),
+    ("dd if=", "Direct disk access not allowed"),
+    ("> /dev/", "Cannot write to device files"),
+    ("chmod -R 777 /", "Cannot change permissions on root"),
+]
+# One scan for all of them; group N+1 is DANGEROUS_COMMANDS[N]
+_DANGEROUS_RE = re.compile(
+    "|".join(f"({re.escape(pattern)})" for pattern, _ in DANGEROUS_COMMANDS),
+    re.IGNORECASE,
+)
+
+# Recent (permission type, path) -> allowed decisions kept per handler
+DECISION_CACHE_SIZE = 1024
+
 
 @dataclass
 class PermissionRequest:
@@ -144,8 +168,10 @@ class PermissionHandler:
         self.on_user_question = on_user_question
         self.on_permission_update = on_permission_update
 
-        # Get session permissions (may be empty for new sessions)
-        self._permissions = session.permissions
+        # Get session permissions (may be empty for new sessions), compiled
+        # into matchers that are rebuilt only when the grants change
+        self._decisions: OrderedDict[tuple[str, str], bool] = OrderedDict()
+        self._set_permissions(session.permissions)
 
         # Global deny list
         self._ignore = get_ignore_patterns()
@@ -174,10 +200,34 @@ class PermissionHandler:
 
     def update_permissions(self, permissions: SessionPermissions) -> None:
         """Update session permissions (e.g., after user grants access)."""
-        self._permissions = permissions
+        self._set_permissions(permissions)
         if self.on_permission_update:
             self.on_permission_update(permissions)
 
+    def _set_permissions(self, permissions: SessionPermissions) -> None:
+        """Install permissions and recompile the read/write grant matchers."""
+        self._permissions = permissions
+        if permissions.allowed_paths:
+            # allowed_paths overrides the read/write lists (see SessionPermissions)
+            read = write = GlobMatcher(permissions.allowed_paths)
+        else:
+            read, write = GlobMatcher(permissions.read), GlobMatcher(permissions.write)
+        self._matchers = {"read": read, "write": write}
+        self._decisions.clear()
+
+    def _is_granted(self, permission_type: str, path: str) -> bool:
+        """Check a path against the compiled read or write grants (LRU-cached)."""
+        key = (permission_type, path)
+        allowed = self._decisions.get(key)
+        if allowed is not None:
+            self._decisions.move_to_end(key)
+            return allowed
+        allowed = self._matchers[permission_type].matches(path)
+        self._decisions[key] = allowed
+        if len(self._decisions) > DECISION_CACHE_SIZE:
+            self._decisions.popitem(last=False)
+        return allowed
+
     def create_sdk_callback(self):
         """
         Create an SDK-compatible can_use_tool callback.
@@ -340,7 +390,7 @@ class PermissionHandler:
             return PermissionDecision(behavior="allow", updated_input=input_data)
 
         # Check session permissions
-        if relative_path and self._permissions.can_read(relative_path):
+        if relative_path and self._is_granted("read", relative_path):
             logger.debug(f"Read allowed by permission: {relative_path}")
             return PermissionDecision(behavior="allow", updated_input=input_data)
 
@@ -384,7 +434,7 @@ class PermissionHandler:
             return PermissionDecision(behavior="allow", updated_input=input_data)
 
         # Check session permissions
-        if relative_path and self._permissions.can_write(relative_path):
+        if relative_path and self._is_granted("write", relative_path):
             logger.debug(f"Write allowed by permission: {relative_path}")
             return PermissionDecision(behavior="allow", updated_input=input_data)
 
@@ -445,24 +495,9 @@ class PermissionHandler:
 
         Returns the reason if dangerous, None if OK.
         """
-        cmd_lower = command.lower().strip()
-
-        blocked_commands = [
-            ("sudo", "sudo commands are not allowed"),
-            ("rm -rf /", "Cannot delete root filesystem"),
-            ("rm -rf ~", "Cannot delete home directory"),
-            ("rm -rf /*", "Cannot delete root filesystem"),
-            (":(){:|:&};:", "Fork bomb detected"),
-            ("mkfs", "Cannot format filesystems"),
-            ("dd if=", "Direct disk access not allowed"),
-            ("> /dev/", "Cannot write to device files"),
-            ("chmod -R 777 /", "Cannot change permissions on root"),
-        ]
-
-        for pattern, reason in blocked_commands:
-            if pattern in cmd_lower:
-                return reason
-
+        match = _DANGEROUS_RE.search(command)
+        if match:
+            return DANGEROUS_COMMANDS[match.lastindex - 1][1]
         return None
 
     async def _request_approval(
@@ -552,30 +587,30 @@ class PermissionHandler:
         if permission_type == "read":
             if pattern not in self._permissions.read:
                 new_read = self._permissions.read + [pattern]
-                self._permissions = SessionPermissions(
+                self._set_permissions(SessionPermissions(
                     read=new_read,
                     write=self._permissions.write,
                     bash=self._permissions.bash,
                     trustLevel=self._permissions.trust_level,
-                )
+                ))
         elif permission_type == "write":
             if pattern not in self._permissions.write:
                 new_write = self._permissions.write + [pattern]
-                self._permissions = SessionPermissions(
+                self._set_permissions(SessionPermissions(
                     read=self._permissions.read,
                     write=new_write,
                     bash=self._permissions.bash,
                     trustLevel=self._permissions.trust_level,
-                )
+                ))
         elif permission_type == "bash":
             if isinstance(self._permissions.bash, list) and pattern not in self._permissions.bash:
                 new_bash = self._permissions.bash + [pattern]
-                self._permissions = SessionPermissions(
+                self._set_permissions(SessionPermissions(
                     read=self._permissions.read,
                     write=self._permissions.write,
                     bash=new_bash,
                     trustLevel=self._permissions.trust_level,
-                )
+                ))
 
         # Notify about permission update
         if self.on_permission_update:
@@ -29,10 +29,12 @@ import shutil
 import tempfile
 import time
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterator
 
+from parachute.lib.metrics import get_metrics
 from parachute.models.session import BOT_SOURCES, SessionSource
 
 SANDBOX_DATA_DIR = "sandbox"
@@ -53,6 +55,11 @@ CONTAINER_MEMORY_LIMIT_EPHEMERAL = "4g"
 CONTAINER_MEMORY_LIMIT_PERSISTENT = "4g"
 CONTAINER_CPU_LIMIT = "2.0"
 
+# docker exec per agent turn: process spawn, first streamed event, whole turn
+_EXEC_SECONDS = get_metrics().histogram(
+    "parachute_sandbox_exec_seconds", "docker exec latency for agent turns", ("phase",)
+)
+
 
 @dataclass
 class AgentSandboxConfig:
@@ -89,6 +96,9 @@ class DockerSandbox:
         self._checked_at: float = 0
         # Per-container locks to prevent race conditions during container creation
         self._slug_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Cleared while startup reconcile runs; sandbox use waits for it
+        self._reconciled = asyncio.Event()
+        self._reconciled.set()
 
     async def is_available(self) -> bool:
         """Check if Docker is installed and running (cached with TTL).
@@ -471,11 +481,31 @@ class DockerSandbox:
             logger.error(f"{label.capitalize()} exited {proc.returncode}: {error_detail}")
             yield {"type": "exit_error", "returncode": proc.returncode, "stderr": error_detail}
 
+    @contextmanager
+    def reconciling(self) -> Iterator[None]:
+        """Hold off sandbox use until the enclosed reconcile has finished.
+
+        Enter before taking the active-slug snapshot: a container created
+        after the snapshot would otherwise look orphaned and be removed,
+        and the first exec could race the tools volume setup.
+        """
+        self._reconciled.clear()
+        try:
+            yield
+        finally:
+            self._reconciled.set()
+
+    async def _wait_for_reconcile(self) -> None:
+        if not self._reconciled.is_set():
+            logger.info("Waiting for container reconcile before sandbox use")
+            await self._reconciled.wait()
+
     async def _validate_docker_ready(self) -> None:
         """Validate Docker and sandbox image are available.
 
         Raises RuntimeError if Docker is not available or image is missing.
         """
+        await self._wait_for_reconcile()
         if not await self.is_available():
             raise RuntimeError("Docker not available for sandboxed execution")
 
@@ -593,6 +623,7 @@ class DockerSandbox:
         Home dir: ~/.parachute/sandbox/envs/<slug>/home/ → /home/sandbox/
         Creates if absent, starts if stopped. Idempotent.
         """
+        await self._wait_for_reconcile()
         container_name = f"parachute-env-{slug}"
         home_dir = self._get_container_home_dir(slug)
         labels = {
@@ -814,12 +845,15 @@ class DockerSandbox:
             "python", "/workspace/entrypoint.py",
         ])
 
+        started = time.perf_counter()
         proc = await asyncio.create_subprocess_exec(
             *exec_args,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
+        _EXEC_SECONDS.observe(time.perf_counter() - started, phase="spawn")
+        first_event = True
 
         try:
             # Build enriched stdin payload — includes secrets and per-session data
@@ -879,6 +913,9 @@ class DockerSandbox:
             async for event in self._stream_process(
                 proc, stdin_payload, config, label=label
             ):
+                if first_event:
+                    first_event = False
+                    _EXEC_SECONDS.observe(time.perf_counter() - started, phase="first_event")
                 if event.get("type") == "exit_error":
                     returncode = event["returncode"]
                     # Exit code 137 = OOM killed — remove so next use recreates
@@ -909,6 +946,7 @@ class DockerSandbox:
             logger.error(f"Failed to exec in {label}: {e}")
             yield {"type": "error", "error": f"Failed to exec in sandbox: {e}"}
         finally:
+            _EXEC_SECONDS.observe(time.perf_counter() - started, phase="total")
             if proc.returncode is None:
                 try:
                     proc.kill()
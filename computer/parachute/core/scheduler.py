@@ -7,12 +7,23 @@ Uses APScheduler to run background jobs like:
 
 Each Agent node has schedule_enabled and schedule_time fields. The scheduler
 discovers enabled agents and schedules them accordingly.
+
+Runs don't start directly from their cron job: they go through the
+AgentRunGovernor, which caps how many agents execute at once, starts queued
+runs in priority order, and coalesces duplicate requests for the same agent.
+Agents sharing a schedule minute are spread apart, and runs missed while the
+server was down are caught up once at startup.
 """
 
+import asyncio
+import heapq
+import itertools
 import logging
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -25,6 +36,18 @@ _scheduler: Optional[AsyncIOScheduler] = None
 _home_path: Optional[Path] = None
 _graph = None
 
+# Run priorities (lower starts first)
+MANUAL_PRIORITY = 0
+CATCH_UP_PRIORITY = 5
+SCHEDULED_PRIORITY = 10
+
+# Agents scheduled at the same minute are offset by this many seconds each
+COLLISION_SPREAD_SECONDS = 90
+# Random start jitter added to every cron fire
+SCHEDULE_JITTER_SECONDS = 20
+# Runs missed by up to this long (downtime, stalled loop) still run once
+MISFIRE_GRACE_SECONDS = 6 * 3600
+
 
 def _parse_time(time_str: str) -> tuple[int, int]:
     """Parse a time string like '3:00' or '06:30' into (hour, minute)."""
@@ -38,23 +61,208 @@ def _parse_time(time_str: str) -> tuple[int, int]:
         return (3, 0)
 
 
+# =============================================================================
+# Run Governor
+# =============================================================================
+
+@dataclass(order=True)
+class _QueuedRun:
+    priority: int
+    seq: int
+    agent_name: str = field(compare=False)
+    trigger: str = field(compare=False)
+    queued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    date: Optional[str] = field(default=None, compare=False)
+
+
+class AgentRunGovernor:
+    """Caps concurrent agent runs and orders the backlog by priority.
+
+    A run requested for an agent and date that is already queued or running
+    joins that run instead of starting another one. A queued run that
+    receives a higher-priority request is promoted. An agent runs at most
+    once at a time; a run for another date waits for the current one.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[str, str, Optional[str]], Awaitable[Any]],
+        max_concurrent: int = 2,
+    ):
+        self._runner = runner
+        self.max_concurrent = max(1, max_concurrent)
+        self._heap: list[_QueuedRun] = []
+        self._queued: dict[tuple[str, Optional[str]], _QueuedRun] = {}
+        self._running: dict[str, _QueuedRun] = {}
+        self._started: dict[str, float] = {}
+        self._seq = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+        self.completed = 0
+        self.coalesced = 0
+
+    def submit(
+        self,
+        agent_name: str,
+        trigger: str = "scheduled",
+        priority: int = SCHEDULED_PRIORITY,
+        date: Optional[str] = None,
+    ) -> asyncio.Future:
+        """Queue a run; the returned future resolves to the runner's result.
+
+        ``date`` is the journal date to process (None: the runner's default).
+        """
+        running = self._running.get(agent_name)
+        if running is not None and running.date == date:
+            self.coalesced += 1
+            return running.future
+
+        queued = self._queued.get((agent_name, date))
+        if queued is not None:
+            self.coalesced += 1
+            if priority < queued.priority:
+                queued.priority = priority
+                heapq.heapify(self._heap)
+            return queued.future
+
+        run = _QueuedRun(
+            priority=priority,
+            seq=next(self._seq),
+            agent_name=agent_name,
+            trigger=trigger,
+            queued_at=time.time(),
+            future=asyncio.get_running_loop().create_future(),
+            date=date,
+        )
+        heapq.heappush(self._heap, run)
+        self._queued[(agent_name, date)] = run
+        self._pump()
+        return run.future
+
+    def set_limit(self, max_concurrent: int) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self._pump()
+
+    def status(self) -> dict[str, Any]:
+        now = time.time()
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": [
+                {
+                    "agent": name,
+                    "trigger": run.trigger,
+                    "date": run.date,
+                    "running_seconds": round(now - self._started[name], 1),
+                }
+                for name, run in self._running.items()
+            ],
+            "queued": [
+                {
+                    "agent": run.agent_name,
+                    "trigger": run.trigger,
+                    "date": run.date,
+                    "priority": run.priority,
+                    "waiting_seconds": round(now - run.queued_at, 1),
+                }
+                for run in sorted(self._heap)
+            ],
+            "completed": self.completed,
+            "coalesced": self.coalesced,
+        }
+
+    def _pump(self) -> None:
+        deferred = []  # agent already running (for another date)
+        while self._heap and len(self._running) < self.max_concurrent:
+            run = heapq.heappop(self._heap)
+            if run.agent_name in self._running:
+                deferred.append(run)
+                continue
+            del self._queued[(run.agent_name, run.date)]
+            self._running[run.agent_name] = run
+            self._started[run.agent_name] = time.time()
+            task = asyncio.create_task(self._execute(run))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        for run in deferred:
+            heapq.heappush(self._heap, run)
+
+    async def _execute(self, run: _QueuedRun) -> None:
+        wait = time.time() - run.queued_at
+        if wait >= 1:
+            logger.info(f"Agent '{run.agent_name}' started after {wait:.0f}s in run queue")
+        try:
+            result = await self._runner(run.agent_name, run.trigger, run.date)
+        except Exception as e:
+            if not run.future.done():
+                run.future.set_exception(e)
+        else:
+            if not run.future.done():
+                run.future.set_result(result)
+        finally:
+            self.completed += 1
+            del self._running[run.agent_name]
+            del self._started[run.agent_name]
+            self._pump()
+
+
+_governor: Optional[AgentRunGovernor] = None
+
+
+def get_governor() -> AgentRunGovernor:
+    """Return the process-wide run governor, creating it on first use."""
+    global _governor
+    if _governor is None:
+        _governor = AgentRunGovernor(_execute_daily_agent)
+    return _governor
+
+
 # =============================================================================
 # Generic Daily Agent Scheduling
 # =============================================================================
 
-async def _run_daily_agent_job(agent_name: str, trigger: str = "scheduled"):
-    """Job function that runs a daily agent."""
-    global _home_path
+async def _execute_daily_agent(
+    agent_name: str, trigger: str, date: Optional[str] = None
+) -> Optional[dict]:
+    """Run a daily agent now (called by the governor)."""
     if not _home_path:
         logger.error(f"Cannot run agent '{agent_name}': home_path not set")
-        return
+        return None
 
     from parachute.core.daily_agent import run_daily_agent
     try:
-        result = await run_daily_agent(_home_path, agent_name, trigger=trigger)
+        result = await run_daily_agent(_home_path, agent_name, date=date, trigger=trigger)
         logger.info(f"Agent '{agent_name}' result: {result.get('status')}")
+        return result
     except Exception as e:
         logger.error(f"Agent '{agent_name}' failed: {e}", exc_info=True)
+        return None
+
+
+async def _run_daily_agent_job(
+    agent_name: str,
+    trigger: str = "scheduled",
+    priority: int = SCHEDULED_PRIORITY,
+):
+    """Job function: queue a daily agent run on the governor and wait for it."""
+    return await get_governor().submit(agent_name, trigger=trigger, priority=priority)
+
+
+def _spread_schedule(agents: list) -> dict[str, tuple[int, int, int]]:
+    """Assign (hour, minute, second) per agent, offsetting same-minute collisions.
+
+    Agents sharing a minute keep their order by name; the n-th one starts
+    n × COLLISION_SPREAD_SECONDS later.
+    """
+    by_slot: dict[tuple[int, int], list[str]] = {}
+    for config in agents:
+        by_slot.setdefault(config.get_schedule_hour_minute(), []).append(config.name)
+
+    times: dict[str, tuple[int, int, int]] = {}
+    for (hour, minute), names in by_slot.items():
+        for i, name in enumerate(sorted(names)):
+            total = (hour * 3600 + minute * 60 + i * COLLISION_SPREAD_SECONDS) % 86400
+            times[name] = (total // 3600, (total % 3600) // 60, total % 60)
+    return times
 
 
 def _schedule_from_list(scheduler: AsyncIOScheduler, agents: list) -> dict[str, bool]:
@@ -64,13 +272,14 @@ def _schedule_from_list(scheduler: AsyncIOScheduler, agents: list) -> dict[str,
         return {}
 
     results = {}
+    times = _spread_schedule([c for c in agents if c.schedule_enabled])
     for config in agents:
         if not config.schedule_enabled:
             logger.info(f"Agent '{config.name}' schedule disabled")
             results[config.name] = False
             continue
 
-        hour, minute = config.get_schedule_hour_minute()
+        hour, minute, second = times[config.name]
         job_id = f"daily_{config.name}"
 
         try:
@@ -80,18 +289,44 @@ def _schedule_from_list(scheduler: AsyncIOScheduler, agents: list) -> dict[str,
 
         scheduler.add_job(
             _run_daily_agent_job,
-            CronTrigger(hour=hour, minute=minute),
+            CronTrigger(hour=hour, minute=minute, second=second, jitter=SCHEDULE_JITTER_SECONDS),
             id=job_id,
             name=f"Daily {config.display_name}",
             args=[config.name],
             replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=MISFIRE_GRACE_SECONDS,
         )
-        logger.info(f"Scheduled agent '{config.name}' at {hour:02d}:{minute:02d}")
+        logger.info(f"Scheduled agent '{config.name}' at {hour:02d}:{minute:02d}:{second:02d}")
         results[config.name] = True
 
     return results
 
 
+def _missed_runs(agents: list, now: datetime) -> list[tuple[str, str]]:
+    """(agent, date) for agents whose last scheduled time fell within the grace window.
+
+    Called at startup: the in-memory job store has no record of fires that
+    happened while the server was down, so these get one catch-up run each
+    (several missed days coalesce into that single run). The date is the
+    one the missed fire would have processed — the day before it was
+    scheduled — not "yesterday" at catch-up time, which differs once the
+    catch-up crosses midnight. run_daily_agent skips dates that were
+    already processed, so a catch-up after a run that did happen is a no-op.
+    """
+    missed = []
+    for config in agents:
+        if not config.schedule_enabled:
+            continue
+        hour, minute = config.get_schedule_hour_minute()
+        last = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if last > now:
+            last -= timedelta(days=1)
+        if now - last <= timedelta(seconds=MISFIRE_GRACE_SECONDS):
+            missed.append((config.name, (last - timedelta(days=1)).strftime("%Y-%m-%d")))
+    return missed
+
+
 # =============================================================================
 # Scheduler Lifecycle
 # =============================================================================
@@ -107,6 +342,9 @@ async def init_scheduler(home_path: Path, graph=None) -> AsyncIOScheduler:
         logger.warning("Scheduler already initialized")
         return _scheduler
 
+    from parachute.config import settings
+    get_governor().set_limit(settings.scheduler_max_concurrent_agents)
+
     # Create scheduler
     _scheduler = AsyncIOScheduler()
 
@@ -120,6 +358,13 @@ async def init_scheduler(home_path: Path, graph=None) -> AsyncIOScheduler:
     _scheduler.start()
     logger.info("Scheduler started")
 
+    # Catch up runs missed while the server was down (one per agent)
+    missed = _missed_runs(agents, datetime.now().astimezone())
+    if missed:
+        logger.info(f"Scheduler: queuing catch-up runs for {missed}")
+    for name, date in missed:
+        get_governor().submit(name, trigger="scheduled", priority=CATCH_UP_PRIORITY, date=date)
+
     return _scheduler
 
 
@@ -160,6 +405,7 @@ async def get_scheduler_status(home_path: Path, graph=None) -> dict[str, Any]:
         "running": _scheduler is not None and _scheduler.running if _scheduler else False,
         "jobs": [],
         "agents": agents_config,
+        "run_queue": get_governor().status(),
         # Legacy field for backward compatibility
         "config": {
             "daily_reflection": agents_config.get("process-day") or agents_config.get("reflection"),
@@ -243,7 +489,7 @@ async def trigger_job_now(job_id: str, home_path: Path) -> dict[str, Any]:
         agent_name = job_id
 
     try:
-        await _run_daily_agent_job(agent_name, trigger="event")
+        await _run_daily_agent_job(agent_name, trigger="event", priority=MANUAL_PRIORITY)
         return {"success": True, "job_id": job_id, "agent": agent_name, "message": "Job executed"}
     except Exception as e:
         return {"success": False, "job_id": job_id, "agent": agent_name, "error": str(e)}
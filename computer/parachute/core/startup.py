@@ -0,0 +1,148 @@
+"""
+Staged server startup.
+
+The lifespan runs only the critical path (config, Brain + schema, the
+orchestrator, modules and their routes, the MCP bridge) before the server
+starts accepting requests. Everything else — container reconciliation,
+transcription model load, the scheduler, hooks and bot connectors —
+starts in background tasks, so /api/health answers while Docker or a
+model download is still slow.
+
+StartupTracker records every subsystem's state and init duration for
+GET /api/health/ready.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+STARTING = "starting"
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"
+CANCELLED = "cancelled"
+
+_SETTLED = frozenset({READY, FAILED, SKIPPED, CANCELLED})
+
+
+class SubsystemSkipped(Exception):
+    """Raised by an init function when its subsystem is unavailable (not an error)."""
+
+
+@dataclass
+class SubsystemState:
+    """Startup state of one subsystem."""
+
+    name: str
+    critical: bool
+    state: str = PENDING
+    started_at: Optional[float] = None
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "critical": self.critical,
+            "durationMs": round(self.duration_ms, 1) if self.duration_ms is not None else None,
+            **({"error": self.error} if self.error else {}),
+        }
+
+
+@dataclass
+class StartupTracker:
+    """Runs and records subsystem initialization."""
+
+    started_at: float = field(default_factory=time.monotonic)
+    subsystems: dict[str, SubsystemState] = field(default_factory=dict)
+    serving_after_ms: Optional[float] = None
+    _tasks: list[asyncio.Task] = field(default_factory=list, repr=False)
+
+    def _state(self, name: str, critical: bool) -> SubsystemState:
+        if name not in self.subsystems:
+            self.subsystems[name] = SubsystemState(name=name, critical=critical)
+        return self.subsystems[name]
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[SubsystemState]:
+        """Time a critical-path step inline; failures propagate."""
+        sub = self._state(name, critical=True)
+        sub.state = STARTING
+        sub.started_at = time.monotonic()
+        try:
+            yield sub
+        except BaseException as e:
+            sub.state = FAILED
+            sub.error = str(e) or type(e).__name__
+            raise
+        else:
+            sub.state = READY
+        finally:
+            sub.duration_ms = (time.monotonic() - sub.started_at) * 1000
+
+    def start_background(self, name: str, init: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Run a non-critical init step in a background task.
+
+        Failures are logged and recorded, never raised — the server keeps
+        running without the subsystem.
+        """
+        self._state(name, critical=False)
+        task = asyncio.create_task(self._run_background(name, init), name=f"startup:{name}")
+        self._tasks.append(task)
+        return task
+
+    async def _run_background(self, name: str, init: Callable[[], Awaitable[Any]]) -> None:
+        sub = self.subsystems[name]
+        sub.state = STARTING
+        sub.started_at = time.monotonic()
+        try:
+            await init()
+            sub.state = READY
+        except SubsystemSkipped as e:
+            sub.state = SKIPPED
+            sub.error = str(e) or None
+        except asyncio.CancelledError:
+            sub.state = CANCELLED
+            raise
+        except Exception as e:
+            sub.state = FAILED
+            sub.error = str(e) or type(e).__name__
+            logger.warning(f"Startup: {name} failed: {e}", exc_info=True)
+        finally:
+            sub.duration_ms = (time.monotonic() - sub.started_at) * 1000
+        logger.info(f"Startup: {name} {sub.state} in {sub.duration_ms:.0f}ms")
+
+    def mark_serving(self) -> None:
+        """Record when the critical path finished and requests are accepted."""
+        self.serving_after_ms = (time.monotonic() - self.started_at) * 1000
+        logger.info(f"Startup: critical path done in {self.serving_after_ms:.0f}ms")
+
+    @property
+    def ready(self) -> bool:
+        """True once every subsystem has settled (ready, failed, or skipped)."""
+        return all(sub.state in _SETTLED for sub in self.subsystems.values())
+
+    async def wait(self) -> None:
+        """Wait for all background init tasks to settle."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def cancel(self) -> None:
+        """Cancel background init still in progress (shutdown)."""
+        pending = [t for t in self._tasks if not t.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "servingAfterMs": round(self.serving_after_ms, 1) if self.serving_after_ms is not None else None,
+            "subsystems": {name: sub.to_dict() for name, sub in self.subsystems.items()},
+        }
@@ -3,7 +3,7 @@ Server-side speech-to-text transcription service.
 
 Delegates to platform-specific backends:
 - macOS: parakeet-mlx (Metal GPU acceleration via Apple MLX)
-- Linux: sherpa-onnx (future — CPU-based ONNX Runtime)
+- Linux: sherpa-onnx (CPU via ONNX Runtime, int8 Parakeet in a process pool)
 
 The TranscriptionService is a singleton initialized at server startup
 and published to the InterfaceRegistry as "TranscriptionService".
@@ -12,8 +12,9 @@ and published to the InterfaceRegistry as "TranscriptionService".
 import asyncio
 import logging
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import AsyncIterator, Protocol, runtime_checkable
 
 from parachute.config import Settings
 
@@ -23,6 +24,15 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL_ID = "mlx-community/parakeet-tdt-0.6b-v3"
 
 
+@dataclass(frozen=True)
+class TranscriptSegment:
+    """A transcribed span of audio (times in seconds from the start)."""
+
+    start: float
+    end: float
+    text: str
+
+
 @runtime_checkable
 class TranscriptionBackend(Protocol):
     """Interface for transcription backends."""
@@ -39,6 +49,10 @@ class TranscriptionBackend(Protocol):
         """Transcribe from raw audio bytes. Returns text."""
         ...
 
+    def transcribe_stream(self, audio_path: Path) -> AsyncIterator[TranscriptSegment]:
+        """Transcribe an audio file, yielding segments in order as they finish."""
+        ...
+
 
 class TranscriptionService:
     """Server-side speech-to-text. Delegates to platform-specific backend."""
@@ -58,8 +72,8 @@ class TranscriptionService:
             logger.info("Transcription disabled via config")
             return None
 
-        # Get model ID from config or use default
-        model_id = getattr(settings, "transcription_model_id", None) or DEFAULT_MODEL_ID
+        # Get model ID from config (each backend has its own default)
+        model_id = getattr(settings, "transcription_model_id", None)
 
         backend = _detect_backend(model_id)
         if backend is None:
@@ -78,29 +92,51 @@ class TranscriptionService:
         """Transcribe from raw audio bytes. Returns text."""
         return await self._backend.transcribe_bytes(audio_bytes)
 
+    def transcribe_stream(self, audio_path: Path) -> AsyncIterator[TranscriptSegment]:
+        """Transcribe an audio file, yielding segments in order as they finish."""
+        return self._backend.transcribe_stream(audio_path)
+
     async def shutdown(self) -> None:
         """Shut down the backend, waiting for in-flight work."""
         if hasattr(self._backend, "shutdown"):
             await self._backend.shutdown()
 
 
-def _detect_backend(model_id: str) -> TranscriptionBackend | None:
-    """Select backend: parakeet-mlx on macOS, sherpa-onnx on Linux (future)."""
+def _detect_backend(model_id: str | None) -> TranscriptionBackend | None:
+    """Select backend: parakeet-mlx on macOS, sherpa-onnx on Linux."""
     if sys.platform == "darwin":
         try:
             from parachute.core.transcription_mlx import ParakeetMLXBackend
 
-            return ParakeetMLXBackend(model_id=model_id)
+            return ParakeetMLXBackend(model_id=model_id or DEFAULT_MODEL_ID)
         except ImportError:
             logger.warning(
                 "parakeet-mlx not installed — transcription unavailable. "
                 "Install with: pip install parakeet-mlx"
             )
             return None
+    elif sys.platform.startswith("linux"):
+        try:
+            import sherpa_onnx  # noqa: F401 — loaded in worker processes
+            import numpy  # noqa: F401
+
+            from parachute.core.transcription_onnx import (
+                DEFAULT_ONNX_MODEL,
+                SherpaOnnxBackend,
+            )
+        except ImportError:
+            logger.warning(
+                "sherpa-onnx not installed — transcription unavailable. "
+                "Install with: pip install sherpa-onnx numpy"
+            )
+            return None
+        # MLX model IDs (HuggingFace repos) don't apply to the ONNX backend
+        if not model_id or "/" in model_id:
+            model_id = DEFAULT_ONNX_MODEL
+        return SherpaOnnxBackend(model_name=model_id)
     else:
-        # Future: sherpa-onnx backend for Linux
         logger.info(
             f"Transcription: no backend available for platform '{sys.platform}'. "
-            f"Server-side transcription requires macOS with parakeet-mlx."
+            f"Server-side transcription requires macOS (parakeet-mlx) or Linux (sherpa-onnx)."
         )
         return None
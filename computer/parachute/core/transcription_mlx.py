@@ -15,7 +15,9 @@ import os
 import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
+
+from parachute.core.transcription import TranscriptSegment
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,23 @@ class ParakeetMLXBackend:
             self._executor, self._transcribe_bytes_sync, audio_bytes
         )
 
+    async def transcribe_stream(self, audio_path: Path) -> AsyncIterator[TranscriptSegment]:
+        """Transcribe a file, yielding sentence segments.
+
+        parakeet-mlx returns the whole result at once (Metal makes even long
+        memos fast), so segments arrive together once inference finishes.
+        """
+        if self._model is None:
+            raise RuntimeError("TranscriptionService not initialized — call initialize() first")
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._executor, self._model.transcribe, str(audio_path)
+        )
+        for sentence in result.sentences:
+            yield TranscriptSegment(
+                start=sentence.start, end=sentence.end, text=sentence.text.strip()
+            )
+
     async def shutdown(self) -> None:
         """Shut down the executor, waiting for in-flight transcriptions."""
         self._executor.shutdown(wait=True, cancel_futures=False)
@@ -0,0 +1,341 @@
+"""
+Parakeet V3 transcription backend for Linux using sherpa-onnx (CPU).
+
+Runs the int8-quantized NeMo Parakeet TDT model through ONNX Runtime. The
+model and the Silero VAD are downloaded once into ~/.parachute/models/ and
+loaded by each worker process at pool start-up, so inference never runs on
+the event loop and never shares the GIL with the server.
+
+Long recordings are cut into fixed windows (decoded with FFmpeg), each window
+is split into speech segments by the VAD, and segments are decoded in batches.
+Windows from concurrent ``transcribe`` calls are batched together so a burst
+of voice memos shares the same forward passes.
+
+Requires: sherpa-onnx and numpy (installed by default on Linux)
+Requires: FFmpeg installed (apt install ffmpeg)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import subprocess
+import tarfile
+import tempfile
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from parachute.core.transcription import TranscriptSegment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONNX_MODEL = "sherpa-onnx-nemo-parakeet-tdt-0.6b-v3-int8"
+MODELS_DIR = Path.home() / ".parachute" / "models"
+_RELEASES_URL = "https://github.com/k2-fsa/sherpa-onnx/releases/download/asr-models"
+VAD_MODEL = "silero_vad.onnx"
+
+SAMPLE_RATE = 16000
+# Audio is decoded and segmented this many seconds at a time
+WINDOW_SECONDS = 300.0
+# Windows decoded per worker call, and how long to wait for a batch to fill
+MAX_BATCH = 8
+BATCH_WINDOW_SECONDS = 0.05
+# Speech segments per recognizer.decode_streams() call
+DECODE_BATCH = 32
+
+
+@dataclass(frozen=True)
+class AudioWindow:
+    """A slice of an audio file to decode (seconds)."""
+
+    path: str
+    start: float
+    duration: float
+
+
+# ── Worker process side ──────────────────────────────────────────────────────
+
+_worker: Optional[dict[str, Any]] = None
+
+
+def _init_worker(model_dir: str, vad_path: str, num_threads: int) -> None:
+    """Pool initializer: load the recognizer and VAD config once per process."""
+    global _worker
+    import sherpa_onnx
+
+    root = Path(model_dir)
+
+    def _find(prefix: str) -> str:
+        matches = sorted(root.glob(f"{prefix}*.onnx"))
+        if not matches:
+            raise FileNotFoundError(f"No {prefix}*.onnx in {root}")
+        return str(matches[0])
+
+    recognizer = sherpa_onnx.OfflineRecognizer.from_transducer(
+        encoder=_find("encoder"),
+        decoder=_find("decoder"),
+        joiner=_find("joiner"),
+        tokens=str(root / "tokens.txt"),
+        num_threads=num_threads,
+        model_type="nemo_transducer",
+        decoding_method="greedy_search",
+    )
+    vad_config = sherpa_onnx.VadModelConfig()
+    vad_config.silero_vad.model = vad_path
+    vad_config.silero_vad.min_silence_duration = 0.4
+    vad_config.silero_vad.max_speech_duration = 30.0
+    vad_config.sample_rate = SAMPLE_RATE
+    _worker = {"sherpa": sherpa_onnx, "recognizer": recognizer, "vad_config": vad_config}
+
+
+def _ping() -> bool:
+    """Warm-up call: forces every worker's initializer to run."""
+    return _worker is not None
+
+
+def _load_window(window: AudioWindow):
+    """Decode a window of any FFmpeg-readable file to 16 kHz mono float32."""
+    import numpy as np
+
+    proc = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-ss", f"{window.start:.3f}", "-t", f"{window.duration:.3f}",
+            "-i", window.path,
+            "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def _speech_segments(samples) -> list[tuple[int, Any]]:
+    """Split samples into (start_sample, samples) speech segments with the VAD."""
+    sherpa_onnx = _worker["sherpa"]
+    config = _worker["vad_config"]
+    vad = sherpa_onnx.VoiceActivityDetector(config, buffer_size_in_seconds=WINDOW_SECONDS + 30)
+    size = config.silero_vad.window_size
+    segments = []
+
+    def _drain() -> None:
+        while not vad.empty():
+            segments.append((vad.front.start, vad.front.samples))
+            vad.pop()
+
+    for i in range(0, len(samples), size):
+        vad.accept_waveform(samples[i:i + size])
+        _drain()
+    vad.flush()
+    _drain()
+    return segments
+
+
+def _decode_windows(windows: list[AudioWindow]) -> list[Optional[list[TranscriptSegment]]]:
+    """Transcribe a batch of windows; one forward pass over all their segments.
+
+    A window that starts past the end of the audio decodes to no samples
+    and gets None instead of a segment list.
+    """
+    recognizer = _worker["recognizer"]
+    streams = []
+    owners: list[tuple[int, float, float]] = []  # (window index, start, end)
+    empty: set[int] = set()
+
+    for idx, window in enumerate(windows):
+        samples = _load_window(window)
+        if not len(samples):
+            empty.add(idx)
+            continue
+        for start_sample, samples in _speech_segments(samples):
+            stream = recognizer.create_stream()
+            stream.accept_waveform(SAMPLE_RATE, samples)
+            streams.append(stream)
+            start = window.start + start_sample / SAMPLE_RATE
+            owners.append((idx, start, start + len(samples) / SAMPLE_RATE))
+
+    results: list[Optional[list[TranscriptSegment]]] = [
+        None if idx in empty else [] for idx in range(len(windows))
+    ]
+    for i in range(0, len(streams), DECODE_BATCH):
+        recognizer.decode_streams(streams[i:i + DECODE_BATCH])
+    for stream, (idx, start, end) in zip(streams, owners):
+        text = stream.result.text.strip()
+        if text:
+            results[idx].append(TranscriptSegment(start=start, end=end, text=text))
+    return results
+
+
+# ── Event loop side ──────────────────────────────────────────────────────────
+
+
+def _download_models(model_name: str) -> tuple[Path, Path]:
+    """Fetch the ASR model and VAD into MODELS_DIR if missing (blocking)."""
+    MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    model_dir = MODELS_DIR / model_name
+    if not (model_dir / "tokens.txt").exists():
+        url = f"{_RELEASES_URL}/{model_name}.tar.bz2"
+        logger.info(f"Downloading transcription model {model_name} (~650 MB)...")
+        with tempfile.TemporaryDirectory(dir=MODELS_DIR) as tmp:
+            archive = Path(tmp) / f"{model_name}.tar.bz2"
+            urllib.request.urlretrieve(url, archive)
+            with tarfile.open(archive) as tar:
+                # filter= needs Python 3.11.4+ (the declared minimum)
+                tar.extractall(tmp, filter="data")
+            os.replace(Path(tmp) / model_name, model_dir)
+
+    vad_path = MODELS_DIR / VAD_MODEL
+    if not vad_path.exists():
+        tmp_path = vad_path.with_suffix(".tmp")
+        urllib.request.urlretrieve(f"{_RELEASES_URL}/{VAD_MODEL}", tmp_path)
+        os.replace(tmp_path, vad_path)
+    return model_dir, vad_path
+
+
+def _probe_duration(path: Path) -> Optional[float]:
+    """Audio duration in seconds via ffprobe, or None if unknown (blocking).
+
+    Tries the container duration, then the audio stream's. MediaRecorder
+    webm/opus files often report "N/A" for both.
+    """
+    for select, entries in (([], "format=duration"), (["-select_streams", "a:0"], "stream=duration")):
+        proc = subprocess.run(
+            [
+                "ffprobe", "-v", "error", *select, "-show_entries", entries,
+                "-of", "default=noprint_wrappers=1:nokey=1", str(path),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        try:
+            return float(proc.stdout.split()[0])
+        except (ValueError, IndexError):
+            continue
+    return None
+
+
+class SherpaOnnxBackend:
+    """Parakeet V3 via sherpa-onnx on CPU, with a process pool and batching."""
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_ONNX_MODEL,
+        workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+    ):
+        self._model_name = model_name
+        self._workers = max(1, workers)
+        self._threads = threads_per_worker or max(1, (os.cpu_count() or 2) // self._workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: list[tuple[AudioWindow, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight = 0
+
+    async def initialize(self) -> None:
+        """Download (first run) and load the model in every worker process."""
+        model_dir, vad_path = await asyncio.to_thread(_download_models, self._model_name)
+        logger.info(
+            f"Loading transcription model '{self._model_name}' in "
+            f"{self._workers} worker(s) × {self._threads} threads..."
+        )
+        self._pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(model_dir), str(vad_path), self._threads),
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _ping) for _ in range(self._workers)
+        ))
+        logger.info(f"Transcription model loaded: {self._model_name}")
+
+    async def transcribe(self, audio_path: Path) -> str:
+        """Transcribe an audio file. Returns text."""
+        segments = [s async for s in self.transcribe_stream(audio_path)]
+        return " ".join(s.text for s in segments)
+
+    async def transcribe_bytes(self, audio_bytes: bytes) -> str:
+        """Transcribe from raw audio bytes via a temp file (FFmpeg needs a path)."""
+        fd, name = tempfile.mkstemp(suffix=".audio")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio_bytes)
+            return await self.transcribe(Path(name))
+        finally:
+            os.unlink(name)
+
+    async def transcribe_stream(self, audio_path: Path) -> AsyncIterator[TranscriptSegment]:
+        """Yield segments window by window, so long memos produce early results.
+
+        When the duration can't be probed, windows are decoded until FFmpeg
+        returns no more audio.
+        """
+        duration = await self._duration(audio_path)
+        count = max(1, int(-(-duration // WINDOW_SECONDS))) if duration is not None else None
+        index = 0
+        while count is None or index < count:
+            window = AudioWindow(str(audio_path), index * WINDOW_SECONDS, WINDOW_SECONDS)
+            segments = await self._submit(window)
+            if segments is None:  # past the end of the audio
+                break
+            for segment in segments:
+                yield segment
+            index += 1
+
+    async def shutdown(self) -> None:
+        """Shut down the worker pool, waiting for in-flight transcriptions."""
+        if self._pool is not None:
+            await asyncio.to_thread(self._pool.shutdown, wait=True, cancel_futures=False)
+            self._pool = None
+
+    # ── Batching ─────────────────────────────────────────────────────────────
+
+    async def _duration(self, audio_path: Path) -> Optional[float]:
+        return await asyncio.to_thread(_probe_duration, audio_path)
+
+    def _submit(self, window: AudioWindow) -> asyncio.Future:
+        """Queue a window for the next batch; resolves to its segments (None: no audio)."""
+        if self._pool is None:
+            raise RuntimeError("TranscriptionService not initialized — call initialize() first")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((window, future))
+        if len(self._pending) >= MAX_BATCH:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(BATCH_WINDOW_SECONDS, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send pending windows to free workers; the rest wait and keep batching."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending and self._inflight < self._workers:
+            batch, self._pending = self._pending[:MAX_BATCH], self._pending[MAX_BATCH:]
+            self._inflight += 1
+            task = asyncio.ensure_future(self._dispatch([w for w, _ in batch]))
+            task.add_done_callback(lambda t, b=batch: self._on_batch_done(t, b))
+
+    def _dispatch(self, windows: list[AudioWindow]) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._pool, _decode_windows, windows)
+
+    def _on_batch_done(self, task: asyncio.Future, batch: list) -> None:
+        self._inflight -= 1
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result()[i])
+        if self._pending:
+            self._flush()
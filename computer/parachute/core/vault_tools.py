@@ -958,3 +958,63 @@ VAULT_TOOLS = [
         },
     ),
 ]
+
+VAULT_TOOL_NAMES = frozenset(t.name for t in VAULT_TOOLS)
+
+
+# ── Dispatch ─────────────────────────────────────────────────────────────────
+
+
+async def call_vault_tool(graph: BrainService, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Run a vault tool by name with MCP-style arguments."""
+    if name == "search_memory":
+        return await search_memory(
+            graph,
+            query=arguments["query"],
+            source=arguments.get("source"),
+            date_from=arguments.get("date_from"),
+            date_to=arguments.get("date_to"),
+            limit=arguments.get("limit", 10),
+        )
+    if name == "search_chats":
+        return await search_chats(
+            graph,
+            query=arguments["query"],
+            limit=arguments.get("limit", 10),
+            module=arguments.get("module"),
+        )
+    if name == "list_chats":
+        return await list_chats(
+            graph,
+            module=arguments.get("module"),
+            limit=arguments.get("limit", 20),
+            archived=arguments.get("archived", False),
+            search=arguments.get("search"),
+        )
+    if name == "list_notes":
+        return await list_notes(
+            graph,
+            date_from=arguments.get("date_from"),
+            date_to=arguments.get("date_to"),
+            limit=arguments.get("limit", 20),
+            note_type=arguments.get("note_type"),
+            search=arguments.get("search"),
+        )
+    if name == "get_chat":
+        return await get_chat(
+            graph,
+            session_id=arguments["session_id"],
+            exchange_limit=arguments.get("exchange_limit", 25),
+            max_chars=arguments.get("max_chars", 2000),
+        )
+    if name == "get_exchange":
+        return await get_exchange(graph, exchange_id=arguments["exchange_id"])
+    if name == "write_note":
+        return await write_note(
+            graph,
+            note_type=arguments["note_type"],
+            title=arguments["title"],
+            content=arguments["content"],
+            date=arguments.get("date"),
+        )
+    return {"error": f"Unknown vault tool: {name}"}
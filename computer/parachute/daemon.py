@@ -24,6 +24,15 @@ SYSTEMD_UNIT = "parachute.service"
 SUPERVISOR_SYSTEMD_UNIT = "parachute-supervisor.service"
 
 
+def daemon_log_dir() -> Path:
+    """Directory the service manager writes daemon stdout/stderr logs to."""
+    if sys.platform == "darwin":
+        # ~/Library/Logs/ — launchd can't write to external volumes
+        return Path.home() / "Library" / "Logs" / "Parachute"
+    # XDG state dir — avoids issues with vault on network/external mounts
+    return Path.home() / ".local" / "state" / "parachute" / "logs"
+
+
 def _is_port_listening(port: int) -> bool:
     """Check if anything is listening on a port (regardless of bind address)."""
     try:
@@ -433,10 +442,7 @@ class PidDaemon(DaemonManager):
         pid_name = "supervisor.pid" if supervisor else "server.pid"
         self.pid_file = parachute_dir / pid_name
         # Use same location as systemd on Linux, macOS logs on macOS
-        if sys.platform == "darwin":
-            self.log_dir = Path.home() / "Library" / "Logs" / "Parachute"
-        else:
-            self.log_dir = Path.home() / ".local" / "state" / "parachute" / "logs"
+        self.log_dir = daemon_log_dir()
         marker_name = ".supervisor_daemon_installed" if supervisor else ".daemon_installed"
         self._installed_marker = parachute_dir / marker_name
 
@@ -23,6 +23,8 @@ from typing import Any
 
 import real_ladybug as lb
 
+from parachute.lib.metrics import get_metrics
+
 _CHECKPOINT_INTERVAL = 300  # seconds between periodic WAL checkpoints
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,14 @@ logger = logging.getLogger(__name__)
 # Internal LadybugDB fields stripped from all API responses
 _INTERNAL_FIELDS = {"_ID", "_LABEL", "_SRC", "_DST"}
 
+# Execution time only — waiting on write_lock happens in the caller
+_QUERY_SECONDS = get_metrics().histogram(
+    "parachute_brain_query_seconds", "Cypher query latency", ("method",)
+)
+_QUERY_ERRORS = get_metrics().counter(
+    "parachute_brain_query_errors_total", "Cypher queries that raised", ("method",)
+)
+
 
 def _clean_node(node: dict) -> dict:
     """Strip LadybugDB internal fields from a node dict."""
@@ -271,7 +281,12 @@ class BrainService:
         Internal use only — prefer execute_cypher() in module code.
         """
         self._ensure_connected()
-        return await self._conn.execute(query, params or None)
+        try:
+            with _QUERY_SECONDS.time(method="execute"):
+                return await self._conn.execute(query, params or None)
+        except Exception:
+            _QUERY_ERRORS.inc(method="execute")
+            raise
 
     async def execute_cypher(
         self,
@@ -284,14 +299,19 @@ class BrainService:
         Read path — does not acquire write_lock.
         """
         self._ensure_connected()
-        result = await self._conn.execute(query, params or None)
-        col_names = result.get_column_names()
-        rows: list[dict[str, Any]] = []
-        while result.has_next():
-            row = result.get_next()
-            if len(col_names) == 1 and isinstance(row[0], dict):
-                rows.append(_clean_node(row[0]))
-            else:
-                rows.append(dict(zip(col_names, row)))
+        try:
+            with _QUERY_SECONDS.time(method="execute_cypher"):
+                result = await self._conn.execute(query, params or None)
+                col_names = result.get_column_names()
+                rows: list[dict[str, Any]] = []
+                while result.has_next():
+                    row = result.get_next()
+                    if len(col_names) == 1 and isinstance(row[0], dict):
+                        rows.append(_clean_node(row[0]))
+                    else:
+                        rows.append(dict(zip(col_names, row)))
+        except Exception:
+            _QUERY_ERRORS.inc(method="execute_cypher")
+            raise
         return rows
 
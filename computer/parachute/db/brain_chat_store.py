@@ -14,9 +14,13 @@ Tags are graph-native: Tag nodes with TAGGED_WITH edges to any entity type.
 Context folders are stored as JSON arrays on the session node.
 """
 
+import hashlib
 import json
 import logging
 import re
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, TypedDict, Union
 
@@ -32,6 +36,15 @@ from parachute.models.session import (
 
 logger = logging.getLogger(__name__)
 
+# Session API field (serialization alias) -> Chat column, for projected lists.
+# vault_root is not stored; it is always None in list responses.
+_SESSION_FIELD_COLUMNS: dict[str, Optional[str]] = {
+    (f.serialization_alias or name): {
+        "id": "session_id", "metadata": "metadata_json", "vault_root": None,
+    }.get(name, name)
+    for name, f in Session.model_fields.items()
+}
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -275,6 +288,279 @@ TRIGGER_TEMPLATES: list[TriggerTemplateDict] = [
 ]
 
 
+# ── Core schema ───────────────────────────────────────────────────────────────
+# All node/rel tables are registered here so they exist at startup
+# regardless of which modules are loaded.  Modules are views (route
+# providers) — not data owners.
+
+
+@dataclass(frozen=True)
+class NodeTableDef:
+    """A node table definition for BrainService.ensure_node_table()."""
+
+    name: str
+    columns: dict[str, str]
+    primary_key: str
+
+
+CORE_NODE_TABLES: list[NodeTableDef] = [
+    NodeTableDef(
+        "Chat",
+        {
+            "session_id": "STRING",
+            "title": "STRING",
+            "module": "STRING",
+            "source": "STRING",
+            "working_directory": "STRING",
+            "model": "STRING",
+            "message_count": "INT64",
+            "archived": "BOOLEAN",
+            "created_at": "STRING",
+            "last_accessed": "STRING",
+            "continued_from": "STRING",
+            "agent_type": "STRING",
+            "trust_level": "STRING",
+            "mode": "STRING",
+            "linked_bot_platform": "STRING",
+            "linked_bot_chat_id": "STRING",
+            "linked_bot_chat_type": "STRING",
+            "parent_session_id": "STRING",
+            "created_by": "STRING",
+            "summary": "STRING",
+            "summary_updated_at": "STRING",
+            "bridge_session_id": "STRING",
+            "bridge_context_log": "STRING",
+            "container_id": "STRING",
+            "metadata_json": "STRING",
+            "tags_json": "STRING",
+            "contexts_json": "STRING",
+        },
+        primary_key="session_id",
+    ),
+    NodeTableDef(
+        "Container",
+        {
+            "slug": "STRING",
+            "display_name": "STRING",
+            "core_memory": "STRING",
+            "is_workspace": "BOOLEAN",
+            "credential_grants_json": "STRING",
+            "created_at": "STRING",
+        },
+        primary_key="slug",
+    ),
+    NodeTableDef(
+        "Parachute_PairingRequest",
+        {
+            "request_id": "STRING",
+            "platform": "STRING",
+            "platform_user_id": "STRING",
+            "platform_user_display": "STRING",
+            "platform_chat_id": "STRING",
+            "status": "STRING",
+            "approved_trust_level": "STRING",
+            "created_at": "STRING",
+            "resolved_at": "STRING",
+            "resolved_by": "STRING",
+        },
+        primary_key="request_id",
+    ),
+    NodeTableDef(
+        "Parachute_KV",
+        {
+            "key": "STRING",
+            "value": "STRING",
+            "updated_at": "STRING",
+        },
+        primary_key="key",
+    ),
+    NodeTableDef(
+        "Note",
+        {
+            "entry_id": "STRING",
+            "note_type": "STRING",
+            "date": "STRING",
+            "content": "STRING",
+            "snippet": "STRING",
+            "created_at": "STRING",
+            "title": "STRING",
+            "entry_type": "STRING",
+            "audio_path": "STRING",
+            "aliases": "STRING",
+            "status": "STRING",
+            "created_by": "STRING",
+            "metadata_json": "STRING",
+            "brain_links_json": "STRING",
+            "updated_at": "STRING",
+        },
+        primary_key="entry_id",
+    ),
+    NodeTableDef(
+        "Card",
+        {
+            "card_id": "STRING",
+            "agent_name": "STRING",
+            "card_type": "STRING",
+            "display_name": "STRING",
+            "content": "STRING",
+            "generated_at": "STRING",
+            "status": "STRING",
+            "date": "STRING",
+            "read_at": "STRING",
+        },
+        primary_key="card_id",
+    ),
+    NodeTableDef(
+        "Message",
+        {
+            "message_id": "STRING",
+            "session_id": "STRING",
+            "role": "STRING",           # "human" | "machine"
+            "content": "STRING",
+            "status": "STRING",         # "complete" | "interrupted" | "error" | "pending"
+            "sequence": "INT64",
+            "tools_used": "STRING",     # JSON: tool names + param keys (machine only)
+            "thinking": "STRING",       # thinking blocks (machine only, null for sandboxed)
+            "description": "STRING",    # search-optimized summary (set by enrichment)
+            "context": "STRING",        # session state snapshot (set by enrichment)
+            "created_at": "STRING",
+            "updated_at": "STRING",
+            "metadata_json": "STRING",
+        },
+        primary_key="message_id",
+    ),
+    # ── Tool / Trigger / ToolRun (universal primitive) ────────────────────
+    NodeTableDef(
+        "Tool",
+        {
+            "name": "STRING",            # PK: "read-days-notes", "process-day"
+            "display_name": "STRING",
+            "description": "STRING",
+            "mode": "STRING",            # "function" | "transform" | "agent" | "mcp"
+            "scope_keys": "STRING",      # JSON array: ["date"], ["entry_id"]
+            "input_schema": "STRING",    # JSON schema for parameters
+
+            # mode=query
+            "query": "STRING",           # Cypher template
+
+            # mode=transform
+            "transform_prompt": "STRING",
+            "transform_model": "STRING",
+            "write_query": "STRING",
+
+            # mode=agent
+            "system_prompt": "STRING",
+            "model": "STRING",
+            "memory_mode": "STRING",     # "persistent" | "fresh"
+            "trust_level": "STRING",     # "direct" | "sandboxed"
+            "container_slug": "STRING",
+
+            # mode=mcp
+            "server_name": "STRING",
+
+            # metadata
+            "builtin": "STRING",         # "true" | "false"
+            "enabled": "STRING",
+            "template_version": "STRING",
+            "user_modified": "STRING",
+            "created_at": "STRING",
+            "updated_at": "STRING",
+        },
+        primary_key="name",
+    ),
+    NodeTableDef(
+        "Trigger",
+        {
+            "name": "STRING",            # PK: "nightly-reflection"
+            "type": "STRING",            # "schedule" | "event"
+            "schedule_time": "STRING",   # "4:00"
+            "event": "STRING",           # "note.transcription_complete"
+            "event_filter": "STRING",    # JSON
+            "scope": "STRING",           # JSON: default scope
+            "enabled": "STRING",
+            "template_version": "STRING",
+            "user_modified": "STRING",
+            "created_at": "STRING",
+            "updated_at": "STRING",
+        },
+        primary_key="name",
+    ),
+    NodeTableDef(
+        "ToolRun",
+        {
+            "run_id": "STRING",
+            "tool_name": "STRING",
+            "display_name": "STRING",
+            "trigger_name": "STRING",    # or "manual"
+            "status": "STRING",
+            "started_at": "STRING",
+            "completed_at": "STRING",
+            "duration_seconds": "DOUBLE",
+            "session_id": "STRING",
+            "scope": "STRING",           # JSON
+            "card_id": "STRING",
+            "error": "STRING",
+            "container_slug": "STRING",
+            "date": "STRING",
+            "entry_id": "STRING",
+            "created_at": "STRING",
+        },
+        primary_key="run_id",
+    ),
+    # ── Brain entities (open ontology — created here so Tag edges work) ───
+    NodeTableDef(
+        "Brain_Entity",
+        {
+            "name": "STRING",
+            "entity_type": "STRING",
+            "description": "STRING",
+            "created_at": "STRING",
+            "updated_at": "STRING",
+        },
+        primary_key="name",
+    ),
+    # ── Tags ──────────────────────────────────────────────────────────────
+    NodeTableDef(
+        "Tag",
+        {
+            "name": "STRING",
+            "description": "STRING",
+            "created_at": "STRING",
+        },
+        primary_key="name",
+    ),
+]
+
+# (name, from_table, to_table); TAGGED_WITH is multi-source and built separately
+CORE_REL_TABLES: list[tuple[str, str, str]] = [
+    ("HAS_MESSAGE", "Chat", "Message"),
+    ("CAN_CALL", "Tool", "Tool"),
+    ("INVOKES", "Trigger", "Tool"),
+]
+
+SCHEMA_MANIFEST_KEY = "schema_manifest"
+SCHEMA_MIGRATION_KEY = "schema_migration_version"
+
+
+def schema_manifest() -> str:
+    """Hash of everything ensure_ready() would apply.
+
+    Covers table definitions, the migration list and built-in seed
+    templates, so editing any of them makes the next start take the full
+    path once.
+    """
+    payload = {
+        "node_tables": [[t.name, t.columns, t.primary_key] for t in CORE_NODE_TABLES],
+        "rel_tables": CORE_REL_TABLES,
+        "tag_sources": sorted(BrainChatStore.TAG_ENTITY_TYPES.items()),
+        "migrations": [[v, m.__name__] for v, m in BrainChatStore.MIGRATIONS],
+        "tools": TOOL_TEMPLATES,
+        "triggers": TRIGGER_TEMPLATES,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
 class BrainChatStore:
     """
     Kuzu-backed chat metadata store.
@@ -292,265 +578,91 @@ class BrainChatStore:
         "tool": ("Tool", "name"),
     }
 
+    # Bound on cached (platform, chat_id) -> session entries
+    BOT_LINK_CACHE_SIZE = 1024
+
     def __init__(self, graph: BrainService):
         self.graph = graph
+        # get_session_by_bot_link runs on every inbound bot message. Cache it
+        # (None = no active linked session) and keep it current write-through
+        # from the session/pairing writes below.
+        self._bot_link_cache: OrderedDict[tuple[str, str], Optional[Session]] = OrderedDict()
+        self.bot_link_cache_hits = 0
+        self.bot_link_cache_misses = 0
+        # Change counter for Chat nodes; drives session-list ETags. The epoch
+        # keeps ETags from a previous server process from ever matching.
+        self._sessions_epoch = uuid.uuid4().hex[:8]
+        self._sessions_version = 0
+
+    @property
+    def sessions_version(self) -> str:
+        """Opaque token that changes whenever any Chat node is written."""
+        return f"{self._sessions_epoch}.{self._sessions_version}"
+
+    def mark_sessions_changed(self) -> None:
+        """Bump the session change counter (also for Chat writes made elsewhere)."""
+        self._sessions_version += 1
 
     # ── Schema ────────────────────────────────────────────────────────────────
 
-    async def ensure_schema(self) -> None:
-        """Create node tables if they don't exist. Idempotent."""
-        await self.graph.ensure_node_table(
-            "Chat",
-            {
-                "session_id": "STRING",
-                "title": "STRING",
-                "module": "STRING",
-                "source": "STRING",
-                "working_directory": "STRING",
-                "model": "STRING",
-                "message_count": "INT64",
-                "archived": "BOOLEAN",
-                "created_at": "STRING",
-                "last_accessed": "STRING",
-                "continued_from": "STRING",
-                "agent_type": "STRING",
-                "trust_level": "STRING",
-                "mode": "STRING",
-                "linked_bot_platform": "STRING",
-                "linked_bot_chat_id": "STRING",
-                "linked_bot_chat_type": "STRING",
-                "parent_session_id": "STRING",
-                "created_by": "STRING",
-                "summary": "STRING",
-                "summary_updated_at": "STRING",
-                "bridge_session_id": "STRING",
-                "bridge_context_log": "STRING",
-                "container_id": "STRING",
-                "metadata_json": "STRING",
-                "tags_json": "STRING",
-                "contexts_json": "STRING",
-            },
-            primary_key="session_id",
-        )
-        await self.graph.ensure_node_table(
-            "Container",
-            {
-                "slug": "STRING",
-                "display_name": "STRING",
-                "core_memory": "STRING",
-                "is_workspace": "BOOLEAN",
-                "credential_grants_json": "STRING",
-                "created_at": "STRING",
-            },
-            primary_key="slug",
-        )
-        # Migrations for existing tables
-        async with self.graph.write_lock:
-            # Rename project_id → container_id (from the container rename PR #265)
-            chat_cols = await self.graph.get_table_columns("Chat")
-            if "project_id" in chat_cols and "container_id" not in chat_cols:
-                await self.graph.execute_cypher(
-                    "ALTER TABLE Chat RENAME project_id TO container_id"
-                )
-                logger.info("Renamed Chat.project_id → container_id")
+    async def ensure_ready(self, force: bool = False) -> bool:
+        """Bring schema, migrations and built-in seeds up to date.
 
-            # Add is_workspace column to Container table
-            container_cols = await self.graph.get_table_columns("Container")
-            if "is_workspace" not in container_cols:
-                await self.graph.execute_cypher(
-                    "ALTER TABLE Container ADD is_workspace BOOLEAN DEFAULT false"
-                )
-                logger.info("Added is_workspace column to Container table")
-        await self.graph.ensure_node_table(
-            "Parachute_PairingRequest",
-            {
-                "request_id": "STRING",
-                "platform": "STRING",
-                "platform_user_id": "STRING",
-                "platform_user_display": "STRING",
-                "platform_chat_id": "STRING",
-                "status": "STRING",
-                "approved_trust_level": "STRING",
-                "created_at": "STRING",
-                "resolved_at": "STRING",
-                "resolved_by": "STRING",
-            },
-            primary_key="request_id",
-        )
-        # ── Shared schema tables ─────────────────────────────────────────────
-        # All node/rel tables are registered here so they exist at startup
-        # regardless of which modules are loaded.  Modules are views (route
-        # providers) — not data owners.
-
-        await self.graph.ensure_node_table(
-            "Note",
-            {
-                "entry_id": "STRING",
-                "note_type": "STRING",
-                "date": "STRING",
-                "content": "STRING",
-                "snippet": "STRING",
-                "created_at": "STRING",
-                "title": "STRING",
-                "entry_type": "STRING",
-                "audio_path": "STRING",
-                "aliases": "STRING",
-                "status": "STRING",
-                "created_by": "STRING",
-                "metadata_json": "STRING",
-                "brain_links_json": "STRING",
-                "updated_at": "STRING",
-            },
-            primary_key="entry_id",
-        )
-        await self.graph.ensure_node_table(
-            "Card",
-            {
-                "card_id": "STRING",
-                "agent_name": "STRING",
-                "card_type": "STRING",
-                "display_name": "STRING",
-                "content": "STRING",
-                "generated_at": "STRING",
-                "status": "STRING",
-                "date": "STRING",
-                "read_at": "STRING",
-            },
-            primary_key="card_id",
-        )
-        await self.graph.ensure_node_table(
-            "Message",
-            {
-                "message_id": "STRING",
-                "session_id": "STRING",
-                "role": "STRING",           # "human" | "machine"
-                "content": "STRING",
-                "status": "STRING",         # "complete" | "interrupted" | "error" | "pending"
-                "sequence": "INT64",
-                "tools_used": "STRING",     # JSON: tool names + param keys (machine only)
-                "thinking": "STRING",       # thinking blocks (machine only, null for sandboxed)
-                "description": "STRING",    # search-optimized summary (set by enrichment)
-                "context": "STRING",        # session state snapshot (set by enrichment)
-                "created_at": "STRING",
-                "updated_at": "STRING",
-                "metadata_json": "STRING",
-            },
-            primary_key="message_id",
-        )
-        await self.graph.ensure_rel_table("HAS_MESSAGE", "Chat", "Message")
-
-        # ── Tool / Trigger / ToolRun (universal primitive) ────────────────────
-        await self.graph.ensure_node_table(
-            "Tool",
-            {
-                "name": "STRING",            # PK: "read-days-notes", "process-day"
-                "display_name": "STRING",
-                "description": "STRING",
-                "mode": "STRING",            # "function" | "transform" | "agent" | "mcp"
-                "scope_keys": "STRING",      # JSON array: ["date"], ["entry_id"]
-                "input_schema": "STRING",    # JSON schema for parameters
-
-                # mode=query
-                "query": "STRING",           # Cypher template
-
-                # mode=transform
-                "transform_prompt": "STRING",
-                "transform_model": "STRING",
-                "write_query": "STRING",
-
-                # mode=agent
-                "system_prompt": "STRING",
-                "model": "STRING",
-                "memory_mode": "STRING",     # "persistent" | "fresh"
-                "trust_level": "STRING",     # "direct" | "sandboxed"
-                "container_slug": "STRING",
-
-                # mode=mcp
-                "server_name": "STRING",
-
-                # metadata
-                "builtin": "STRING",         # "true" | "false"
-                "enabled": "STRING",
-                "template_version": "STRING",
-                "user_modified": "STRING",
-                "created_at": "STRING",
-                "updated_at": "STRING",
-            },
-            primary_key="name",
-        )
-        await self.graph.ensure_node_table(
-            "Trigger",
-            {
-                "name": "STRING",            # PK: "nightly-reflection"
-                "type": "STRING",            # "schedule" | "event"
-                "schedule_time": "STRING",   # "4:00"
-                "event": "STRING",           # "note.transcription_complete"
-                "event_filter": "STRING",    # JSON
-                "scope": "STRING",           # JSON: default scope
-                "enabled": "STRING",
-                "template_version": "STRING",
-                "user_modified": "STRING",
-                "created_at": "STRING",
-                "updated_at": "STRING",
-            },
-            primary_key="name",
-        )
-        await self.graph.ensure_node_table(
-            "ToolRun",
-            {
-                "run_id": "STRING",
-                "tool_name": "STRING",
-                "display_name": "STRING",
-                "trigger_name": "STRING",    # or "manual"
-                "status": "STRING",
-                "started_at": "STRING",
-                "completed_at": "STRING",
-                "duration_seconds": "DOUBLE",
-                "session_id": "STRING",
-                "scope": "STRING",           # JSON
-                "card_id": "STRING",
-                "error": "STRING",
-                "container_slug": "STRING",
-                "date": "STRING",
-                "entry_id": "STRING",
-                "created_at": "STRING",
-            },
-            primary_key="run_id",
-        )
-        # Relationships
-        await self.graph.ensure_rel_table("CAN_CALL", "Tool", "Tool")
-        await self.graph.ensure_rel_table("INVOKES", "Trigger", "Tool")
-
-        # ── Brain entities (open ontology — created here so Tag edges work) ───
-        await self.graph.ensure_node_table(
-            "Brain_Entity",
-            {
-                "name": "STRING",
-                "entity_type": "STRING",
-                "description": "STRING",
-                "created_at": "STRING",
-                "updated_at": "STRING",
-            },
-            primary_key="name",
-        )
+        Compares the stored schema manifest with schema_manifest() and skips
+        all DDL, introspection, migrations and seeding when they match — one
+        read instead of dozens of write-locked statements on every start.
 
-        # ── Tags ──────────────────────────────────────────────────────────────
-        await self.graph.ensure_node_table(
-            "Tag",
-            {
-                "name": "STRING",
-                "description": "STRING",
-                "created_at": "STRING",
-            },
-            primary_key="name",
-        )
-        await self._ensure_tagged_with_rel_table()
+        Returns True if the full path ran, False on the fast path.
+        """
+        manifest = schema_manifest()
+        meta = await self._read_kv()
+        if not force and meta.get(SCHEMA_MANIFEST_KEY) == manifest:
+            logger.info(f"BrainChatStore: schema current (manifest {manifest[:12]}), skipping checks")
+            return False
+
+        await self.ensure_schema(migration_version=meta.get(SCHEMA_MIGRATION_KEY))
+        # Order matters: tools must exist before triggers (INVOKES edges need Tool nodes)
+        await self.seed_builtin_tools()
+        await self.seed_builtin_triggers()
+
+        # Seeding logs and skips failures; leave the manifest stale so the
+        # next start retries rather than fast-pathing over missing built-ins.
+        if not await self._builtin_seeds_present():
+            logger.warning("BrainChatStore: some built-in seeds are missing; will retry next start")
+            return True
+        await self._write_kv(SCHEMA_MANIFEST_KEY, manifest)
+        logger.info(f"BrainChatStore: schema manifest updated to {manifest[:12]}")
+        return True
+
+    async def _builtin_seeds_present(self) -> bool:
+        """True if every built-in Tool and Trigger template has a node."""
+        for table, templates in (("Tool", TOOL_TEMPLATES), ("Trigger", TRIGGER_TEMPLATES)):
+            names = [tpl["name"] for tpl in templates]
+            rows = await self.graph.execute_cypher(
+                f"MATCH (t:{table}) WHERE t.name IN $names RETURN count(t) AS n",
+                {"names": names},
+            )
+            if not rows or rows[0].get("n", 0) < len(names):
+                return False
+        return True
 
-        # ── Column migrations ────────────────────────────────────────────────
-        await self._ensure_column_migrations()
+    async def ensure_schema(self, migration_version: Optional[str] = None) -> None:
+        """Create node tables if they don't exist and run pending migrations. Idempotent.
 
-        # ── Tag migration (JSON arrays → graph edges) ────────────────────────
-        await self._migrate_tags_to_graph()
+        ``migration_version`` is the stored version (read from Parachute_KV
+        when not given); migrations at or below it are skipped.
+        """
+        for table in CORE_NODE_TABLES:
+            await self.graph.ensure_node_table(
+                table.name, table.columns, primary_key=table.primary_key
+            )
+        for name, from_table, to_table in CORE_REL_TABLES:
+            await self.graph.ensure_rel_table(name, from_table, to_table)
+        await self._ensure_tagged_with_rel_table()
+
+        if migration_version is None:
+            migration_version = (await self._read_kv()).get(SCHEMA_MIGRATION_KEY)
+        await self._run_migrations(int(migration_version or 0))
 
         logger.info("BrainChatStore: schema ready")
 
@@ -693,6 +805,61 @@ class BrainChatStore:
                     )
                     logger.info(f"Schema migration: added Note.{col}")
 
+    async def _migrate_chat_container_id(self) -> None:
+        """Rename Chat.project_id → container_id (from the container rename PR #265)."""
+        async with self.graph.write_lock:
+            chat_cols = await self.graph.get_table_columns("Chat")
+            if "project_id" in chat_cols and "container_id" not in chat_cols:
+                await self.graph.execute_cypher(
+                    "ALTER TABLE Chat RENAME project_id TO container_id"
+                )
+                logger.info("Renamed Chat.project_id → container_id")
+
+    async def _migrate_container_is_workspace(self) -> None:
+        """Add is_workspace column to Container table."""
+        async with self.graph.write_lock:
+            container_cols = await self.graph.get_table_columns("Container")
+            if "is_workspace" not in container_cols:
+                await self.graph.execute_cypher(
+                    "ALTER TABLE Container ADD is_workspace BOOLEAN DEFAULT false"
+                )
+                logger.info("Added is_workspace column to Container table")
+
+    # Ordered, versioned migrations. Append only — never renumber or reorder;
+    # the stored version is the highest one that completed.
+    MIGRATIONS: tuple[tuple[int, Any], ...] = (
+        (1, _migrate_chat_container_id),
+        (2, _migrate_container_is_workspace),
+        (3, _ensure_column_migrations),
+        (4, _migrate_tags_to_graph),
+    )
+
+    async def _run_migrations(self, from_version: int) -> None:
+        """Run migrations newer than ``from_version``, recording each as it completes."""
+        for version, migration in self.MIGRATIONS:
+            if version <= from_version:
+                continue
+            await migration(self)
+            await self._write_kv(SCHEMA_MIGRATION_KEY, str(version))
+            logger.info(f"Schema migration {version} ({migration.__name__}) complete")
+
+    async def _read_kv(self) -> dict[str, str]:
+        """All Parachute_KV entries ({} if the table doesn't exist yet)."""
+        try:
+            rows = await self.graph.execute_cypher(
+                "MATCH (m:Parachute_KV) RETURN m.key AS key, m.value AS value"
+            )
+        except Exception as e:
+            logger.debug(f"Parachute_KV unavailable: {e}")
+            return {}
+        return {row["key"]: row.get("value") or "" for row in rows}
+
+    async def _write_kv(self, key: str, value: str) -> None:
+        async with self.graph.write_lock:
+            await self.graph.execute_cypher(
+                "MERGE (m:Parachute_KV {key: $key}) SET m.value = $value, m.updated_at = $now",
+                {"key": key, "value": value, "now": _now()},
+            )
 
     # ── Message writes ─────────────────────────────────────────────────────
 
@@ -801,6 +968,8 @@ class BrainChatStore:
                     )
                 except Exception as e:
                     logger.debug(f"HAS_MESSAGE edge skipped for {mid}: {e}")
+        if session_meta:
+            self.mark_sessions_changed()
 
         logger.debug(
             f"Wrote messages {human_id}, {machine_id} "
@@ -1116,10 +1285,40 @@ class BrainChatStore:
 
     # ── Session CRUD ──────────────────────────────────────────────────────────
 
-    async def create_session(
-        self, session: Union[Session, SessionCreate]
-    ) -> Session:
-        """Create a new session."""
+    _CREATE_CHAT_QUERY = """
+        CREATE (:Chat {
+            session_id: $session_id,
+            title: $title,
+            module: $module,
+            source: $source,
+            working_directory: $working_directory,
+            model: $model,
+            message_count: $message_count,
+            archived: $archived,
+            created_at: $created_at,
+            last_accessed: $last_accessed,
+            continued_from: $continued_from,
+            agent_type: $agent_type,
+            trust_level: $trust_level,
+            mode: $mode,
+            linked_bot_platform: $linked_bot_platform,
+            linked_bot_chat_id: $linked_bot_chat_id,
+            linked_bot_chat_type: $linked_bot_chat_type,
+            parent_session_id: $parent_session_id,
+            created_by: $created_by,
+            summary: $summary,
+            bridge_session_id: $bridge_session_id,
+            bridge_context_log: $bridge_context_log,
+            container_id: $container_id,
+            metadata_json: $metadata_json,
+            tags_json: $tags_json,
+            contexts_json: $contexts_json
+        })
+        """
+
+    @staticmethod
+    def _session_create_params(session: Union[Session, SessionCreate]) -> dict[str, Any]:
+        """Build CREATE parameters for a Chat node from a session model."""
         now = _now()
 
         if isinstance(session, Session):
@@ -1137,7 +1336,7 @@ class BrainChatStore:
             json.dumps(session.metadata) if session.metadata else None
         )
 
-        params = {
+        return {
             "session_id": session.id,
             "title": session.title,
             "module": session.module,
@@ -1166,46 +1365,60 @@ class BrainChatStore:
             "contexts_json": "[]",
         }
 
+    async def create_session(
+        self, session: Union[Session, SessionCreate]
+    ) -> Session:
+        """Create a new session."""
+        params = self._session_create_params(session)
+
         async with self.graph.write_lock:
-            await self.graph._execute(
-                """
-                CREATE (:Chat {
-                    session_id: $session_id,
-                    title: $title,
-                    module: $module,
-                    source: $source,
-                    working_directory: $working_directory,
-                    model: $model,
-                    message_count: $message_count,
-                    archived: $archived,
-                    created_at: $created_at,
-                    last_accessed: $last_accessed,
-                    continued_from: $continued_from,
-                    agent_type: $agent_type,
-                    trust_level: $trust_level,
-                    mode: $mode,
-                    linked_bot_platform: $linked_bot_platform,
-                    linked_bot_chat_id: $linked_bot_chat_id,
-                    linked_bot_chat_type: $linked_bot_chat_type,
-                    parent_session_id: $parent_session_id,
-                    created_by: $created_by,
-                    summary: $summary,
-                    bridge_session_id: $bridge_session_id,
-                    bridge_context_log: $bridge_context_log,
-                    container_id: $container_id,
-                    metadata_json: $metadata_json,
-                    tags_json: $tags_json,
-                    contexts_json: $contexts_json
-                })
-                """,
-                params,
-            )
+            await self.graph._execute(self._CREATE_CHAT_QUERY, params)
+        self.mark_sessions_changed()
 
         result = await self.get_session(session.id)
         if result is None:
             raise RuntimeError(f"Failed to create session {session.id}")
+        self._bot_link_written(result)
         return result
 
+    async def create_sessions(
+        self, sessions: list[Union[Session, SessionCreate]]
+    ) -> tuple[list[str], dict[str, str]]:
+        """Create many sessions under a single write-lock acquisition.
+
+        Used by bulk import. Sessions whose ID already exists are skipped
+        (so a resumed import is idempotent) and no per-session read-back is
+        done. Returns (created_ids, {session_id: error}) — one bad row does
+        not abort the rest of the batch.
+        """
+        if not sessions:
+            return [], {}
+
+        rows = await self.graph.execute_cypher(
+            "MATCH (s:Chat) WHERE s.session_id IN $ids RETURN s.session_id AS id",
+            {"ids": [s.id for s in sessions]},
+        )
+        existing = {r["id"] for r in rows}
+
+        created: list[str] = []
+        errors: dict[str, str] = {}
+        async with self.graph.write_lock:
+            for session in sessions:
+                if session.id in existing:
+                    continue
+                try:
+                    await self.graph._execute(
+                        self._CREATE_CHAT_QUERY, self._session_create_params(session)
+                    )
+                    created.append(session.id)
+                except Exception as e:
+                    errors[session.id] = str(e)
+        if created:
+            self.mark_sessions_changed()
+        for session in sessions:
+            self._forget_bot_link(self._bot_link_key(session))
+        return created, errors
+
     async def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
         rows = await self.graph.execute_cypher(
@@ -1287,8 +1500,14 @@ class BrainChatStore:
                 f"SET {', '.join(set_parts)}",
                 params,
             )
+        self.mark_sessions_changed()
 
-        return await self.get_session(session_id)
+        result = await self.get_session(session_id)
+        if result is None:
+            self._forget_bot_link_session(session_id)
+        else:
+            self._bot_link_written(result)
+        return result
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
@@ -1300,6 +1519,8 @@ class BrainChatStore:
                 "MATCH (s:Chat {session_id: $session_id}) DETACH DELETE s",
                 {"session_id": session_id},
             )
+        self.mark_sessions_changed()
+        self._forget_bot_link(self._bot_link_key(existing))
         return True
 
     async def list_sessions(
@@ -1339,16 +1560,120 @@ class BrainChatStore:
         limit = max(1, min(int(limit), 10000))
         offset = max(0, int(offset))
         where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
-        skip_clause = f" SKIP {offset}" if offset > 0 else ""
+        skip_clause = f"SKIP {offset} " if offset > 0 else ""
         query = (
             f"MATCH (s:Chat) {where_clause} "
             f"RETURN s ORDER BY s.last_accessed DESC "
-            f"LIMIT {limit}{skip_clause}"
+            f"{skip_clause}LIMIT {limit}"
         )
 
         rows = await self.graph.execute_cypher(query, params or None)
         return [self._node_to_session(r) for r in rows]
 
+    async def list_session_page(
+        self,
+        module: Optional[str] = None,
+        archived: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        after: Optional[tuple[str, str]] = None,
+        offset: int = 0,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[tuple[str, str]]]:
+        """One page of sessions as API dicts, newest first.
+
+        Keyset-paginated on (last_accessed, session_id): pass the returned
+        cursor as ``after`` to get the next page (None = no more rows).
+        ``offset`` is only honoured without a cursor (legacy callers).
+
+        ``fields`` projects to the named Session fields (API aliases such as
+        "lastAccessed"); only those columns are read and no Session model is
+        built. Raises ValueError for unknown field names.
+        """
+        if fields is not None:
+            unknown = [f for f in fields if f not in _SESSION_FIELD_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown session fields: {', '.join(unknown)}")
+
+        where_parts: list[str] = []
+        params: dict[str, Any] = {}
+        if module is not None:
+            where_parts.append("s.module = $module")
+            params["module"] = module
+        if archived is not None:
+            where_parts.append("s.archived = $archived")
+            params["archived"] = archived
+        if search is not None:
+            where_parts.append("s.title CONTAINS $search")
+            params["search"] = search
+        # Lazily-created Chat nodes may lack last_accessed; sort those by created_at
+        sort_ts = "coalesce(s.last_accessed, s.created_at, '')"
+        if after is not None:
+            where_parts.append(
+                f"({sort_ts} < $after_ts OR "
+                f"({sort_ts} = $after_ts AND s.session_id < $after_id))"
+            )
+            params["after_ts"], params["after_id"] = after
+
+        if fields is None:
+            returns = "s"
+        else:
+            # Cursor columns are always read, even when not projected
+            columns = {"session_id", "last_accessed", "created_at"}
+            columns.update(c for f in fields if (c := _SESSION_FIELD_COLUMNS[f]))
+            returns = ", ".join(f"s.{c} AS {c}" for c in sorted(columns))
+
+        limit = max(1, min(int(limit), 10000))
+        where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+        skip_clause = f"SKIP {max(0, int(offset))} " if after is None and offset > 0 else ""
+        rows = await self.graph.execute_cypher(
+            f"MATCH (s:Chat) {where_clause} "
+            f"RETURN {returns} ORDER BY {sort_ts} DESC, s.session_id DESC "
+            f"{skip_clause}LIMIT {limit + 1}",
+            params or None,
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = (last.get("last_accessed") or last.get("created_at") or "", last["session_id"])
+
+        if fields is None:
+            return [self._node_to_session(r).model_dump(by_alias=True) for r in rows], next_cursor
+        return [self._project_session_row(r, fields) for r in rows], next_cursor
+
+    @staticmethod
+    def _project_session_row(row: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+        """Build the requested Session fields from raw columns (as _node_to_session would)."""
+        out: dict[str, Any] = {}
+        for field in fields:
+            column = _SESSION_FIELD_COLUMNS[field]
+            value = row.get(column) if column else None
+            if column == "source":
+                try:
+                    value = SessionSource(value).value
+                except ValueError:
+                    value = SessionSource.PARACHUTE.value
+            elif column in ("created_at", "last_accessed"):
+                value = value or row.get("created_at") or _now()
+                value = datetime.fromisoformat(value)
+            elif column == "metadata_json":
+                try:
+                    value = json.loads(value) if value else None
+                except (json.JSONDecodeError, TypeError):
+                    value = None
+            elif column == "archived":
+                value = bool(value)
+            elif column == "message_count":
+                value = value or 0
+            elif column == "created_by":
+                value = value or "user"
+            elif column == "module":
+                value = value if value is not None else "chat"
+            out[field] = value
+        return out
+
     async def archive_session(self, session_id: str) -> Optional[Session]:
         """Archive a session."""
         return await self.update_session(session_id, SessionUpdate(archived=True))
@@ -1360,11 +1685,14 @@ class BrainChatStore:
     async def touch_session(self, session_id: str) -> None:
         """Update last_accessed timestamp."""
         async with self.graph.write_lock:
-            await self.graph._execute(
+            rows = await self.graph.execute_cypher(
                 "MATCH (s:Chat {session_id: $session_id}) "
-                "SET s.last_accessed = $last_accessed",
+                "SET s.last_accessed = $last_accessed RETURN s",
                 {"session_id": session_id, "last_accessed": _now()},
             )
+        self.mark_sessions_changed()
+        if rows:
+            self._bot_link_written(self._node_to_session(rows[0]))
 
     async def increment_message_count(
         self, session_id: str, increment: int = 1
@@ -1380,15 +1708,19 @@ class BrainChatStore:
                 return
             current = rows[0].get("s.message_count", 0) or 0
             new_count = current + increment
-            await self.graph._execute(
+            rows = await self.graph.execute_cypher(
                 "MATCH (s:Chat {session_id: $session_id}) "
-                "SET s.message_count = $count, s.last_accessed = $last_accessed",
+                "SET s.message_count = $count, s.last_accessed = $last_accessed "
+                "RETURN s",
                 {
                     "session_id": session_id,
                     "count": new_count,
                     "last_accessed": _now(),
                 },
             )
+        self.mark_sessions_changed()
+        if rows:
+            self._bot_link_written(self._node_to_session(rows[0]))
 
     async def get_session_count(
         self,
@@ -1435,11 +1767,16 @@ class BrainChatStore:
             params["message_count"] = message_count
         if set_parts:
             async with self.graph.write_lock:
-                await self.graph._execute(
+                rows = await self.graph.execute_cypher(
                     f"MATCH (s:Chat {{session_id: $session_id}}) "
-                    f"SET {', '.join(set_parts)}",
+                    f"SET {', '.join(set_parts)} RETURN s",
                     params,
                 )
+            self.mark_sessions_changed()
+            # last_accessed may now be older than another linked session's
+            self._forget_bot_link_session(session_id)
+            if rows:
+                self._forget_bot_link(self._bot_link_key(self._node_to_session(rows[0])))
 
     async def update_session_config(self, session_id: str, **kwargs: Any) -> None:
         """Update session config fields (trust_level, module, etc.)."""
@@ -1454,11 +1791,14 @@ class BrainChatStore:
             set_parts.append("s.last_accessed = $last_accessed")
             params["last_accessed"] = _now()
             async with self.graph.write_lock:
-                await self.graph._execute(
+                rows = await self.graph.execute_cypher(
                     f"MATCH (s:Chat {{session_id: $session_id}}) "
-                    f"SET {', '.join(set_parts)}",
+                    f"SET {', '.join(set_parts)} RETURN s",
                     params,
                 )
+            self.mark_sessions_changed()
+            if rows:
+                self._bot_link_written(self._node_to_session(rows[0]))
 
     # ── Tags (graph-native) ─────────────────────────────────────────────────
 
@@ -1712,7 +2052,19 @@ class BrainChatStore:
     async def get_session_by_bot_link(
         self, platform: str, chat_id: str
     ) -> Optional[Session]:
-        """Get the most recent active session linked to a bot chat."""
+        """Get the most recent active session linked to a bot chat.
+
+        Served from the bot-link cache when possible; returns a copy so
+        callers can't mutate the cached entry.
+        """
+        key = (platform, str(chat_id))
+        if key in self._bot_link_cache:
+            self._bot_link_cache.move_to_end(key)
+            self.bot_link_cache_hits += 1
+            cached = self._bot_link_cache[key]
+            return cached.model_copy(deep=True) if cached else None
+
+        self.bot_link_cache_misses += 1
         rows = await self.graph.execute_cypher(
             "MATCH (s:Chat) "
             "WHERE s.linked_bot_platform = $platform "
@@ -1721,9 +2073,50 @@ class BrainChatStore:
             "RETURN s ORDER BY s.last_accessed DESC LIMIT 1",
             {"platform": platform, "chat_id": chat_id},
         )
-        if rows:
-            return self._node_to_session(rows[0])
-        return None
+        session = self._node_to_session(rows[0]) if rows else None
+        self._remember_bot_link(key, session)
+        return session.model_copy(deep=True) if session else None
+
+    @staticmethod
+    def _bot_link_key(session: Union[Session, SessionCreate, None]) -> Optional[tuple[str, str]]:
+        platform = getattr(session, "linked_bot_platform", None)
+        chat_id = getattr(session, "linked_bot_chat_id", None)
+        if not platform or not chat_id:
+            return None
+        return (platform, str(chat_id))
+
+    def _remember_bot_link(self, key: tuple[str, str], session: Optional[Session]) -> None:
+        self._bot_link_cache[key] = session
+        self._bot_link_cache.move_to_end(key)
+        while len(self._bot_link_cache) > self.BOT_LINK_CACHE_SIZE:
+            self._bot_link_cache.popitem(last=False)
+
+    def clear_bot_link_cache(self) -> None:
+        """Drop every cached bot link (after Chat writes the cache can't follow)."""
+        self._bot_link_cache.clear()
+
+    def _forget_bot_link(self, key: Optional[tuple[str, str]]) -> None:
+        if key is not None:
+            self._bot_link_cache.pop(key, None)
+
+    def _forget_bot_link_session(self, session_id: str) -> None:
+        for key, cached in list(self._bot_link_cache.items()):
+            if cached is not None and cached.id == session_id:
+                del self._bot_link_cache[key]
+
+    def _bot_link_written(self, session: Session) -> None:
+        """Write-through after a session create/update.
+
+        A write bumps last_accessed, so an active linked session becomes the
+        chat's most recent one; an archived one drops out of the lookup.
+        """
+        key = self._bot_link_key(session)
+        if key is None:
+            self._forget_bot_link_session(session.id)
+        elif session.archived:
+            self._forget_bot_link(key)
+        else:
+            self._remember_bot_link(key, session.model_copy(deep=True))
 
     # ── Multi-Agent Helpers ───────────────────────────────────────────────────
 
@@ -1867,7 +2260,11 @@ class BrainChatStore:
                     "resolved_by": resolved_by,
                 },
             )
-        return await self.get_pairing_request(request_id)
+        request = await self.get_pairing_request(request_id)
+        if request is not None:
+            # Approval/denial changes the linked session right after; drop it
+            self._forget_bot_link((request.platform, str(request.platform_chat_id)))
+        return request
 
     async def get_expired_pairing_requests(
         self, ttl_days: int = 7
@@ -1977,6 +2374,8 @@ class BrainChatStore:
                 "SET s.container_id = null",
                 {"slug": slug},
             )
+            self.mark_sessions_changed()
+            self.clear_bot_link_cache()
             result = await self.graph.execute_cypher(
                 "MATCH (c:Container {slug: $slug}) RETURN count(c) AS cnt",
                 {"slug": slug},
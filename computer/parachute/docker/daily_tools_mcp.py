@@ -10,6 +10,8 @@ graph access.
 Environment variables:
     PARACHUTE_CALLER_NAME   - Agent name (e.g. "reflection")
     PARACHUTE_HOST_URL      - Host server URL (default: http://host.docker.internal:3333)
+    PARACHUTE_HOST_SOCKET   - Optional unix socket for the host server (used instead
+                              of PARACHUTE_HOST_URL when it exists in the container)
 
 Usage (by the Claude SDK inside the container):
     Configured as an MCP server in the capabilities JSON:
@@ -23,9 +25,13 @@ Usage (by the Claude SDK inside the container):
     }
 """
 
+import http.client
 import json
 import os
+import socket
 import sys
+import time
+import urllib.parse
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -34,6 +40,7 @@ JSONRPC_VERSION = "2.0"
 
 AGENT_NAME = os.environ.get("PARACHUTE_CALLER_NAME", "unknown")
 HOST_URL = os.environ.get("PARACHUTE_HOST_URL", "http://host.docker.internal:3333")
+HOST_SOCKET = os.environ.get("PARACHUTE_HOST_SOCKET", "")
 
 # Tools provided by this MCP server
 TOOLS = [
@@ -109,45 +116,145 @@ TOOLS = [
             "required": ["date", "content"],
         },
     },
+    {
+        "name": "debug_http_stats",
+        "description": "Debugging: per-endpoint latency histograms for calls to the host server.",
+        "inputSchema": {"type": "object", "properties": {}},
+    },
 ]
 
 
-def _http_get(path: str, params: dict | None = None) -> dict | str:
-    """Make an HTTP GET request to the host server using urllib (no deps)."""
-    import urllib.request
-    import urllib.parse
-    import urllib.error
-
-    url = f"{HOST_URL}{path}"
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-    try:
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        return {"error": f"HTTP {e.code}: {e.reason}"}
-    except Exception as e:
-        return {"error": str(e)}
+# ── Host HTTP connection ───────────────────────────────────────────────────
+#
+# One keep-alive connection to the host for the life of the process, instead
+# of a fresh urllib connection per tool call. Reconnects when the host closes
+# it; a request is only resent if it never reached the host, or if it is
+# idempotent — write_card must not run twice. Latencies are recorded per
+# endpoint for debug_http_stats.
 
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+
+_conn: http.client.HTTPConnection | None = None
+_latency: dict[str, dict] = {}
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+def _connection() -> http.client.HTTPConnection:
+    global _conn
+    if _conn is None:
+        if HOST_SOCKET and os.path.exists(HOST_SOCKET):
+            _conn = _UnixHTTPConnection(HOST_SOCKET, timeout=30)
+        else:
+            url = urllib.parse.urlsplit(HOST_URL)
+            if url.scheme == "https":
+                _conn = http.client.HTTPSConnection(url.hostname, url.port or 443, timeout=30)
+            else:
+                _conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+    return _conn
 
-def _http_post(path: str, body: dict) -> dict:
-    """Make an HTTP POST request to the host server using urllib (no deps)."""
-    import urllib.request
-    import urllib.error
 
-    url = f"{HOST_URL}{path}"
-    data = json.dumps(body).encode()
+def _reset_connection() -> None:
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _record_latency(endpoint: str, ms: float, error: bool) -> None:
+    stats = _latency.setdefault(endpoint, {
+        "count": 0, "errors": 0, "sum_ms": 0.0, "max_ms": 0.0,
+        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+    })
+    idx = next((i for i, b in enumerate(LATENCY_BUCKETS_MS) if ms <= b), len(LATENCY_BUCKETS_MS))
+    stats["buckets"][idx] += 1
+    stats["count"] += 1
+    stats["sum_ms"] += ms
+    stats["max_ms"] = max(stats["max_ms"], ms)
+    if error:
+        stats["errors"] += 1
+
+
+def _http_request(method: str, path: str, query: dict | None = None, body: dict | None = None) -> dict:
+    """Send a request on the shared connection; returns JSON or an error dict."""
+    target = path + ("?" + urllib.parse.urlencode(query) if query else "")
+    data = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"} if data is not None else {}
+    started = time.perf_counter()
+    error = True
     try:
-        req = urllib.request.Request(url, data=data, method="POST")
-        req.add_header("Content-Type", "application/json")
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        body_text = e.read().decode() if e.fp else ""
-        return {"error": f"HTTP {e.code}: {body_text or e.reason}"}
+        # A kept-alive connection may have been closed by the host; retry once fresh
+        for attempt in range(2):
+            conn = _connection()
+            try:
+                conn.request(method, target, body=data, headers=headers)
+            except (http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError):
+                # The request was not (fully) written, so the host never ran it
+                _reset_connection()
+                if attempt:
+                    raise
+                continue
+            try:
+                resp = conn.getresponse()
+                payload = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                # Sent but unanswered — the host may have run it already
+                _reset_connection()
+                if attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+        if resp.status >= 400:
+            text = payload.decode(errors="replace")
+            return {"error": f"HTTP {resp.status}: {text or resp.reason}"}
+        error = False
+        return json.loads(payload.decode())
     except Exception as e:
+        _reset_connection()
         return {"error": str(e)}
+    finally:
+        _record_latency(f"{method} {path}", (time.perf_counter() - started) * 1000, error)
+
+
+def _http_get(path: str, params: dict | None = None) -> dict | str:
+    """Make an HTTP GET request to the host server (stdlib only)."""
+    return _http_request("GET", path, query=params)
+
+
+def _http_post(path: str, body: dict) -> dict:
+    """Make an HTTP POST request to the host server (stdlib only)."""
+    return _http_request("POST", path, body=body)
+
+
+def handle_debug_http_stats(args: dict) -> list[dict]:
+    """Report per-endpoint latency histograms for calls to the host."""
+    labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+    report = {
+        "transport": "uds" if isinstance(_conn, _UnixHTTPConnection) else "tcp",
+        "endpoints": {
+            endpoint: {
+                "count": s["count"],
+                "errors": s["errors"],
+                "mean_ms": round(s["sum_ms"] / s["count"], 2),
+                "max_ms": round(s["max_ms"], 2),
+                "buckets": {label: n for label, n in zip(labels, s["buckets"]) if n},
+            }
+            for endpoint, s in sorted(_latency.items())
+        },
+    }
+    return [{"type": "text", "text": json.dumps(report, indent=2)}]
 
 
 def handle_read_journal(args: dict) -> list[dict]:
@@ -274,6 +381,7 @@ TOOL_HANDLERS = {
     "read_recent_journals": handle_read_recent_journals,
     "read_recent_sessions": handle_read_recent_sessions,
     "write_card": handle_write_card,
+    "debug_http_stats": handle_debug_http_stats,
 }
 
 
@@ -0,0 +1,235 @@
+"""
+Directory listing for the filesystem browser.
+
+Built for slow mounts (FUSE, OrbStack, network shares) where every
+syscall is expensive:
+
+- A directory's sorted child names and kinds are cached and reused while
+  its mtime is unchanged, so a repeat listing skips os.scandir.
+- Only the requested page is stat'ed — one lstat per entry (plus a
+  target stat for symlinks) instead of is_symlink/resolve/stat/is_dir/
+  is_file on a Path.
+- AGENTS.md / CLAUDE.md / .git markers on child directories are optional.
+  When requested they are cached per child and keyed by that child's
+  mtime, which the page stat already returns.
+
+All methods block; call them via asyncio.to_thread.
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+MAX_CACHED_LISTINGS = 128
+MAX_CACHED_MARKERS = 8192
+
+# Changed within this window → the same mtime tick could hide a further change
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class _Child:
+    name: str
+    is_symlink: bool
+
+
+@dataclass(frozen=True)
+class _Listing:
+    mtime_ns: int
+    trusted: bool
+    children: tuple[_Child, ...]
+
+
+@dataclass(frozen=True)
+class _Markers:
+    mtime_ns: int
+    trusted: bool
+    has_agents_md: bool
+    has_claude_md: bool
+    is_git_repo: bool
+
+
+def _trusted(mtime_ns: int) -> bool:
+    return mtime_ns < time.time_ns() - RACY_WINDOW_NS
+
+
+@dataclass(frozen=True)
+class DirectoryPage:
+    """One page of a directory listing."""
+
+    entries: list[dict[str, Any]]
+    total: int
+    offset: int
+    next_offset: Optional[int]
+
+
+class DirectoryLister:
+    """Lists directories with cached names and optional cached child markers."""
+
+    def __init__(
+        self,
+        max_listings: int = MAX_CACHED_LISTINGS,
+        max_markers: int = MAX_CACHED_MARKERS,
+    ):
+        self._listings: OrderedDict[str, _Listing] = OrderedDict()
+        self._markers: OrderedDict[str, _Markers] = OrderedDict()
+        self._max_listings = max_listings
+        self._max_markers = max_markers
+        self._lock = threading.Lock()
+        self.scans = 0  # os.scandir calls, for diagnostics and tests
+
+    def list(
+        self,
+        directory: str,
+        home: str,
+        include_hidden: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        markers: bool = True,
+    ) -> DirectoryPage:
+        """List `directory`, returning entries in the /api/ls shape.
+
+        Raises FileNotFoundError, NotADirectoryError or PermissionError.
+        """
+        st = os.stat(directory)
+        if not stat.S_ISDIR(st.st_mode):
+            raise NotADirectoryError(directory)
+
+        children = self._children(directory, st.st_mtime_ns)
+        if not include_hidden:
+            children = tuple(c for c in children if not c.name.startswith("."))
+
+        end = len(children) if limit is None else offset + limit
+        entries = []
+        for child in children[offset:end]:
+            entry = self._entry(directory, home, child, markers)
+            if entry is not None:
+                entries.append(entry)
+        return DirectoryPage(
+            entries=entries,
+            total=len(children),
+            offset=offset,
+            next_offset=end if end < len(children) else None,
+        )
+
+    def invalidate(self, directory: Optional[str] = None) -> None:
+        """Drop cached data for one directory (or everything)."""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+                self._markers.clear()
+            else:
+                self._listings.pop(directory, None)
+                self._markers.pop(directory, None)
+
+    def _children(self, directory: str, mtime_ns: int) -> tuple[_Child, ...]:
+        with self._lock:
+            cached = self._listings.get(directory)
+            if cached is not None and cached.trusted and cached.mtime_ns == mtime_ns:
+                self._listings.move_to_end(directory)
+                return cached.children
+
+        self.scans += 1
+        with os.scandir(directory) as it:
+            children = tuple(sorted(
+                (_Child(entry.name, entry.is_symlink()) for entry in it),
+                key=lambda c: c.name,
+            ))
+
+        with self._lock:
+            self._listings[directory] = _Listing(mtime_ns, _trusted(mtime_ns), children)
+            self._listings.move_to_end(directory)
+            while len(self._listings) > self._max_listings:
+                self._listings.popitem(last=False)
+        return children
+
+    def _entry(
+        self, directory: str, home: str, child: _Child, markers: bool
+    ) -> Optional[dict[str, Any]]:
+        path = os.path.join(directory, child.name)
+        try:
+            # lstat describes the link itself for symlinks (may be broken)
+            st = os.lstat(path)
+        except OSError:
+            return None  # vanished or unreadable since listing
+
+        target = st
+        is_broken = False
+        link_target = None
+        if child.is_symlink:
+            try:
+                target = os.stat(path)
+            except OSError:
+                is_broken = True
+            try:
+                link_target = os.readlink(path)
+            except OSError:
+                pass
+
+        is_dir = not is_broken and stat.S_ISDIR(target.st_mode)
+        is_file = not is_broken and stat.S_ISREG(target.st_mode)
+
+        entry: dict[str, Any] = {
+            "name": child.name,
+            "type": "symlink" if is_broken else ("directory" if is_dir else "file"),
+            "path": path,  # Full absolute path
+            "relativePath": os.path.relpath(path, home),
+            "isDirectory": is_dir,
+            "isFile": is_file,
+            "isSymlink": child.is_symlink,
+            "isBrokenSymlink": is_broken,
+            "symlinkTarget": link_target,
+            "hasAgentsMd": False,
+            "hasClaudeMd": False,
+            "isGitRepo": False,
+            "size": st.st_size if is_file else None,
+            "lastModified": datetime.fromtimestamp(st.st_mtime).isoformat() + "Z",
+        }
+        if is_dir:
+            if markers:
+                found = self._dir_markers(path, target.st_mtime_ns)
+                entry["hasAgentsMd"] = found.has_agents_md
+                entry["hasClaudeMd"] = found.has_claude_md
+                entry["isGitRepo"] = found.is_git_repo
+            else:
+                # Not computed; clients fetch them lazily
+                entry["hasAgentsMd"] = entry["hasClaudeMd"] = entry["isGitRepo"] = None
+        return entry
+
+    def _dir_markers(self, path: str, mtime_ns: int) -> _Markers:
+        with self._lock:
+            cached = self._markers.get(path)
+            if cached is not None and cached.trusted and cached.mtime_ns == mtime_ns:
+                self._markers.move_to_end(path)
+                return cached
+
+        # os.path.exists swallows OSError — FUSE mounts can time out or refuse
+        found = _Markers(
+            mtime_ns=mtime_ns,
+            trusted=_trusted(mtime_ns),
+            has_agents_md=os.path.exists(os.path.join(path, "AGENTS.md")),
+            has_claude_md=os.path.exists(os.path.join(path, "CLAUDE.md")),
+            is_git_repo=os.path.exists(os.path.join(path, ".git")),
+        )
+        with self._lock:
+            self._markers[path] = found
+            self._markers.move_to_end(path)
+            while len(self._markers) > self._max_markers:
+                self._markers.popitem(last=False)
+        return found
+
+
+_lister: Optional[DirectoryLister] = None
+
+
+def get_directory_lister() -> DirectoryLister:
+    """Get the shared DirectoryLister."""
+    global _lister
+    if _lister is None:
+        _lister = DirectoryLister()
+    return _lister
@@ -0,0 +1,67 @@
+"""
+Compiled glob matching for session permission grants.
+
+A session can accumulate many granted patterns, and every Read/Grep/Edit
+checks the path against all of them. GlobMatcher compiles a pattern list
+once — literal patterns into a set, globs into a single combined regex —
+so a check is one set lookup plus one regex match instead of a loop of
+fnmatch calls.
+
+Semantics match SessionPermissions' original per-pattern check:
+- fnmatch-style globs where ``*`` also crosses ``/``
+- a pattern containing ``**`` also matches anything under the literal
+  prefix before the first ``**`` (so "Blogs/**/*" matches "Blogs/post.md")
+"""
+
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Iterable
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class GlobMatcher:
+    """A compiled set of glob patterns."""
+
+    __slots__ = ("patterns", "_literals", "_regex", "_match_all")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(patterns)
+        self._literals: set[str] = set()
+        alternatives: list[str] = []
+        self._match_all = False
+
+        for pattern in self.patterns:
+            if _GLOB_CHARS.isdisjoint(pattern):
+                self._literals.add(pattern)
+            else:
+                alternatives.append(fnmatch.translate(pattern))
+            if "**" in pattern:
+                base = pattern.split("**")[0].rstrip("/")
+                if not base:
+                    self._match_all = True
+                alternatives.append(re.escape(base))
+
+        self._regex = (
+            re.compile("|".join(f"(?:{alt})" for alt in alternatives))
+            if alternatives else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def matches(self, path: str) -> bool:
+        """Check a path (leading ``./`` and ``/`` are stripped first)."""
+        if self._match_all:
+            return True
+        normalized = path.lstrip("./")
+        if normalized in self._literals:
+            return True
+        return self._regex is not None and self._regex.match(normalized) is not None
+
+
+@lru_cache(maxsize=128)
+def compile_globs(patterns: tuple[str, ...]) -> GlobMatcher:
+    """Shared compiled matcher for a pattern tuple."""
+    return GlobMatcher(patterns)
@@ -0,0 +1,240 @@
+"""
+Server log tailing for the supervisor's log stream.
+
+follow_log() reads the tail of a log file, then follows it by polling the
+file offset. Like `tail -F`, it survives rotation (new inode) and
+truncation. LogFilter filters records server-side by level, logger name
+and regex; traceback lines stay with the record that produced them.
+
+Blocking file I/O runs in worker threads; the async side only parses,
+filters and yields.
+"""
+
+import asyncio
+import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# Settings.log_format: "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_RECORD_RE = re.compile(
+    r"^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d+ - (?P<logger>\S+) - (?P<level>[A-Z]+) - "
+)
+# uvicorn's default formatter: "INFO:     message"
+_UVICORN_RE = re.compile(r"^(?P<level>DEBUG|INFO|WARNING|ERROR|CRITICAL):\s")
+
+TAIL_SCAN_BYTES = 2 * 1024 * 1024  # how far back to look for the initial tail
+READ_CHUNK_BYTES = 64 * 1024
+MAX_BACKLOG_BYTES = 1024 * 1024  # a reader further behind than this skips ahead
+POLL_INTERVAL = 0.25
+MAX_PATTERN_LENGTH = 200
+
+
+@dataclass(frozen=True)
+class LogLine:
+    """One log line, attributed to the record it belongs to."""
+
+    text: str
+    level: Optional[str] = None
+    logger: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {"line": self.text, "level": self.level, "logger": self.logger}
+
+
+class LogParser:
+    """Tracks the current record so continuation lines inherit its level/logger."""
+
+    def __init__(self):
+        self.level: Optional[str] = None
+        self.logger: Optional[str] = None
+
+    def reset(self) -> None:
+        self.level = self.logger = None
+
+    def parse(self, text: str) -> LogLine:
+        match = _RECORD_RE.match(text)
+        if match:
+            self.level, self.logger = match["level"], match["logger"]
+        else:
+            match = _UVICORN_RE.match(text)
+            if match:
+                self.level, self.logger = match["level"], "uvicorn"
+        return LogLine(text, self.level, self.logger)
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Server-side filter: minimum level, logger (with children), regex."""
+
+    min_level: Optional[str] = None
+    logger: Optional[str] = None
+    pattern: Optional[re.Pattern] = None
+
+    @classmethod
+    def build(
+        cls,
+        level: Optional[str] = None,
+        logger: Optional[str] = None,
+        pattern: Optional[str] = None,
+    ) -> "LogFilter":
+        """Validate raw query values. Raises ValueError on bad input."""
+        if level is not None:
+            level = level.upper()
+            if level not in LEVELS:
+                raise ValueError(f"Unknown level '{level}' (expected one of {', '.join(LEVELS)})")
+        compiled = None
+        if pattern:
+            if len(pattern) > MAX_PATTERN_LENGTH:
+                raise ValueError(f"Pattern longer than {MAX_PATTERN_LENGTH} characters")
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern: {e}") from e
+        return cls(min_level=level, logger=logger or None, pattern=compiled)
+
+    def matches(self, line: LogLine) -> bool:
+        if self.min_level and LEVELS.get(line.level or "", 0) < LEVELS[self.min_level]:
+            return False
+        if self.logger:
+            name = line.logger or ""
+            if name != self.logger and not name.startswith(self.logger + "."):
+                return False
+        if self.pattern and not self.pattern.search(line.text):
+            return False
+        return True
+
+
+def _split(data: bytes) -> tuple[list[str], bytes]:
+    """Split complete lines off a byte buffer; return (lines, trailing partial)."""
+    *complete, partial = data.split(b"\n")
+    return [line.decode("utf-8", errors="replace").rstrip("\r") for line in complete], partial
+
+
+class LogFollower:
+    """Follows one file by offset, reopening on rotation or truncation.
+
+    Blocking — call read_tail() and poll() via asyncio.to_thread.
+    """
+
+    def __init__(self, path: Path, max_backlog: int = MAX_BACKLOG_BYTES):
+        self.path = path
+        self.max_backlog = max_backlog
+        self.caught_up = True
+        self._fh = None
+        self._inode: Optional[int] = None
+        self._partial = b""
+
+    def read_tail(self) -> list[str]:
+        """Open the file and return the complete lines in its last TAIL_SCAN_BYTES.
+
+        Following starts right after the last complete line.
+        """
+        self._fh = open(self.path, "rb")
+        self._inode = os.fstat(self._fh.fileno()).st_ino
+        size = os.fstat(self._fh.fileno()).st_size
+        start = max(0, size - TAIL_SCAN_BYTES)
+        self._fh.seek(start)
+        lines, self._partial = _split(self._fh.read(size - start))
+        if start > 0 and lines:
+            lines = lines[1:]  # first line was cut by the scan window
+        return lines
+
+    def poll(self) -> tuple[list[str], list[dict]]:
+        """Read newly appended lines; also return rotated/skipped notices."""
+        events: list[dict] = []
+        lines: list[str] = []
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # Mid-rotation: keep reading the old handle until the new file appears
+            st = None
+
+        if st is not None and st.st_ino != self._inode:
+            # Rotated: drain what is left of the old file, then switch
+            lines, _ = _split(self._partial + self._fh.read(self.max_backlog) + b"\n")
+            lines = [line for line in lines if line]
+            self._fh.close()
+            self._fh = open(self.path, "rb")
+            self._inode = os.fstat(self._fh.fileno()).st_ino
+            self._partial = b""
+            events.append({"rotated": True})
+        elif st is not None and st.st_size < self._fh.tell():
+            self._fh.seek(0)
+            self._partial = b""
+            events.append({"rotated": True})
+
+        size = os.fstat(self._fh.fileno()).st_size
+        backlog = size - self._fh.tell()
+        if backlog > self.max_backlog:
+            # Slow reader: drop the backlog rather than fall further behind
+            self._fh.seek(size)
+            self._partial = b""
+            events.append({"skipped": backlog})
+
+        chunk = self._fh.read(READ_CHUNK_BYTES)
+        self.caught_up = len(chunk) < READ_CHUNK_BYTES
+        new_lines, self._partial = _split(self._partial + chunk)
+        return lines + new_lines, events
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+async def follow_log(
+    path: Path,
+    log_filter: Optional[LogFilter] = None,
+    lines: int = 50,
+    follow: bool = True,
+    redact: Optional[Callable[[str], str]] = None,
+    poll_interval: float = POLL_INTERVAL,
+    max_backlog: int = MAX_BACKLOG_BYTES,
+) -> AsyncIterator[Optional[dict]]:
+    """Yield the last `lines` matching lines, then (if follow) new ones as written.
+
+    Yields dicts ({"line", "level", "logger"}, {"rotated"} or {"skipped"})
+    and None on every idle poll, so the caller can send keepalives and
+    check for disconnects. Lines are redacted before filtering, so a
+    pattern cannot probe redacted content.
+    """
+    log_filter = log_filter or LogFilter()
+    parser = LogParser()
+    follower = LogFollower(path, max_backlog)
+
+    def parse(text: str) -> LogLine:
+        return parser.parse(redact(text) if redact else text)
+
+    def tail() -> list[LogLine]:
+        matched: deque[LogLine] = deque(maxlen=lines)
+        for text in follower.read_tail():
+            line = parse(text)
+            if log_filter.matches(line):
+                matched.append(line)
+        return list(matched)
+
+    try:
+        for line in await asyncio.to_thread(tail):
+            yield line.to_dict()
+        if not follow:
+            return
+
+        while True:
+            raw, events = await asyncio.to_thread(follower.poll)
+            for event in events:
+                parser.reset()
+                yield event
+            for text in raw:
+                line = parse(text)
+                if log_filter.matches(line):
+                    yield line.to_dict()
+            if follower.caught_up:
+                yield None
+                await asyncio.sleep(poll_interval)
+    finally:
+        follower.close()
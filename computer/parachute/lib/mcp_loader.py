@@ -18,13 +18,20 @@ import logging
 import os
 import re
 import sys
+import time
 from pathlib import Path
 from typing import Any, Literal, Optional
 
 import aiofiles
 
+from parachute.lib.metrics import get_metrics
+
 logger = logging.getLogger(__name__)
 
+_LOAD_SECONDS = get_metrics().histogram(
+    "parachute_mcp_load_seconds", "MCP server config load time", ("cache",)
+)
+
 
 # Valid auth types for remote MCP servers
 AuthType = Literal["none", "bearer"]
@@ -50,14 +57,19 @@ def _get_builtin_mcp_servers(home_path: Path) -> dict[str, dict[str, Any]]:
         # Fall back to current Python
         python_path = sys.executable
 
+    env = {
+        "PARACHUTE_SERVER_PORT": os.environ.get("PARACHUTE_SERVER_PORT", "3333"),
+        "PYTHONPATH": str(base_dir),
+    }
+    # Optional unix socket the server also listens on (faster than loopback TCP)
+    if os.environ.get("PARACHUTE_SERVER_SOCKET"):
+        env["PARACHUTE_SERVER_SOCKET"] = os.environ["PARACHUTE_SERVER_SOCKET"]
+
     return {
         "parachute": {
             "command": python_path,
             "args": ["-m", "parachute.mcp_server"],
-            "env": {
-                "PARACHUTE_SERVER_PORT": os.environ.get("PARACHUTE_SERVER_PORT", "3333"),
-                "PYTHONPATH": str(base_dir),
-            },
+            "env": env,
             "_builtin": True,  # Marker to identify built-in servers
             "trust_level": "sandboxed",  # Available at all trust levels
         }
@@ -119,8 +131,10 @@ async def load_mcp_servers(
 
     # Check cache
     if not raw and _mcp_cache_path == mcp_path and _mcp_cache:
+        _LOAD_SECONDS.observe(0.0, cache="hit")
         return _mcp_cache
 
+    started = time.perf_counter()
     # Start with built-in servers
     servers = _get_builtin_mcp_servers(home_path)
 
@@ -150,6 +164,7 @@ async def load_mcp_servers(
             logger.error(f"Error loading user MCP servers: {e}")
 
     if raw:
+        _LOAD_SECONDS.observe(time.perf_counter() - started, cache="raw")
         return servers
 
     # Process each server config (substitute env vars and normalize)
@@ -168,6 +183,7 @@ async def load_mcp_servers(
     _mcp_cache = processed
     _mcp_cache_path = mcp_path
 
+    _LOAD_SECONDS.observe(time.perf_counter() - started, cache="miss")
     logger.debug(f"Total MCP servers available: {len(processed)}")
     return processed
 
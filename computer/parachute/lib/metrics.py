@@ -0,0 +1,263 @@
+"""
+In-process performance metrics.
+
+Counters and fixed-bucket histograms, cheap enough to sit on hot paths
+(a dict lookup, a bisect and two additions under a lock per observation).
+Metrics are declared once at module level where they are recorded:
+
+    QUERY_SECONDS = get_metrics().histogram(
+        "parachute_brain_query_seconds", "Cypher query latency", ("op",)
+    )
+    with QUERY_SECONDS.time(op="read"):
+        ...
+
+MetricsRegistry.render() produces the Prometheus text exposition format
+served at /api/metrics; summary() feeds /api/health?detailed=true.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+# Latency buckets in seconds, 1ms to 2 minutes
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+# Distinct label sets per metric; beyond this, new sets share one overflow series
+MAX_SERIES = 500
+OVERFLOW_LABEL = "_other"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Shared label handling for counters and histograms."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str], series: dict) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        if key not in series and len(series) >= MAX_SERIES:
+            key = (OVERFLOW_LABEL,) * len(self.labelnames)
+        return key
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        with self._lock:
+            key = self._key(labels, self._values)
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        return self._values.get(key, 0)
+
+    def total(self) -> float:
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def summary(self) -> dict:
+        return {"total": self.total()}
+
+
+class _Series:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution of observations (usually seconds) in fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], _Series] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            key = self._key(labels, self._series)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.buckets))
+            series.counts[index] += 1
+            series.sum += value
+            series.count += 1
+            if value > series.max:
+                series.max = value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time of the block, including when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        series = self._series.get(key)
+        return series.count if series else 0
+
+    def render(self) -> list[str]:
+        lines = []
+        with self._lock:
+            items = sorted(
+                (key, list(s.counts), s.sum, s.count) for key, s in self._series.items()
+            )
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def _quantile(self, counts: list[int], count: int, q: float) -> float:
+        """Estimate a quantile by interpolating within its bucket."""
+        rank = q * count
+        seen = 0
+        for i, n in enumerate(counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+    def summary(self) -> dict:
+        """Aggregate over all label sets, in milliseconds."""
+        with self._lock:
+            series = list(self._series.values())
+        count = sum(s.count for s in series)
+        if not count:
+            return {"count": 0}
+        counts = [sum(col) for col in zip(*(s.counts for s in series))]
+        total = sum(s.sum for s in series)
+        return {
+            "count": count,
+            "avg_ms": round(total / count * 1000, 2),
+            "p50_ms": round(self._quantile(counts, count, 0.5) * 1000, 2),
+            "p95_ms": round(self._quantile(counts, count, 0.95) * 1000, 2),
+            "max_ms": round(max(s.max for s in series) * 1000, 2),
+        }
+
+
+class MetricsRegistry:
+    """Holds every metric; declaring the same name twice returns the existing one."""
+
+    def __init__(self):
+        self._metrics: dict[str, Union[Counter, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help, labelnames, buckets=buckets)
+
+    def _register(self, cls, name: str, help: str, labelnames: tuple[str, ...], **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} already registered with a different shape")
+                return existing
+            metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            return metric
+
+    def get(self, name: str) -> Optional[Union[Counter, Histogram]]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict[str, dict]:
+        """Compact per-metric stats for the detailed health check."""
+        return {name: self._metrics[name].summary() for name in sorted(self._metrics)}
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
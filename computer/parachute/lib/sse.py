@@ -0,0 +1,122 @@
+"""
+Server-Sent Events framing and the chat stream protocol.
+
+Protocol versions for POST /api/chat:
+
+- **1** (default): every ``text`` and ``thinking`` event carries the full
+  accumulated ``content``. Long replies resend the whole text on every
+  chunk, so bytes on the wire grow quadratically.
+- **2**: ``text`` and ``thinking`` events carry only the new characters
+  (``delta``) plus a per-kind sequence number (``seq``). A full
+  ``content`` snapshot (``snapshot: true``) is sent whenever the text does
+  not extend what the client already has (a new block after a tool call),
+  and every ``SNAPSHOT_EVERY`` frames so a client that dropped a frame can
+  resync without reconnecting. A ``stream_protocol`` event opens the stream.
+
+Clients opt in with ``"streamProtocol": 2`` in the request body or an
+``Accept: text/event-stream; protocol=2`` header. All other events are
+passed through unchanged in both versions.
+"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+STREAM_PROTOCOL_V1 = 1
+STREAM_PROTOCOL_V2 = 2
+SUPPORTED_STREAM_PROTOCOLS = (STREAM_PROTOCOL_V1, STREAM_PROTOCOL_V2)
+
+# Full-content resync interval for v2 text/thinking frames
+SNAPSHOT_EVERY = 64
+
+_DELTA_TYPES = ("text", "thinking")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an event to compact JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Non-str keys or >64-bit ints — let json handle the odd case
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def sse_data(obj: Any) -> str:
+    """Frame an event as an SSE ``data:`` line."""
+    return f"data: {dumps(obj)}\n\n"
+
+
+def negotiate_stream_protocol(requested: Optional[int], accept: Optional[str]) -> int:
+    """Pick the stream protocol from the body field or the Accept header.
+
+    The body field wins. Unknown versions fall back to v1 so a newer client
+    talking to an older server build still gets a stream it can parse.
+    """
+    version = requested
+    if version is None and accept:
+        for media_range in accept.split(","):
+            media_type, *params = media_range.split(";")
+            if media_type.strip().lower() != "text/event-stream":
+                continue
+            for param in params:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "protocol" and value.strip().isdigit():
+                    version = int(value.strip())
+    return version if version in SUPPORTED_STREAM_PROTOCOLS else STREAM_PROTOCOL_V1
+
+
+class StreamEncoder:
+    """Encodes orchestrator events as SSE frames for one stream."""
+
+    def __init__(self, protocol: int = STREAM_PROTOCOL_V1, snapshot_every: int = SNAPSHOT_EVERY):
+        self.protocol = protocol
+        self.snapshot_every = snapshot_every
+        # Per event type: last full content the client holds, frame seq,
+        # and frames since the last snapshot
+        self._content: dict[str, str] = {}
+        self._seq: dict[str, int] = {}
+        self._since_snapshot: dict[str, int] = {}
+
+    def preamble(self) -> Optional[str]:
+        """Opening frame announcing the negotiated protocol (v2 only)."""
+        if self.protocol < STREAM_PROTOCOL_V2:
+            return None
+        return sse_data({
+            "type": "stream_protocol",
+            "version": self.protocol,
+            "snapshotEvery": self.snapshot_every,
+        })
+
+    def encode(self, event: dict[str, Any], data: Optional[str] = None) -> Optional[str]:
+        """Encode one event; returns None when there is nothing to send.
+
+        ``data`` is the event already serialized, reused for pass-through frames.
+        """
+        if self.protocol < STREAM_PROTOCOL_V2 or event.get("type") not in _DELTA_TYPES:
+            return f"data: {data}\n\n" if data is not None else sse_data(event)
+        frame = self._delta_frame(event["type"], event.get("content") or "")
+        return sse_data(frame) if frame is not None else None
+
+    def _delta_frame(self, kind: str, content: str) -> Optional[dict[str, Any]]:
+        previous = self._content.get(kind)
+        extends = previous is not None and content.startswith(previous)
+        if extends and len(content) == len(previous):
+            return None  # client already has exactly this
+
+        seq = self._seq.get(kind, 0) + 1
+        self._seq[kind] = seq
+        self._content[kind] = content
+        since = self._since_snapshot.get(kind, 0) + 1
+
+        if extends and since < self.snapshot_every:
+            self._since_snapshot[kind] = since
+            return {"type": kind, "seq": seq, "delta": content[len(previous):]}
+
+        self._since_snapshot[kind] = 0
+        return {"type": kind, "seq": seq, "content": content, "snapshot": True}
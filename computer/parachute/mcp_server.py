@@ -22,6 +22,9 @@ Session & Tag Tools (via HTTP API):
 - get_session / search_by_tag / list_tags / add_session_tag / remove_session_tag
 - create_session (child sessions with spawn limits)
 
+Debugging:
+- debug_http_stats: Latency histograms for the server's HTTP calls
+
 Run with:
     python -m parachute.mcp_server /path/to/vault
 """
@@ -33,6 +36,7 @@ import logging
 import os
 import re
 import sys
+import time
 
 import httpx
 from dataclasses import dataclass
@@ -259,10 +263,187 @@ TOOLS = [
             "required": ["query"],
         },
     ),
+    Tool(
+        name="debug_http_stats",
+        description=(
+            "Debugging: per-endpoint latency histograms for this MCP server's calls "
+            "to the Parachute API, and whether it is using TCP or a unix socket."
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
 ] + VAULT_TOOLS  # Shared vault tools (search_memory, search_chats, list_chats, list_notes, get_chat, get_exchange)
 
 
 
+# ── HTTP client ─────────────────────────────────────────────────────────────
+#
+# One client for the life of the process: tool calls reuse keep-alive
+# connections to the local server instead of paying a TCP handshake each time.
+# When PARACHUTE_SERVER_SOCKET names a unix socket the server listens on, the
+# client talks over it instead of loopback TCP.
+
+_client: httpx.AsyncClient | None = None
+_transport_kind = "tcp"
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+
+# Latency histogram bucket upper bounds (ms); the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# Cap on distinct endpoints tracked, so unexpected paths can't grow it unbounded
+_MAX_ENDPOINTS = 100
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[\w.:-]{6,}$")
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Bucketed request latencies for one endpoint."""
+
+    counts: list[int]
+    total: int = 0
+    errors: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls(counts=[0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe(self, ms: float, error: bool = False) -> None:
+        idx = next((i for i, b in enumerate(LATENCY_BUCKETS_MS) if ms <= b), len(LATENCY_BUCKETS_MS))
+        self.counts[idx] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if error:
+            self.errors += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-th quantile (None if open-ended)."""
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else None
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.total,
+            "errors": self.errors,
+            "mean_ms": round(self.sum_ms / self.total, 2) if self.total else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+_latency: dict[str, LatencyHistogram] = {}
+
+
+def _endpoint_key(method: str, url: str) -> str:
+    """Endpoint label for a request: path with ID-like segments collapsed."""
+    path = httpx.URL(url).path
+    segments = ["{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/")]
+    return f"{method} {'/'.join(segments)}"
+
+
+def _record_latency(method: str, url: str, ms: float, error: bool) -> None:
+    key = _endpoint_key(method, url)
+    hist = _latency.get(key)
+    if hist is None:
+        if len(_latency) >= _MAX_ENDPOINTS:
+            key = f"{method} (other)"
+            hist = _latency.setdefault(key, LatencyHistogram.empty())
+        else:
+            hist = _latency[key] = LatencyHistogram.empty()
+    hist.observe(ms, error)
+
+
+def http_stats() -> dict[str, Any]:
+    """Per-endpoint latency histograms and client transport info."""
+    return {
+        "transport": _transport_kind,
+        "endpoints": {key: hist.to_dict() for key, hist in sorted(_latency.items())},
+    }
+
+
+def _server_socket() -> str | None:
+    path = os.environ.get("PARACHUTE_SERVER_SOCKET", "")
+    return path if path and Path(path).is_socket() else None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the process-lifetime client, creating it on first use."""
+    global _client, _transport_kind
+    if _client is None or _client.is_closed:
+        socket_path = _server_socket()
+        _transport_kind = "uds" if socket_path else "tcp"
+        transport = httpx.AsyncHTTPTransport(
+            uds=socket_path, limits=_CLIENT_LIMITS, retries=1
+        )
+        _client = httpx.AsyncClient(timeout=30.0, transport=transport)
+        if socket_path:
+            logger.info(f"MCP HTTP client using unix socket {socket_path}")
+    return _client
+
+
+def use_in_process_app(app: Any) -> None:
+    """Route brain/API calls straight into an ASGI app in this process.
+
+    Used by the in-process built-in server: requests skip the socket layer
+    and run the same endpoint code (validation, trust checks) as over HTTP.
+    """
+    global _client, _brain_base_url, _api_base_url, _transport_kind
+    _client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), timeout=30.0
+    )
+    _transport_kind = "asgi"
+    _brain_base_url = "http://parachute.local/api/brain"
+    _api_base_url = "http://parachute.local/api"
+
+
+async def _close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _request(
+    url: str,
+    method: str,
+    body: dict[str, Any] | None,
+    params: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Send a request on the shared client; returns JSON or an error dict."""
+    client = _get_client()
+    started = time.perf_counter()
+    error = True
+    try:
+        if method == "POST":
+            response = await client.post(url, json=body or {})
+        elif method == "DELETE":
+            response = await client.delete(url, params=params)
+        else:
+            response = await client.get(url, params=params)
+        error = response.status_code >= 400
+        if error:
+            try:
+                detail = response.json().get("detail", response.text)
+            except Exception:
+                detail = response.text
+            return {"error": detail, "status_code": response.status_code}
+        return response.json()
+    finally:
+        _record_latency(method, url, (time.perf_counter() - started) * 1000, error)
+
+
 async def _brain_call(
     path: str,
     method: str = "GET",
@@ -272,20 +453,8 @@ async def _brain_call(
     """Make a GET or POST request to the local brain API."""
     if not _brain_base_url:
         return {"error": "Brain API not available"}
-    url = f"{_brain_base_url}{path}"
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method == "POST":
-                response = await client.post(url, json=body or {})
-            else:
-                response = await client.get(url, params=params)
-            if response.status_code >= 400:
-                try:
-                    detail = response.json().get("detail", response.text)
-                except Exception:
-                    detail = response.text
-                return {"error": detail, "status_code": response.status_code}
-            return response.json()
+        return await _request(f"{_brain_base_url}{path}", method, body, params)
     except httpx.ConnectError:
         return {"error": "Brain API unavailable — is the server running?"}
     except Exception as e:
@@ -302,22 +471,8 @@ async def _api_call(
     """Make a request to the local server API (any path under /api/)."""
     if not _api_base_url:
         return {"error": "Server API not available"}
-    url = f"{_api_base_url}{path}"
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method == "POST":
-                response = await client.post(url, json=body or {})
-            elif method == "DELETE":
-                response = await client.delete(url, params=params)
-            else:
-                response = await client.get(url, params=params)
-            if response.status_code >= 400:
-                try:
-                    detail = response.json().get("detail", response.text)
-                except Exception:
-                    detail = response.text
-                return {"error": detail, "status_code": response.status_code}
-            return response.json()
+        return await _request(f"{_api_base_url}{path}", method, body, params)
     except httpx.ConnectError:
         return {"error": "Server API unavailable — is the server running?"}
     except Exception as e:
@@ -325,8 +480,17 @@ async def _api_call(
         return {"error": str(e)}
 
 
-async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
-    """Handle a tool call and return the result as JSON string."""
+async def handle_tool_call(
+    name: str,
+    arguments: dict[str, Any],
+    context: SessionContext | None = None,
+) -> str:
+    """Handle a tool call and return the result as JSON string.
+
+    ``context`` overrides the process-wide session context (in-process
+    servers serve many sessions from one module).
+    """
+    session_context = context or _session_context
     try:
         if name == "search_memory":
             p: dict[str, Any] = {"search": arguments["query"]}
@@ -364,7 +528,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
             )
         # Multi-Agent Session Tools
         elif name == "create_session":
-            if not _session_context or not _session_context.is_available:
+            if not session_context or not session_context.is_available:
                 result = {
                     "error": "Session context not available. This tool can only be called from an active session."
                 }
@@ -376,9 +540,9 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
                         "title": arguments["title"],
                         "agentType": arguments["agent_type"],
                         "initialMessage": arguments["initial_message"],
-                        "parentSessionId": _session_context.session_id,
-                        "trustLevel": _session_context.trust_level,
-                        "containerId": _session_context.container_id,
+                        "parentSessionId": session_context.session_id,
+                        "trustLevel": session_context.trust_level,
+                        "containerId": session_context.container_id,
                     },
                 )
         # Brain Tools
@@ -390,7 +554,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
         elif name == "brain_query":
             # Require vault/direct trust — raw Cypher reads all journal data.
             # Fail-closed: deny if context is absent (standalone/legacy mode).
-            trust = _session_context.trust_level if _session_context else None
+            trust = session_context.trust_level if session_context else None
             if trust != "direct":
                 result = {"error": "brain_query requires vault or full trust level"}
             else:
@@ -402,7 +566,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
         elif name == "brain_execute":
             # Require full (direct) trust — arbitrary writes can corrupt or destroy the graph.
             # Fail-closed: deny if context is absent (standalone/legacy mode).
-            trust = _session_context.trust_level if _session_context else None
+            trust = session_context.trust_level if session_context else None
             if trust != "direct":
                 result = {"error": "brain_execute requires full trust level"}
             else:
@@ -458,6 +622,8 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
                     "date": arguments.get("date"),
                 },
             )
+        elif name == "debug_http_stats":
+            result = http_stats()
         else:
             return json.dumps({"error": f"Unknown tool: {name}"})
 
@@ -491,7 +657,10 @@ async def run_server():
 
     # Run with stdio transport
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+        try:
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+        finally:
+            await _close_client()
 
 
 def main():
@@ -146,6 +146,12 @@ class ChatRequest(BaseModel):
         default=None,
         description="Session mode: 'converse' or 'cocreate'. Persisted on session creation.",
     )
+    stream_protocol: Optional[int] = Field(
+        alias="streamProtocol",
+        default=None,
+        description="SSE stream protocol version. 2 = delta-only text/thinking "
+                    "events with sequence numbers. Defaults to 1 (full content).",
+    )
 
     # Legacy fields for compatibility
     agent_path: Optional[str] = Field(alias="agentPath", default=None)
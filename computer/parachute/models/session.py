@@ -94,20 +94,8 @@ class SessionPermissions(BaseModel):
 
     def _matches_any_pattern(self, path: str, patterns: list[str]) -> bool:
         """Check if path matches any of the glob patterns."""
-        import fnmatch
-        # Normalize path (remove leading ./ or /)
-        normalized = path.lstrip("./")
-        for pattern in patterns:
-            if fnmatch.fnmatch(normalized, pattern):
-                return True
-            # Also check if the pattern matches a parent directory
-            # e.g., pattern "Blogs/**/*" should match "Blogs/post.md"
-            if "**" in pattern:
-                # Convert ** to regex-style matching
-                base = pattern.split("**")[0].rstrip("/")
-                if normalized.startswith(base):
-                    return True
-        return False
+        from parachute.lib.glob_matcher import compile_globs
+        return compile_globs(tuple(patterns)).matches(path)
 
 
 class SessionSource(str, Enum):
@@ -8,6 +8,7 @@ Discovers and loads modules from vault/.modules/ directory.
 import asyncio
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 
 # Ensure SSL certificates are available on macOS (Python.org builds lack system certs)
@@ -28,12 +29,15 @@ from fastapi.responses import JSONResponse
 from parachute import __version__
 from parachute.api import api_router
 from parachute.config import get_settings, Settings
+from parachute.core.live_streams import LiveStreamHub
 from parachute.core.module_loader import ModuleLoader
 from parachute.core.orchestrator import Orchestrator
 from parachute.core.scheduler import init_scheduler, stop_scheduler
+from parachute.core.startup import StartupTracker, SubsystemSkipped
 from parachute.db.brain_chat_store import BrainChatStore
 from parachute.db.brain import BrainService
 from parachute.lib.logger import setup_logging, get_logger
+from parachute.lib.metrics import get_metrics
 from parachute.lib.server_config import (
     init_server_config,
     get_server_config,
@@ -61,99 +65,73 @@ async def lifespan(app: FastAPI):
     (settings.parachute_dir / "graph").mkdir(exist_ok=True)
     settings.log_dir.mkdir(exist_ok=True)
 
+    startup = StartupTracker()
+    app.state.startup = startup
+
     # Initialize server config (API keys, auth settings)
-    server_config = init_server_config(settings.parachute_dir)
+    with startup.step("config"):
+        server_config = init_server_config(settings.parachute_dir)
     app.state.server_config = server_config
     logger.info(f"Auth mode: {server_config.security.require_auth.value}")
     logger.info(f"API keys configured: {len(server_config.security.api_keys)}")
     logger.info(f"Claude token: {'configured' if settings.claude_code_oauth_token else 'not set (run `claude setup-token`)'}")
 
     # Initialize brain database (Kuzu/LadybugDB) (must come before orchestrator — sessions live here)
-    brain = BrainService(db_path=settings.brain_db_path)
-    await brain.connect()
-
-    # Initialize brain-backed session store and register schema
-    session_store = BrainChatStore(brain)
-    await session_store.ensure_schema()
-    # Order matters: tools must exist before triggers (INVOKES edges need Tool nodes)
-    await session_store.seed_builtin_tools()
-    await session_store.seed_builtin_triggers()
+    with startup.step("brain"):
+        brain = BrainService(db_path=settings.brain_db_path)
+        await brain.connect()
+
+        # Initialize brain-backed session store: schema, migrations and built-in
+        # seeds (skipped when the stored schema manifest is current)
+        session_store = BrainChatStore(brain)
+        await session_store.ensure_ready()
     app.state.brain = brain
     app.state.session_store = session_store
     from parachute.core.interfaces import get_registry
     get_registry().publish("BrainDB", brain)
     get_registry().publish("ChatStore", session_store)
+    get_registry().publish("ASGIApp", app)  # In-process built-in MCP tools call back into it
     await brain.start_checkpoint_loop()
     logger.info(f"BrainDB initialized: {settings.brain_db_path}")
 
     # Initialize orchestrator and store in app.state
-    orchestrator = Orchestrator(
-        parachute_dir=settings.parachute_dir,
-        session_store=session_store,
-        settings=settings,
-    )
+    with startup.step("orchestrator"):
+        orchestrator = Orchestrator(
+            parachute_dir=settings.parachute_dir,
+            session_store=session_store,
+            settings=settings,
+        )
     app.state.orchestrator = orchestrator
     app.state.sandbox = orchestrator.sandbox  # Shared DockerSandbox for health checks
+    app.state.live_streams = LiveStreamHub()
     get_registry().publish("DockerSandbox", orchestrator.sandbox)
 
-    # Discover existing persistent container env containers
-    await orchestrator.reconcile_containers()
-
-    # Initialize transcription service (optional — skip if backend not available)
-    from parachute.core.transcription import TranscriptionService
-
-    _transcription_service = TranscriptionService.from_config(settings)
-    if _transcription_service:
-        try:
-            await _transcription_service.initialize()
-            get_registry().publish("TranscriptionService", _transcription_service)
-            logger.info("Transcription service initialized")
-        except Exception as e:
-            logger.warning(f"Transcription service failed to initialize: {e}")
-            _transcription_service = None
-    else:
-        logger.info("Transcription service: no backend available, skipping")
-
-    # Load modules from ~/.parachute/modules/
-    module_loader = ModuleLoader(settings.parachute_dir)
-    modules = await module_loader.discover_and_load()
-    app.state.module_loader = module_loader
-    app.state.modules = modules
-    logger.info(f"Loaded {len(modules)} modules: {list(modules.keys())}")
-
-    # Initialize scheduler after modules so Agent nodes are migrated first
-    from parachute.core.interfaces import get_registry
-    graph = get_registry().get("BrainDB")
-    scheduler = await init_scheduler(settings.parachute_dir, graph=graph)
-    app.state.scheduler = scheduler
-    logger.info("Scheduler initialized")
-
-    # Register module routes dynamically and track which modules have routers
-    module_has_router: dict[str, bool] = {}
-    for name, module in modules.items():
-        if hasattr(module, 'get_router'):
-            router = module.get_router()
-            if router:
-                prefix = f"/api/{name}"
-                app.include_router(router, prefix=prefix, tags=[name])
-                logger.info(f"Registered routes for module: {name} at {prefix}")
-                module_has_router[name] = True
-                continue
-        module_has_router[name] = False
-    app.state.module_has_router = module_has_router
-
-    # Initialize hooks runner
-    from parachute.core.hooks.runner import HookRunner
-    from parachute.api.hooks import init_hooks_api
-    try:
-        hook_runner = HookRunner(settings.parachute_dir)
-        await hook_runner.discover()
-        init_hooks_api(hook_runner)
-        app.state.hook_runner = hook_runner
-        logger.info(f"Hooks: {len(hook_runner.get_registered_hooks())} hooks discovered")
-    except Exception as e:
-        logger.warning(f"Failed to initialize hooks: {e}")
-        app.state.hook_runner = None
+    # Load modules from ~/.parachute/modules/ and register their routes before
+    # serving, so /api/{module}/* never 404s while startup is still running
+    with startup.step("modules"):
+        module_loader = ModuleLoader(settings.parachute_dir)
+        modules = await module_loader.discover_and_load()
+        app.state.module_loader = module_loader
+        app.state.modules = modules
+        logger.info(f"Loaded {len(modules)} modules: {list(modules.keys())}")
+
+        # Register module routes dynamically and track which modules have routers
+        module_has_router: dict[str, bool] = {}
+        for name, module in modules.items():
+            if hasattr(module, 'get_router'):
+                router = module.get_router()
+                if router:
+                    prefix = f"/api/{name}"
+                    app.include_router(router, prefix=prefix, tags=[name])
+                    logger.info(f"Registered routes for module: {name} at {prefix}")
+                    module_has_router[name] = True
+                    continue
+            module_has_router[name] = False
+        app.state.module_has_router = module_has_router
+
+    # Filled in by background init below; endpoints treat None as "not loaded yet"
+    app.state.scheduler = None
+    app.state.hook_runner = None
 
     # Initialize bots API (pass server_ref with database for connector sessions)
     from parachute.api.bots import init_bots_api, auto_start_connectors
@@ -164,16 +142,23 @@ async def lifespan(app: FastAPI):
 
         Connectors call: orchestrate(session_id, message, source)
         Orchestrator expects: run_streaming(message, session_id, ..., trust_level)
+
+        The run goes through the live stream hub so the app can attach to
+        a bot-driven turn with GET /api/chat/{session_id}/stream.
         """
         session = await session_store.get_session(session_id)
         trust_level = getattr(session, 'trust_level', None) if session else None
 
-        async for event in orchestrator.run_streaming(
-            message=message,
+        live = app.state.live_streams.start(
+            orchestrator.run_streaming(
+                message=message,
+                session_id=session_id,
+                trust_level=trust_level,
+            ),
             session_id=session_id,
-            trust_level=trust_level,
-        ):
-            yield event
+        )
+        async for item in live.subscribe():
+            yield item.event
 
     async def transcribe_audio(audio_data) -> str:
         """Transcribe audio for bot connectors.
@@ -191,40 +176,82 @@ async def lifespan(app: FastAPI):
         session_store=session_store,
         orchestrator=orchestrator,
         orchestrate=orchestrate,
-        hook_runner=app.state.hook_runner,
+        hook_runner=None,  # set once hooks are discovered
         transcribe_audio=transcribe_audio,
     )
     init_bots_api(parachute_dir=settings.parachute_dir, server_ref=server_ref)
 
-    # Auto-start enabled bot connectors (errors logged, never crash server)
-    await auto_start_connectors()
-
     # Initialize MCP HTTP bridge for sandbox containers
-    from parachute.lib.sandbox_tokens import SandboxTokenStore
-    from parachute.api.mcp_bridge import (
-        create_mcp_server,
-        create_session_manager,
-        create_mcp_asgi_app,
-    )
+    with startup.step("mcp_bridge"):
+        from parachute.lib.sandbox_tokens import SandboxTokenStore
+        from parachute.api.mcp_bridge import (
+            create_mcp_server,
+            create_session_manager,
+            create_mcp_asgi_app,
+        )
 
-    token_store = SandboxTokenStore()
-    app.state.sandbox_token_store = token_store
-    get_registry().publish("SandboxTokenStore", token_store)
-
-    mcp_server = create_mcp_server()
-    mcp_session_manager = create_session_manager(mcp_server)
-    # StreamableHTTPSessionManager.run() returns an async context manager.
-    # We call __aenter__/__aexit__ manually because FastAPI's lifespan is
-    # itself a context manager — we can't nest `async with` across the yield.
-    mcp_run_ctx = mcp_session_manager.run()
-    await mcp_run_ctx.__aenter__()
-    app.state.mcp_session_manager = mcp_session_manager
-    app.state.mcp_run_ctx = mcp_run_ctx
-
-    mcp_asgi_app = create_mcp_asgi_app(mcp_session_manager, token_store)
-    app.mount("/mcp/v1", mcp_asgi_app)
+        token_store = SandboxTokenStore()
+        app.state.sandbox_token_store = token_store
+        get_registry().publish("SandboxTokenStore", token_store)
+
+        mcp_server = create_mcp_server()
+        mcp_session_manager = create_session_manager(mcp_server)
+        # StreamableHTTPSessionManager.run() returns an async context manager.
+        # We call __aenter__/__aexit__ manually because FastAPI's lifespan is
+        # itself a context manager — we can't nest `async with` across the yield.
+        mcp_run_ctx = mcp_session_manager.run()
+        await mcp_run_ctx.__aenter__()
+        app.state.mcp_session_manager = mcp_session_manager
+        app.state.mcp_run_ctx = mcp_run_ctx
+
+        mcp_asgi_app = create_mcp_asgi_app(mcp_session_manager, token_store)
+        app.mount("/mcp/v1", mcp_asgi_app)
     logger.info("MCP HTTP bridge mounted at /mcp/v1")
 
+    # --- Non-critical subsystems: initialized in the background ---
+
+    async def reconcile_containers():
+        # Discover existing persistent container env containers. Sandboxed
+        # turns that arrive meanwhile wait for this (DockerSandbox.reconciling).
+        await orchestrator.reconcile_containers()
+
+    async def init_transcription():
+        # Optional — skip if backend not available
+        from parachute.core.transcription import TranscriptionService
+
+        service = TranscriptionService.from_config(settings)
+        if not service:
+            raise SubsystemSkipped("no backend available")
+        await service.initialize()
+        get_registry().publish("TranscriptionService", service)
+
+    async def init_scheduler_bg():
+        # Modules loaded above, so Agent nodes are already migrated
+        app.state.scheduler = await init_scheduler(settings.parachute_dir, graph=brain)
+
+    async def init_hooks():
+        from parachute.core.hooks.runner import HookRunner
+        from parachute.api.hooks import init_hooks_api
+
+        hook_runner = HookRunner(settings.parachute_dir)
+        await hook_runner.discover()
+        init_hooks_api(hook_runner)
+        app.state.hook_runner = hook_runner
+        server_ref.hook_runner = hook_runner
+        logger.info(f"Hooks: {len(hook_runner.get_registered_hooks())} hooks discovered")
+
+    async def start_bots_after_hooks():
+        # Connectors fire hooks, so wait for discovery (errors logged, never crash server)
+        await hooks_task
+        await auto_start_connectors()
+
+    startup.start_background("containers", reconcile_containers)
+    startup.start_background("transcription", init_transcription)
+    startup.start_background("scheduler", init_scheduler_bg)
+    hooks_task = startup.start_background("hooks", init_hooks)
+    startup.start_background("bots", start_bots_after_hooks)
+
+    startup.mark_serving()
     logger.info("Server ready")
 
     yield
@@ -232,6 +259,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
 
+    # Stop background init that is still running before tearing down what it uses
+    await startup.cancel()
+
     # Shut down transcription service (waits for in-flight work)
     ts = get_registry().get("TranscriptionService")
     if ts and hasattr(ts, "shutdown"):
@@ -258,6 +288,11 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Error stopping {platform} connector: {e}")
     bot_connectors.clear()
 
+    # Cancel turns still running in the background (no subscriber may be attached)
+    if getattr(app.state, "live_streams", None):
+        await app.state.live_streams.close()
+        app.state.live_streams = None
+
     # Clean up any remaining pending permissions before shutdown
     if app.state.orchestrator:
         for session_id, handler in list(app.state.orchestrator.pending_permissions.items()):
@@ -355,7 +390,7 @@ async def api_key_middleware(request: Request, call_next):
     server_config = get_server_config()
 
     # Skip auth for health check and non-API routes
-    if request.url.path in ["/api/health", "/"] or not request.url.path.startswith("/api"):
+    if request.url.path in ["/api/health", "/api/health/ready", "/"] or not request.url.path.startswith("/api"):
         return await call_next(request)
 
     # Skip auth for auth management endpoints from localhost (bootstrap case)
@@ -415,6 +450,32 @@ async def api_key_middleware(request: Request, call_next):
     return await call_next(request)
 
 
+_REQUEST_SECONDS = get_metrics().histogram(
+    "parachute_http_request_duration_seconds",
+    "HTTP request latency (to response headers for streaming responses)",
+    ("method", "route"),
+)
+_REQUESTS = get_metrics().counter(
+    "parachute_http_requests_total", "HTTP requests by response status", ("method", "route", "status")
+)
+
+
+# Request metrics — registered last so it wraps auth and times rejected requests too
+@app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template, not raw path, to keep series bounded
+        route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+        _REQUEST_SECONDS.observe(time.perf_counter() - started, method=request.method, route=route)
+        _REQUESTS.inc(method=request.method, route=route, status=str(status))
+
+
 # Include API routes
 app.include_router(api_router)
 
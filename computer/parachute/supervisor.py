@@ -12,7 +12,6 @@ Supervisor must be ultra-stable and defensive.
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
@@ -22,18 +21,24 @@ from pathlib import Path
 from typing import Any
 
 import httpx
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from parachute import __version__
 from parachute.docker_runtime import DockerRuntime, DockerRuntimeRegistry
+from parachute.lib.log_tail import LogFilter, follow_log
+from parachute.lib.sse import sse_data
 
 logger = logging.getLogger(__name__)
 
 # Track supervisor start time for uptime
 _start_time = time.time()
 
+# Server log files the supervisor can stream (written by the service manager)
+LOG_STREAMS = ("stdout", "stderr")
+LOG_KEEPALIVE_SECONDS = 15.0
+
 # Track background tasks to prevent GC collection and silent exception loss
 _background_tasks: set[asyncio.Task] = set()
 
@@ -396,53 +401,79 @@ async def restart_server() -> ServerActionResponse:
         raise HTTPException(status_code=500, detail=f"Server restart failed: {e}")
 
 
+def _server_log_file(stream: str) -> Path | None:
+    """Locate the server's `<stream>.log`.
+
+    settings.log_dir is checked first, then the service manager's log
+    directory (platform-specific, see daemon.daemon_log_dir).
+    """
+    from parachute.daemon import daemon_log_dir
+
+    dirs = [settings.log_dir] if settings else []
+    dirs.append(daemon_log_dir())
+    for log_dir in dirs:
+        path = log_dir / f"{stream}.log"
+        if path.exists():
+            return path
+    return None
+
+
 @app.get("/supervisor/logs")
 async def stream_logs(
     request: Request,
     lines: int = 50,
+    follow: bool = False,
+    level: str | None = None,
+    logger_name: str | None = Query(default=None, alias="logger"),
+    pattern: str | None = None,
+    stream: str = "stdout",
 ) -> StreamingResponse:
     """
-    Stream recent server log lines via SSE with backpressure control.
+    Stream server log lines via SSE: the last `lines` matching lines, then
+    (with follow=true) new lines as they are written, across rotation.
 
-    Security: Log lines are redacted (API keys, tokens, paths).
-    Performance: Bounded memory usage via line limit.
+    Filtering happens server-side: `level` is a minimum level, `logger`
+    matches a logger and its children, `pattern` is a regex.
+
+    Security: Log lines are redacted (API keys, tokens, paths) before filtering.
+    Performance: Bounded memory; a client more than MAX_BACKLOG_BYTES behind
+    the file skips ahead and gets a {"skipped": bytes} event.
     """
     # Cap at 500 to prevent OOM
-    lines = min(lines, 500)
+    lines = max(0, min(lines, 500))
 
-    log_file = Path.home() / "Library" / "Logs" / "Parachute" / "server.log"
+    if stream not in LOG_STREAMS:
+        raise HTTPException(status_code=400, detail=f"stream must be one of {', '.join(LOG_STREAMS)}")
+    try:
+        log_filter = LogFilter.build(level=level, logger=logger_name, pattern=pattern)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    log_file = await asyncio.to_thread(_server_log_file, stream)
 
     async def log_generator():
-        if not log_file.exists():
-            yield f"data: {json.dumps({'error': 'Log file not found'})}\n\n"
+        if log_file is None:
+            yield sse_data({"error": "Log file not found"})
             return
 
-        # Read last N lines in thread (blocking I/O)
-        def read_tail(path: Path, n: int) -> list[str]:
-            from collections import deque
-            try:
-                with open(path, 'rb') as f:
-                    return [line.decode('utf-8', errors='replace') for line in deque(f, maxlen=n)]
-            except Exception as e:
-                logger.error(f"Failed to read log file: {e}")
-                return []
-
+        last_sent = time.monotonic()
         try:
-            lines_list = await asyncio.to_thread(read_tail, log_file, lines)
-
-            for line in lines_list:
-                if await request.is_disconnected():
-                    return
-
-                # SECURITY: Redact sensitive patterns
-                line = _redact_log_line(line)
-
-                yield f"data: {json.dumps({'line': line})}\n\n"
-                await asyncio.sleep(0)  # Yield to event loop (backpressure)
-
+            async for item in follow_log(
+                log_file, log_filter, lines=lines, follow=follow, redact=_redact_log_line,
+            ):
+                if item is None:
+                    # Idle poll: notice disconnects, keep proxies from timing out
+                    if await request.is_disconnected():
+                        return
+                    if time.monotonic() - last_sent >= LOG_KEEPALIVE_SECONDS:
+                        yield ": keepalive\n\n"
+                        last_sent = time.monotonic()
+                    continue
+                yield sse_data(item)
+                last_sent = time.monotonic()
         except Exception as e:
             logger.error(f"Log streaming error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse_data({"error": str(e)})
 
     return StreamingResponse(
         log_generator(),
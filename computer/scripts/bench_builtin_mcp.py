@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Compare round-trip latency of the built-in parachute MCP tools:
+stdio subprocess (calls back over HTTP) vs. in-process SDK server.
+
+Starts the Parachute app on a free local port (stop the running server
+first — the brain DB is single-writer), then calls the same tool N times
+through each path and prints latency percentiles.
+
+Usage:
+    python -m scripts.bench_builtin_mcp [--tool search_memory] [--query notes] [-n 200]
+
+The in-process numbers cover the MCP server side only; the SDK's control
+channel to the Claude CLI adds one local hop that a stdio server also pays.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import time
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]  # noqa: E731
+    print(
+        f"{label:<12} n={len(samples):<5} mean={statistics.fmean(samples):7.2f}ms "
+        f"p50={p(0.5):7.2f}ms p95={p(0.95):7.2f}ms max={samples[-1]:7.2f}ms"
+    )
+
+
+async def _bench_stdio(port: int, tool: str, arguments: dict, n: int) -> list[float]:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "parachute.mcp_server"],
+        env={**os.environ, "PARACHUTE_SERVER_PORT": str(port)},
+    )
+    samples = []
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            await session.call_tool(tool, arguments)  # warm-up
+            for _ in range(n):
+                start = time.perf_counter()
+                await session.call_tool(tool, arguments)
+                samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def _bench_in_process(tool: str, arguments: dict, n: int) -> list[float]:
+    from mcp.types import CallToolRequest, CallToolRequestParams
+
+    from parachute.core.builtin_mcp import create_builtin_mcp_server
+    from parachute.mcp_server import SessionContext
+
+    config = create_builtin_mcp_server(SessionContext(session_id=None, trust_level="direct"))
+    handler = config["instance"].request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=tool, arguments=arguments)
+    )
+    await handler(request)  # warm-up
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await handler(request)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tool", default="search_memory")
+    parser.add_argument("--query", default="notes")
+    parser.add_argument("--args", help="JSON tool arguments (overrides --query)")
+    parser.add_argument("-n", type=int, default=200)
+    opts = parser.parse_args()
+    arguments = json.loads(opts.args) if opts.args else {"query": opts.query}
+
+    import uvicorn
+
+    from parachute.server import app
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    try:
+        print(f"{opts.tool}({json.dumps(arguments)}) × {opts.n}")
+        _report("stdio+http", await _bench_stdio(port, opts.tool, arguments, opts.n))
+        _report("in-process", await _bench_in_process(opts.tool, arguments, opts.n))
+    finally:
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,7 @@ Pytest configuration and fixtures.
 
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
@@ -104,6 +105,45 @@ requires_ladybugdb = pytest.mark.skipif(
 )
 
 
+# ---------------------------------------------------------------------------
+# Graph round-trip budgets
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def assert_max_queries(graph, budget: int):
+    """Fail if the block sends more than ``budget`` queries to ``graph``.
+
+    Wraps the graph's ``execute_cypher`` and ``_execute`` on the instance and
+    yields the list of issued queries, so hot agent tools can lock in their
+    round-trip count:
+
+        with assert_max_queries(graph, 1):
+            await read_days_chats({"date": "2026-03-25"})
+    """
+    queries: list[str] = []
+    originals = {}
+    for name in ("execute_cypher", "_execute"):
+        fn = getattr(graph, name, None)
+        if fn is None:
+            continue
+        originals[name] = fn
+
+        async def counted(query, *args, _fn=fn, **kwargs):
+            queries.append(query)
+            return await _fn(query, *args, **kwargs)
+
+        setattr(graph, name, counted)
+    try:
+        yield queries
+    finally:
+        for name in originals:
+            delattr(graph, name)
+    assert len(queries) <= budget, (
+        f"Expected at most {budget} graph queries, got {len(queries)}:\n"
+        + "\n".join(f"  {q}" for q in queries)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -141,6 +181,16 @@ This is a test vault for automated testing.
     return vault
 
 
+@pytest.fixture
+def age_dirs():
+    """Backdate every directory's mtime under a root so cached listings are trusted."""
+    def age(root: Path, seconds: int = 60) -> None:
+        past = os.stat(root).st_mtime - seconds
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, (past, past))
+    return age
+
+
 @pytest.fixture
 def test_home_path(test_vault: Path) -> str:
     """Get test vault path as string."""
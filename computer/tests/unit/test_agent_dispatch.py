@@ -75,6 +75,12 @@ class TestFilterMatching:
             {"entry_type": "text", "tags": ["meeting"]},
         ) is False
 
+    def test_unhashable_filter_tags_are_tolerated(self):
+        """A hand-edited filter with nested values must not break matching."""
+        filt = {"tags": ["meeting", ["nested"], {"odd": 1}]}
+        assert AgentDispatcher._matches_filter(filt, {"tags": ["meeting"]}) is True
+        assert AgentDispatcher._matches_filter(filt, {"tags": ["work"]}) is False
+
     def test_generic_key_equality(self):
         assert AgentDispatcher._matches_filter(
             {"date": "2026-03-16"},
@@ -146,3 +152,116 @@ class TestDailyAgentConfigTriggerFields:
             tool_row, can_call_names=[], trigger_row=trigger_row,
         )
         assert config.trigger_filter == {}
+
+
+def _index_graph(triggers: list[dict], children: list[dict] | None = None):
+    """Fake graph serving the two trigger-index queries."""
+    from unittest.mock import AsyncMock
+
+    async def execute_cypher(query, params=None):
+        return list(children or []) if "CAN_CALL" in query else list(triggers)
+
+    graph = AsyncMock()
+    graph.execute_cypher = AsyncMock(side_effect=execute_cypher)
+    return graph
+
+
+class TestTriggerIndex:
+    """The event → trigger index is built once and reused across dispatches."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_index(self):
+        from parachute.core.agent_dispatch import invalidate_trigger_index
+
+        invalidate_trigger_index()
+        yield
+        invalidate_trigger_index()
+
+    async def test_index_built_once_and_filters_applied(self, tmp_path):
+        graph = _index_graph([
+            {"event": "note.created", "name": "a-voice", "event_filter": '{"entry_type": "voice"}'},
+            {"event": "note.created", "name": "b-all", "event_filter": ""},
+            {"event": "note.updated", "name": "c-other", "event_filter": None},
+        ])
+        dispatcher = AgentDispatcher(graph=graph, home_path=tmp_path)
+
+        voice = await dispatcher._find_matching_agents("note.created", {"entry_type": "voice"})
+        text = await dispatcher._find_matching_agents("note.created", {"entry_type": "text"})
+        none = await dispatcher._find_matching_agents("note.deleted", {})
+
+        assert [a.name for a in voice] == ["a-voice", "b-all"]
+        assert [a.name for a in text] == ["b-all"]
+        assert none == []
+        assert graph.execute_cypher.await_count == 2  # triggers + CAN_CALL, once
+
+    async def test_invalidate_reloads(self, tmp_path):
+        from parachute.core.agent_dispatch import invalidate_trigger_index
+
+        graph = _index_graph([{"event": "note.created", "name": "a", "event_filter": "{}"}])
+        dispatcher = AgentDispatcher(graph=graph, home_path=tmp_path)
+        await dispatcher._find_matching_agents("note.created", {})
+        invalidate_trigger_index()
+        await dispatcher._find_matching_agents("note.created", {})
+        assert graph.execute_cypher.await_count == 4
+
+
+class TestDispatchPlan:
+    """Mutating agents keep their order; read-only agents run concurrently."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_index(self):
+        from parachute.core.agent_dispatch import invalidate_trigger_index
+
+        invalidate_trigger_index()
+        yield
+        invalidate_trigger_index()
+
+    async def test_plan_orders_mutations_and_parallelizes_reads(self, tmp_path, monkeypatch):
+        import asyncio
+
+        graph = _index_graph(
+            [
+                {"event": "e", "name": "a-clean", "event_filter": "{}"},
+                {"event": "e", "name": "b-read", "event_filter": "{}"},
+                {"event": "e", "name": "c-read", "event_filter": "{}"},
+                {"event": "e", "name": "d-tag", "event_filter": "{}"},
+            ],
+            [
+                {"parent": "a-clean", "child": "update-this-note"},
+                {"parent": "b-read", "child": "read-this-note"},
+                {"parent": "d-tag", "child": "update-note-tags"},
+            ],
+        )
+        dispatcher = AgentDispatcher(graph=graph, home_path=tmp_path)
+        log: list[str] = []
+        running = 0
+        peak = 0
+
+        async def fake_invoke(agent_name, entry_id, event, entry_meta, display_name=""):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            log.append(f"start:{agent_name}")
+            await asyncio.sleep(0.01)
+            log.append(f"end:{agent_name}")
+            running -= 1
+            return {"status": "completed", "agent": agent_name}
+
+        monkeypatch.setattr(dispatcher, "_invoke_agent", fake_invoke)
+        results = await dispatcher.dispatch("e", "entry-1", {})
+
+        assert [r["agent"] for r in results] == ["a-clean", "b-read", "c-read", "d-tag"]
+        # Readers wait for the earlier mutation, then run together
+        assert log.index("end:a-clean") < log.index("start:b-read")
+        assert peak == 2
+        # The later mutation waits for everything before it
+        assert log.index("start:d-tag") > max(log.index("end:b-read"), log.index("end:c-read"))
+
+    def test_plan_dependencies(self):
+        from parachute.core.agent_dispatch import IndexedTrigger, plan_dependencies
+
+        def agent(name, mutates):
+            return IndexedTrigger(name, None, {}, lambda m: True, mutates)
+
+        deps = plan_dependencies([agent("w1", True), agent("r1", False), agent("w2", True), agent("r2", False)])
+        assert deps == [[], [0], [0, 1], [0, 2]]
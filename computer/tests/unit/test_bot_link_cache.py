@@ -0,0 +1,166 @@
+"""Tests for the write-through bot_link session cache in BrainChatStore."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from parachute.db.brain_chat_store import BrainChatStore
+from parachute.models.session import SessionCreate, SessionUpdate
+
+
+class FakeGraph:
+    """Minimal stand-in for BrainService: one Chat row per session_id."""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self.write_lock = asyncio.Lock()
+        self.reads: list[str] = []
+
+    async def _execute(self, query: str, params: dict | None = None):
+        params = params or {}
+        if query.lstrip().startswith("CREATE (:Chat"):
+            self.rows[params["session_id"]] = dict(params)
+        elif "DETACH DELETE" in query:
+            self.rows.pop(params["session_id"], None)
+        elif "SET" in query and "session_id" in params:
+            row = self.rows[params["session_id"]]
+            for key in ("archived", "title", "trust_level", "metadata_json", "last_accessed"):
+                if key in params:
+                    row[key] = params[key]
+            if "count" in params:
+                row["message_count"] = params["count"]
+
+    async def execute_cypher(self, query: str, params: dict | None = None):
+        params = params or {}
+        if "SET" in query:
+            await self._execute(query, params)
+            row = self.rows.get(params.get("session_id"))
+            return [row] if row and "RETURN s" in query else []
+        self.reads.append(query)
+        if "RETURN s.message_count" in query:
+            row = self.rows.get(params["session_id"])
+            return [{"s.message_count": row.get("message_count", 0)}] if row else []
+        if "linked_bot_platform = $platform" in query:
+            matches = [
+                r for r in self.rows.values()
+                if r.get("linked_bot_platform") == params["platform"]
+                and r.get("linked_bot_chat_id") == params["chat_id"]
+                and not r.get("archived")
+            ]
+            matches.sort(key=lambda r: r.get("last_accessed") or "", reverse=True)
+            return matches[:1]
+        if "session_id: $session_id" in query:
+            row = self.rows.get(params["session_id"])
+            return [row] if row else []
+        return []
+
+
+@pytest.fixture
+def store() -> BrainChatStore:
+    return BrainChatStore(FakeGraph())
+
+
+def _linked(session_id: str, chat_id: str = "42") -> SessionCreate:
+    return SessionCreate(
+        id=session_id,
+        title="Telegram - someone",
+        module="chat",
+        linked_bot_platform="telegram",
+        linked_bot_chat_id=chat_id,
+        linked_bot_chat_type="dm",
+        metadata={"pending_initialization": True},
+    )
+
+
+class TestBotLinkCache:
+    """Steady-state lookups don't touch the graph."""
+
+    async def test_repeat_lookups_are_served_from_cache(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        store.graph.reads.clear()
+
+        for _ in range(5):
+            session = await store.get_session_by_bot_link("telegram", "42")
+            assert session.id == "s1"
+        assert store.graph.reads == []
+        assert store.bot_link_cache_hits == 5
+
+    async def test_negative_lookup_cached_until_create(self, store: BrainChatStore):
+        assert await store.get_session_by_bot_link("telegram", "42") is None
+        assert await store.get_session_by_bot_link("telegram", "42") is None
+        assert store.bot_link_cache_misses == 1
+
+        await store.create_session(_linked("s1"))
+        assert (await store.get_session_by_bot_link("telegram", "42")).id == "s1"
+
+    async def test_update_session_writes_through(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        await store.update_session("s1", SessionUpdate(metadata={}, trust_level="direct"))
+        store.graph.reads.clear()
+
+        session = await store.get_session_by_bot_link("telegram", "42")
+        assert session.metadata == {}
+        assert session.trust_level == "direct"
+        assert store.graph.reads == []
+
+    async def test_archive_drops_session(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        await store.get_session_by_bot_link("telegram", "42")
+        await store.archive_session("s1")
+
+        assert await store.get_session_by_bot_link("telegram", "42") is None
+
+    async def test_returned_session_is_a_copy(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        session = await store.get_session_by_bot_link("telegram", "42")
+        session.metadata["pending_initialization"] = False
+
+        again = await store.get_session_by_bot_link("telegram", "42")
+        assert again.metadata["pending_initialization"] is True
+
+    async def test_pairing_resolution_invalidates(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        request = MagicMock(platform="telegram", platform_chat_id="42")
+        store.get_pairing_request = AsyncMock(return_value=request)
+        store.graph.rows["s1"]["title"] = "changed behind the cache"
+
+        await store.resolve_pairing_request("r1", approved=True, trust_level="sandboxed")
+        session = await store.get_session_by_bot_link("telegram", "42")
+        assert session.title == "changed behind the cache"
+
+    async def test_message_count_and_touch_write_through(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        await store.get_session_by_bot_link("telegram", "42")
+        await store.increment_message_count("s1", 2)
+        store.graph.reads.clear()
+
+        session = await store.get_session_by_bot_link("telegram", "42")
+        assert session.message_count == 2
+        assert session.last_accessed.isoformat() == store.graph.rows["s1"]["last_accessed"]
+        assert store.graph.reads == []
+
+    async def test_touch_switches_to_most_recent_linked_session(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        await store.create_session(_linked("s2"))
+        store.graph.rows["s1"]["last_accessed"] = store.graph.rows["s2"]["last_accessed"] = "2000-01-01"
+        await store.touch_session("s1")
+
+        assert (await store.get_session_by_bot_link("telegram", "42")).id == "s1"
+
+    async def test_raw_write_clears_cache(self, store: BrainChatStore):
+        await store.create_session(_linked("s1"))
+        await store.get_session_by_bot_link("telegram", "42")
+        store.graph.rows["s1"]["title"] = "changed by /brain/execute"
+        store.clear_bot_link_cache()
+
+        session = await store.get_session_by_bot_link("telegram", "42")
+        assert session.title == "changed by /brain/execute"
+
+    async def test_cache_is_bounded(self, store: BrainChatStore, monkeypatch):
+        monkeypatch.setattr(BrainChatStore, "BOT_LINK_CACHE_SIZE", 3)
+        for i in range(5):
+            await store.get_session_by_bot_link("telegram", str(i))
+        assert list(store._bot_link_cache) == [
+            ("telegram", "2"), ("telegram", "3"), ("telegram", "4"),
+        ]
@@ -0,0 +1,59 @@
+"""Tests for raw Cypher writes through POST /api/brain/execute."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import brain
+from parachute.core import interfaces
+from parachute.db.brain_chat_store import BrainChatStore
+
+
+class FakeGraph:
+    """Accepts any query and returns no rows."""
+
+    def __init__(self):
+        self.write_lock = asyncio.Lock()
+        self.queries: list[str] = []
+
+    async def execute_cypher(self, query: str, params: dict | None = None):
+        self.queries.append(query)
+        return []
+
+
+@pytest.fixture
+def store(monkeypatch):
+    registry = interfaces.InterfaceRegistry()
+    monkeypatch.setattr(interfaces, "_registry", registry)
+    graph = FakeGraph()
+    store = BrainChatStore(graph)
+    registry.publish("BrainDB", graph)
+    registry.publish("ChatStore", store)
+    return store
+
+
+@pytest.fixture
+def client(store):
+    app = FastAPI()
+    app.include_router(brain.router, prefix="/api")
+    return TestClient(app)
+
+
+class TestExecute:
+    """Every raw write invalidates session-list ETags and bot-link lookups."""
+
+    @pytest.mark.parametrize("query", [
+        "MATCH (s:Chat {session_id: 'a'}) SET s.title = 'x'",
+        "MATCH (s: Chat) SET s.archived = true",
+        "MATCH (s:`Chat`) DETACH DELETE s",
+        "MATCH (n {session_id: $id}) SET n.title = $title",
+    ])
+    def test_write_invalidates_session_caches(self, client, store, query):
+        before = store.sessions_version
+        store._bot_link_cache[("telegram", "42")] = None
+        resp = client.post("/api/brain/execute", json={"query": query, "params": {"id": "a", "title": "x"}})
+        assert resp.status_code == 200
+        assert store.sessions_version != before
+        assert not store._bot_link_cache
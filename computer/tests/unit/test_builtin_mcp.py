@@ -0,0 +1,108 @@
+"""Tests for the in-process built-in parachute MCP server."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+import parachute.core.builtin_mcp as builtin_mcp
+import parachute.mcp_server as mcp_server
+from parachute.core import interfaces
+from parachute.mcp_server import SessionContext
+
+CONTEXT = SessionContext(session_id="sess_0123456789abcdef", trust_level="direct")
+STDIO_CONFIG = {"command": "python", "args": ["-m", "parachute.mcp_server"], "_builtin": True}
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = interfaces.InterfaceRegistry()
+    monkeypatch.setattr(interfaces, "_registry", registry)
+    # mcp_server module state is process-wide; restore it after each test
+    monkeypatch.setattr(mcp_server, "_client", None)
+    monkeypatch.setattr(mcp_server, "_brain_base_url", "")
+    monkeypatch.setattr(mcp_server, "_api_base_url", "")
+    monkeypatch.setattr(builtin_mcp, "_bound_app", None)
+    return registry
+
+
+@pytest.fixture
+def app(registry):
+    app = FastAPI()
+
+    @app.get("/api/chat/tags")
+    async def tags():
+        return {"tags": ["work", "ideas"]}
+
+    registry.publish("ASGIApp", app)
+    return app
+
+
+async def _call(config: dict, name: str, arguments: dict) -> dict:
+    """Round-trip a tool call through the SDK server instance."""
+    handler = config["instance"].request_handlers[CallToolRequest]
+    result = await handler(CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    ))
+    return json.loads(result.root.content[0].text)
+
+
+class TestBuiltinServer:
+    """Same tool set as the stdio server, served in-process."""
+
+    async def test_exposes_stdio_tool_set(self, registry):
+        config = builtin_mcp.create_builtin_mcp_server(CONTEXT)
+        handler = config["instance"].request_handlers[ListToolsRequest]
+        result = await handler(ListToolsRequest(method="tools/list"))
+        assert config["name"] == "parachute"
+        assert {t.name for t in result.root.tools} == {t.name for t in mcp_server.TOOLS}
+
+    async def test_vault_tools_call_graph_directly(self, registry, monkeypatch):
+        graph = object()
+        registry.publish("BrainDB", graph)
+        calls = []
+
+        async def fake_call_vault_tool(g, name, arguments):
+            calls.append((g, name, arguments))
+            return {"results": [], "count": 0}
+
+        monkeypatch.setattr(builtin_mcp, "call_vault_tool", fake_call_vault_tool)
+        config = builtin_mcp.create_builtin_mcp_server(CONTEXT)
+        result = await _call(config, "search_memory", {"query": "garden"})
+
+        assert result == {"results": [], "count": 0}
+        assert calls == [(graph, "search_memory", {"query": "garden"})]
+        assert mcp_server._client is None  # no HTTP involved
+
+    async def test_api_tools_run_against_app_in_process(self, app):
+        config = builtin_mcp.create_builtin_mcp_server(CONTEXT)
+        assert await _call(config, "list_tags", {}) == {"tags": ["work", "ideas"]}
+        assert mcp_server.http_stats()["transport"] == "asgi"
+
+    async def test_trust_checks_use_session_context(self, app):
+        sandboxed = SessionContext(session_id=CONTEXT.session_id, trust_level="sandboxed")
+        config = builtin_mcp.create_builtin_mcp_server(sandboxed)
+        result = await _call(config, "brain_query", {"query": "MATCH (n) RETURN n"})
+        assert "requires" in result["error"]
+
+
+class TestWithInProcessBuiltin:
+    """Only the built-in stdio entry is replaced, and only when hostable."""
+
+    def test_replaces_builtin_when_available(self, app, registry):
+        registry.publish("BrainDB", object())
+        servers = {"parachute": STDIO_CONFIG, "github": {"command": "gh-mcp"}}
+        result = builtin_mcp.with_in_process_builtin(servers, CONTEXT)
+        assert result["parachute"]["type"] == "sdk"
+        assert result["github"] == {"command": "gh-mcp"}
+        assert servers["parachute"] is STDIO_CONFIG
+
+    def test_keeps_stdio_without_brain(self, app):
+        servers = {"parachute": STDIO_CONFIG}
+        assert builtin_mcp.with_in_process_builtin(servers, CONTEXT) is servers
+
+    def test_keeps_user_override(self, app, registry):
+        registry.publish("BrainDB", object())
+        servers = {"parachute": {"command": "my-parachute"}}
+        assert builtin_mcp.with_in_process_builtin(servers, CONTEXT) is servers
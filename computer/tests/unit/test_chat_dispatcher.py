@@ -0,0 +1,306 @@
+"""Tests for per-chat message coalescing and the global turn scheduler."""
+
+import asyncio
+import datetime
+import types
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from parachute.connectors.base import ChatDispatcher, ChatGate, TurnScheduler
+
+
+class Recorder:
+    """Collects turns; each turn blocks until released."""
+
+    def __init__(self):
+        self.turns: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.running = 0
+        self.max_running = 0
+
+    def run(self, tag: str = ""):
+        async def _run(message: str) -> None:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.turns.append(tag + message)
+            await self.release.wait()
+            self.running -= 1
+
+        return _run
+
+
+class TestChatDispatcher:
+    """Coalescing and injection."""
+
+    async def test_burst_within_window_is_one_turn(self):
+        rec = Recorder()
+        dispatcher = ChatDispatcher("test", coalesce_window=0.05, scheduler=TurnScheduler(4))
+
+        await asyncio.gather(*(
+            dispatcher.submit("c1", f"line {i}", rec.run()) for i in range(3)
+        ))
+
+        assert rec.turns == ["line 0\n\nline 1\n\nline 2"]
+        stats = dispatcher.stats()
+        assert stats["turns"] == 1 and stats["coalesced_messages"] == 2
+        assert stats["queued_messages"] == 0
+
+    async def test_messages_during_turn_run_as_next_turn(self):
+        rec = Recorder()
+        rec.release.clear()
+        dispatcher = ChatDispatcher("test", coalesce_window=0, scheduler=TurnScheduler(4))
+
+        first = asyncio.create_task(dispatcher.submit("c1", "a", rec.run()))
+        await asyncio.sleep(0.01)
+        rest = [asyncio.create_task(dispatcher.submit("c1", t, rec.run())) for t in ("b", "c")]
+        await asyncio.sleep(0.01)
+        assert dispatcher.stats()["queued_messages"] == 2
+
+        rec.release.set()
+        await asyncio.gather(first, *rest)
+        assert rec.turns == ["a", "b\n\nc"]
+
+    async def test_inject_into_active_turn(self):
+        rec = Recorder()
+        rec.release.clear()
+        injected = []
+
+        def inject(session_id: str, text: str) -> bool:
+            injected.append((session_id, text))
+            return True
+
+        dispatcher = ChatDispatcher("test", coalesce_window=0, inject=inject, scheduler=TurnScheduler(4))
+        first = asyncio.create_task(dispatcher.submit("c1", "a", rec.run(), session_id="s1"))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(dispatcher.submit("c1", "b", rec.run(), session_id="s1"))
+        await asyncio.sleep(0.01)
+        # Injected caller waits for the in-flight turn to finish
+        assert not second.done()
+
+        rec.release.set()
+        await asyncio.gather(first, second)
+        assert injected == [("s1", "b")]
+        assert rec.turns == ["a"]
+
+    async def test_combined_turn_uses_first_context_and_last_run(self):
+        rec = Recorder()
+        dispatcher = ChatDispatcher("test", coalesce_window=0.05, scheduler=TurnScheduler(4))
+
+        await asyncio.gather(
+            dispatcher.submit("g", "one", rec.run("first:"), context="<history/>"),
+            dispatcher.submit("g", "two", rec.run("last:"), context="<history>one</history>"),
+        )
+
+        assert rec.turns == ["last:<history/>\n\none\n\ntwo"]
+
+    async def test_turn_error_propagates_to_callers(self):
+        async def boom(message: str) -> None:
+            raise RuntimeError("nope")
+
+        dispatcher = ChatDispatcher("test", coalesce_window=0, scheduler=TurnScheduler(4))
+        results = await asyncio.gather(dispatcher.submit("c1", "x", boom), return_exceptions=True)
+        assert isinstance(results[0], RuntimeError)
+
+
+class TestTurnScheduler:
+    """Global cap with FIFO fairness."""
+
+    async def test_caps_concurrency_across_chats(self):
+        rec = Recorder()
+        rec.release.clear()
+        dispatcher = ChatDispatcher("test", coalesce_window=0, scheduler=TurnScheduler(2))
+
+        tasks = [asyncio.create_task(dispatcher.submit(f"c{i}", "hi", rec.run())) for i in range(5)]
+        await asyncio.sleep(0.01)
+        stats = dispatcher.stats()
+        assert stats["global_active_turns"] == 2
+        assert stats["global_waiting_chats"] == 3
+
+        rec.release.set()
+        await asyncio.gather(*tasks)
+        assert rec.max_running == 2
+        assert len(rec.turns) == 5
+
+    async def test_busy_chat_yields_to_waiting_chats(self):
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        def run(tag: str):
+            async def _run(message: str) -> None:
+                order.append(tag)
+                await gate.wait()
+
+            return _run
+
+        dispatcher = ChatDispatcher("test", coalesce_window=0, scheduler=TurnScheduler(1))
+        tasks = [asyncio.create_task(dispatcher.submit("busy", "1", run("busy")))]
+        await asyncio.sleep(0.01)
+        tasks.append(asyncio.create_task(dispatcher.submit("quiet", "q", run("quiet"))))
+        await asyncio.sleep(0.01)
+        tasks.append(asyncio.create_task(dispatcher.submit("busy", "2", run("busy"))))
+        await asyncio.sleep(0.01)
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert order == ["busy", "quiet", "busy"]
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        scheduler = TurnScheduler(1)
+        await scheduler.acquire()
+        waiter = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        scheduler.release()
+        assert scheduler.active == 0
+        await asyncio.wait_for(scheduler.acquire(), 0.1)
+
+
+class TestChatGate:
+    """Commands wait for a chat's in-flight message handlers, and vice versa."""
+
+    async def test_command_waits_for_messages_and_blocks_new_ones(self):
+        gate = ChatGate()
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def message(tag: str, wait: bool = False):
+            async with gate.message("c1"):
+                order.append(f"{tag} start")
+                if wait:
+                    await release.wait()
+                order.append(f"{tag} end")
+
+        async def command():
+            async with gate.command("c1"):
+                order.append("command")
+
+        first = asyncio.create_task(message("m1", wait=True))
+        await asyncio.sleep(0)
+        cmd = asyncio.create_task(command())
+        await asyncio.sleep(0)
+        later = asyncio.create_task(message("m2"))
+        other_chat = gate.message("c2")
+        async with other_chat:  # other chats are unaffected
+            pass
+        await asyncio.sleep(0)
+        assert order == ["m1 start"]
+
+        release.set()
+        await asyncio.gather(first, cmd, later)
+        assert order == ["m1 start", "m1 end", "command", "m2 start", "m2 end"]
+        assert gate._chats == {}
+
+
+class TestConnectorDispatch:
+    """Platform event loops hand messages off without waiting for the turn."""
+
+    async def test_telegram_burst_coalesces(self):
+        telegram = pytest.importorskip("telegram")
+        from telegram.ext import ExtBot
+
+        from parachute.connectors.telegram import TelegramConnector
+
+        connector = TelegramConnector("123:abc", server=None, allowed_users=[5], ack_emoji=None)
+        connector.dispatcher = ChatDispatcher("telegram", coalesce_window=0.1, scheduler=TurnScheduler(4))
+        connector.get_or_create_session = AsyncMock(return_value=types.SimpleNamespace(id="s1", metadata={}))
+        turns: list[str] = []
+        done = asyncio.Event()
+
+        async def stream(session_id, message, update, placeholder):
+            turns.append(message)
+            done.set()
+
+        connector._stream_to_chat = stream
+        app = connector._build_app()
+        chat = telegram.Chat(1, "private")
+        user = telegram.User(5, "Someone", False)
+
+        with patch.object(ExtBot, "initialize", AsyncMock()), \
+                patch.object(ExtBot, "shutdown", AsyncMock()), \
+                patch.object(telegram.Message, "reply_text", AsyncMock()), \
+                patch("telegram.Bot.bot", new_callable=PropertyMock, return_value=telegram.User(1, "bot", True)):
+            async with app:
+                await app.start()
+                for i, text in enumerate(["first", "second"], start=1):
+                    message = telegram.Message(i, datetime.datetime.now(), chat, from_user=user, text=text)
+                    await app.update_queue.put(telegram.Update(i, message=message))
+                await asyncio.wait_for(done.wait(), 2)
+                await app.stop()
+
+        assert turns == ["first\n\nsecond"]
+
+    async def test_telegram_command_waits_for_inflight_message(self):
+        telegram = pytest.importorskip("telegram")
+        from telegram.ext import ExtBot
+
+        from parachute.connectors.telegram import TelegramConnector
+
+        connector = TelegramConnector("123:abc", server=None, allowed_users=[5], ack_emoji=None)
+        connector.dispatcher = ChatDispatcher("telegram", coalesce_window=0, scheduler=TurnScheduler(4))
+        connector.get_or_create_session = AsyncMock(return_value=types.SimpleNamespace(id="s1", metadata={}))
+        order: list[str] = []
+        turn_started, release, command_done = asyncio.Event(), asyncio.Event(), asyncio.Event()
+
+        async def stream(session_id, message, update, placeholder):
+            order.append("turn start")
+            turn_started.set()
+            await release.wait()
+            order.append("turn end")
+
+        async def dispatch_command(command, chat_id, user_id, args):
+            order.append(command)
+            command_done.set()
+            return "ok"
+
+        connector._stream_to_chat = stream
+        connector.dispatch_command = dispatch_command
+        app = connector._build_app()
+        chat = telegram.Chat(1, "private")
+        user = telegram.User(5, "Someone", False)
+        new = telegram.Message(
+            2, datetime.datetime.now(), chat, from_user=user, text="/new",
+            entities=[telegram.MessageEntity(telegram.MessageEntity.BOT_COMMAND, 0, 4)],
+        )
+
+        with patch.object(ExtBot, "initialize", AsyncMock()), \
+                patch.object(ExtBot, "shutdown", AsyncMock()), \
+                patch.object(telegram.Message, "reply_text", AsyncMock()), \
+                patch("telegram.Bot.bot", new_callable=PropertyMock, return_value=telegram.User(1, "bot", True, username="parachute_bot")):
+            async with app:
+                await app.start()
+                message = telegram.Message(1, datetime.datetime.now(), chat, from_user=user, text="hi")
+                await app.update_queue.put(telegram.Update(1, message=message))
+                await asyncio.wait_for(turn_started.wait(), 2)
+                new.set_bot(app.bot)  # CommandHandler checks the bot's username
+                await app.update_queue.put(telegram.Update(2, message=new))
+                await asyncio.sleep(0.05)
+                assert order == ["turn start"]
+                release.set()
+                await asyncio.wait_for(command_done.wait(), 2)
+                await app.stop()
+
+        assert order == ["turn start", "turn end", "new"]
+
+    async def test_matrix_callback_does_not_block_sync(self):
+        from parachute.connectors.matrix_bot import MatrixConnector
+
+        connector = MatrixConnector("https://m.example", "@bot:m.example", "tok", "DEV", None, [], [])
+        connector.dispatcher = ChatDispatcher("matrix", coalesce_window=0.05, scheduler=TurnScheduler(4))
+        connector._initial_sync_done = True
+        rec = Recorder()
+
+        async def on_text_message(update, context):
+            event = update["event"]
+            await connector.dispatcher.submit("!room", event.body, rec.run())
+
+        connector.on_text_message = on_text_message
+        room = types.SimpleNamespace(room_id="!room")
+        for body in ("first", "second"):
+            # nio awaits each callback before dispatching the next event
+            await connector._on_message(room, types.SimpleNamespace(sender="@u:m.example", body=body))
+        await asyncio.gather(*connector._handler_tasks)
+
+        assert rec.turns == ["first\n\nsecond"]
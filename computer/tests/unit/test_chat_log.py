@@ -0,0 +1,123 @@
+"""Tests for the append-only chat log writer."""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from parachute.core.chat_log import ChatLogEntry, ChatLogService
+
+
+def _entry(para_id: str, content: str, session_id: str | None = None) -> ChatLogEntry:
+    return ChatLogEntry(
+        para_id=para_id,
+        timestamp=datetime.now().astimezone(),
+        title=f"Title {para_id}",
+        content=content,
+        session_id=session_id,
+    )
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> ChatLogService:
+    return ChatLogService(tmp_path, flush_delay=60)
+
+
+def _read(service: ChatLogService) -> tuple[dict, str]:
+    return service._parse_file(service.get_today_path().read_text(encoding="utf-8"))
+
+
+class TestAppend:
+    """Appends and the debounced frontmatter."""
+
+    def test_appends_entries_with_separators(self, service: ChatLogService):
+        assert service.append_entry(_entry("aaa111", "first", "s1"))
+        assert service.append_entry(_entry("bbb222", "second", "s2"))
+        service.flush()
+
+        frontmatter, body = _read(service)
+        assert list(frontmatter["entries"]) == ["aaa111", "bbb222"]
+        assert frontmatter["entries"]["bbb222"]["session"] == "s2"
+        assert body.count("\n\n---\n\n") == 1
+        assert body.endswith("second\n")
+
+    def test_frontmatter_write_is_deferred(self, service: ChatLogService):
+        service.append_entry(_entry("aaa111", "first"))
+        service.append_entry(_entry("bbb222", "second", "s2"))
+
+        frontmatter, body = _read(service)
+        assert "bbb222" not in frontmatter["entries"]
+        assert "# para:bbb222" in body
+        # The in-memory index already knows the new entry
+        assert service.get_session_para_id("s2") == "bbb222"
+
+    def test_session_recovered_from_body_after_restart(self, service: ChatLogService, tmp_path: Path):
+        service.append_entry(_entry("aaa111", "first", "s1"))
+        service.append_entry(_entry("bbb222", "second", "s2"))
+
+        fresh = ChatLogService(tmp_path, flush_delay=60)
+        assert fresh.get_session_para_id("s2") == "bbb222"
+        assert fresh.get_session_para_id("s1") == "aaa111"
+
+
+class TestEdits:
+    """Splicing edits into existing entries."""
+
+    def test_append_to_middle_entry(self, service: ChatLogService):
+        service.append_entry(_entry("aaa111", "first"))
+        service.append_entry(_entry("bbb222", "second"))
+
+        assert service.append_to_entry("aaa111", "more")
+        assert service.append_to_entry("bbb222", "tail")
+
+        assert service.get_entry_content("aaa111").endswith("first\nmore")
+        assert service.get_entry_content("bbb222").endswith("second\ntail")
+        _, body = _read(service)
+        assert body.index("more") < body.index("# para:bbb222")
+
+    def test_update_entry_round_trips_with_reindex(self, service: ChatLogService, tmp_path: Path):
+        service.append_entry(_entry("aaa111", "first"))
+        service.append_entry(_entry("bbb222", "second"))
+        service.append_entry(_entry("ccc333", "third"))
+
+        assert service.update_entry("bbb222", "rewritten\nacross lines")
+        assert service.update_entry("aaa111", "x")
+        service.flush()
+
+        fresh = ChatLogService(tmp_path)
+        assert fresh.get_entry_content("aaa111") == "x"
+        assert fresh.get_entry_content("bbb222") == "rewritten\nacross lines"
+        assert fresh.get_entry_content("ccc333") == service.get_entry_content("ccc333")
+
+    def test_external_edit_triggers_reindex(self, service: ChatLogService):
+        service.append_entry(_entry("aaa111", "first"))
+        service.flush()
+        path = service.get_today_path()
+        path.write_text(path.read_text() + "\n\n---\n\n# para:zzz999 10:00\n\nmanual\n")
+
+        assert service.get_entry_content("zzz999") == "manual"
+        assert service.update_entry("aaa111", "edited")
+        assert "manual" in path.read_text()
+
+    def test_missing_entry(self, service: ChatLogService):
+        service.append_entry(_entry("aaa111", "first"))
+        assert service.append_to_entry("nope00", "x") is False
+        assert service.update_entry("nope00", "x") is False
+
+
+def test_concurrent_appends_are_not_lost(service: ChatLogService):
+    def worker(n: int):
+        for i in range(10):
+            service.append_entry(_entry(f"t{n}i{i}", f"content {n}-{i}", f"s{n}-{i}"))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    service.flush()
+
+    frontmatter, body = _read(service)
+    assert len(frontmatter["entries"]) == 40
+    assert body.count("# para:") == 40
@@ -7,13 +7,8 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from parachute.cli import (
-    _config_get,
-    _config_set,
-    _config_show,
-    _migrate_env_to_yaml,
-    _migrate_server_yaml,
-)
+from parachute.cli.config import _config_get, _config_set, _config_show
+from parachute.cli.install import _migrate_env_to_yaml, _migrate_server_yaml
 from parachute.config import _load_yaml_config, _load_token, save_yaml_config, save_token
 
 
@@ -44,7 +39,7 @@ class TestMigrateEnvToYaml:
 
         fake_home = tmp_path / "fake_home"
         fake_home.mkdir()
-        with patch("parachute.cli._get_env_file", return_value=env_file), \
+        with patch("parachute.cli.install._get_env_file", return_value=env_file), \
              patch("parachute.config.Path") as mock_config_path:
             mock_config_path.home.return_value = fake_home
             mock_config_path.side_effect = lambda *a, **kw: Path(*a, **kw)
@@ -65,14 +60,14 @@ class TestMigrateEnvToYaml:
 
     def test_no_env_file_returns_false(self, vault, tmp_path):
         env_file = tmp_path / ".env"
-        with patch("parachute.cli._get_env_file", return_value=env_file):
+        with patch("parachute.cli.install._get_env_file", return_value=env_file):
             result = _migrate_env_to_yaml(vault)
         assert result is False
 
     def test_empty_env_returns_false(self, vault, tmp_path):
         env_file = tmp_path / ".env"
         env_file.write_text("")
-        with patch("parachute.cli._get_env_file", return_value=env_file):
+        with patch("parachute.cli.install._get_env_file", return_value=env_file):
             result = _migrate_env_to_yaml(vault)
         assert result is False
 
@@ -82,7 +77,7 @@ class TestMigrateEnvToYaml:
         env_file = tmp_path / ".env"
         env_file.write_text("PORT=4444\nHOST=0.0.0.0\n")
 
-        with patch("parachute.cli._get_env_file", return_value=env_file):
+        with patch("parachute.cli.install._get_env_file", return_value=env_file):
             _migrate_env_to_yaml(vault)
 
         config = _load_yaml_config(vault)
@@ -93,7 +88,7 @@ class TestMigrateEnvToYaml:
         env_file = tmp_path / ".env"
         env_file.write_text("PORT=5555\n")
 
-        with patch("parachute.cli._get_env_file", return_value=env_file):
+        with patch("parachute.cli.install._get_env_file", return_value=env_file):
             _migrate_env_to_yaml(vault)
 
         config = _load_yaml_config(vault)
@@ -103,7 +98,7 @@ class TestMigrateEnvToYaml:
         env_file = tmp_path / ".env"
         env_file.write_text("DEBUG=true\n")
 
-        with patch("parachute.cli._get_env_file", return_value=env_file):
+        with patch("parachute.cli.install._get_env_file", return_value=env_file):
             _migrate_env_to_yaml(vault)
 
         config = _load_yaml_config(vault)
@@ -119,7 +114,7 @@ class TestMigrateServerYaml:
 
         fake_home = tmp_path / "fake_home"
         fake_home.mkdir()
-        with patch("parachute.cli.Path") as mock_cli_path, \
+        with patch("parachute.cli.install.Path") as mock_cli_path, \
              patch("parachute.config.Path") as mock_config_path:
             mock_cli_path.home.return_value = legacy_home
             mock_cli_path.side_effect = lambda *a, **kw: Path(*a, **kw)
@@ -133,7 +128,7 @@ class TestMigrateServerYaml:
         assert config["port"] == 5555
 
     def test_no_server_yaml_returns_false(self, vault, legacy_home):
-        with patch("parachute.cli.Path") as mock_path:
+        with patch("parachute.cli.install.Path") as mock_path:
             mock_path.home.return_value = legacy_home
             mock_path.side_effect = lambda *a, **kw: Path(*a, **kw)
             result = _migrate_server_yaml(vault)
@@ -145,7 +140,7 @@ class TestMigrateServerYaml:
         server_yaml = legacy_home / "Parachute" / ".parachute" / "server.yaml"
         server_yaml.write_text(yaml.dump({"security": {"require_auth": "always"}}))
 
-        with patch("parachute.cli.Path") as mock_path:
+        with patch("parachute.cli.install.Path") as mock_path:
             mock_path.home.return_value = legacy_home
             mock_path.side_effect = lambda *a, **kw: Path(*a, **kw)
             _migrate_server_yaml(vault)
@@ -156,7 +151,7 @@ class TestMigrateServerYaml:
 
 class TestConfigSetGet:
     def test_set_and_get_port(self, vault, capsys):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             with patch.dict(os.environ, {}, clear=False):
                 # Remove PORT from env if present
                 os.environ.pop("PORT", None)
@@ -167,50 +162,50 @@ class TestConfigSetGet:
         assert "7777" in out
 
     def test_set_rejects_unknown_key(self, vault):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             with pytest.raises(SystemExit):
                 _config_set("unknown_key", "value")
 
     def test_set_saves_token(self, vault):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             _config_set("token", "sk-ant-test-token-value")
         token_file = vault / ".token"
         assert token_file.exists()
         assert token_file.read_text().strip() == "sk-ant-test-token-value"
 
     def test_set_converts_port_to_int(self, vault):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             _config_set("port", "8888")
         config = _load_yaml_config(vault)
         assert isinstance(config["port"], int)
 
     def test_set_rejects_non_numeric_port(self, vault):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             with pytest.raises(SystemExit):
                 _config_set("port", "not-a-number")
 
     def test_get_env_override(self, vault, capsys):
         save_yaml_config(vault, {"port": 3333})
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             with patch.dict(os.environ, {"PORT": "9999"}):
                 _config_get("port")
         out = capsys.readouterr().out
         assert "9999" in out
 
     def test_get_nonexistent_key(self, vault):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             with pytest.raises(SystemExit):
                 _config_get("nonexistent")
 
     def test_show_empty_config(self, vault, capsys):
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             _config_show()
         out = capsys.readouterr().out
         assert "empty" in out
 
     def test_show_with_values(self, vault, capsys):
         save_yaml_config(vault, {"port": 3333, "host": "0.0.0.0"})
-        with patch("parachute.cli._get_parachute_dir", return_value=vault):
+        with patch("parachute.cli.config._get_parachute_dir", return_value=vault):
             _config_show()
         out = capsys.readouterr().out
         assert "3333" in out
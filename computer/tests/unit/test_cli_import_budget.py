@@ -0,0 +1,83 @@
+"""Import-time budget for the CLI entry point and its lightweight commands."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from parachute.cli import _build_parser
+
+# `parachute --help`, `status` and `logs` must start without any of these
+HEAVY_MODULES = {
+    "yaml",
+    "pydantic",
+    "pydantic_settings",
+    "fastapi",
+    "claude_agent_sdk",
+    "parachute.config",
+    "parachute.core",
+}
+
+IMPORT_BUDGET_MS = 100
+
+
+def _import_profile(*modules: str) -> dict[str, int]:
+    """Import modules in a fresh interpreter; return {module: self time in µs}.
+
+    Modules loaded by interpreter startup (site, .pth finders) are excluded.
+    """
+    code = "; ".join(f"import {m}" for m in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name == "site":
+            profile.clear()  # everything so far was interpreter startup
+            continue
+        profile[name] = int(self_us)
+    return profile
+
+
+class TestImportBudget:
+    """Lightweight commands stay cheap to start."""
+
+    @pytest.mark.parametrize("command", [None, "status", "logs"])
+    def test_command_within_budget(self, command):
+        modules = ["parachute.cli"] + ([f"parachute.cli.{command}"] if command else [])
+        profile = _import_profile(*modules)
+
+        heavy = sorted(
+            name for name in profile
+            if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)
+        )
+        assert heavy == []
+        total_ms = sum(profile.values()) / 1000
+        assert total_ms < IMPORT_BUDGET_MS, f"{total_ms:.0f}ms: {sorted(profile, key=profile.get)[-5:]}"
+
+
+class TestLazyDispatch:
+    """Every subcommand resolves to a handler in its own module."""
+
+    @pytest.mark.parametrize("argv", [
+        ["install"], ["update"], ["status"], ["server"], ["logs"], ["doctor"],
+        ["config", "show"], ["module", "list"], ["module", "approve", "x"],
+        ["module", "status"], ["module", "test"], ["bot"], ["supervisor"],
+        ["setup"], ["sandbox"], ["tools"],
+    ])
+    def test_handler_resolves(self, argv):
+        args = _build_parser().parse_args(argv)
+        module_name, func_name = args.handler.split(":")
+        module = importlib.import_module(f"parachute.cli.{module_name}")
+        assert callable(getattr(module, func_name))
+
+    def test_groups_without_action_show_usage(self):
+        args = _build_parser().parse_args(["module"])
+        assert getattr(args, "handler", None) is None
+        assert args.usage.__self__.prog.endswith("module")
@@ -0,0 +1,131 @@
+"""Tests for the context-folder index (pruned scandir walk, mtime revalidation)."""
+
+import os
+import threading
+
+import pytest
+
+from parachute.core import context_folders
+from parachute.core.context_folders import ContextFolderIndex, ContextFolderService
+
+
+@pytest.fixture
+def vault(tmp_path, age_dirs):
+    (tmp_path / "AGENTS.md").write_text("root")
+    (tmp_path / "Projects" / "app").mkdir(parents=True)
+    (tmp_path / "Projects" / "app" / "CLAUDE.md").write_text("app")
+    (tmp_path / "Projects" / "app" / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "Projects" / "app" / "node_modules" / "pkg" / "AGENTS.md").write_text("no")
+    (tmp_path / ".hidden" / "deep").mkdir(parents=True)
+    (tmp_path / ".hidden" / "deep" / "AGENTS.md").write_text("no")
+    (tmp_path / "Notes").mkdir()
+    (tmp_path / "Notes" / "AGENTS.md").write_text("notes")
+    (tmp_path / "Notes" / "CLAUDE.md").write_text("notes")
+    age_dirs(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    """Record every directory os.scandir lists."""
+    paths = []
+    real = os.scandir
+
+    def recording(path):
+        paths.append(os.fspath(path))
+        return real(path)
+
+    monkeypatch.setattr(context_folders.os, "scandir", recording)
+    return paths
+
+
+class TestContextFolderIndex:
+    """Discovery matches the old rglob walk without entering skipped dirs."""
+
+    def test_discovers_and_prunes(self, vault, scanned):
+        folders = ContextFolderIndex(vault).folders()
+        assert [(f.path, f.context_file) for f in folders] == [
+            ("", "AGENTS.md"),
+            ("Notes", "AGENTS.md"),
+            ("Projects/app", "CLAUDE.md"),
+        ]
+        assert folders[1].has_agents_md and folders[1].has_claude_md
+        assert not any("node_modules" in p or ".hidden" in p for p in scanned)
+
+    def test_unchanged_dirs_are_not_relisted(self, vault, scanned):
+        index = ContextFolderIndex(vault, ttl=0)
+        index.folders()
+        scanned.clear()
+
+        index.folders()
+        assert scanned == []
+        assert index.last_refresh["scanned"] == 0
+
+        (vault / "Notes" / "Daily").mkdir()
+        (vault / "Notes" / "Daily" / "AGENTS.md").write_text("daily")
+        assert "Notes/Daily" in [f.path for f in index.folders()]
+        assert sorted(os.path.relpath(p, vault) for p in scanned) == ["Notes", "Notes/Daily"]
+
+    def test_recent_mtime_is_not_trusted(self, tmp_path, scanned):
+        (tmp_path / "a").mkdir()
+        index = ContextFolderIndex(tmp_path, ttl=0)
+        assert index.folders() == []
+        # Created within the same mtime tick as the first listing
+        (tmp_path / "a" / "AGENTS.md").write_text("x")
+        assert [f.path for f in index.folders()] == ["a"]
+
+    def test_ttl_answers_from_memory(self, vault, scanned):
+        index = ContextFolderIndex(vault, ttl=60)
+        index.folders()
+        (vault / "Notes" / "AGENTS.md").unlink()
+        scanned.clear()
+        assert "Notes" in [f.path for f in index.folders()]
+        assert scanned == []
+
+        index.invalidate()
+        assert [f.context_file for f in index.folders() if f.path == "Notes"] == ["CLAUDE.md"]
+
+    def test_context_file_lookup(self, vault, scanned):
+        index = ContextFolderIndex(vault)
+        index.folders()
+        scanned.clear()
+        assert index.context_file("Projects/app") == "CLAUDE.md"
+        assert index.context_file("missing") is None
+        assert scanned == []
+
+    def test_lookup_does_not_wait_for_refresh(self, vault, monkeypatch):
+        index = ContextFolderIndex(vault)
+        index.folders()
+        entered, release = threading.Event(), threading.Event()
+        real = context_folders._scan_dir
+
+        def slow_scan(path, mtime_ns, descend):
+            entered.set()
+            release.wait(5)
+            return real(path, mtime_ns, descend)
+
+        (vault / "Notes" / "Daily").mkdir()  # forces a rescan of Notes
+        monkeypatch.setattr(context_folders, "_scan_dir", slow_scan)
+        index.invalidate()
+        walker = threading.Thread(target=index.folders)
+        walker.start()
+        try:
+            assert entered.wait(5)
+            assert index.context_file("Projects/app") == "CLAUDE.md"
+            assert walker.is_alive()
+        finally:
+            release.set()
+            walker.join()
+
+
+class TestBuildChain:
+    """build_chain resolves context files through the index."""
+
+    def test_chain_with_parents(self, vault):
+        service = ContextFolderService(vault)
+        chain = service.build_chain(["Projects/app"], include_parent_chain=True)
+        assert chain.file_paths == ["AGENTS.md", "Projects/app/CLAUDE.md"]
+        assert [f.level for f in chain.files] == ["root", "direct"]
+
+    def test_shared_service_per_root(self, vault):
+        assert context_folders.get_context_folder_service(vault) is context_folders.get_context_folder_service(vault)
@@ -17,7 +17,7 @@ import pytest_asyncio
 from parachute.db.brain import BrainService
 from parachute.db.brain_chat_store import BrainChatStore
 
-from tests.conftest import LADYBUGDB_WORKS
+from tests.conftest import LADYBUGDB_WORKS, assert_max_queries
 
 pytestmark = pytest.mark.skipif(
     not LADYBUGDB_WORKS,
@@ -181,6 +181,52 @@ class TestReadDaysChats:
         result = await tool({"date": "2026-03-25"})
         assert "graph unavailable" in result["content"][0]["text"]
 
+    @pytest.mark.asyncio
+    async def test_all_sessions_in_one_round_trip(self, graph_with_chat_data):
+        graph = graph_with_chat_data
+        await graph.execute_cypher(
+            "CREATE (s:Chat {session_id: 'test-session-2', title: 'Second session', "
+            "  module: 'chat', summary: '', archived: false})"
+        )
+        # Insert out of sequence order — output must still follow sequence
+        for mid, content, seq in [("msg-b", "second reply", 2), ("msg-a", "first question", 1)]:
+            await graph.execute_cypher(
+                "MATCH (s:Chat {session_id: 'test-session-2'}) "
+                "CREATE (s)-[:HAS_MESSAGE]->(:Message {message_id: $mid, session_id: 'test-session-2', "
+                "  role: 'human', content: $content, created_at: '2026-03-25T18:00:00+00:00', "
+                "  sequence: $seq, status: 'complete'})",
+                {"mid": mid, "content": content, "seq": seq},
+            )
+
+        tool = _make_tool("read_days_chats", graph, scope={"date": "2026-03-25"})
+        with assert_max_queries(graph, 1):
+            result = await tool({"date": "2026-03-25"})
+        text = result["content"][0]["text"]
+
+        assert "Working on daily agent" in text and "Second session" in text
+        assert text.index("first question") < text.index("second reply")
+
+
+# ---------------------------------------------------------------------------
+# Tests: discover_daily_agents
+# ---------------------------------------------------------------------------
+
+class TestDiscoverDailyAgents:
+    @pytest.mark.asyncio
+    async def test_tools_and_children_in_one_round_trip(self, graph):
+        from parachute.core.daily_agent import discover_daily_agents
+
+        store = BrainChatStore(graph)
+        await store.seed_builtin_tools()
+        await store.seed_builtin_triggers()
+        await graph.execute_cypher("MATCH (t:Trigger {type: 'schedule'}) SET t.enabled = 'true'")
+
+        with assert_max_queries(graph, 1):
+            agents = await discover_daily_agents(Path("/tmp"), graph)
+
+        by_name = {a.name: a for a in agents}
+        assert "read_days_chats" in by_name["process-day"].tools
+
 
 # ---------------------------------------------------------------------------
 # Tests: summarize_chat
@@ -188,8 +234,15 @@ class TestReadDaysChats:
 
 class TestSummarizeChat:
     @pytest.mark.asyncio
-    async def test_summarizes_session(self, graph_with_chat_data):
+    async def test_summarizes_session(self, graph_with_chat_data, monkeypatch):
         """Test that summarize_chat reads messages and calls sub-agent."""
+        from parachute.core import interfaces
+
+        registry = interfaces.InterfaceRegistry()
+        store = BrainChatStore(graph_with_chat_data)
+        registry.publish("ChatStore", store)
+        monkeypatch.setattr(interfaces, "_registry", registry)
+        version = store.sessions_version
         tool = _make_tool("summarize_chat", graph_with_chat_data, scope={"date": "2026-03-25"})
 
         mock_response = (
@@ -220,6 +273,8 @@ class TestSummarizeChat:
         )
         assert rows[0]["summary"] == "This conversation is about building daily agent tools."
         assert rows[0]["updated_at"] != ""
+        # Session-list ETags change with the summary
+        assert store.sessions_version != version
 
     @pytest.mark.asyncio
     async def test_skips_session_with_no_today_messages(self, graph_with_chat_data):
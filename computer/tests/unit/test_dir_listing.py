@@ -0,0 +1,118 @@
+"""Tests for the filesystem browser's cached, paged directory lister."""
+
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import filesystem
+from parachute.lib import dir_listing
+from parachute.lib.dir_listing import DirectoryLister
+
+
+@pytest.fixture
+def home(tmp_path, age_dirs):
+    (tmp_path / "notes.md").write_text("hello")
+    (tmp_path / ".secret").write_text("x")
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "AGENTS.md").write_text("a")
+    (project / ".git").mkdir()
+    (tmp_path / "link.md").symlink_to(tmp_path / "notes.md")
+    (tmp_path / "broken").symlink_to(tmp_path / "missing")
+    age_dirs(tmp_path)
+    return tmp_path
+
+
+def _by_name(page) -> dict:
+    return {e["name"]: e for e in page.entries}
+
+
+class TestDirectoryLister:
+    """Same entry shape as before, fewer syscalls on repeat listings."""
+
+    def test_entry_shape(self, home):
+        page = DirectoryLister().list(str(home), str(home))
+        entries = _by_name(page)
+        assert list(entries) == ["broken", "link.md", "notes.md", "project"]
+
+        assert entries["notes.md"]["size"] == 5 and entries["notes.md"]["isFile"]
+        project = entries["project"]
+        assert project["type"] == "directory" and project["relativePath"] == "project"
+        assert (project["hasAgentsMd"], project["hasClaudeMd"], project["isGitRepo"]) == (True, False, True)
+
+        link = entries["link.md"]
+        assert link["isSymlink"] and link["isFile"] and link["symlinkTarget"] == str(home / "notes.md")
+        broken = entries["broken"]
+        assert broken["type"] == "symlink" and broken["isBrokenSymlink"]
+        assert not broken["isFile"] and not broken["isDirectory"]
+
+    def test_hidden_entries(self, home):
+        page = DirectoryLister().list(str(home), str(home), include_hidden=True)
+        assert ".secret" in _by_name(page)
+
+    def test_unchanged_directory_is_not_rescanned(self, home):
+        lister = DirectoryLister()
+        lister.list(str(home), str(home))
+        (home / "notes.md").write_text("hello, world")  # no dir mtime change
+        page = lister.list(str(home), str(home))
+        assert lister.scans == 1
+        assert _by_name(page)["notes.md"]["size"] == 12  # stat data is fresh
+
+        (home / "new.md").write_text("")
+        assert "new.md" in _by_name(lister.list(str(home), str(home)))
+        assert lister.scans == 2
+
+    def test_pagination(self, tmp_path):
+        for i in range(25):
+            (tmp_path / f"f{i:02d}").write_text("")
+        lister = DirectoryLister()
+        first = lister.list(str(tmp_path), str(tmp_path), limit=10)
+        assert [e["name"] for e in first.entries][:2] == ["f00", "f01"]
+        assert (first.total, first.next_offset) == (25, 10)
+        last = lister.list(str(tmp_path), str(tmp_path), offset=20, limit=10)
+        assert len(last.entries) == 5 and last.next_offset is None
+
+    def test_markers_are_optional_and_cached(self, home, monkeypatch):
+        probes = []
+        real_exists = os.path.exists
+        monkeypatch.setattr(dir_listing.os.path, "exists", lambda p: probes.append(p) or real_exists(p))
+        lister = DirectoryLister()
+
+        lazy = _by_name(lister.list(str(home), str(home), markers=False))["project"]
+        assert lazy["hasAgentsMd"] is None and probes == []
+
+        lister.list(str(home), str(home))
+        lister.list(str(home), str(home))
+        assert len(probes) == 3  # probed once, then reused while project/ is unchanged
+
+    def test_errors(self, home):
+        lister = DirectoryLister()
+        with pytest.raises(FileNotFoundError):
+            lister.list(str(home / "nope"), str(home))
+        with pytest.raises(NotADirectoryError):
+            lister.list(str(home / "notes.md"), str(home))
+
+
+class TestListEndpoint:
+    """GET /api/ls keeps its response shape and adds paging fields."""
+
+    @pytest.fixture
+    def client(self, home, monkeypatch):
+        monkeypatch.setattr(filesystem, "get_home_path", lambda request: home)
+        monkeypatch.setattr(dir_listing, "_lister", DirectoryLister())
+        app = FastAPI()
+        app.include_router(filesystem.router, prefix="/api")
+        return TestClient(app)
+
+    def test_list_and_page(self, client):
+        body = client.get("/api/ls", params={"limit": 2}).json()
+        assert [e["name"] for e in body["entries"]] == ["broken", "link.md"]
+        assert (body["total"], body["nextOffset"]) == (4, 2)
+        project = client.get("/api/ls", params={"path": "project"}).json()
+        assert [e["relativePath"] for e in project["entries"]] == ["project/AGENTS.md"]
+
+    @pytest.mark.parametrize("path,status", [("nope", 404), ("notes.md", 400), ("../..", 403)])
+    def test_errors(self, client, path, status):
+        assert client.get("/api/ls", params={"path": path}).status_code == status
@@ -0,0 +1,146 @@
+"""Tests for compiled permission grant matching."""
+
+import fnmatch
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from parachute.core.permission_handler import DECISION_CACHE_SIZE, PermissionHandler
+from parachute.lib.glob_matcher import GlobMatcher
+from parachute.models.session import Session, SessionPermissions, SessionSource, TrustLevel
+
+
+def _reference_match(path: str, patterns: list[str]) -> bool:
+    """The original per-pattern fnmatch loop from SessionPermissions."""
+    normalized = path.lstrip("./")
+    for pattern in patterns:
+        if fnmatch.fnmatch(normalized, pattern):
+            return True
+        if "**" in pattern:
+            base = pattern.split("**")[0].rstrip("/")
+            if normalized.startswith(base):
+                return True
+    return False
+
+
+PATTERNS = [
+    "Blogs/**/*",
+    "Chat/artifacts/*",
+    "Notes/2026-0?-*.md",
+    "README.md",
+    "Projects/[ab]*/todo.txt",
+    "*.csv",
+]
+
+PATHS = [
+    "Blogs/post.md",
+    "Blogs/2026/draft.md",
+    "./Chat/artifacts/chart.png",
+    "Chat/artifacts/deep/nested.png",
+    "Chat/other.md",
+    "Notes/2026-03-01.md",
+    "Notes/2026-10-01.md",
+    "README.md",
+    "/README.md",
+    "docs/README.md",
+    "Projects/alpha/todo.txt",
+    "Projects/gamma/todo.txt",
+    "exports/data.csv",
+    "Private/diary.md",
+]
+
+
+class TestGlobMatcher:
+    """Compiled matching agrees with the fnmatch loop it replaces."""
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_matches_reference(self, path):
+        assert GlobMatcher(PATTERNS).matches(path) == _reference_match(path, PATTERNS)
+
+    def test_bare_double_star_matches_everything(self):
+        assert GlobMatcher(["**/*.md"]).matches("anything.txt")
+
+    def test_empty_matches_nothing(self):
+        assert not GlobMatcher([]).matches("Blogs/post.md")
+
+    def test_session_permissions_use_compiled_matcher(self):
+        perms = SessionPermissions(trustLevel=TrustLevel.SANDBOXED, read=PATTERNS)
+        for path in PATHS:
+            assert perms.can_read(path) == _reference_match(path, PATTERNS)
+
+    def test_thousands_of_patterns_benchmark(self):
+        patterns = [f"Projects/p{i}/**/*.md" for i in range(3000)]
+        patterns += [f"Archive/{i}/*-notes-*.txt" for i in range(2000)]
+        paths = [f"Projects/p{i}/sub/file.md" for i in range(0, 3000, 150)]
+        paths += ["Archive/1999/x-notes-y.txt", "Elsewhere/file.md"]
+
+        matcher = GlobMatcher(patterns)
+        assert [matcher.matches(p) for p in paths] == [_reference_match(p, patterns) for p in paths]
+
+        start = time.perf_counter()
+        for p in paths:
+            _reference_match(p, patterns)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for p in paths:
+            matcher.matches(p)
+        compiled_time = time.perf_counter() - start
+
+        assert compiled_time * 5 < loop_time, (compiled_time, loop_time)
+
+
+def _handler(read: list[str]) -> PermissionHandler:
+    session = Session(
+        id="sess-glob",
+        module="chat",
+        source=SessionSource.PARACHUTE,
+        created_at=datetime.now(timezone.utc),
+        last_accessed=datetime.now(timezone.utc),
+        metadata={"permissions": SessionPermissions(
+            trustLevel=TrustLevel.SANDBOXED, read=read
+        ).model_dump(by_alias=True)},
+    )
+    return PermissionHandler(session=session, home_path="/vault")
+
+
+class TestPermissionHandlerGrants:
+    """Grant matchers are rebuilt on change; decisions are LRU-cached."""
+
+    def test_add_permission_recompiles_and_clears_cache(self):
+        handler = _handler(["Blogs/**/*"])
+        assert not handler._is_granted("read", "Notes/a.md")
+
+        handler._add_permission("read", "Notes/*")
+        assert handler._is_granted("read", "Notes/a.md")
+        assert handler._is_granted("read", "Blogs/post.md")
+
+    def test_update_permissions_recompiles(self):
+        handler = _handler(["Blogs/**/*"])
+        assert handler._is_granted("read", "Blogs/post.md")
+        handler.update_permissions(SessionPermissions(trustLevel=TrustLevel.SANDBOXED, read=[]))
+        assert not handler._is_granted("read", "Blogs/post.md")
+
+    def test_decision_cache_is_bounded(self):
+        handler = _handler(["Blogs/**/*"])
+        for i in range(DECISION_CACHE_SIZE + 10):
+            handler._is_granted("read", f"Blogs/{i}.md")
+        assert len(handler._decisions) == DECISION_CACHE_SIZE
+        assert ("read", "Blogs/0.md") not in handler._decisions
+
+    async def test_read_check_uses_grants(self):
+        handler = _handler(["Blogs/**/*"])
+        decision = await handler._check_read_permission(
+            "Read", {"file_path": "Blogs/post.md"}, None, trust_mode=False
+        )
+        assert decision.behavior == "allow"
+
+    @pytest.mark.parametrize("command,reason", [
+        ("SUDO apt install x", "sudo commands are not allowed"),
+        ("echo hi > /dev/sda", "Cannot write to device files"),
+        ("chmod -R 777 /", "Cannot change permissions on root"),
+        ("ls -la", None),
+    ])
+    def test_dangerous_commands(self, command, reason):
+        assert _handler([])._is_dangerous_command(command) == reason
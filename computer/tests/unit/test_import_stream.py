@@ -0,0 +1,147 @@
+"""Tests for the streaming export importer."""
+
+import io
+import json
+import zipfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from parachute.core.import_service import ImportService, iter_json_array, open_export
+
+
+def _chatgpt_conv(i: int) -> dict:
+    return {
+        "id": f"conv-{i}",
+        "title": f"Conversation {i}",
+        "create_time": 1700000000 + i,
+        "current_node": "b",
+        "mapping": {
+            "a": {"message": {"author": {"role": "user"}, "content": {"parts": [f"hello {i}"]}}},
+            "b": {
+                "parent": "a",
+                "message": {"author": {"role": "assistant"}, "content": {"parts": ["hi"]}},
+            },
+        },
+    }
+
+
+class TestIterJsonArray:
+    """Incremental parsing of top-level arrays."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    def test_yields_elements_across_chunk_boundaries(self, chunk_size):
+        data = [{"a": 1, "s": "x" * 50}, [1, 2], "str", 12345, None, {"ü": "€"}]
+        raw = json.dumps(data, ensure_ascii=False).encode()
+        assert list(iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)) == data
+
+    def test_empty_array(self):
+        assert list(iter_json_array(io.BytesIO(b" [ ] "))) == []
+
+    def test_wrapped_object_is_single_item(self):
+        raw = json.dumps({"conversations": [{"uuid": "x"}]}).encode()
+        assert list(iter_json_array(io.BytesIO(raw))) == [{"conversations": [{"uuid": "x"}]}]
+
+    def test_utf8_bom(self):
+        raw = b"\xef\xbb\xbf" + json.dumps([{"a": 1}]).encode()
+        assert list(iter_json_array(io.BytesIO(raw), chunk_size=2)) == [{"a": 1}]
+
+    def test_truncated_array_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.BytesIO(b'[{"a": 1}, {"b"'), chunk_size=4))
+
+
+class TestOpenExport:
+    """Zip archives are read in place."""
+
+    def test_reads_conversations_member_from_zip(self, tmp_path: Path):
+        archive = tmp_path / "export.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("user.json", "{}")
+            zf.writestr("export/conversations.json", json.dumps([_chatgpt_conv(1)]))
+        with open_export(archive) as stream:
+            items = list(iter_json_array(stream))
+        assert [i["id"] for i in items] == ["conv-1"]
+
+    def test_plain_file_object(self):
+        with open_export(io.BytesIO(b"[1, 2]")) as stream:
+            assert list(iter_json_array(stream)) == [1, 2]
+
+
+@pytest.fixture
+def service(tmp_path: Path, monkeypatch):
+    store = MagicMock()
+    created: list[str] = []
+
+    async def create_sessions(sessions):
+        new = [s.id for s in sessions if s.id not in created]
+        created.extend(new)
+        return new, {}
+
+    store.create_sessions = AsyncMock(side_effect=create_sessions)
+    svc = ImportService(str(tmp_path), store, progress_dir=tmp_path / "imports")
+    svc._sdk_projects_dir = tmp_path / "projects"
+    return svc
+
+
+class TestImportStream:
+    """End-to-end streaming pipeline with a mocked store."""
+
+    async def test_imports_in_batches_and_checkpoints(self, service: ImportService, tmp_path: Path):
+        export = tmp_path / "conversations.json"
+        export.write_text(json.dumps([_chatgpt_conv(i) for i in range(7)] + [{"id": "empty"}]))
+        seen = []
+
+        result = await service.import_stream(
+            export, import_id="abc", batch_size=3, on_progress=lambda p: seen.append(p.processed)
+        )
+
+        assert result.imported_count == 7
+        assert result.skipped_count == 1
+        assert result.total_conversations == 8
+        assert service.database.create_sessions.await_count == 3
+        assert seen == [3, 6, 8]
+        assert len(list(service._get_sdk_session_dir().glob("*.jsonl"))) == 7
+        progress = service.load_progress("abc")
+        assert progress.done and progress.processed == 8
+
+    async def test_resume_skips_processed_items(self, service: ImportService, tmp_path: Path):
+        export = tmp_path / "conversations.json"
+        export.write_text(json.dumps([_chatgpt_conv(i) for i in range(5)]))
+
+        first = await service.import_stream(export, import_id="run1", batch_size=2)
+        progress = service.load_progress("run1")
+        progress.done = False
+        progress.processed = 2
+        service._save_progress(progress)
+
+        second = await service.import_stream(export, import_id="run1", batch_size=2)
+        inserted = [
+            s.id for call in service.database.create_sessions.await_args_list[-2:]
+            for s in call.args[0]
+        ]
+        assert len(inserted) == 3
+        # Stable IDs: resumed items map to the same sessions as the first run
+        assert set(inserted) <= set(first.session_ids)
+        assert second.import_id == "run1"
+
+    async def test_load_progress_rejects_path_like_ids(self, service: ImportService):
+        assert service.load_progress("../etc") is None
+
+
+class TestUploadFingerprint:
+    """Uploads are keyed by content, not filename and size."""
+
+    def test_same_size_different_content(self):
+        a = io.BytesIO(json.dumps([_chatgpt_conv(1)]).encode())
+        b = io.BytesIO(json.dumps([_chatgpt_conv(2)]).encode())
+        assert len(a.getvalue()) == len(b.getvalue())
+        assert ImportService.fingerprint_content(a) != ImportService.fingerprint_content(b)
+
+    def test_rewinds_and_is_stable(self):
+        fh = io.BytesIO(b"[]" * 1000)
+        first = ImportService.fingerprint_content(fh, chunk_size=7)
+        assert fh.tell() == 0
+        assert ImportService.fingerprint_content(fh) == first
+        assert first.isalnum()  # load_progress only accepts alphanumeric ids
@@ -0,0 +1,144 @@
+"""Tests for the durable background job queue."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from parachute.core.job_queue import JobQueue, JobQueueFull
+
+
+class Worker:
+    """Job handler that records payloads and can block or fail on demand."""
+
+    def __init__(self, failures: int = 0):
+        self.seen: list[dict] = []
+        self.failures = failures
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, payload: dict) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.gate.wait()
+            self.seen.append(payload)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("transient")
+        finally:
+            self.running -= 1
+
+
+def _queue(root: Path, **kwargs) -> JobQueue:
+    kwargs.setdefault("base_delay", 0.01)
+    return JobQueue(root, **kwargs)
+
+
+class TestJobQueue:
+    """Pools, retries, dedupe, and backpressure."""
+
+    async def test_concurrency_is_bounded_per_kind(self, tmp_path: Path):
+        queue = _queue(tmp_path)
+        worker = Worker()
+        worker.gate.clear()
+        queue.register("work", worker, concurrency=2)
+
+        for i in range(5):
+            queue.enqueue("work", f"k{i}", {"i": i})
+        await asyncio.sleep(0.01)
+        assert queue.stats()["work"]["running"] == 2
+        assert queue.stats()["work"]["pending"] == 3
+
+        worker.gate.set()
+        await queue.drain()
+        assert worker.max_running == 2
+        assert sorted(p["i"] for p in worker.seen) == [0, 1, 2, 3, 4]
+        assert list(tmp_path.glob("*.json")) == []
+
+    async def test_retries_with_backoff_then_succeeds(self, tmp_path: Path):
+        queue = _queue(tmp_path)
+        worker = Worker(failures=2)
+        queue.register("work", worker)
+
+        queue.enqueue("work", "k", {"x": 1})
+        await queue.drain()
+
+        stats = queue.stats()["work"]
+        assert len(worker.seen) == 3
+        assert stats["retried"] == 2 and stats["completed"] == 1
+        assert stats["run_ms"]["max"] is not None
+
+    async def test_exhausted_job_becomes_dead_letter(self, tmp_path: Path):
+        failed = []
+
+        async def on_failure(job, exc):
+            failed.append((job.key, str(exc)))
+
+        queue = _queue(tmp_path, max_attempts=2)
+        queue.register("work", Worker(failures=5), on_failure=on_failure)
+        queue.enqueue("work", "k", {})
+        await queue.drain()
+
+        assert failed == [("k", "transient")]
+        [path] = tmp_path.glob("*.json")
+        assert json.loads(path.read_text())["status"] == "failed"
+
+        # Dead letters are not re-run after a restart
+        fresh = _queue(tmp_path)
+        fresh.register("work", Worker())
+        assert fresh.recover() == 0
+
+    async def test_pending_duplicates_collapse(self, tmp_path: Path):
+        queue = _queue(tmp_path)
+        worker = Worker()
+        worker.gate.clear()
+        queue.register("work", worker, concurrency=1)
+
+        queue.enqueue("work", "busy", {})
+        await asyncio.sleep(0)
+        first = queue.enqueue("work", "e1:note.created", {"v": 1})
+        second = queue.enqueue("work", "e1:note.created", {"v": 2})
+        assert first.id == second.id
+
+        worker.gate.set()
+        await queue.drain()
+        assert worker.seen == [{}, {"v": 2}]
+
+    async def test_backlog_limit(self, tmp_path: Path):
+        queue = _queue(tmp_path)
+        worker = Worker()
+        worker.gate.clear()
+        queue.register("work", worker, concurrency=1, max_pending=2)
+
+        queue.enqueue("work", "a", {})
+        queue.enqueue("work", "b", {})
+        assert not queue.has_capacity("work")
+        with pytest.raises(JobQueueFull):
+            queue.enqueue("work", "c", {})
+
+        worker.gate.set()
+        await queue.drain()
+
+
+async def test_jobs_survive_restart(tmp_path: Path):
+    stuck = Worker()
+    stuck.gate.clear()
+    before = _queue(tmp_path)
+    before.register("work", stuck, concurrency=1)
+    before.enqueue("work", "a", {"n": "a"})
+    before.enqueue("work", "b", {"n": "b"})
+    await asyncio.sleep(0.01)  # "a" is running, "b" waiting — then the process dies
+
+    after = _queue(tmp_path)
+    worker = Worker()
+    after.register("work", worker, concurrency=2)
+    assert after.recover() == 2
+    await after.drain()
+
+    assert sorted(p["n"] for p in worker.seen) == ["a", "b"]
+    assert list(tmp_path.glob("*.json")) == []
+    stuck.gate.set()
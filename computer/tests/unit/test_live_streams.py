@@ -0,0 +1,212 @@
+"""Tests for resumable live chat streams."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import chat
+from parachute.core.live_streams import LAG_DISCONNECT, LiveStream, LiveStreamHub
+
+
+async def _events(count: int, gate: asyncio.Event | None = None, session_id: str = "s1"):
+    yield {"type": "session", "sessionId": session_id}
+    for i in range(count):
+        if gate is not None and i == count // 2:
+            await gate.wait()
+        yield {"type": "text", "content": f"chunk {i}"}
+    yield {"type": "done", "sessionId": session_id}
+
+
+async def _collect(stream: LiveStream, after_id: int = 0) -> list:
+    return [item async for item in stream.subscribe(after_id)]
+
+
+async def _collect_lagged(stream: LiveStream, **kwargs) -> list:
+    return [item async for item in stream.subscribe(0, **kwargs)]
+
+
+class TestLiveStream:
+    """Buffered replay, gaps, and shared runs."""
+
+    async def test_replay_after_last_event_id(self):
+        hub = LiveStreamHub()
+        stream = hub.start(_events(5))
+        await stream._task
+        base = stream.first_id - 1
+
+        items = await _collect(stream, after_id=base + 3)
+        assert [i.id - base for i in items] == [4, 5, 6, 7]
+        assert items[-1].event["type"] == "done"
+        assert json.loads(items[0].data) == items[0].event
+
+    async def test_gap_when_events_were_evicted(self):
+        stream = LiveStream(max_events=4)
+        for i in range(10):
+            stream.publish({"type": "text", "content": str(i)})
+        stream.finish()
+
+        items = await _collect(stream, after_id=2)
+        assert items[0].event == {"type": "stream_gap", "missed": 4}
+        assert [i.id for i in items[1:]] == [7, 8, 9, 10]
+
+    async def test_byte_bound_evicts(self):
+        stream = LiveStream(max_bytes=200)
+        for i in range(20):
+            stream.publish({"type": "text", "content": "x" * 50})
+        assert stream._bytes <= 200
+        assert stream.first_id > 1
+
+    async def test_stale_cursor_from_earlier_run_replays_all(self):
+        stream = LiveStream()
+        stream.publish({"type": "session", "sessionId": "s1"})
+        stream.finish()
+        assert [i.id for i in await _collect(stream, after_id=99)] == [1]
+
+    async def test_subscribers_share_one_run_and_run_outlives_them(self):
+        gate = asyncio.Event()
+        hub = LiveStreamHub()
+        stream = hub.start(_events(6, gate))
+
+        # First subscriber drops mid-turn
+        first = stream.subscribe()
+        seen = [await first.__anext__() for _ in range(2)]
+        await first.aclose()
+        assert stream.subscribers == 0
+
+        late = asyncio.create_task(_collect(stream, after_id=seen[-1].id))
+        watcher = asyncio.create_task(_collect(stream))
+        await asyncio.sleep(0)
+        gate.set()
+
+        late_items, all_items = await asyncio.gather(late, watcher)
+        base = stream.first_id - 1
+        assert [i.id - base for i in all_items] == list(range(1, 9))
+        assert [i.id - base for i in late_items] == list(range(3, 9))
+        assert hub.get("s1") is stream
+
+    async def test_cursor_from_previous_turn_replays_new_turn(self):
+        hub = LiveStreamHub()
+        first = hub.start(_events(8), session_id="s1")
+        await first._task
+        second = hub.start(_events(8), session_id="s1")
+        await second._task
+
+        assert second.first_id > first.last_id
+        items = await _collect(hub.get("s1"), after_id=first.last_id - 5)
+        assert [i.id for i in items] == list(range(second.first_id, second.last_id + 1))
+        assert items[0].event["type"] == "session"
+
+    async def test_registers_new_session_and_lingers(self):
+        hub = LiveStreamHub(linger_seconds=0.01)
+        stream = hub.start(_events(1, session_id="new-id"))
+        await stream._task
+        assert hub.get("new-id") is stream
+        await asyncio.sleep(0.05)
+        assert hub.get("new-id") is None
+
+    async def test_source_error_becomes_typed_error_event(self):
+        async def failing():
+            yield {"type": "session", "sessionId": "s1"}
+            raise RuntimeError("boom")
+
+        stream = LiveStreamHub().start(failing())
+        await stream._task
+        items = await _collect(stream)
+        assert items[-1].event["type"] == "typed_error"
+        assert stream.done
+
+
+def _publish_turn(stream: LiveStream) -> None:
+    text = ""
+    for i in range(10):
+        text += f"w{i} "
+        stream.publish({"type": "text", "content": text})
+    stream.publish({"type": "tool_use", "tool": {"id": "t1"}})
+    for content in ["After", "After tool"]:
+        stream.publish({"type": "text", "content": content})
+
+
+class TestSlowConsumers:
+    """Subscribers trailing the head by more than max_lag."""
+
+    async def test_snapshot_drops_superseded_text(self):
+        stream = LiveStream()
+        _publish_turn(stream)
+        stream.finish()
+
+        items = await _collect_lagged(stream, max_lag=5)
+        assert [i.event.get("content") for i in items] == [
+            "w0 w1 w2 w3 w4 w5 w6 w7 w8 w9 ", None, "After tool",
+        ]
+        assert [i.id for i in items] == [10, 11, 13]
+
+    async def test_within_lag_gets_every_event(self):
+        stream = LiveStream()
+        _publish_turn(stream)
+        stream.finish()
+        assert len(await _collect_lagged(stream, max_lag=100)) == 13
+
+    async def test_disconnect_policy(self):
+        stream = LiveStream()
+        _publish_turn(stream)
+
+        items = await _collect_lagged(stream, max_lag=5, on_lag=LAG_DISCONNECT)
+        assert items == [items[0]]
+        assert items[0].event == {"type": "stream_lagged", "behind": 13}
+        assert stream.subscribers == 0
+
+    async def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            await _collect_lagged(LiveStream(), max_lag=5, on_lag="queue")
+
+
+class FakeOrchestrator:
+    def __init__(self):
+        self.runs = 0
+
+    def run_streaming(self, **kwargs):
+        self.runs += 1
+        return _events(3)
+
+
+def _frames(body: str) -> list[tuple[int, dict]]:
+    frames = []
+    for block in body.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "data" in lines and "id" in lines:
+            frames.append((int(lines["id"]), json.loads(lines["data"])))
+    return frames
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api")
+    app.state.orchestrator = FakeOrchestrator()
+    return TestClient(app)
+
+
+class TestAttachEndpoint:
+    """GET /api/chat/{session_id}/stream replays and follows a turn."""
+
+    def test_attach_replays_from_last_event_id(self, client):
+        posted = _frames(client.post("/api/chat", json={"message": "hi"}).text)
+        base = posted[0][0] - 1
+        assert [i - base for i, _ in posted] == [1, 2, 3, 4, 5]
+
+        resumed = _frames(client.get(f"/api/chat/s1/stream?last_event_id={base + 2}").text)
+        assert resumed == posted[2:]
+
+        by_header = client.get("/api/chat/s1/stream", headers={"Last-Event-ID": str(base + 4)})
+        assert _frames(by_header.text) == posted[4:]
+        assert client.app.state.orchestrator.runs == 1
+
+    def test_unknown_session_is_404(self, client):
+        assert client.get("/api/chat/nope/stream").status_code == 404
+
+    def test_unknown_lag_policy_is_400(self, client):
+        client.post("/api/chat", json={"message": "hi"})
+        assert client.get("/api/chat/s1/stream?on_lag=buffer").status_code == 400
@@ -0,0 +1,167 @@
+"""Tests for supervisor log tailing: filtering, follow mode, rotation, backpressure."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from parachute import supervisor
+from parachute.lib.log_tail import LogFilter, LogParser, follow_log
+
+
+def _record(logger: str, level: str, message: str) -> str:
+    return f"2026-10-18 12:00:00,123 - {logger} - {level} - {message}\n"
+
+
+TRACEBACK = (
+    _record("parachute.core.orchestrator", "ERROR", "Run failed")
+    + "Traceback (most recent call last):\n"
+    + "RuntimeError: boom\n"
+)
+
+
+def _match(log_filter: LogFilter, text: str) -> list[str]:
+    parser = LogParser()
+    return [
+        line.text for line in map(parser.parse, text.splitlines())
+        if log_filter.matches(line)
+    ]
+
+
+class TestLogFilter:
+    """Level, logger and regex filters; continuation lines follow their record."""
+
+    def test_min_level_keeps_traceback_lines(self):
+        text = _record("parachute.api", "INFO", "hello") + TRACEBACK
+        assert _match(LogFilter.build(level="warning"), text) == TRACEBACK.splitlines()
+
+    def test_logger_matches_children_only(self):
+        text = (
+            _record("parachute.core.orchestrator", "INFO", "a")
+            + _record("parachute.core_extra", "INFO", "b")
+            + _record("parachute.core", "INFO", "c")
+        )
+        assert [t[-1] for t in _match(LogFilter.build(logger="parachute.core"), text)] == ["a", "c"]
+
+    def test_uvicorn_lines(self):
+        line = LogParser().parse("ERROR:    Exception in ASGI application")
+        assert (line.level, line.logger) == ("ERROR", "uvicorn")
+
+    def test_pattern(self):
+        text = _record("x", "INFO", "session abc started") + _record("x", "INFO", "other")
+        assert len(_match(LogFilter.build(pattern=r"session \w+"), text)) == 1
+
+    @pytest.mark.parametrize("kwargs", [{"level": "LOUD"}, {"pattern": "("}, {"pattern": "a" * 300}])
+    def test_invalid_filters_rejected(self, kwargs):
+        with pytest.raises(ValueError):
+            LogFilter.build(**kwargs)
+
+
+async def _next_lines(stream, count: int) -> list[dict]:
+    """Pull events until `count` non-idle items arrive."""
+    async def pull():
+        items = []
+        while len(items) < count:
+            item = await stream.__anext__()
+            if item is not None:
+                items.append(item)
+        return items
+
+    return await asyncio.wait_for(pull(), timeout=2)
+
+
+class TestFollowLog:
+    """Tail, then follow across rotation, truncation and a slow reader."""
+
+    async def test_tail_is_last_matching_lines(self, tmp_path):
+        log = tmp_path / "stdout.log"
+        log.write_text("".join(_record("x", "INFO", f"m{i}") for i in range(10)) + "partial")
+        items = [i async for i in follow_log(log, lines=3, follow=False)]
+        assert [i["line"][-2:] for i in items] == ["m7", "m8", "m9"]
+        assert items[0]["level"] == "INFO" and items[0]["logger"] == "x"
+
+    async def test_follows_appends_and_rotation(self, tmp_path):
+        log = tmp_path / "stdout.log"
+        log.write_text(_record("x", "INFO", "old"))
+        stream = follow_log(log, lines=10, poll_interval=0.01)
+        try:
+            assert [i["line"][-3:] for i in await _next_lines(stream, 1)] == ["old"]
+
+            with open(log, "a") as f:
+                f.write(_record("x", "INFO", "new"))
+            assert (await _next_lines(stream, 1))[0]["line"].endswith("new")
+
+            # Rotate: unflushed tail of the old file is still delivered
+            with open(log, "a") as f:
+                f.write(_record("x", "INFO", "last-in-old"))
+            log.rename(tmp_path / "stdout.log.1")
+            log.write_text(_record("x", "INFO", "first-in-new"))
+            items = await _next_lines(stream, 3)
+            assert items[0] == {"rotated": True}
+            assert [i["line"].split(" - ")[-1] for i in items[1:]] == ["last-in-old", "first-in-new"]
+
+            # Truncate in place
+            log.write_text("")
+            assert await _next_lines(stream, 1) == [{"rotated": True}]
+            log.write_text(_record("x", "INFO", "after-truncate"))
+            assert (await _next_lines(stream, 1))[0]["line"].endswith("after-truncate")
+        finally:
+            await stream.aclose()
+
+    async def test_slow_reader_skips_backlog(self, tmp_path):
+        log = tmp_path / "stdout.log"
+        log.write_text("")
+        stream = follow_log(log, poll_interval=0.01, max_backlog=1000)
+        try:
+            assert await stream.__anext__() is None
+            with open(log, "a") as f:
+                f.write("".join(_record("x", "INFO", f"m{i}") for i in range(100)))
+            item = await _next_lines(stream, 1)
+            assert item[0]["skipped"] > 1000
+            with open(log, "a") as f:
+                f.write(_record("x", "INFO", "live"))
+            assert (await _next_lines(stream, 1))[0]["line"].endswith("live")
+        finally:
+            await stream.aclose()
+
+    async def test_redacts_before_filtering(self, tmp_path):
+        log = tmp_path / "stdout.log"
+        log.write_text(_record("x", "INFO", "key para_" + "a" * 32))
+        redact = supervisor._redact_log_line
+        assert [i async for i in follow_log(log, LogFilter.build(pattern="para_a"), follow=False, redact=redact)] == []
+        items = [i async for i in follow_log(log, follow=False, redact=redact)]
+        assert "[REDACTED_API_KEY]" in items[0]["line"]
+
+
+class TestLogsEndpoint:
+    """GET /supervisor/logs validates filters and streams SSE."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        log = tmp_path / "stdout.log"
+        log.write_text(_record("parachute.api", "INFO", "hello") + TRACEBACK)
+        monkeypatch.setattr(supervisor, "_server_log_file", lambda stream: log)
+        return TestClient(supervisor.app)
+
+    def test_filtered_tail(self, client):
+        resp = client.get("/supervisor/logs", params={"level": "error", "logger": "parachute.core"})
+        frames = [json.loads(line[6:]) for line in resp.text.split("\n") if line.startswith("data: ")]
+        assert [f["line"] for f in frames] == TRACEBACK.splitlines()
+
+    @pytest.mark.parametrize("params", [{"level": "LOUD"}, {"pattern": "("}, {"stream": "syslog"}])
+    def test_bad_params_are_400(self, client, params):
+        assert client.get("/supervisor/logs", params=params).status_code == 400
+
+    def test_missing_log_file(self, client, monkeypatch):
+        monkeypatch.setattr(supervisor, "_server_log_file", lambda stream: None)
+        assert "Log file not found" in client.get("/supervisor/logs").text
+
+    def test_log_file_prefers_settings_log_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(supervisor, "settings", type("S", (), {"log_dir": tmp_path})())
+        monkeypatch.setattr("parachute.daemon.daemon_log_dir", lambda: tmp_path / "daemon")
+        (tmp_path / "daemon").mkdir()
+        (tmp_path / "daemon" / "stderr.log").write_text("")
+        (tmp_path / "stdout.log").write_text("")
+        assert supervisor._server_log_file("stdout") == tmp_path / "stdout.log"
+        assert supervisor._server_log_file("stderr") == tmp_path / "daemon" / "stderr.log"
@@ -0,0 +1,199 @@
+"""Tests for the MCP servers' persistent HTTP clients and latency stats."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+import parachute.mcp_server as mcp
+from parachute.docker import daily_tools_mcp as container
+
+
+@pytest.fixture
+def mock_server(monkeypatch):
+    """Route the shared client through a MockTransport, counting clients built."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(f"{request.method} {request.url.path}")
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(200, json={"ok": True})
+
+    clients = []
+
+    def build(*args, **kwargs):
+        client = real_client(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(mcp.httpx, "AsyncClient", build)
+    monkeypatch.setattr(mcp, "_client", None)
+    monkeypatch.setattr(mcp, "_latency", {})
+    monkeypatch.setattr(mcp, "_brain_base_url", "http://localhost:3333/api/brain")
+    monkeypatch.setattr(mcp, "_api_base_url", "http://localhost:3333/api")
+    yield seen, clients
+    mcp._client = None
+
+
+class TestSharedClient:
+    """One client per process, with per-endpoint histograms."""
+
+    async def test_client_is_reused_across_calls(self, mock_server):
+        seen, clients = mock_server
+        await mcp._brain_call("/schema")
+        await mcp._api_call("/chat/tags")
+        await mcp._api_call("/chat/tags", method="POST", body={"tag": "x"})
+
+        assert len(clients) == 1
+        assert seen == ["GET /api/brain/schema", "GET /api/chat/tags", "POST /api/chat/tags"]
+        await mcp._close_client()
+        assert clients[0].is_closed
+
+    async def test_latency_grouped_by_endpoint_template(self, mock_server):
+        for sid in ("a1b2c3d4-e5f6", "f00dcafe-1234"):
+            await mcp._api_call(f"/chat/{sid}")
+        await mcp._api_call("/chat/missing")
+
+        stats = mcp.http_stats()
+        assert stats["transport"] == "tcp"
+        endpoints = stats["endpoints"]
+        assert endpoints["GET /api/chat/{id}"]["count"] == 2
+        assert endpoints["GET /api/chat/missing"]["errors"] == 1
+        assert sum(endpoints["GET /api/chat/{id}"]["buckets"].values()) == 2
+
+    async def test_debug_tool_returns_stats(self, mock_server):
+        await mcp._brain_call("/schema")
+        result = json.loads(await mcp.handle_tool_call("debug_http_stats", {}))
+        assert "GET /api/brain/schema" in result["endpoints"]
+
+
+class TestLatencyHistogram:
+    """Bucketing and percentile bounds."""
+
+    def test_percentiles(self):
+        hist = mcp.LatencyHistogram.empty()
+        for ms in (1, 2, 3, 40, 9000):
+            hist.observe(ms)
+        assert hist.percentile(0.5) == 5.0
+        assert hist.percentile(0.8) == 50.0
+        assert hist.percentile(1.0) is None  # open-ended top bucket
+        assert hist.to_dict()["max_ms"] == 9000
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+
+    def do_GET(self):
+        self.connections.add(self.client_address)
+        body = json.dumps({"entries": [], "path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _DroppingHandler(BaseHTTPRequestHandler):
+    """Hangs up without answering the first `drops` requests."""
+
+    protocol_version = "HTTP/1.1"
+    drops = 0
+    hits: list = []
+
+    def _handle(self):
+        self.hits.append(self.command)
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if _DroppingHandler.drops:
+            _DroppingHandler.drops -= 1
+            self.close_connection = True
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def host(monkeypatch):
+    """Serve a handler class on localhost and point the container client at it."""
+    servers = []
+
+    def start(handler):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        monkeypatch.setattr(container, "HOST_URL", f"http://127.0.0.1:{server.server_port}")
+        monkeypatch.setattr(container, "HOST_SOCKET", None)
+        monkeypatch.setattr(container, "_conn", None)
+        monkeypatch.setattr(container, "_latency", {})
+        return server
+
+    yield start
+    if container._conn is not None:
+        container._conn.close()
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestContainerConnection:
+    """The stdlib container server keeps one connection open."""
+
+    def test_https_url_uses_tls(self, monkeypatch):
+        monkeypatch.setattr(container, "HOST_URL", "https://parachute.example")
+        monkeypatch.setattr(container, "HOST_SOCKET", None)
+        monkeypatch.setattr(container, "_conn", None)
+        conn = container._connection()
+        assert isinstance(conn, container.http.client.HTTPSConnection)
+        assert (conn.host, conn.port) == ("parachute.example", 443)
+
+    def test_dropped_get_is_retried(self, host):
+        _DroppingHandler.drops, _DroppingHandler.hits = 1, []
+        host(_DroppingHandler)
+        assert container._http_get("/api/daily/entries") == {"ok": True}
+        assert _DroppingHandler.hits == ["GET", "GET"]
+
+    def test_dropped_post_is_not_replayed(self, host):
+        _DroppingHandler.drops, _DroppingHandler.hits = 1, []
+        host(_DroppingHandler)
+        result = container._http_post("/api/daily/cards", {"title": "once"})
+        assert "error" in result
+        assert _DroppingHandler.hits == ["POST"]
+
+    def test_requests_share_one_connection(self, monkeypatch):
+        _Handler.connections = set()
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        monkeypatch.setattr(container, "HOST_URL", f"http://127.0.0.1:{server.server_port}")
+        monkeypatch.setattr(container, "_conn", None)
+        monkeypatch.setattr(container, "_latency", {})
+        try:
+            for day in ("2026-03-01", "2026-03-02", "2026-03-03"):
+                result = container._http_get("/api/daily/entries", {"date": day})
+                assert result["path"] == f"/api/daily/entries?date={day}"
+            assert len(_Handler.connections) == 1
+
+            [text] = container.handle_debug_http_stats({})
+            stats = json.loads(text["text"])
+            assert stats["endpoints"]["GET /api/daily/entries"]["count"] == 3
+        finally:
+            if container._conn is not None:
+                container._conn.close()
+            server.shutdown()
+            server.server_close()
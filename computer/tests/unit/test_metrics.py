@@ -0,0 +1,151 @@
+"""Tests for in-process metrics, /api/metrics and hot-path instrumentation."""
+
+import asyncio
+import types
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import health
+from parachute.core.hooks.models import HookConfig
+from parachute.core.hooks.runner import HookRunner
+from parachute.lib import mcp_loader, metrics
+from parachute.lib.metrics import MetricsRegistry
+
+
+class TestCounter:
+    """Counters accumulate per label set and render one sample each."""
+
+    def test_inc_and_render(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("app_requests_total", "Requests", ("status",))
+        requests.inc(status="200")
+        requests.inc(2, status="200")
+        requests.inc(status='a"b')
+        assert requests.value(status="200") == 3
+        assert registry.render().splitlines() == [
+            "# HELP app_requests_total Requests",
+            "# TYPE app_requests_total counter",
+            'app_requests_total{status="200"} 3',
+            'app_requests_total{status="a\\"b"} 1',
+        ]
+
+    def test_wrong_labels_rejected(self):
+        counter = MetricsRegistry().counter("c", "C", ("a",))
+        with pytest.raises(ValueError):
+            counter.inc(b="x")
+
+    def test_series_are_capped(self, monkeypatch):
+        monkeypatch.setattr(metrics, "MAX_SERIES", 2)
+        counter = MetricsRegistry().counter("c", "C", ("id",))
+        for i in range(5):
+            counter.inc(id=str(i))
+        assert counter.value(id="_other") == 3
+        assert counter.total() == 5
+
+
+class TestHistogram:
+    """Cumulative buckets, sum and count; summary estimates quantiles."""
+
+    def test_render_is_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("lat_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            latency.observe(value)
+        assert registry.render().splitlines()[2:] == [
+            'lat_seconds_bucket{le="0.1"} 1',
+            'lat_seconds_bucket{le="1.0"} 3',
+            'lat_seconds_bucket{le="+Inf"} 4',
+            "lat_seconds_sum 4.05",
+            "lat_seconds_count 4",
+        ]
+
+    def test_summary_aggregates_label_sets(self):
+        latency = MetricsRegistry().histogram("h", "H", ("op",), buckets=(0.01, 0.1, 1.0))
+        for _ in range(90):
+            latency.observe(0.005, op="read")
+        for _ in range(10):
+            latency.observe(0.5, op="write")
+        summary = latency.summary()
+        assert summary["count"] == 100
+        assert summary["p50_ms"] <= 10 and 100 <= summary["p95_ms"] <= 1000
+        assert summary["max_ms"] == 500.0
+
+    def test_timer_observes_on_error(self):
+        latency = MetricsRegistry().histogram("h", "H", ("op",))
+        with pytest.raises(RuntimeError):
+            with latency.time(op="x"):
+                raise RuntimeError("boom")
+        assert latency.count(op="x") == 1
+
+    def test_redeclaring_returns_same_metric(self):
+        registry = MetricsRegistry()
+        assert registry.histogram("h", "H", ("a",)) is registry.histogram("h", "H", ("a",))
+        with pytest.raises(ValueError):
+            registry.counter("h", "H", ("a",))
+
+
+class TestEndpoints:
+    """GET /api/metrics serves Prometheus text; detailed health includes a summary."""
+
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        registry = MetricsRegistry()
+        monkeypatch.setattr(metrics, "_registry", registry)
+        return registry
+
+    def test_metrics_endpoint(self, registry):
+        registry.counter("x_total", "X").inc()
+        app = FastAPI()
+        app.include_router(health.router, prefix="/api")
+        resp = TestClient(app).get("/api/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "x_total 1" in resp.text
+
+    def test_request_middleware_labels_by_route(self, registry):
+        from parachute import server
+
+        app = FastAPI()
+        app.middleware("http")(server.metrics_middleware)
+
+        @app.get("/api/items/{item_id}")
+        async def item(item_id: str):
+            return {}
+
+        client = TestClient(app)
+        client.get("/api/items/1")
+        client.get("/api/items/2")
+        client.get("/api/missing")
+        assert server._REQUESTS.value(method="GET", route="/api/items/{item_id}", status="200") >= 2
+        assert server._REQUESTS.value(method="GET", route="unmatched", status="404") >= 1
+
+
+class TestHotPaths:
+    """Instrumented call sites record into the shared registry."""
+
+    async def test_hook_time_recorded_on_timeout(self, tmp_path):
+        async def run(context):
+            await asyncio.sleep(1)
+
+        runner = HookRunner(tmp_path)
+        runner._hooks["custom"] = [HookConfig(name="slow", path=Path("x"), timeout=0.01)]
+        runner._hook_modules["slow"] = types.SimpleNamespace(run=run)
+        hook_seconds = metrics.get_metrics().get("parachute_hook_seconds")
+        before = hook_seconds.count(event="custom")
+
+        await runner.fire("custom", blocking=True)
+        assert hook_seconds.count(event="custom") == before + 1
+        assert runner._recent_errors[-1].hook_name == "slow"
+
+    async def test_mcp_load_hit_and_miss(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(mcp_loader, "_mcp_cache", None)
+        monkeypatch.setattr(mcp_loader, "_mcp_cache_path", None)
+        load_seconds = metrics.get_metrics().get("parachute_mcp_load_seconds")
+        misses, hits = load_seconds.count(cache="miss"), load_seconds.count(cache="hit")
+
+        await mcp_loader.load_mcp_servers(tmp_path)
+        await mcp_loader.load_mcp_servers(tmp_path)
+        assert (load_seconds.count(cache="miss"), load_seconds.count(cache="hit")) == (misses + 1, hits + 1)
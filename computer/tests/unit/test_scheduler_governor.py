@@ -0,0 +1,133 @@
+"""Tests for the scheduled-agent run governor and schedule spreading."""
+
+import asyncio
+from datetime import datetime
+
+from parachute.core.daily_agent import DailyAgentConfig
+from parachute.core.scheduler import (
+    COLLISION_SPREAD_SECONDS,
+    MANUAL_PRIORITY,
+    AgentRunGovernor,
+    _missed_runs,
+    _spread_schedule,
+)
+
+
+class Runner:
+    """Agent runner that blocks until released and records start order."""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.dates: list = []
+        self.gate = asyncio.Event()
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, agent_name: str, trigger: str, date=None) -> dict:
+        self.started.append(agent_name)
+        self.dates.append(date)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.gate.wait()
+            return {"status": "completed", "agent": agent_name}
+        finally:
+            self.running -= 1
+
+
+def _agent(name: str, time: str = "3:00", enabled: bool = True) -> DailyAgentConfig:
+    return DailyAgentConfig(
+        name=name,
+        display_name=name,
+        description="",
+        system_prompt="",
+        schedule_enabled=enabled,
+        schedule_time=time,
+    )
+
+
+class TestAgentRunGovernor:
+    """Concurrency cap, priority, and coalescing."""
+
+    async def test_caps_concurrent_runs(self):
+        runner = Runner()
+        governor = AgentRunGovernor(runner, max_concurrent=2)
+
+        futures = [governor.submit(f"agent-{i}") for i in range(5)]
+        await asyncio.sleep(0)
+        status = governor.status()
+        assert len(status["running"]) == 2
+        assert [q["agent"] for q in status["queued"]] == ["agent-2", "agent-3", "agent-4"]
+
+        runner.gate.set()
+        results = await asyncio.gather(*futures)
+        assert runner.max_running == 2
+        assert [r["agent"] for r in results] == [f"agent-{i}" for i in range(5)]
+        assert governor.status()["completed"] == 5
+
+    async def test_higher_priority_starts_first(self):
+        runner = Runner()
+        governor = AgentRunGovernor(runner, max_concurrent=1)
+
+        futures = [governor.submit("busy"), governor.submit("low"), governor.submit("urgent", priority=MANUAL_PRIORITY)]
+        runner.gate.set()
+        await asyncio.gather(*futures)
+        assert runner.started == ["busy", "urgent", "low"]
+
+    async def test_duplicate_requests_coalesce(self):
+        runner = Runner()
+        governor = AgentRunGovernor(runner, max_concurrent=1)
+
+        running = governor.submit("a")
+        queued = governor.submit("b")
+        assert governor.submit("a") is running
+        # Re-request of a queued run joins it and can promote it
+        assert governor.submit("b", priority=MANUAL_PRIORITY) is queued
+        assert governor.status()["queued"][0]["priority"] == MANUAL_PRIORITY
+
+        runner.gate.set()
+        await asyncio.gather(running, queued)
+        assert runner.started == ["a", "b"]
+        assert governor.status()["coalesced"] == 2
+
+    async def test_other_date_waits_for_running_agent(self):
+        runner = Runner()
+        governor = AgentRunGovernor(runner, max_concurrent=2)
+
+        first = governor.submit("a", date="2026-03-23")
+        second = governor.submit("a", date="2026-03-24")
+        assert second is not first
+        await asyncio.sleep(0)
+        assert runner.started == ["a"]
+        assert governor.status()["queued"][0]["date"] == "2026-03-24"
+
+        runner.gate.set()
+        await asyncio.gather(first, second)
+        assert runner.dates == ["2026-03-23", "2026-03-24"]
+
+
+class TestSchedule:
+    """Collision spreading and misfire catch-up."""
+
+    def test_same_minute_agents_are_spread(self):
+        times = _spread_schedule([_agent("b"), _agent("a"), _agent("c", "4:15")])
+
+        assert times["a"] == (3, 0, 0)
+        offset = COLLISION_SPREAD_SECONDS
+        assert times["b"] == (3, offset // 60, offset % 60)
+        assert times["c"] == (4, 15, 0)
+
+    def test_missed_runs_within_grace_window(self):
+        now = datetime(2026, 3, 25, 5, 0).astimezone()
+        agents = [
+            _agent("early", "3:00"),         # 2h ago — caught up
+            _agent("later", "9:00"),         # yesterday 9:00 — 20h ago, too old
+            _agent("off", "4:00", enabled=False),
+        ]
+        assert _missed_runs(agents, now) == [("early", "2026-03-24")]
+
+    def test_missed_run_date_is_from_scheduled_time(self):
+        # Missed the 23:30 run; catching up after midnight must still
+        # process the day before the missed run, not the day before now.
+        now = datetime(2026, 3, 25, 0, 30).astimezone()
+        assert _missed_runs([_agent("late", "23:30")], now) == [("late", "2026-03-23")]
@@ -0,0 +1,145 @@
+"""Tests for the BrainChatStore schema-manifest fast path and versioned migrations."""
+
+import asyncio
+
+import pytest
+
+import parachute.db.brain_chat_store as store_module
+from parachute.db.brain_chat_store import (
+    CORE_NODE_TABLES,
+    SCHEMA_MANIFEST_KEY,
+    SCHEMA_MIGRATION_KEY,
+    BrainChatStore,
+    schema_manifest,
+)
+
+
+class FakeGraph:
+    """Records DDL and serves Parachute_KV reads/writes."""
+
+    def __init__(self):
+        self.write_lock = asyncio.Lock()
+        self.kv: dict[str, str] = {}
+        self.ddl: list[str] = []
+        self.queries: list[str] = []
+
+    async def ensure_node_table(self, name, columns, primary_key="name"):
+        self.ddl.append(name)
+
+    async def ensure_rel_table(self, name, from_table, to_table, columns=None):
+        self.ddl.append(name)
+
+    async def _execute(self, query, params=None):
+        self.ddl.append(query.split("(")[0].strip())
+
+    async def execute_cypher(self, query, params=None):
+        self.queries.append(query)
+        if query.startswith("MATCH (m:Parachute_KV)"):
+            return [{"key": k, "value": v} for k, v in self.kv.items()]
+        if query.startswith("MERGE (m:Parachute_KV"):
+            self.kv[params["key"]] = params["value"]
+        return []
+
+
+@pytest.fixture
+def store(monkeypatch):
+    calls: list[str] = []
+
+    def migration(name):
+        async def run(self):
+            if name in self._fail:
+                raise RuntimeError(f"{name} failed")
+            calls.append(name)
+        run.__name__ = name
+        return run
+
+    monkeypatch.setattr(
+        BrainChatStore, "MIGRATIONS", tuple((v, migration(f"m{v}")) for v in (1, 2, 3))
+    )
+
+    async def seed(self):
+        calls.append("seed")
+
+    async def seeds_present(self):
+        return self._seeds_ok
+
+    monkeypatch.setattr(BrainChatStore, "seed_builtin_tools", seed)
+    monkeypatch.setattr(BrainChatStore, "seed_builtin_triggers", seed)
+    monkeypatch.setattr(BrainChatStore, "_builtin_seeds_present", seeds_present)
+
+    s = BrainChatStore(FakeGraph())
+    s._fail = set()
+    s._seeds_ok = True
+    s.calls = calls
+    return s
+
+
+class TestEnsureReady:
+    """One KV read when current; full path and pending migrations otherwise."""
+
+    async def test_fresh_then_fast_path(self, store):
+        assert await store.ensure_ready() is True
+        assert store.calls == ["m1", "m2", "m3", "seed", "seed"]
+        assert store.graph.kv == {SCHEMA_MANIFEST_KEY: schema_manifest(), SCHEMA_MIGRATION_KEY: "3"}
+        assert len(store.graph.ddl) > len(CORE_NODE_TABLES)
+
+        store.calls.clear()
+        store.graph.ddl.clear()
+        store.graph.queries.clear()
+        assert await store.ensure_ready() is False
+        assert store.calls == []
+        assert store.graph.ddl == []
+        assert len(store.graph.queries) == 1
+
+    async def test_changed_manifest_skips_completed_migrations(self, store):
+        store.graph.kv = {SCHEMA_MANIFEST_KEY: "old", SCHEMA_MIGRATION_KEY: "2"}
+        assert await store.ensure_ready() is True
+        assert store.calls == ["m3", "seed", "seed"]
+        assert store.graph.kv[SCHEMA_MANIFEST_KEY] == schema_manifest()
+
+    async def test_force_runs_full_path(self, store):
+        await store.ensure_ready()
+        store.calls.clear()
+        assert await store.ensure_ready(force=True) is True
+        assert store.calls == ["seed", "seed"]
+
+    async def test_failed_migration_keeps_last_completed_version(self, store):
+        store._fail = {"m2"}
+        with pytest.raises(RuntimeError):
+            await store.ensure_ready()
+        assert store.graph.kv == {SCHEMA_MIGRATION_KEY: "1"}
+
+        store._fail = set()
+        store.calls.clear()
+        await store.ensure_ready()
+        assert store.calls[:2] == ["m2", "m3"]
+
+    async def test_missing_seeds_leave_manifest_stale(self, store):
+        store._seeds_ok = False
+        await store.ensure_ready()
+        assert SCHEMA_MANIFEST_KEY not in store.graph.kv
+        store.calls.clear()
+        await store.ensure_ready()
+        assert "seed" in store.calls
+
+
+class TestSchemaManifest:
+    """The manifest covers tables, migrations and seed templates."""
+
+    def test_stable(self):
+        assert schema_manifest() == schema_manifest()
+
+    def test_changes_with_seed_templates(self, monkeypatch):
+        before = schema_manifest()
+        templates = [dict(t) for t in store_module.TOOL_TEMPLATES]
+        templates[0]["template_version"] = "2099-01-01"
+        monkeypatch.setattr(store_module, "TOOL_TEMPLATES", templates)
+        assert schema_manifest() != before
+
+    def test_changes_with_table_columns(self, monkeypatch):
+        before = schema_manifest()
+        tables = list(CORE_NODE_TABLES)
+        chat = tables[0]
+        tables[0] = type(chat)(chat.name, {**chat.columns, "new_col": "STRING"}, chat.primary_key)
+        monkeypatch.setattr(store_module, "CORE_NODE_TABLES", tables)
+        assert schema_manifest() != before
@@ -0,0 +1,101 @@
+"""Tests for the session list endpoint: cursors, projection, and ETags."""
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import sessions
+from parachute.db.brain_chat_store import BrainChatStore
+
+
+class FakeStore:
+    """Serves fixed pages and records what the endpoint asked for."""
+
+    def __init__(self):
+        self.version = 0
+        self.calls: list[dict] = []
+
+    @property
+    def sessions_version(self) -> str:
+        return f"test.{self.version}"
+
+    async def list_session_page(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs["fields"] and "bogus" in kwargs["fields"]:
+            raise ValueError("Unknown session fields: bogus")
+        if kwargs["after"] is None:
+            return [{"id": "b"}, {"id": "a"}], ("2026-03-01T00:00:00+00:00", "a")
+        return [{"id": "z"}], None
+
+
+@pytest.fixture
+def client_and_store():
+    app = FastAPI()
+    app.include_router(sessions.router, prefix="/api")
+    store = FakeStore()
+    app.state.session_store = store
+    return TestClient(app), store
+
+
+class TestSessionListEndpoint:
+    """GET /api/chat pagination, projection, and conditional requests."""
+
+    def test_cursor_round_trip(self, client_and_store):
+        client, store = client_and_store
+        first = client.get("/api/chat?limit=2&fields=id,title").json()
+        assert [s["id"] for s in first["sessions"]] == ["b", "a"]
+        assert store.calls[0]["fields"] == ["id", "title"]
+
+        second = client.get(f"/api/chat?limit=2&cursor={first['nextCursor']}").json()
+        assert store.calls[1]["after"] == ("2026-03-01T00:00:00+00:00", "a")
+        assert second["nextCursor"] is None
+
+    def test_etag_short_circuit_until_sessions_change(self, client_and_store):
+        client, store = client_and_store
+        response = client.get("/api/chat")
+        etag = response.headers["etag"]
+
+        cached = client.get("/api/chat", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert len(store.calls) == 1
+
+        # Different query → different ETag
+        assert client.get("/api/chat?limit=5").headers["etag"] != etag
+
+        store.version += 1
+        fresh = client.get("/api/chat", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+
+    def test_bad_input_is_400(self, client_and_store):
+        client, _ = client_and_store
+        assert client.get("/api/chat?cursor=%%%").status_code == 400
+        assert client.get("/api/chat?fields=id,bogus").status_code == 400
+
+
+class TestProjection:
+    """Projected rows convert values the same way full Session dumps do."""
+
+    def test_projected_values_match_full_dump(self):
+        row = {
+            "session_id": "s1",
+            "title": "Hello",
+            "module": "chat",
+            "source": "telegram",
+            "archived": None,
+            "message_count": None,
+            "created_at": "2026-03-01T10:00:00+00:00",
+            "last_accessed": None,
+            "metadata_json": '{"k": 1}',
+        }
+        fields = ["id", "title", "source", "archived", "messageCount", "lastAccessed", "metadata", "vaultRoot"]
+        projected = BrainChatStore._project_session_row(row, fields)
+        full = BrainChatStore._node_to_session(None, row).model_dump(by_alias=True)
+
+        for field in fields:
+            expected = full[field]
+            expected = getattr(expected, "value", expected)
+            assert projected[field] == expected, field
+        assert projected["lastAccessed"] == datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
@@ -193,6 +193,50 @@ async def test_session_with_metadata(session_manager, test_database):
 # ── resolve_working_directory tests ──
 
 
+@pytest.mark.asyncio
+async def test_list_session_page_keyset_and_projection(session_manager, test_database):
+    """Keyset pages cover every session once; fields= projects columns."""
+    for i in range(5):
+        await test_database.create_session(SessionCreate(id=f"page-{i}", title=f"Page {i}", module="chat"))
+        await test_database.patch_session_timestamps(f"page-{i}", last_accessed=f"2026-03-0{i % 2 + 1}T00:00:00+00:00")
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await test_database.list_session_page(
+            module="chat", limit=2, after=cursor, fields=["id", "lastAccessed"]
+        )
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert sorted(s["id"] for s in seen) == [f"page-{i}" for i in range(5)]
+    assert all(set(s) == {"id", "lastAccessed"} for s in seen)
+    stamps = [s["lastAccessed"] for s in seen]
+    assert stamps == sorted(stamps, reverse=True)
+
+    with pytest.raises(ValueError):
+        await test_database.list_session_page(fields=["nope"])
+
+
+@pytest.mark.asyncio
+async def test_sessions_version_changes_on_write(session_manager, test_database):
+    """Chat writes bump the change counter used for list ETags."""
+    before = test_database.sessions_version
+    await test_database.create_session(SessionCreate(id="ver-1", title="v", module="chat"))
+    after_create = test_database.sessions_version
+    await test_database.touch_session("ver-1")
+
+    assert before != after_create != test_database.sessions_version
+
+
+@pytest.mark.asyncio
+async def test_sessions_version_changes_on_container_delete(test_database):
+    """Unlinking sessions from a deleted container changes their list ETag."""
+    before = test_database.sessions_version
+    await test_database.delete_container("gone")
+    assert test_database.sessions_version != before
+
+
 def test_resolve_working_directory_none(session_manager, test_vault):
     """None or empty returns home dir."""
     home = Path.home()
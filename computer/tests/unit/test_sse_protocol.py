@@ -0,0 +1,143 @@
+"""Tests for chat stream protocol negotiation and delta encoding."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import chat
+from parachute.lib.sse import StreamEncoder, dumps, negotiate_stream_protocol
+
+
+def _frames(body: str) -> list[dict]:
+    return [json.loads(line[6:]) for line in body.split("\n") if line.startswith("data: ")]
+
+
+def _apply(frames: list[dict], kind: str = "text") -> str:
+    """Rebuild client-side content from v2 frames, checking sequence order."""
+    content, last_seq = "", 0
+    for frame in frames:
+        if frame.get("type") != kind:
+            continue
+        assert frame["seq"] == last_seq + 1
+        last_seq = frame["seq"]
+        content = frame["content"] if frame.get("snapshot") else content + frame["delta"]
+    return content
+
+
+class TestNegotiation:
+    """Body field wins; unknown versions fall back to v1."""
+
+    @pytest.mark.parametrize("requested,accept,expected", [
+        (None, None, 1),
+        (2, None, 2),
+        (None, "text/event-stream; protocol=2", 2),
+        (None, "application/json, text/event-stream;protocol=2", 2),
+        (1, "text/event-stream; protocol=2", 1),
+        (9, None, 1),
+        (None, "text/event-stream", 1),
+    ])
+    def test_negotiate(self, requested, accept, expected):
+        assert negotiate_stream_protocol(requested, accept) == expected
+
+
+class TestStreamEncoder:
+    """v2 sends deltas with resync snapshots; v1 is untouched."""
+
+    def test_v1_passes_full_events_through(self):
+        encoder = StreamEncoder()
+        event = {"type": "text", "content": "Hello world", "delta": " world"}
+        assert encoder.preamble() is None
+        assert _frames(encoder.encode(event)) == [event]
+
+    def test_v2_deltas_and_new_block_snapshot(self):
+        encoder = StreamEncoder(2)
+        frames = []
+        for content in ["Hel", "Hello", "Hello", "Hello world", "Next block"]:
+            frame = encoder.encode({"type": "text", "content": content, "delta": ""})
+            if frame:
+                frames += _frames(frame)
+
+        assert frames[0] == {"type": "text", "seq": 1, "content": "Hel", "snapshot": True}
+        assert frames[1] == {"type": "text", "seq": 2, "delta": "lo"}
+        assert frames[2] == {"type": "text", "seq": 3, "delta": " world"}
+        assert frames[3]["snapshot"] and frames[3]["content"] == "Next block"
+        assert len(frames) == 4  # unchanged content is not resent
+
+    def test_v2_periodic_snapshot(self):
+        encoder = StreamEncoder(2, snapshot_every=4)
+        text, frames = "", []
+        for i in range(10):
+            text += f"w{i} "
+            frames += _frames(encoder.encode({"type": "text", "content": text}))
+
+        assert [f["seq"] for f in frames if f.get("snapshot")] == [1, 5, 9]
+        assert _apply(frames) == text
+
+    def test_thinking_tracked_separately(self):
+        encoder = StreamEncoder(2)
+        frames = []
+        for event in [
+            {"type": "text", "content": "A"},
+            {"type": "thinking", "content": "hmm"},
+            {"type": "text", "content": "AB"},
+            {"type": "thinking", "content": "hmm, ok"},
+            {"type": "tool_use", "tool": {"id": "t1"}},
+        ]:
+            frames += _frames(encoder.encode(event))
+
+        assert _apply(frames, "text") == "AB"
+        assert _apply(frames, "thinking") == "hmm, ok"
+        assert frames[-1] == {"type": "tool_use", "tool": {"id": "t1"}}
+
+    def test_dumps_matches_json(self):
+        event = {"type": "text", "content": "naïve — 🪂", "n": 2**70}
+        assert json.loads(dumps(event)) == event
+
+
+class FakeOrchestrator:
+    """Streams a growing reply the way _run_trusted does."""
+
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+
+    async def run_streaming(self, **kwargs):
+        yield {"type": "session", "sessionId": "s1"}
+        text = ""
+        for chunk in self.chunks:
+            text += chunk
+            yield {"type": "text", "content": text, "delta": chunk}
+        yield {"type": "done", "sessionId": "s1"}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api")
+    app.state.orchestrator = FakeOrchestrator([f"token{i} " for i in range(200)])
+    return TestClient(app)
+
+
+class TestChatStreamProtocol:
+    """POST /api/chat negotiates the protocol per request."""
+
+    def test_old_clients_get_full_content(self, client):
+        frames = _frames(client.post("/api/chat", json={"message": "hi"}).text)
+        texts = [f for f in frames if f["type"] == "text"]
+        assert len(texts) == 200
+        assert all("content" in f and "seq" not in f for f in texts)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"json": {"message": "hi", "streamProtocol": 2}},
+        {"json": {"message": "hi"}, "headers": {"Accept": "text/event-stream; protocol=2"}},
+    ])
+    def test_v2_reconstructs_same_text_with_fewer_bytes(self, client, kwargs):
+        v1 = client.post("/api/chat", json={"message": "hi"}).text
+        v2 = client.post("/api/chat", **kwargs).text
+        frames = _frames(v2)
+
+        assert frames[0]["type"] == "stream_protocol" and frames[0]["version"] == 2
+        assert _apply(frames) == [f for f in _frames(v1) if f["type"] == "text"][-1]["content"]
+        assert frames[-1] == {"type": "done", "sessionId": "s1"}
+        assert len(v2) * 5 < len(v1)
@@ -0,0 +1,133 @@
+"""Tests for staged startup tracking and the readiness endpoint."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from parachute.api import health
+from parachute.core.sandbox import DockerSandbox
+from parachute.core.startup import StartupTracker, SubsystemSkipped
+
+
+class TestStartupTracker:
+    """Critical steps raise; background steps are recorded, never raised."""
+
+    async def test_critical_step_records_duration(self):
+        startup = StartupTracker()
+        with startup.step("brain"):
+            await asyncio.sleep(0.01)
+        sub = startup.subsystems["brain"]
+        assert sub.state == "ready" and sub.critical
+        assert sub.duration_ms >= 10
+
+    def test_critical_failure_propagates(self):
+        startup = StartupTracker()
+        with pytest.raises(RuntimeError):
+            with startup.step("brain"):
+                raise RuntimeError("db locked")
+        assert startup.subsystems["brain"].to_dict()["error"] == "db locked"
+
+    async def test_background_outcomes(self):
+        startup = StartupTracker()
+
+        async def ok():
+            await asyncio.sleep(0)
+
+        async def boom():
+            raise RuntimeError("docker timeout")
+
+        async def unavailable():
+            raise SubsystemSkipped("no backend available")
+
+        startup.start_background("modules", ok)
+        startup.start_background("containers", boom)
+        startup.start_background("transcription", unavailable)
+        startup.mark_serving()
+        assert not startup.ready
+
+        await startup.wait()
+        states = {name: sub.state for name, sub in startup.subsystems.items()}
+        assert states == {"modules": "ready", "containers": "failed", "transcription": "skipped"}
+        assert startup.ready
+        assert startup.to_dict()["subsystems"]["containers"]["error"] == "docker timeout"
+
+    async def test_dependent_step_waits(self):
+        startup = StartupTracker()
+        order = []
+
+        async def modules():
+            await asyncio.sleep(0.01)
+            order.append("modules")
+
+        async def scheduler():
+            await modules_task
+            order.append("scheduler")
+
+        modules_task = startup.start_background("modules", modules)
+        startup.start_background("scheduler", scheduler)
+        await startup.wait()
+        assert order == ["modules", "scheduler"]
+
+    async def test_cancel_on_shutdown(self):
+        startup = StartupTracker()
+        startup.start_background("transcription", lambda: asyncio.sleep(10))
+        await asyncio.sleep(0)
+        await startup.cancel()
+        assert startup.subsystems["transcription"].state == "cancelled"
+        assert startup.ready
+
+
+class TestReadinessEndpoint:
+    """GET /api/health/ready is 503 until every subsystem settles."""
+
+    def test_ready_after_background_settles(self):
+        app = FastAPI()
+        app.include_router(health.router, prefix="/api")
+        client = TestClient(app)
+        assert client.get("/api/health/ready").status_code == 503
+
+        startup = StartupTracker()
+        app.state.startup = startup
+        with startup.step("brain"):
+            pass
+        startup.subsystems["brain"].duration_ms = 12.34
+        startup._state("containers", critical=False)
+
+        pending = client.get("/api/health/ready")
+        assert pending.status_code == 503
+        assert pending.json()["subsystems"]["containers"]["state"] == "pending"
+
+        startup.subsystems["containers"].state = "ready"
+        ready = client.get("/api/health/ready")
+        assert ready.status_code == 200
+        assert ready.json()["subsystems"]["brain"] == {
+            "state": "ready", "critical": True, "durationMs": 12.3,
+        }
+
+
+class TestBackgroundReconcile:
+    """Sandbox use waits for the background container reconcile."""
+
+    async def test_ensure_container_waits_for_reconcile(self, tmp_path, monkeypatch):
+        sandbox = DockerSandbox(parachute_dir=tmp_path)
+        created = []
+
+        async def fake_ensure(name, slug, home_dir, labels, config):
+            created.append(name)
+            return name
+
+        monkeypatch.setattr(sandbox, "_ensure_container", fake_ensure)
+        with sandbox.reconciling():
+            turn = asyncio.create_task(sandbox.ensure_container("new", config=None))
+            await asyncio.sleep(0.01)
+            assert not turn.done() and created == []
+        assert await asyncio.wait_for(turn, 1) == "parachute-env-new"
+
+    async def test_reconcile_failure_releases_sandbox(self, tmp_path):
+        sandbox = DockerSandbox(parachute_dir=tmp_path)
+        with pytest.raises(RuntimeError):
+            with sandbox.reconciling():
+                raise RuntimeError("docker ps failed")
+        await asyncio.wait_for(sandbox._wait_for_reconcile(), 0.1)
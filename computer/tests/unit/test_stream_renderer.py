@@ -0,0 +1,187 @@
+"""Tests for progressive reply rendering in bot connectors."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from parachute.connectors.base import (
+    BotConnector,
+    EditPacer,
+    StreamingRenderer,
+    StreamPacing,
+    StreamRateLimited,
+)
+
+
+class FakeChat:
+    """Records sends/edits like a platform message API."""
+
+    def __init__(self):
+        self.messages: list[str] = []
+        self.edits = 0
+        self.formatted: list[str] = []
+        self.fail_next_edit: Exception | None = None
+
+    def format(self, block: str) -> str:
+        self.formatted.append(block)
+        return block.upper()
+
+    async def send(self, text: str, raw: str) -> int:
+        self.messages.append(text)
+        return len(self.messages) - 1
+
+    async def edit(self, handle: int, text: str, raw: str) -> None:
+        if self.fail_next_edit is not None:
+            exc, self.fail_next_edit = self.fail_next_edit, None
+            raise exc
+        self.edits += 1
+        self.messages[handle] = text
+
+
+def _renderer(chat: FakeChat, rate: float = 1000.0, burst: int = 1000, max_len: int = 4000):
+    return StreamingRenderer(
+        send=chat.send,
+        edit=chat.edit,
+        format_block=chat.format,
+        pacing=StreamPacing(rate=rate, burst=burst, max_message_length=max_len),
+    )
+
+
+class TestStreamingRenderer:
+    """Block segmentation, rollover, and pacing."""
+
+    async def test_completed_blocks_formatted_once(self):
+        chat = FakeChat()
+        renderer = _renderer(chat)
+        text = ""
+        for word in "one two\n\nthree four\n\nfive".split(" "):
+            text += word + " "
+            await renderer.update(text)
+        await renderer.finish(text)
+
+        assert chat.messages == ["ONE TWO\n\nTHREE FOUR\n\nFIVE"]
+        assert chat.formatted.count("one two") == 1
+        assert chat.formatted.count("three four") == 1
+
+    async def test_blank_lines_inside_code_fence_do_not_split(self):
+        chat = FakeChat()
+        renderer = _renderer(chat)
+        text = "intro\n\n```\na\n\nb\n```\n\nend"
+        for i in range(1, len(text) + 1):
+            await renderer.update(text[:i])
+        await renderer.finish(text)
+
+        assert "```\na\n\nb\n```" in chat.formatted
+        assert chat.messages == ["INTRO\n\n```\nA\n\nB\n```\n\nEND"]
+
+    async def test_rolls_over_into_new_message_at_limit(self):
+        chat = FakeChat()
+        renderer = _renderer(chat, max_len=25)
+        text = "\n\n".join(f"paragraph {i}" for i in range(5))
+        await renderer.update(text)
+        await renderer.finish(text)
+
+        assert len(chat.messages) == 3
+        assert all(len(m) <= 25 for m in chat.messages)
+        assert "\n\n".join(chat.messages) == text.upper()
+
+    async def test_oversized_block_is_split(self):
+        chat = FakeChat()
+        renderer = _renderer(chat, max_len=20)
+        await renderer.finish("x" * 50)
+
+        assert "".join(chat.messages) == "X" * 50
+        assert all(len(m) <= 20 for m in chat.messages)
+
+    async def test_restart_when_text_is_replaced(self):
+        chat = FakeChat()
+        renderer = _renderer(chat)
+        await renderer.update("thinking out loud\n\nstill")
+        await renderer.finish("final answer")
+
+        assert chat.messages == ["FINAL ANSWER"]
+
+    async def test_edits_are_paced_and_deferred_text_flushes(self):
+        chat = FakeChat()
+        renderer = _renderer(chat, rate=20.0, burst=1)
+        for i in range(10):
+            await renderer.update("word " * (i + 1))
+        # Only the burst went out immediately; the rest is deferred
+        assert chat.edits == 0 and len(chat.messages) == 1
+
+        await asyncio.sleep(0.12)
+        assert chat.messages[0] == ("WORD " * 10).strip()
+        await renderer.finish()
+
+    async def test_rate_limit_backs_off_and_final_edit_lands(self):
+        chat = FakeChat()
+        renderer = _renderer(chat)
+        await renderer.update("hello")
+        chat.fail_next_edit = StreamRateLimited(0.05)
+        await renderer.update("hello world")
+
+        assert renderer.pacer.rate < renderer.pacer.base_rate
+        await renderer.finish("hello world, done")
+        assert chat.messages == ["HELLO WORLD, DONE"]
+
+
+class TestEditPacer:
+    """Token bucket with AIMD backoff."""
+
+    def test_burst_then_wait(self):
+        pacer = EditPacer(rate=1.0, burst=2)
+        assert pacer.try_acquire() and pacer.try_acquire()
+        assert not pacer.try_acquire()
+        assert 0 < pacer.delay() <= 1.0
+
+    def test_backoff_and_recovery(self):
+        pacer = EditPacer(rate=1.0, burst=2)
+        pacer.on_rate_limited(5)
+        assert pacer.rate == 0.5
+        assert pacer.delay() > 4
+        for _ in range(10):
+            pacer.on_success()
+        assert pacer.rate == pytest.approx(1.0)
+
+
+class _Connector(BotConnector):
+    platform = "test"
+
+    async def start(self): ...
+    async def stop(self): ...
+    async def _run_loop(self): ...
+    async def on_text_message(self, update, context): ...
+    async def on_voice_message(self, update, context): ...
+    async def send_message(self, chat_id, text): ...
+    async def send_approval_message(self, chat_id): ...
+    async def send_denial_message(self, chat_id): ...
+
+
+async def test_stream_response_appends_warnings():
+    async def orchestrate(**kwargs):
+        yield {"type": "text", "content": "Partial"}
+        yield {"type": "warning", "title": "Heads up", "message": "slow"}
+        yield {"type": "text", "content": "Partial answer"}
+
+    server = MagicMock()
+    server.orchestrate = orchestrate
+    connector = _Connector(bot_token="t", server=server, allowed_users=[])
+    chat = FakeChat()
+    await connector.stream_response("s1", "hi", _renderer(chat))
+
+    assert chat.messages == ["PARTIAL ANSWER\n\n⚠️ HEADS UP: SLOW"]
+
+
+async def test_stream_failure_keeps_partial_reply():
+    async def orchestrate(**kwargs):
+        yield {"type": "text", "content": "Partial answer"}
+        raise RuntimeError("connection lost")
+
+    server = MagicMock()
+    server.orchestrate = orchestrate
+    connector = _Connector(bot_token="t", server=server, allowed_users=[])
+    chat = FakeChat()
+    await connector.stream_response("s1", "hi", _renderer(chat))
+
+    assert chat.messages == ["PARTIAL ANSWER\n\n⚠️ SOMETHING WENT WRONG. PLEASE TRY AGAIN LATER."]
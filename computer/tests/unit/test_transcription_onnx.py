@@ -0,0 +1,116 @@
+"""Tests for request batching in the sherpa-onnx transcription backend."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from parachute.core import transcription_onnx
+from parachute.core.transcription import TranscriptSegment
+from parachute.core.transcription_onnx import (
+    MAX_BATCH,
+    WINDOW_SECONDS,
+    AudioWindow,
+    SherpaOnnxBackend,
+)
+
+
+class FakeBackend(SherpaOnnxBackend):
+    """Backend with the process pool replaced by an in-loop decoder."""
+
+    def __init__(
+        self,
+        durations: dict[str, float],
+        workers: int = 1,
+        fail: bool = False,
+        probe_fails: bool = False,
+    ):
+        super().__init__(workers=workers)
+        self._pool = object()  # initialized
+        self.durations = durations
+        self.batches: list[list[AudioWindow]] = []
+        self.fail = fail
+        self.probe_fails = probe_fails
+
+    async def _duration(self, audio_path: Path):
+        return None if self.probe_fails else self.durations[str(audio_path)]
+
+    async def _dispatch(self, windows: list[AudioWindow]):
+        self.batches.append(windows)
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("decoder crashed")
+        return [
+            [TranscriptSegment(w.start, w.start + 1, f"{Path(w.path).stem}@{int(w.start)}")]
+            if w.start < self.durations[w.path] else None
+            for w in windows
+        ]
+
+
+class TestBatching:
+    """Concurrent requests share worker calls."""
+
+    async def test_concurrent_calls_are_batched(self):
+        backend = FakeBackend({f"m{i}": 10 for i in range(5)})
+        texts = await asyncio.gather(*(backend.transcribe(Path(f"m{i}")) for i in range(5)))
+
+        assert texts == [f"m{i}@0" for i in range(5)]
+        assert len(backend.batches) == 1
+
+    async def test_batches_are_capped_and_queue_behind_busy_workers(self):
+        n = MAX_BATCH + 3
+        backend = FakeBackend({f"m{i}": 10 for i in range(n)}, workers=1)
+        await asyncio.gather(*(backend.transcribe(Path(f"m{i}")) for i in range(n)))
+
+        assert [len(b) for b in backend.batches] == [MAX_BATCH, 3]
+
+    async def test_long_audio_is_decoded_window_by_window(self):
+        backend = FakeBackend({"long": WINDOW_SECONDS * 2.5})
+        text = await backend.transcribe(Path("long"))
+
+        assert text == f"long@0 long@{int(WINDOW_SECONDS)} long@{int(WINDOW_SECONDS * 2)}"
+        assert [len(b) for b in backend.batches] == [1, 1, 1]
+
+    async def test_unknown_duration_decodes_until_audio_ends(self):
+        backend = FakeBackend({"webm": WINDOW_SECONDS * 1.5}, probe_fails=True)
+        text = await backend.transcribe(Path("webm"))
+
+        assert text == f"webm@0 webm@{int(WINDOW_SECONDS)}"
+        assert [w.start for b in backend.batches for w in b] == [0, WINDOW_SECONDS, WINDOW_SECONDS * 2]
+
+    async def test_worker_error_fails_every_request_in_batch(self):
+        backend = FakeBackend({"a": 1, "b": 1}, fail=True)
+        results = await asyncio.gather(
+            backend.transcribe(Path("a")), backend.transcribe(Path("b")),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_requires_initialize(self):
+        backend = SherpaOnnxBackend()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            backend._submit(AudioWindow("x", 0, 1))
+
+
+class TestProbeDuration:
+    """ffprobe "N/A" durations fall back to the stream, then to unknown."""
+
+    @pytest.fixture
+    def ffprobe(self, monkeypatch):
+        outputs = {}
+
+        def run(args, **kwargs):
+            entries = args[args.index("-show_entries") + 1]
+            return subprocess.CompletedProcess(args, 0, stdout=outputs[entries])
+
+        monkeypatch.setattr(transcription_onnx.subprocess, "run", run)
+        return outputs
+
+    def test_stream_duration_used_when_format_is_na(self, ffprobe):
+        ffprobe.update({"format=duration": "N/A\n", "stream=duration": "12.5\n"})
+        assert transcription_onnx._probe_duration(Path("memo.webm")) == 12.5
+
+    def test_unknown_when_both_are_na(self, ffprobe):
+        ffprobe.update({"format=duration": "N/A\n", "stream=duration": "N/A\n"})
+        assert transcription_onnx._probe_duration(Path("memo.webm")) is None
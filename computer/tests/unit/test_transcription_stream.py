@@ -0,0 +1,122 @@
+"""Tests for streaming partial transcripts into daily voice entries."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+import modules.daily.module as daily
+from parachute.core import interfaces
+from parachute.core.transcription import TranscriptionService, TranscriptSegment
+
+
+class FakeGraph:
+    """One Note row; records every content write."""
+
+    def __init__(self):
+        self.write_lock = asyncio.Lock()
+        self.content = ""
+        self.meta = {"transcription_status": "processing"}
+        self.writes: list[tuple[str, dict]] = []
+
+    async def execute_cypher(self, query: str, params: dict | None = None):
+        params = params or {}
+        if "RETURN e.metadata_json" in query:
+            return [{"meta": json.dumps(self.meta)}]
+        if "SET e.content" in query:
+            self.content = params["content"]
+            self.meta = json.loads(params["meta"])
+            self.writes.append((self.content, dict(self.meta)))
+        elif "SET e.metadata_json" in query:
+            self.meta = json.loads(params["meta"])
+        return []
+
+
+class StreamingBackend:
+    """Yields segments one at a time, letting the test observe each step."""
+
+    def __init__(self, texts: list[str], stepped: bool = True):
+        self.texts = texts
+        self.stepped = stepped
+        self.step = asyncio.Event()
+
+    async def transcribe_stream(self, audio_path: Path):
+        for i, text in enumerate(self.texts):
+            if self.stepped:
+                await self.step.wait()
+                self.step.clear()
+            yield TranscriptSegment(start=i * 10.0, end=i * 10.0 + 9.5, text=text)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = interfaces.InterfaceRegistry()
+    monkeypatch.setattr(interfaces, "_registry", registry)
+    monkeypatch.setattr(daily, "PARTIAL_TRANSCRIPT_WRITE_INTERVAL", 0)
+    return registry
+
+
+async def _advance(backend: StreamingBackend) -> None:
+    backend.step.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestStreamingTranscription:
+    """Content fills in as segments arrive; events fire only at the end."""
+
+    async def test_partials_written_and_event_after_final(self, registry):
+        backend = StreamingBackend(["first part.", "second part.", "the end."])
+        registry.publish("TranscriptionService", TranscriptionService(backend))
+        graph = FakeGraph()
+        events = []
+
+        async def dispatch(event, entry_id):
+            events.append((event, graph.meta["transcription_status"]))
+
+        task = asyncio.create_task(
+            daily._transcribe_and_cleanup(graph, "e1", Path("memo.wav"), dispatch_event_fn=dispatch)
+        )
+        await _advance(backend)
+        assert graph.content == "first part."
+        assert graph.meta["transcription_status"] == "processing"
+        assert graph.meta["transcription_progress_seconds"] == 9.5
+
+        await _advance(backend)
+        assert graph.content == "first part. second part."
+        assert events == []
+
+        await _advance(backend)
+        await task
+        assert graph.content == "first part. second part. the end."
+        assert graph.meta["transcription_raw"] == graph.content
+        assert "transcription_progress_seconds" not in graph.meta
+        assert events == [("note.transcription_complete", "transcribed")]
+
+    async def test_partial_writes_are_debounced(self, registry, monkeypatch):
+        monkeypatch.setattr(daily, "PARTIAL_TRANSCRIPT_WRITE_INTERVAL", 3600)
+        backend = StreamingBackend(["a", "b", "c"], stepped=False)
+        registry.publish("TranscriptionService", TranscriptionService(backend))
+        graph = FakeGraph()
+
+        await daily._transcribe_and_cleanup(graph, "e1", Path("memo.wav"), dispatch_event_fn=_noop)
+        # Only the final commit touched the content
+        assert [content for content, _ in graph.writes] == ["a b c"]
+
+    async def test_no_speech_marks_failed_without_event(self, registry):
+        backend = StreamingBackend([], stepped=False)
+        registry.publish("TranscriptionService", TranscriptionService(backend))
+        graph = FakeGraph()
+        events = []
+
+        async def dispatch(event, entry_id):
+            events.append(event)
+
+        await daily._transcribe_and_cleanup(graph, "e1", Path("memo.wav"), dispatch_event_fn=dispatch)
+        assert graph.meta["transcription_status"] == "failed"
+        assert events == []
+
+
+async def _noop(event, entry_id):
+    return None